@@ -0,0 +1,59 @@
+"""Add material_blobs table for content-addressed material storage
+
+Revision ID: 019_material_blobs
+Revises: 018_add_syllabus_json
+Create Date: 2026-10-18
+
+Course materials with identical content now share one S3 object, tracked in
+material_blobs with a reference count. s3_key on course_materials is no longer
+unique because deduplicated rows point at the same object.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '019_material_blobs'
+down_revision = '018_add_syllabus_json'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'material_blobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('s3_key', sa.String(length=1000), nullable=False),
+        sa.Column('file_size', sa.BigInteger(), nullable=False),
+        sa.Column('content_type', sa.String(length=255), nullable=False),
+        sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('s3_key'),
+    )
+    op.create_index(op.f('ix_material_blobs_id'), 'material_blobs', ['id'], unique=False)
+    op.create_index(op.f('ix_material_blobs_sha256'), 'material_blobs', ['sha256'], unique=True)
+
+    op.add_column('course_materials', sa.Column('blob_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_course_materials_blob_id', 'course_materials', 'material_blobs',
+        ['blob_id'], ['id'], ondelete='RESTRICT',
+    )
+    op.create_index(op.f('ix_course_materials_blob_id'), 'course_materials', ['blob_id'], unique=False)
+
+    op.drop_index(op.f('ix_course_materials_s3_key'), table_name='course_materials')
+    op.create_index(op.f('ix_course_materials_s3_key'), 'course_materials', ['s3_key'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_course_materials_s3_key'), table_name='course_materials')
+    op.create_index(op.f('ix_course_materials_s3_key'), 'course_materials', ['s3_key'], unique=True)
+
+    op.drop_index(op.f('ix_course_materials_blob_id'), table_name='course_materials')
+    op.drop_constraint('fk_course_materials_blob_id', 'course_materials', type_='foreignkey')
+    op.drop_column('course_materials', 'blob_id')
+
+    op.drop_index(op.f('ix_material_blobs_sha256'), table_name='material_blobs')
+    op.drop_index(op.f('ix_material_blobs_id'), table_name='material_blobs')
+    op.drop_table('material_blobs')
@@ -0,0 +1,28 @@
+"""Add node cache columns to reports
+
+Revision ID: 020_report_node_cache
+Revises: 019_material_blobs
+Create Date: 2026-10-18
+
+Reports store a fingerprint of all workflow inputs and the fingerprinted output
+of each LLM node, so regeneration can reuse unchanged nodes or skip the run.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '020_report_node_cache'
+down_revision = '019_material_blobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('reports', sa.Column('input_fingerprint', sa.String(length=64), nullable=True))
+    op.add_column('reports', sa.Column('node_cache_json', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('reports', 'node_cache_json')
+    op.drop_column('reports', 'input_fingerprint')
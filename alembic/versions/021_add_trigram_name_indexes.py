@@ -0,0 +1,44 @@
+"""Add pg_trgm indexes for fuzzy name resolution
+
+Revision ID: 021_trigram_name_indexes
+Revises: 020_report_node_cache
+Create Date: 2026-10-18
+
+resolve_course / resolve_session / resolve_user fall back to pg_trgm similarity
+search when a scope is too large for the in-memory resolution index. GIN
+trigram indexes keep those queries from scanning the tables. PostgreSQL only.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '021_trigram_name_indexes'
+down_revision = '020_report_node_cache'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = (
+    ('ix_courses_title_trgm', 'courses', 'title'),
+    ('ix_sessions_title_trgm', 'sessions', 'title'),
+    ('ix_users_name_trgm', 'users', 'name'),
+    ('ix_users_email_trgm', 'users', 'email'),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
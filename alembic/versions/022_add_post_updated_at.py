@@ -0,0 +1,29 @@
+"""Add updated_at to posts
+
+Revision ID: 022_post_updated_at
+Revises: 021_trigram_name_indexes
+Create Date: 2026-10-18
+
+Label, pin and moderation edits bump updated_at, so the report dedup
+fingerprint notices edited posts and not only new or deleted ones.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '022_post_updated_at'
+down_revision = '021_trigram_name_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'posts',
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('posts', 'updated_at')
@@ -1,10 +1,25 @@
 """Utilities for executing MCP tool handlers safely."""
 
+import asyncio
 import inspect
-from typing import Any, Callable, Dict, Optional
+import logging
+import re
+import weakref
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from sqlalchemy.orm import Session
 
+logger = logging.getLogger(__name__)
+
+# Concurrent read steps per plan
+PLAN_MAX_WORKERS = 4
+
+# A step argument "$steps.<index>.<field>[.<field>...]" takes its value from an earlier step's result
+STEP_REFERENCE = re.compile(r"^\$steps\.(\d+)((?:\.[A-Za-z0-9_]+)+)$")
+
 
 def _handler_requires_db(handler: Callable[..., Any]) -> bool:
     try:
@@ -25,3 +40,295 @@ def invoke_tool_handler(
             raise RuntimeError("Database session required for tool handler.")
         return handler(db=db, **args)
     return handler(**args)
+
+
+def invoke_tool_handler_with_session(handler: Callable[..., Any], args: Dict[str, Any]) -> Any:
+    """Invoke a tool handler on its own database session, for use from worker threads."""
+    if not _handler_requires_db(handler):
+        return handler(**args)
+    from api.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return handler(db=db, **args)
+    finally:
+        db.close()
+
+
+def plan_write_action_with_session(
+    tool_name: str,
+    args: Dict[str, Any],
+    user_id: Optional[int],
+    action_store: Any,
+) -> Dict[str, Any]:
+    """Build the preview for a write tool and store it as a planned action. Returns action_id and preview."""
+    from api.core.database import SessionLocal
+    from api.services.action_preview import build_action_preview
+
+    db = SessionLocal()
+    try:
+        preview = build_action_preview(tool_name, args, db=db)
+    finally:
+        db.close()
+    action = action_store.create_action(user_id=user_id, tool_name=tool_name, args=args, preview=preview)
+    return {"action_id": action.action_id, "preview": preview}
+
+
+# ============ Async execution layer ============
+#
+# Tool handlers are synchronous and use blocking SQLAlchemy sessions. Every
+# async MCP entry point (stdio call_tool, the HTTP /execute servers and
+# /api/mcp/execute) runs them through one ToolExecutor so that:
+#   - handlers never block the event loop (they run on a bounded thread pool),
+#   - a burst of calls queues fairly for a slot instead of piling onto the
+#     pool (at most max_workers run at once, max_per_tool per tool),
+#   - a slow tool fails with ToolTimeoutError after its timeout instead of
+#     holding the caller indefinitely.
+
+# Tools that call an LLM get longer than the default timeout. Confirmed writes
+# (execute_action) get much longer: a timeout does not stop the write, so
+# reporting one early only invites a retry of an action that is still running.
+CATEGORY_TIMEOUTS = {"content_generation": 90.0, "actions": 300.0}
+WRITE_CATEGORIES = {"actions"}
+
+
+class ToolTimeoutError(Exception):
+    """Raised when a tool does not finish within its timeout."""
+
+
+class ToolBusyError(Exception):
+    """Raised when no execution slot frees up within the queue timeout."""
+
+
+class _LoopLimits:
+    def __init__(self, max_workers: int, max_per_tool: int):
+        self.total = asyncio.Semaphore(max_workers)
+        self.max_per_tool = max_per_tool
+        self.per_tool: Dict[str, asyncio.Semaphore] = {}
+
+    def for_tool(self, tool_name: str) -> asyncio.Semaphore:
+        if tool_name not in self.per_tool:
+            self.per_tool[tool_name] = asyncio.Semaphore(self.max_per_tool)
+        return self.per_tool[tool_name]
+
+
+class ToolExecutor:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_per_tool: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        queue_timeout_seconds: Optional[float] = None,
+    ):
+        from api.core.config import get_settings
+
+        settings = get_settings()
+        self.max_workers = max_workers or settings.mcp_tool_max_workers
+        self.max_per_tool = max_per_tool or settings.mcp_tool_max_per_tool
+        self.timeout_seconds = timeout_seconds or settings.mcp_tool_timeout_seconds
+        self.queue_timeout_seconds = queue_timeout_seconds or settings.mcp_tool_queue_timeout_seconds
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mcp-tool")
+        # asyncio semaphores belong to one event loop; keep a set per loop
+        self._limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopLimits]" = weakref.WeakKeyDictionary()
+        self._running: Counter = Counter()
+        self._timeouts = 0
+        self._rejected = 0
+
+    def _loop_limits(self) -> _LoopLimits:
+        loop = asyncio.get_running_loop()
+        limits = self._limits.get(loop)
+        if limits is None:
+            limits = self._limits[loop] = _LoopLimits(self.max_workers, self.max_per_tool)
+        return limits
+
+    async def run(self, tool_name: str, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """Run fn(*args) on the pool under the tool's concurrency limits and timeout."""
+        limits = self._loop_limits()
+        tool_limit = limits.for_tool(tool_name)
+        try:
+            await asyncio.wait_for(tool_limit.acquire(), self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise ToolBusyError(f"Too many concurrent calls to '{tool_name}'; try again shortly")
+        try:
+            await asyncio.wait_for(limits.total.acquire(), self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            tool_limit.release()
+            self._rejected += 1
+            raise ToolBusyError("Tool executor is busy; try again shortly")
+
+        future = asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+        self._running[tool_name] += 1
+
+        def _release(_future: asyncio.Future) -> None:
+            # Slots are held until the thread actually finishes, even after a timeout
+            self._running[tool_name] -= 1
+            tool_limit.release()
+            limits.total.release()
+
+        future.add_done_callback(_release)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout or self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise ToolTimeoutError(f"Tool '{tool_name}' timed out after {timeout or self.timeout_seconds:.0f}s")
+
+    async def invoke(
+        self,
+        tool_name: str,
+        handler: Callable[..., Any],
+        args: Dict[str, Any],
+        category: Optional[str] = None,
+    ) -> Any:
+        """Run a tool handler on its own database session."""
+        try:
+            return await self.run(
+                tool_name, invoke_tool_handler_with_session, handler, args,
+                timeout=CATEGORY_TIMEOUTS.get(category or "", self.timeout_seconds),
+            )
+        except ToolTimeoutError as exc:
+            if category in WRITE_CATEGORIES:
+                raise ToolTimeoutError(
+                    f"{exc}. The action is still running and may still complete; "
+                    "check its status before retrying."
+                ) from exc
+            raise
+
+    async def plan_write(self, tool_name: str, args: Dict[str, Any], user_id: Optional[int], action_store: Any) -> Dict[str, Any]:
+        """Preview and store a write action off the event loop."""
+        return await self.run(tool_name, plan_write_action_with_session, tool_name, args, user_id, action_store)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_per_tool": self.max_per_tool,
+            "running": {name: count for name, count in self._running.items() if count},
+            "timeouts": self._timeouts,
+            "rejected": self._rejected,
+        }
+
+
+_tool_executor: Optional[ToolExecutor] = None
+
+
+def get_tool_executor() -> ToolExecutor:
+    global _tool_executor
+    if _tool_executor is None:
+        _tool_executor = ToolExecutor()
+    return _tool_executor
+
+
+# ============ Plan execution ============
+
+@dataclass
+class StepOutcome:
+    output: Any = None
+    error: Optional[str] = None
+
+
+def _step_references(value: Any) -> Set[int]:
+    if isinstance(value, str):
+        match = STEP_REFERENCE.match(value)
+        return {int(match.group(1))} if match else set()
+    if isinstance(value, dict):
+        return set().union(*(_step_references(v) for v in value.values())) if value else set()
+    if isinstance(value, list):
+        return set().union(*(_step_references(v) for v in value)) if value else set()
+    return set()
+
+
+def plan_step_dependencies(steps: List[Dict[str, Any]], is_write: Callable[[Dict[str, Any]], bool]) -> List[Set[int]]:
+    """
+    For each step, the indexes of earlier steps that must finish first.
+
+    A step waits for the steps its arguments reference. Writes are barriers:
+    a write waits for every earlier step, and later steps wait for the write,
+    so writes keep their plan order relative to everything else.
+    """
+    dependencies: List[Set[int]] = []
+    last_write: Optional[int] = None
+    for index, step in enumerate(steps):
+        depends = {ref for ref in _step_references(step.get("args") or {}) if ref < index}
+        if is_write(step):
+            depends.update(range(index))
+            last_write = index
+        elif last_write is not None:
+            depends.add(last_write)
+        dependencies.append(depends)
+    return dependencies
+
+
+def _lookup(output: Any, path: List[str]) -> Any:
+    value = output
+    for key in path:
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            raise KeyError(key)
+    return value
+
+
+def resolve_step_references(value: Any, outcomes: Dict[int, StepOutcome]) -> Any:
+    """Replace "$steps.N.field" arguments with values from finished steps."""
+    if isinstance(value, str):
+        match = STEP_REFERENCE.match(value)
+        if not match:
+            return value
+        index = int(match.group(1))
+        outcome = outcomes.get(index)
+        if outcome is None or outcome.error is not None:
+            raise ValueError(f"Step {index} did not succeed, so '{value}' cannot be resolved")
+        try:
+            return _lookup(outcome.output, match.group(2).lstrip(".").split("."))
+        except KeyError:
+            raise ValueError(f"Step {index} result has no value for '{value}'")
+    if isinstance(value, dict):
+        return {key: resolve_step_references(item, outcomes) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_step_references(item, outcomes) for item in value]
+    return value
+
+
+def run_plan_steps(
+    steps: List[Dict[str, Any]],
+    run_step: Callable[[Dict[str, Any], Dict[str, Any]], Any],
+    is_write: Callable[[Dict[str, Any]], bool],
+    max_workers: int = PLAN_MAX_WORKERS,
+) -> List[StepOutcome]:
+    """
+    Run plan steps, overlapping independent reads, and return outcomes in plan order.
+
+    run_step(step, resolved_args) performs one step and returns its output; an
+    exception marks the step failed. Steps become ready once every step they
+    depend on (plan_step_dependencies) has finished, and all ready steps run
+    concurrently, so run_step must not share a database session between reads.
+    """
+    if not steps:
+        return []
+    dependencies = plan_step_dependencies(steps, is_write)
+    outcomes: Dict[int, StepOutcome] = {}
+
+    def execute(index: int) -> StepOutcome:
+        step = steps[index]
+        try:
+            args = resolve_step_references(step.get("args") or {}, outcomes)
+            return StepOutcome(output=run_step(step, args))
+        except Exception as exc:
+            logger.exception(f"Plan step {index} ({step.get('tool_name')}) failed")
+            return StepOutcome(error=str(exc))
+
+    pending = set(range(len(steps)))
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plan-step") as pool:
+        while pending or running:
+            for index in sorted(pending):
+                if dependencies[index] <= outcomes.keys():
+                    pending.discard(index)
+                    running[pool.submit(execute, index)] = index
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcomes[running.pop(future)] = future.result()
+
+    return [outcomes[index] for index in range(len(steps))]
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from typing import List, Optional
 from pydantic import BaseModel
 from api.core.database import get_db
+from api.services.tool_cache import invalidate_tags
 from api.core.config import get_settings
 from api.models.course import Course, CourseResource, generate_join_code
 from api.models.session import Session as SessionModel
@@ -20,7 +22,12 @@ from api.schemas.course import (
     JoinCourseResponse,
 )
 from api.schemas.session import SessionResponse
-from api.services.document_extractor import extract_text, is_supported_document, get_supported_extensions_display
+from api.services.document_extractor import (
+    get_document_extraction_service,
+    get_supported_extensions_display,
+    is_supported_document,
+)
+from api.services.material_storage import acquire_blob, delete_material_record, hash_file
 from api.services.s3_service import get_s3_service
 import logging
 
@@ -65,6 +72,7 @@ def create_course(course: CourseCreate, db: Session = Depends(get_db)):
         db.add(materials_session)
 
         db.commit()
+        invalidate_tags("courses")
         db.refresh(db_course)
         return db_course
     except SQLAlchemyError as e:
@@ -112,6 +120,7 @@ def update_course(
             setattr(course, field, value)
 
         db.commit()
+        invalidate_tags("courses", f"course:{course_id}")
         db.refresh(course)
         return course
     except SQLAlchemyError as e:
@@ -143,8 +152,18 @@ def delete_course(
         raise HTTPException(status_code=403, detail="You don't have permission to delete this course")
 
     try:
+        # Release file references first; the cascade would leave blobs and S3 objects behind
+        unused_s3_keys = [
+            key for key in (delete_material_record(db, material) for material in list(course.materials)) if key
+        ]
+        db.expire(course, ["materials"])
         db.delete(course)
         db.commit()
+        invalidate_tags("courses", f"course:{course_id}", "sessions", f"enrollment:{course_id}")
+
+        s3_service = get_s3_service()
+        for s3_key in unused_s3_keys:
+            s3_service.delete_file(s3_key)
         return None
     except SQLAlchemyError as e:
         db.rollback()
@@ -222,6 +241,7 @@ def add_course_resource(
         db_resource = CourseResource(course_id=course_id, **resource.model_dump())
         db.add(db_resource)
         db.commit()
+        invalidate_tags(f"course:{course_id}")
         db.refresh(db_resource)
         return db_resource
     except SQLAlchemyError as e:
@@ -237,10 +257,11 @@ def generate_session_plans(course_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Course not found")
 
     # Import here to avoid circular imports
+    from worker.dedup import plans_fingerprint, submit_deduplicated
     from worker.tasks import generate_plans_task
 
-    task = generate_plans_task.delay(course_id)
-    return {"task_id": task.id, "status": "queued"}
+    submission = submit_deduplicated(generate_plans_task, (course_id,), plans_fingerprint(db, course_id))
+    return {"task_id": submission.task_id, "status": submission.status, "result": submission.result}
 
 
 @router.post("/{course_id}/regenerate-join-code", response_model=CourseResponse)
@@ -258,6 +279,7 @@ def regenerate_join_code(course_id: int, db: Session = Depends(get_db)):
 
         course.join_code = new_code
         db.commit()
+        invalidate_tags("courses", f"course:{course_id}")
         db.refresh(course)
         return course
     except SQLAlchemyError as e:
@@ -295,6 +317,7 @@ def join_course_by_code(
         enrollment = Enrollment(user_id=user_id, course_id=course.id)
         db.add(enrollment)
         db.commit()
+        invalidate_tags(f"enrollment:{course.id}")
         return JoinCourseResponse(
             message="Successfully enrolled in course",
             course_id=course.id,
@@ -340,8 +363,8 @@ async def upload_syllabus(
             detail="File too large. Maximum size for syllabus is 10MB."
         )
 
-    # Extract text
-    extracted_text, error = extract_text(
+    # Extract text in the extraction process pool (cached by content hash)
+    extracted_text, error = await get_document_extraction_service().extract(
         file_content,
         file.filename,
         file.content_type or "application/octet-stream"
@@ -361,6 +384,7 @@ async def upload_syllabus(
         s3_service = get_s3_service()
 
         if s3_service.is_enabled():
+            created, blob_key = False, None
             try:
                 # Find the materials session for this course
                 materials_session = db.query(SessionModel).filter(
@@ -370,43 +394,38 @@ async def upload_syllabus(
 
                 session_id = materials_session.id if materials_session else None
 
-                # Generate S3 key and upload
-                s3_key = s3_service.generate_s3_key(
-                    course_id,
-                    f"syllabus_{file.filename}",
-                    session_id
+                # Store the file, reusing an identical copy if one exists
+                content_type = file.content_type or "application/octet-stream"
+                sha256, _ = await run_in_threadpool(hash_file, file.file)
+                blob, created = await run_in_threadpool(
+                    acquire_blob, db, sha256, file_size, content_type, file.filename, file.file
                 )
-
-                # Reset file position and upload
-                await file.seek(0)
-                success, upload_error = s3_service.upload_file(
-                    file.file,
-                    s3_key,
-                    file.content_type or "application/octet-stream",
-                    file.filename,
+                blob_key = blob.s3_key
+
+                # Create material record
+                material = CourseMaterial(
+                    course_id=course_id,
+                    session_id=session_id,
+                    filename=file.filename,
+                    s3_key=blob.s3_key,
+                    blob_id=blob.id,
+                    file_size=file_size,
+                    content_type=content_type,
+                    title=f"Syllabus - {file.filename}",
+                    description="Course syllabus uploaded during course creation",
+                    uploaded_by=user_id,
                 )
-
-                if success:
-                    # Create material record
-                    material = CourseMaterial(
-                        course_id=course_id,
-                        session_id=session_id,
-                        filename=file.filename,
-                        s3_key=s3_key,
-                        file_size=file_size,
-                        content_type=file.content_type or "application/octet-stream",
-                        title=f"Syllabus - {file.filename}",
-                        description="Course syllabus uploaded during course creation",
-                        uploaded_by=user_id,
-                    )
-                    db.add(material)
-                    db.commit()
-                    db.refresh(material)
-                    material_id = material.id
-                    logger.info(f"Syllabus uploaded and saved as material {material_id} for course {course_id}")
-                else:
-                    logger.warning(f"Failed to upload syllabus to S3: {upload_error}")
+                db.add(material)
+                db.commit()
+                invalidate_tags(f"course:{course_id}")
+                db.refresh(material)
+                material_id = material.id
+                logger.info(f"Syllabus uploaded and saved as material {material_id} for course {course_id}")
             except Exception as e:
+                db.rollback()
+                # The new blob's row was rolled back; don't leave its S3 object behind
+                if created:
+                    s3_service.delete_file(blob_key)
                 logger.error(f"Error saving syllabus to S3: {e}")
                 # Don't fail the whole request, just log the error
 
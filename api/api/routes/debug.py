@@ -39,3 +39,11 @@ def get_task_status(task_id: str):
     if task.successful():
         response["result"] = task.result
     return response
+
+
+@router.get("/voice_prompt_tokens")
+def get_voice_prompt_tokens():
+    """Token counts for the intent classification prompt, per page variant."""
+    from api.api.voice_prompt_assembly import prompt_token_report
+
+    return prompt_token_report()
@@ -912,10 +912,14 @@ def analyze_objective_coverage(
     db: Session = Depends(get_db)
 ):
     """Trigger analysis of learning objective coverage."""
+    from worker.dedup import coverage_fingerprint, submit_deduplicated
     from worker.tasks import analyze_objective_coverage_task
-    task = analyze_objective_coverage_task.delay(course_id)
+    submission = submit_deduplicated(analyze_objective_coverage_task, (course_id,), coverage_fingerprint(db, course_id))
 
-    return {"message": "Coverage analysis started", "task_id": task.id}
+    message = "Coverage analysis started" if not submission.deduplicated else "Coverage analysis already in progress"
+    if submission.status == "completed":
+        message = "Coverage analysis is up to date"
+    return {"message": message, "task_id": submission.task_id, "status": submission.status}
 
 
 # ============ Feature 9: Peer Review Workflow ============
@@ -7,6 +7,7 @@ from datetime import datetime
 import csv
 import io
 from api.core.database import get_db
+from api.services.tool_cache import invalidate_tags
 from api.models.enrollment import Enrollment
 from api.models.user import User, UserRole
 from api.models.course import Course
@@ -54,6 +55,7 @@ def enroll_user(enrollment: EnrollmentCreate, db: Session = Depends(get_db)):
         db_enrollment = Enrollment(**enrollment.model_dump())
         db.add(db_enrollment)
         db.commit()
+        invalidate_tags(f"enrollment:{enrollment.course_id}")
         db.refresh(db_enrollment)
         return db_enrollment
     except IntegrityError:
@@ -71,9 +73,11 @@ def unenroll_user(enrollment_id: int, db: Session = Depends(get_db)):
     if not enrollment:
         raise HTTPException(status_code=404, detail="Enrollment not found")
 
+    course_id = enrollment.course_id
     try:
         db.delete(enrollment)
         db.commit()
+        invalidate_tags(f"enrollment:{course_id}")
     except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -158,6 +162,7 @@ def enroll_all_students(course_id: int, db: Session = Depends(get_db)):
 
     try:
         db.commit()
+        invalidate_tags(f"enrollment:{course_id}")
         return {
             "message": f"Enrolled {len(new_enrollments)} students",
             "newly_enrolled_user_ids": new_enrollments,
@@ -210,6 +215,7 @@ def bulk_enroll_students(request: BulkEnrollRequest, db: Session = Depends(get_d
 
     try:
         db.commit()
+        invalidate_tags(f"enrollment:{request.course_id}")
         return {
             "message": f"Enrolled {len(new_enrollments)} students",
             "newly_enrolled_user_ids": new_enrollments,
@@ -312,6 +318,9 @@ async def upload_roster_csv(course_id: int, file: UploadFile = File(...), db: Se
                 results["errors"].append(f"Row {row_num}: {str(e)}")
 
         db.commit()
+        invalidate_tags(f"enrollment:{course_id}")
+        if results["created_and_enrolled"]:
+            invalidate_tags("users")
 
         return {
             "message": f"Processed roster for course {course_id}",
@@ -36,7 +36,9 @@ from api.models.session import SessionStatus
 from api.models.user import AuthProvider, User, UserRole
 from api.services.integrations.registry import get_provider, list_supported_providers
 from api.services.integrations.secrets import decrypt_secret, encrypt_secret
+from api.services.material_storage import acquire_blob
 from api.services.s3_service import get_s3_service
+from api.services.tool_cache import invalidate_tags
 
 router = APIRouter(prefix="/integrations", tags=["integrations"])
 
@@ -509,6 +511,7 @@ def _sync_sessions_from_external(
     if not external_sessions:
         return session_mapping
 
+    created_sessions = False
     for ext_session in external_sessions:
         # Check if this session is already linked
         existing_link = db.query(IntegrationSessionLink).filter(
@@ -554,8 +557,11 @@ def _sync_sessions_from_external(
         db.flush()
 
         session_mapping[ext_session.external_id] = new_session.id
+        created_sessions = True
 
     db.commit()
+    if created_sessions:
+        invalidate_tags("sessions", f"course:{target_course_id}")
     return session_mapping
 
 
@@ -577,6 +583,8 @@ def _import_materials_batch(
 ) -> dict:
     """Import materials in batch, updating the provided job record.
 
+    Files are stored once per content hash.
+
     Returns dict with imported_count, skipped_count, failed_count, results.
     This function is used by both sync endpoint and Celery background task.
     """
@@ -608,6 +616,7 @@ def _import_materials_batch(
         db.commit()
         db.refresh(sync_item)
 
+        created_blob_key: Optional[str] = None
         try:
             existing_link = db.query(IntegrationMaterialLink).filter(
                 IntegrationMaterialLink.provider == provider_name,
@@ -653,6 +662,7 @@ def _import_materials_batch(
             content_bytes, material_meta = provider_obj.download_material(external_id)
             if not content_bytes:
                 raise RuntimeError("Downloaded file is empty.")
+            checksum = hashlib.sha256(content_bytes).hexdigest()
 
             # Pick the best title available. download_material() may return
             # a Content-Disposition filename (good) or a URL-derived name (bad).
@@ -675,30 +685,26 @@ def _import_materials_batch(
                     elif map_looks_like_hash == dl_looks_like_hash and len(map_title) > len(dl_title):
                         material_meta.title = map_title
 
-            checksum = hashlib.sha256(content_bytes).hexdigest()
-
-            s3_key = s3_service.generate_s3_key(
-                target_course_id,
-                material_meta.filename,
-                resolved_target_session_id,
-            )
-            file_like = io.BytesIO(content_bytes)
-            ok, err = s3_service.upload_file(
-                file_like,
-                s3_key,
+            # Upload only when no identical file is stored yet
+            blob, blob_created = acquire_blob(
+                db,
+                checksum,
+                len(content_bytes),
                 material_meta.content_type,
                 material_meta.filename,
+                io.BytesIO(content_bytes),
             )
-            if not ok:
-                raise RuntimeError(err or "S3 upload failed.")
+            if blob_created:
+                created_blob_key = blob.s3_key
 
             title = f"{prefix}{material_meta.title}" if prefix else material_meta.title
             course_material = CourseMaterial(
                 course_id=target_course_id,
                 session_id=resolved_target_session_id,
                 filename=material_meta.filename,
-                s3_key=s3_key,
-                file_size=material_meta.size_bytes or len(content_bytes),
+                s3_key=blob.s3_key,
+                blob_id=blob.id,
+                file_size=blob.file_size,
                 content_type=material_meta.content_type,
                 title=title,
                 description=f"Imported from {provider_name} (external id: {external_id})",
@@ -707,6 +713,7 @@ def _import_materials_batch(
             db.add(course_material)
             db.commit()
             db.refresh(course_material)
+            created_blob_key = None
 
             db.add(
                 IntegrationMaterialLink(
@@ -723,19 +730,22 @@ def _import_materials_batch(
             db.commit()
 
             imported_count += 1
+            message = "Imported successfully." if blob_created else "Imported successfully (reused stored file)."
             sync_item.status = "imported"
-            sync_item.message = "Imported successfully."
+            sync_item.message = message
             sync_item.course_material_id = course_material.id
             sync_item.external_material_name = material_meta.title
             db.commit()
             results.append({
                 "material_external_id": external_id,
                 "status": "imported",
-                "message": "Imported successfully.",
+                "message": message,
                 "created_material_id": course_material.id,
             })
         except Exception as exc:
             db.rollback()
+            if created_blob_key:
+                s3_service.delete_file(created_blob_key)
             failed_count += 1
             sync_item.status = "failed"
             sync_item.message = str(exc)
@@ -1293,6 +1303,7 @@ def import_external_course(
     )
     db.add(mapping)
     db.commit()
+    invalidate_tags("courses", "sessions", f"course:{new_course.id}")
     db.refresh(new_course)
     db.refresh(mapping)
 
@@ -1495,6 +1506,8 @@ def import_materials(
     result.target_course_id = resolved_target_course_id
     result.target_course_title = resolved_target_title
     result.created_target_course = created_target_course
+    if created_target_course:
+        invalidate_tags("courses", "sessions", f"course:{resolved_target_course_id}")
     return result
 
 
@@ -1578,6 +1591,8 @@ def sync_materials(
     result.target_course_id = resolved_target_course_id
     result.target_course_title = resolved_target_title
     result.created_target_course = created_target_course
+    if created_target_course:
+        invalidate_tags("courses", "sessions", f"course:{resolved_target_course_id}")
     return result
 
 
@@ -1612,7 +1627,7 @@ def sync_materials_async(
 
     # Ensure target course exists
     p = _resolve_provider(provider, db=db, connection_id=request.source_connection_id, actor_user_id=actor_id)
-    resolved_target_course_id, _, _ = _ensure_target_course(
+    resolved_target_course_id, _, created_target_course = _ensure_target_course(
         db=db,
         provider=provider,
         provider_obj=p,
@@ -1636,6 +1651,8 @@ def sync_materials_async(
     )
     db.add(job)
     db.commit()
+    if created_target_course:
+        invalidate_tags("courses", "sessions", f"course:{resolved_target_course_id}")
     db.refresh(job)
 
     # Queue Celery task
@@ -1680,7 +1697,7 @@ def sync_roster(
         request.source_connection_id = mapping.source_connection_id
         request.target_course_id = mapping.target_course_id
 
-    resolved_target_course_id, _, _ = _ensure_target_course(
+    resolved_target_course_id, _, created_target_course = _ensure_target_course(
         db=db,
         provider=provider,
         provider_obj=p,
@@ -1733,6 +1750,11 @@ def sync_roster(
         enrolled_count += 1
 
     db.commit()
+    invalidate_tags(f"enrollment:{resolved_target_course_id}")
+    if created_users_count:
+        invalidate_tags("users")  # New students must be resolvable by name right away
+    if created_target_course:
+        invalidate_tags("courses", "sessions", f"course:{resolved_target_course_id}")
 
     return SyncRosterResponse(
         provider=provider,
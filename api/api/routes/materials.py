@@ -1,9 +1,11 @@
 """API routes for course materials (file upload/download/delete)."""
 
 import logging
-from typing import List, Optional
+import os
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -12,8 +14,14 @@ from api.core.database import get_db
 from api.core.config import get_settings
 from api.models.course import Course
 from api.models.session import Session as SessionModel
-from api.models.course_material import CourseMaterial
+from api.models.course_material import CourseMaterial, MaterialBlob
 from api.models.enrollment import Enrollment
+from api.services.material_storage import (
+    MaterialStorageError,
+    acquire_blob,
+    delete_material_record,
+    hash_file,
+)
 from api.services.s3_service import get_s3_service
 from pydantic import BaseModel
 from datetime import datetime
@@ -60,12 +68,63 @@ class PresignedUploadResponse(BaseModel):
     expires_in: int
 
 
+class MultipartUploadInitRequest(BaseModel):
+    course_id: int
+    filename: str
+    content_type: str
+    file_size: int
+    session_id: Optional[int] = None
+    user_id: Optional[int] = None  # Would come from auth
+
+
+class MultipartUploadInitResponse(BaseModel):
+    upload_id: str
+    s3_key: str
+    part_size: int
+    part_count: int
+    part_urls: Dict[int, str]
+    expires_in: int
+
+
+class UploadedPart(BaseModel):
+    part_number: int
+    etag: str
+
+
+class MultipartUploadCompleteRequest(BaseModel):
+    course_id: int
+    s3_key: str
+    upload_id: str
+    parts: List[UploadedPart]
+    user_id: Optional[int] = None  # Would come from auth
+
+
+class MultipartUploadAbortRequest(BaseModel):
+    course_id: int
+    s3_key: str
+    upload_id: str
+    user_id: Optional[int] = None  # Would come from auth
+
+
+class MaterialFinalizeRequest(BaseModel):
+    s3_key: str
+    filename: str
+    title: Optional[str] = None
+    description: Optional[str] = None
+    session_id: Optional[int] = None
+    replaces_material_id: Optional[int] = None
+    user_id: Optional[int] = None  # Would come from auth
+
+
 # --- Helper Functions ---
 
 def get_material_with_url(material: CourseMaterial) -> MaterialResponse:
     """Convert a CourseMaterial to response with download URL."""
     s3_service = get_s3_service()
-    download_url = s3_service.generate_presigned_url(material.s3_key) if s3_service.is_enabled() else None
+    download_url = (
+        s3_service.generate_presigned_url(material.s3_key, filename=material.filename)
+        if s3_service.is_enabled() else None
+    )
 
     return MaterialResponse(
         id=material.id,
@@ -103,6 +162,63 @@ def check_instructor_access(db: Session, course_id: int, user_id: Optional[int]
     return course
 
 
+def get_upload_size(file: UploadFile) -> int:
+    """Size of an uploaded file without reading it into memory."""
+    if file.size is not None:
+        return file.size
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    return size
+
+
+def check_file_size(file_size: int) -> None:
+    """Reject files above the configured maximum."""
+    if file_size > get_s3_service().max_file_size_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {get_settings().aws_s3_max_file_size_mb}MB"
+        )
+
+
+def check_session_in_course(db: Session, course_id: int, session_id: Optional[int]) -> None:
+    """Verify the session (if any) belongs to the course."""
+    if session_id:
+        session = db.query(SessionModel).filter(
+            SessionModel.id == session_id,
+            SessionModel.course_id == course_id
+        ).first()
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found in this course")
+
+
+def check_course_s3_key(course_id: int, s3_key: str) -> None:
+    """Reject keys outside the course's materials prefix."""
+    if not s3_key.startswith(f"courses/{course_id}/materials/") or ".." in s3_key:
+        raise HTTPException(status_code=400, detail="Upload key does not belong to this course")
+
+
+async def store_upload(
+    db: Session,
+    file: UploadFile,
+    file_size: int,
+    content_type: str,
+) -> tuple[MaterialBlob, bool]:
+    """
+    Store an upload as a content-addressed blob, skipping the S3 upload when
+    identical content is already stored. Hashing and uploading run in the
+    thread pool in chunks.
+    """
+    sha256, _ = await run_in_threadpool(hash_file, file.file)
+    try:
+        return await run_in_threadpool(
+            acquire_blob, db, sha256, file_size, content_type, file.filename, file.file
+        )
+    except (MaterialStorageError, SQLAlchemyError) as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to upload file: {e}")
+
+
 # --- API Endpoints ---
 
 @router.post("/courses/{course_id}/materials", response_model=MaterialResponse, status_code=status.HTTP_201_CREATED)
@@ -122,7 +238,6 @@ async def upload_material(
     - Files are stored in S3 with metadata in database
     - Maximum file size: 100MB (configurable)
     """
-    settings = get_settings()
     s3_service = get_s3_service()
 
     if not s3_service.is_enabled():
@@ -132,40 +247,16 @@ async def upload_material(
     check_instructor_access(db, course_id, user_id)
 
     # Verify session if provided
-    if session_id:
-        session = db.query(SessionModel).filter(
-            SessionModel.id == session_id,
-            SessionModel.course_id == course_id
-        ).first()
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found in this course")
-
-    # Check file size
-    file_content = await file.read()
-    file_size = len(file_content)
+    check_session_in_course(db, course_id, session_id)
 
-    if file_size > s3_service.max_file_size_bytes:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size is {settings.aws_s3_max_file_size_mb}MB"
-        )
+    # Check file size (the spooled upload is measured, not read)
+    file_size = get_upload_size(file)
+    check_file_size(file_size)
 
-    # Reset file pointer
-    await file.seek(0)
-
-    # Generate S3 key and upload
-    s3_key = s3_service.generate_s3_key(course_id, file.filename, session_id)
+    # Hash and stream the upload to S3 off the event loop (reusing identical content)
     content_type = file.content_type or "application/octet-stream"
-
-    success, error = s3_service.upload_file(
-        file.file,
-        s3_key,
-        content_type,
-        file.filename,
-    )
-
-    if not success:
-        raise HTTPException(status_code=500, detail=f"Failed to upload file: {error}")
+    blob, created = await store_upload(db, file, file_size, content_type)
+    s3_key = blob.s3_key
 
     # Create database record
     try:
@@ -174,6 +265,7 @@ async def upload_material(
             session_id=session_id,
             filename=file.filename,
             s3_key=s3_key,
+            blob_id=blob.id,
             file_size=file_size,
             content_type=content_type,
             title=title or file.filename,
@@ -188,9 +280,10 @@ async def upload_material(
         return get_material_with_url(material)
 
     except SQLAlchemyError as e:
-        # Clean up S3 file if database fails
-        s3_service.delete_file(s3_key)
+        # Clean up S3 file if database fails and no other material uses it
         db.rollback()
+        if created:
+            s3_service.delete_file(s3_key)
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
@@ -266,7 +359,7 @@ def download_material(
         raise HTTPException(status_code=404, detail="Material not found")
 
     s3_service = get_s3_service()
-    download_url = s3_service.generate_presigned_url(material.s3_key)
+    download_url = s3_service.generate_presigned_url(material.s3_key, filename=material.filename)
 
     if not download_url:
         raise HTTPException(status_code=500, detail="Failed to generate download URL")
@@ -323,7 +416,6 @@ async def replace_material(
     - Creates a new database record with incremented version
     - Links to the replaced material
     """
-    settings = get_settings()
     s3_service = get_s3_service()
 
     if not s3_service.is_enabled():
@@ -341,30 +433,13 @@ async def replace_material(
         raise HTTPException(status_code=404, detail="Material not found")
 
     # Check file size
-    file_content = await file.read()
-    file_size = len(file_content)
+    file_size = get_upload_size(file)
+    check_file_size(file_size)
 
-    if file_size > s3_service.max_file_size_bytes:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size is {settings.aws_s3_max_file_size_mb}MB"
-        )
-
-    await file.seek(0)
-
-    # Generate new S3 key and upload
-    s3_key = s3_service.generate_s3_key(course_id, file.filename, old_material.session_id)
+    # Store the new content
     content_type = file.content_type or "application/octet-stream"
-
-    success, error = s3_service.upload_file(
-        file.file,
-        s3_key,
-        content_type,
-        file.filename,
-    )
-
-    if not success:
-        raise HTTPException(status_code=500, detail=f"Failed to upload file: {error}")
+    blob, created = await store_upload(db, file, file_size, content_type)
+    s3_key = blob.s3_key
 
     # Create new version record
     try:
@@ -373,6 +448,7 @@ async def replace_material(
             session_id=old_material.session_id,
             filename=file.filename,
             s3_key=s3_key,
+            blob_id=blob.id,
             file_size=file_size,
             content_type=content_type,
             title=old_material.title,  # Keep same title
@@ -389,8 +465,9 @@ async def replace_material(
         return get_material_with_url(new_material)
 
     except SQLAlchemyError as e:
-        s3_service.delete_file(s3_key)
         db.rollback()
+        if created:
+            s3_service.delete_file(s3_key)
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
@@ -405,7 +482,7 @@ def delete_material(
     Delete a material.
 
     - Removes from database
-    - Deletes file from S3
+    - Deletes the file from S3 once no other material shares it
     """
     check_instructor_access(db, course_id, user_id)
 
@@ -417,15 +494,13 @@ def delete_material(
     if not material:
         raise HTTPException(status_code=404, detail="Material not found")
 
-    s3_key = material.s3_key
-
     try:
-        db.delete(material)
+        unused_s3_key = delete_material_record(db, material)
         db.commit()
 
-        # Delete from S3 after database success
-        s3_service = get_s3_service()
-        s3_service.delete_file(s3_key)
+        # Delete from S3 after database success, once no material references the file
+        if unused_s3_key:
+            get_s3_service().delete_file(unused_s3_key)
 
         logger.info(f"Material deleted: {material_id}")
 
@@ -492,3 +567,178 @@ def get_presigned_upload_url(
         s3_key=s3_key,
         expires_in=3600,
     )
+
+
+@router.post("/materials/multipart-uploads", response_model=MultipartUploadInitResponse)
+def start_multipart_upload(
+    request: MultipartUploadInitRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Start a direct browser-to-S3 multipart upload.
+
+    The browser PUTs each part to its presigned URL, sends the returned ETags
+    to /materials/multipart-uploads/complete, then calls
+    /courses/{course_id}/materials/finalize to register the material.
+    """
+    s3_service = get_s3_service()
+
+    if not s3_service.is_enabled():
+        raise HTTPException(status_code=503, detail="File storage service is not configured")
+
+    check_instructor_access(db, request.course_id, request.user_id)
+    check_session_in_course(db, request.course_id, request.session_id)
+    check_file_size(request.file_size)
+
+    s3_key = s3_service.generate_s3_key(request.course_id, request.filename, request.session_id)
+    upload_id = s3_service.create_multipart_upload(s3_key, request.content_type, request.filename)
+    if not upload_id:
+        raise HTTPException(status_code=500, detail="Failed to start upload")
+
+    part_size, part_count = s3_service.plan_multipart_parts(request.file_size)
+    expires_in = 3600
+    part_urls = s3_service.generate_presigned_part_urls(
+        s3_key, upload_id, list(range(1, part_count + 1)), expires_in
+    )
+    if not part_urls:
+        s3_service.abort_multipart_upload(s3_key, upload_id)
+        raise HTTPException(status_code=500, detail="Failed to generate upload URLs")
+
+    return MultipartUploadInitResponse(
+        upload_id=upload_id,
+        s3_key=s3_key,
+        part_size=part_size,
+        part_count=part_count,
+        part_urls=part_urls,
+        expires_in=expires_in,
+    )
+
+
+@router.post("/materials/multipart-uploads/complete", status_code=status.HTTP_204_NO_CONTENT)
+def complete_multipart_upload(
+    request: MultipartUploadCompleteRequest,
+    db: Session = Depends(get_db),
+):
+    """Assemble the uploaded parts into the final S3 object."""
+    s3_service = get_s3_service()
+
+    if not s3_service.is_enabled():
+        raise HTTPException(status_code=503, detail="File storage service is not configured")
+
+    check_instructor_access(db, request.course_id, request.user_id)
+    check_course_s3_key(request.course_id, request.s3_key)
+    if not request.parts:
+        raise HTTPException(status_code=400, detail="No uploaded parts")
+
+    success, error = s3_service.complete_multipart_upload(
+        request.s3_key,
+        request.upload_id,
+        [{"PartNumber": part.part_number, "ETag": part.etag} for part in request.parts],
+    )
+    if not success:
+        raise HTTPException(status_code=500, detail=f"Failed to complete upload: {error}")
+
+
+@router.post("/materials/multipart-uploads/abort", status_code=status.HTTP_204_NO_CONTENT)
+def abort_multipart_upload(
+    request: MultipartUploadAbortRequest,
+    db: Session = Depends(get_db),
+):
+    """Abort a multipart upload so S3 discards its parts."""
+    s3_service = get_s3_service()
+
+    if not s3_service.is_enabled():
+        raise HTTPException(status_code=503, detail="File storage service is not configured")
+
+    check_instructor_access(db, request.course_id, request.user_id)
+    check_course_s3_key(request.course_id, request.s3_key)
+
+    success, error = s3_service.abort_multipart_upload(request.s3_key, request.upload_id)
+    if not success:
+        raise HTTPException(status_code=500, detail=f"Failed to abort upload: {error}")
+
+
+@router.post("/courses/{course_id}/materials/finalize", response_model=MaterialResponse, status_code=status.HTTP_201_CREATED)
+def finalize_material_upload(
+    course_id: int,
+    request: MaterialFinalizeRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Register a material whose file was uploaded directly to S3.
+
+    - Verifies the object exists and is within the size limit (HEAD, no download)
+    - Creates the database record, or a new version when replaces_material_id is set
+    """
+    s3_service = get_s3_service()
+
+    if not s3_service.is_enabled():
+        raise HTTPException(status_code=503, detail="File storage service is not configured")
+
+    check_instructor_access(db, course_id, request.user_id)
+    check_course_s3_key(course_id, request.s3_key)
+
+    if db.query(CourseMaterial.id).filter(CourseMaterial.s3_key == request.s3_key).first():
+        raise HTTPException(status_code=409, detail="Upload has already been finalized")
+
+    old_material = None
+    session_id = request.session_id
+    if request.replaces_material_id is not None:
+        old_material = db.query(CourseMaterial).filter(
+            CourseMaterial.id == request.replaces_material_id,
+            CourseMaterial.course_id == course_id,
+        ).first()
+        if not old_material:
+            raise HTTPException(status_code=404, detail="Material not found")
+        session_id = old_material.session_id
+    else:
+        check_session_in_course(db, course_id, session_id)
+
+    file_info = s3_service.get_file_info(request.s3_key)
+    if not file_info:
+        raise HTTPException(status_code=404, detail="Uploaded file not found in storage")
+
+    file_size = file_info.get("content_length") or 0
+    try:
+        check_file_size(file_size)
+    except HTTPException:
+        s3_service.delete_file(request.s3_key)
+        raise
+
+    try:
+        if old_material:
+            material = CourseMaterial(
+                course_id=course_id,
+                session_id=session_id,
+                filename=request.filename,
+                s3_key=request.s3_key,
+                file_size=file_size,
+                content_type=file_info.get("content_type") or "application/octet-stream",
+                title=old_material.title,
+                description=old_material.description,
+                uploaded_by=request.user_id,
+                version=old_material.version + 1,
+                replaced_material_id=old_material.id,
+            )
+        else:
+            material = CourseMaterial(
+                course_id=course_id,
+                session_id=session_id,
+                filename=request.filename,
+                s3_key=request.s3_key,
+                file_size=file_size,
+                content_type=file_info.get("content_type") or "application/octet-stream",
+                title=request.title or request.filename,
+                description=request.description,
+                uploaded_by=request.user_id,
+            )
+        db.add(material)
+        db.commit()
+        db.refresh(material)
+
+        logger.info(f"Material finalized: {material.id} for course {course_id}")
+        return get_material_with_url(material)
+
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from api.core.database import get_db
+from api.services.tool_cache import invalidate_tags
 from api.models.poll import Poll, PollVote
 from api.models.session import Session as SessionModel
 from api.models.user import User
@@ -25,6 +26,7 @@ def create_poll(session_id: int, poll: PollCreate, db: Session = Depends(get_db)
         db_poll = Poll(session_id=session_id, **poll.model_dump())
         db.add(db_poll)
         db.commit()
+        invalidate_tags("polls")
         db.refresh(db_poll)
         return db_poll
     except SQLAlchemyError as e:
@@ -64,6 +66,7 @@ def vote_on_poll(poll_id: int, vote: PollVoteCreate, db: Session = Depends(get_d
         db_vote = PollVote(poll_id=poll_id, **vote.model_dump())
         db.add(db_vote)
         db.commit()
+        invalidate_tags("polls")
         return {"status": "vote_recorded"}
     except IntegrityError as e:
         db.rollback()
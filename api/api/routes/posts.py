@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from typing import List
 from api.core.database import get_db
+from api.services.tool_cache import invalidate_tags
 from api.models.post import Post
 from api.models.session import Session as SessionModel
 from api.models.user import User
@@ -56,6 +57,7 @@ def create_post(session_id: int, post: PostCreate, db: Session = Depends(get_db)
         db_post = Post(session_id=session_id, **post.model_dump())
         db.add(db_post)
         db.commit()
+        invalidate_tags("posts")
         db.refresh(db_post)
         return db_post
     except SQLAlchemyError as e:
@@ -73,6 +75,7 @@ def label_post(post_id: int, label_update: PostLabelUpdate, db: Session = Depend
     try:
         post.labels_json = label_update.labels
         db.commit()
+        invalidate_tags("posts")
         db.refresh(post)
         return post
     except SQLAlchemyError as e:
@@ -90,6 +93,7 @@ def pin_post(post_id: int, pin_update: PostPinUpdate, db: Session = Depends(get_
     try:
         post.pinned = pin_update.pinned
         db.commit()
+        invalidate_tags("posts")
         db.refresh(post)
         return post
     except SQLAlchemyError as e:
@@ -115,6 +119,7 @@ def moderate_post(post_id: int, moderation: PostModerationUpdate, db: Session =
         if moderation.pinned is not None:
             post.pinned = moderation.pinned
         db.commit()
+        invalidate_tags("posts")
         db.refresh(post)
         return post
     except SQLAlchemyError as e:
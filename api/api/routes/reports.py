@@ -15,10 +15,11 @@ def generate_report(session_id: int, db: Session = Depends(get_db)):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    from worker.dedup import report_fingerprint, submit_deduplicated
     from worker.tasks import generate_report_task
 
-    task = generate_report_task.delay(session_id)
-    return {"task_id": task.id, "status": "queued"}
+    submission = submit_deduplicated(generate_report_task, (session_id,), report_fingerprint(db, session_id))
+    return {"task_id": submission.task_id, "status": submission.status, "result": submission.result}
 
 
 @router.get("/session/{session_id}", response_model=ReportResponse)
@@ -4,6 +4,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from typing import List, Optional
 from pydantic import BaseModel
 from api.core.database import get_db
+from api.services.tool_cache import invalidate_tags
 from api.models.session import Session as SessionModel, Case
 from api.models.intervention import Intervention
 from api.models.integration import IntegrationCanvasPush, IntegrationProviderConnection, IntegrationCourseMapping
@@ -78,6 +79,7 @@ def create_session(session: SessionCreate, db: Session = Depends(get_db)):
         db_session = SessionModel(**session.model_dump())
         db.add(db_session)
         db.commit()
+        invalidate_tags("sessions", f"course:{db_session.course_id}")
         db.refresh(db_session)
         return db_session
     except SQLAlchemyError as e:
@@ -137,6 +139,7 @@ def update_session(
                 setattr(session, field, value)
 
         db.commit()
+        invalidate_tags("sessions", f"session:{session_id}")
         db.refresh(session)
         return session
     except ValueError as e:
@@ -180,6 +183,7 @@ def delete_session(
     try:
         db.delete(session)
         db.commit()
+        invalidate_tags("sessions", f"session:{session_id}")
         return None
     except SQLAlchemyError as e:
         db.rollback()
@@ -210,6 +214,7 @@ def update_session_status(
         new_status = SessionStatus(status_update.status)
         session.status = new_status
         db.commit()
+        invalidate_tags("sessions", f"session:{session_id}")
         db.refresh(session)
         return session
     except ValueError:
@@ -4,6 +4,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing import List, Optional
 from datetime import datetime
 from api.core.database import get_db
+from api.services.tool_cache import invalidate_tags
 from api.models.user import User, InstructorRequestStatus, UserRole
 from api.schemas.user import UserCreate, UserUpdate, UserResponse, UserRegisterOrGet
 
@@ -17,6 +18,7 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
         db_user = User(**user.model_dump())
         db.add(db_user)
         db.commit()
+        invalidate_tags("users")
         db.refresh(db_user)
         return db_user
     except IntegrityError:
@@ -65,6 +67,7 @@ def register_or_get_user(user_data: UserRegisterOrGet, db: Session = Depends(get
         )
         db.add(db_user)
         db.commit()
+        invalidate_tags("users")
         db.refresh(db_user)
         return db_user
     except SQLAlchemyError as e:
@@ -144,6 +147,7 @@ def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get
         for field, value in update_data.items():
             setattr(user, field, value)
         db.commit()
+        invalidate_tags("users")
         db.refresh(user)
         return user
     except SQLAlchemyError as e:
@@ -161,6 +165,7 @@ def delete_user(user_id: int, db: Session = Depends(get_db)):
     try:
         db.delete(user)
         db.commit()
+        invalidate_tags("users")
     except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
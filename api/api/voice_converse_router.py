@@ -11,14 +11,16 @@ Add this router to your main API router.
 """
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Any, Dict, Tuple
+import asyncio
 import re
 import logging
 
 from sqlalchemy.orm import Session
 
-from api.core.database import get_db
+from api.core.database import SessionLocal, get_db
 
 # Phase 3: Import from modular components
 from api.api.voice_responses import (
@@ -64,10 +66,20 @@ from api.models.course import Course
 from api.models.user import User
 from api.models.integration import IntegrationProviderConnection, IntegrationCourseMapping
 from api.models.session import Session as SessionModel, SessionStatus
-from api.api.mcp_executor import invoke_tool_handler
+from api.api.mcp_executor import invoke_tool_handler, invoke_tool_handler_with_session, run_plan_steps
 from api.services.integrations.registry import list_supported_providers
 from api.services.speech_filter import sanitize_speech
+from api.services.speech_stream import (
+    SpeechSink,
+    current_speech_sink,
+    format_sse,
+    get_streaming_tts,
+    reset_speech_sink,
+    stream_speech,
+    use_speech_sink,
+)
 from api.services.tool_response import normalize_tool_result
+from api.services.tool_validation import ToolArgumentError, validate_tool_args
 from api.services.context_store import ContextStore
 from api.services.voice_conversation_state import (
     VoiceConversationManager,
@@ -99,6 +111,9 @@ from api.api.voice_intent_classifier import (
     generate_llm_response,
 )
 
+# Single-call turn planning (intent + UI target + dictation + spoken response)
+from api.api.voice_turn_planner import plan_voice_turn, TurnPlan
+
 # Instructor enhancement features voice handlers
 from api.api.voice_instructor_handlers import handle_instructor_feature
 
@@ -119,6 +134,11 @@ USE_LLM_INTENT_DETECTION = True  # Always True - regex fallback removed
 # If confidence is below this, ask for clarification (no regex fallback)
 LLM_INTENT_CONFIDENCE_THRESHOLD = 0.5  # Lowered from 0.6 - trust LLM more
 
+# Plan each turn with ONE structured LLM call (voice_turn_planner.py).
+# The individual classifiers (navigation, tab switch, form input, intent)
+# only run as fallbacks when the planner call fails or is not confident.
+USE_UNIFIED_TURN_PLANNER = True
+
 # ============================================================================
 # Phase 2.5: AUTO-NAVIGATION FOR CROSS-PAGE COMMANDS
 # ============================================================================
@@ -773,29 +793,6 @@ def detect_navigation_intent_llm(
     return None
 
 
-def _validate_tool_args(tool_name: str, args: dict, schema: dict) -> Optional[str]:
-    required = schema.get("required", [])
-    properties = schema.get("properties", {})
-
-    for field in required:
-        if field not in args:
-            return f"Missing required field '{field}' for tool '{tool_name}'"
-
-    for field, value in args.items():
-        expected = properties.get(field, {}).get("type")
-        if not expected:
-            continue
-        if expected == "integer" and not isinstance(value, int):
-            return f"Field '{field}' must be integer"
-        if expected == "string" and not isinstance(value, str):
-            return f"Field '{field}' must be string"
-        if expected == "array" and not isinstance(value, list):
-            return f"Field '{field}' must be array"
-        if expected == "boolean" and not isinstance(value, bool):
-            return f"Field '{field}' must be boolean"
-    return None
-
-
 def generate_conversational_response(
     intent_type: str,
     intent_value: str,
@@ -1089,7 +1086,16 @@ async def voice_converse(request: ConverseRequest, db: Session = Depends(get_db)
     4. Regex action check (instant)
     5. LLM orchestrator (only for complex requests)
     6. Template-based summary (no LLM)
+
+    The conversation context is loaded once per turn and written back once
+    when the turn finishes (see VoiceConversationManager.unit_of_work).
     """
+    with conversation_manager.unit_of_work(request.user_id):
+        return await _voice_converse_turn(request, db)
+
+
+async def _voice_converse_turn(request: ConverseRequest, db: Session) -> ConverseResponse:
+    """Process one conversational turn; see voice_converse."""
     transcript = request.transcript.strip()
     language = request.language or 'en'  # Default to English
 
@@ -1106,6 +1112,18 @@ async def voice_converse(request: ConverseRequest, db: Session = Depends(get_db)
     conv_context = conversation_manager.get_context(request.user_id)
     print(f"🔍 VOICE STATE: user_id={request.user_id}, state={conv_context.state}, transcript='{transcript[:50]}...'")
 
+    # Build page context for smarter decisions (Phase 2: rich context from frontend)
+    page_context = build_page_context(
+        current_page=request.current_page,
+        available_tabs=request.available_tabs,
+        available_buttons=request.available_buttons,
+        active_course_name=request.active_course_name,
+        active_session_name=request.active_session_name,
+        is_session_live=request.is_session_live,
+        copilot_active=request.copilot_active,
+    )
+    turn_plan: Optional[TurnPlan] = None
+
     # --- Handle confirmation state ---
     if conv_context.state == ConversationState.AWAITING_CONFIRMATION:
         # Check if user confirmed or denied
@@ -1268,9 +1286,18 @@ async def voice_converse(request: ConverseRequest, db: Session = Depends(get_db)
     if conv_context.state == ConversationState.AWAITING_FIELD_INPUT:
         current_field = conversation_manager.get_current_field(request.user_id)
         if current_field:
+            # One planner call answers navigation, tab switch and input type together.
+            # Each decision falls back to its own classifier unless the plan is confident.
+            if USE_UNIFIED_TURN_PLANNER:
+                turn_plan = plan_voice_turn(transcript, conv_context, page_context, language, current_field)
+            planned = turn_plan is not None and turn_plan.is_confident()
+
             # FIRST: Check if user wants to navigate away or switch tabs (escape from form)
             # Check for navigation intent
-            nav_path = detect_navigation_intent(transcript, request.context, request.current_page)
+            if planned:
+                nav_path = turn_plan.navigation_target()
+            else:
+                nav_path = detect_navigation_intent(transcript, request.context, request.current_page)
             if nav_path:
                 # User wants to navigate - cancel form and navigate
                 conversation_manager.cancel_form(request.user_id)
@@ -1289,9 +1316,12 @@ async def voice_converse(request: ConverseRequest, db: Session = Depends(get_db)
             # Check for tab switching intent using LLM-based classification
             # Available tabs depend on the page - using common course/session tabs
             available_tabs = ['create', 'manage', 'sessions', 'advanced', 'instructor', 'enrollment']
-            tab_result = classify_tab_switch(transcript, available_tabs, language)
-            if tab_result.element_type == UIElementType.TAB and tab_result.element_name:
-                tab_name = tab_result.element_name
+            if planned:
+                tab_name = turn_plan.tab_target(available_tabs)
+            else:
+                tab_result = classify_tab_switch(transcript, available_tabs, language)
+                tab_name = tab_result.element_name if tab_result.element_type == UIElementType.TAB else None
+            if tab_name:
                 # User wants to switch tabs - cancel form and switch
                 conversation_manager.cancel_form(request.user_id)
 
@@ -1398,12 +1428,14 @@ async def voice_converse(request: ConverseRequest, db: Session = Depends(get_db)
             field_type = current_field.voice_id if hasattr(current_field, 'voice_id') else current_field.name
             workflow_name = conv_context.action if hasattr(conv_context, 'action') else "form_filling"
 
-            input_classification = classify_form_input(
-                user_input=transcript,
-                field_prompt=field_prompt,
-                field_type=field_type,
-                workflow_name=workflow_name
-            )
+            input_classification = turn_plan.to_input_type_result() if planned else None
+            if input_classification is None:
+                input_classification = classify_form_input(
+                    user_input=transcript,
+                    field_prompt=field_prompt,
+                    field_type=field_type,
+                    workflow_name=workflow_name
+                )
 
             import logging
             logger = logging.getLogger(__name__)
@@ -3357,21 +3389,17 @@ async def voice_converse(request: ConverseRequest, db: Session = Depends(get_db)
         # This approach understands user intent regardless of exact phrasing.
         # "I want to go to the course page" works just as well as "go to courses"
 
-        # Build page context for smarter decisions (Phase 2: rich context from frontend)
-        page_context = build_page_context(
-            current_page=request.current_page,
-            available_tabs=request.available_tabs,
-            available_buttons=request.available_buttons,
-            active_course_name=request.active_course_name,
-            active_session_name=request.active_session_name,
-            is_session_live=request.is_session_live,
-            copilot_active=request.copilot_active,
-        )
-
         # Classify intent using LLM (all confirmations go through LLM)
         print(f"🎯 [VOICE] Classifying intent for: '{transcript}'")
         print(f"🎯 [VOICE] Page context: page={request.current_page}, tabs={request.available_tabs}, buttons={request.available_buttons}")
-        intent = classify_intent(transcript, page_context)
+        intent = None
+        if USE_UNIFIED_TURN_PLANNER:
+            # Reuse the plan if a form handler above already made one and fell through
+            if turn_plan is None:
+                turn_plan = plan_voice_turn(transcript, conv_context, page_context, language)
+            intent = turn_plan.to_classified_intent(LLM_INTENT_CONFIDENCE_THRESHOLD)
+        if intent is None:
+            intent = classify_intent(transcript, page_context, language)
         print(f"🎯 [VOICE] LLM classification: category={intent.category}, action={intent.action}, confidence={intent.confidence}")
         print(f"🎯 [VOICE] Parameters: {intent.parameters}")
 
@@ -3457,6 +3485,10 @@ async def voice_converse(request: ConverseRequest, db: Session = Depends(get_db)
                     message = message.rstrip('.!') + f" y abriendo la pestaña {tab_display}."
                 else:
                     message = message.rstrip('.!') + f" and opening the {tab_display} tab."
+            elif intent.voice_response:
+                # The planner already wrote the spoken response in the same call; use it
+                # instead of a second LLM round trip.
+                message = sanitize_speech(intent.voice_response)
             else:
                 message = sanitize_speech(generate_conversational_response('navigate', nav_path, language=language))
 
@@ -3711,6 +3743,65 @@ async def voice_converse(request: ConverseRequest, db: Session = Depends(get_db)
     )
 
 
+@router.post("/converse/stream")
+async def voice_converse_stream(request: ConverseRequest):
+    """
+    Streaming variant of /converse that speaks the response as it is produced.
+
+    Emits SSE events: a ``response`` event with the usual ConverseResponse
+    payload as soon as it is known, ``text``/``audio`` events for each spoken
+    sentence (audio is base64), and a final ``done`` event. Open questions
+    stream LLM tokens straight into TTS, so the first sentence is audible
+    before the full answer has been generated.
+    """
+    async def generator():
+        sink = SpeechSink()
+        events: asyncio.Queue = asyncio.Queue()
+
+        async def run_converse():
+            # The request outlives this handler, so it owns its DB session.
+            db = SessionLocal()
+            token = use_speech_sink(sink)
+            try:
+                response = await voice_converse(request, db)
+                await events.put(format_sse({"type": "response", **response.model_dump()}))
+                if not sink.streamed:
+                    sink.put(response.message)
+            except Exception as e:
+                print(f"❌ [VOICE_STREAM] Converse failed: {e}")
+                await events.put(format_sse({"type": "error", "message": "Voice request failed."}))
+            finally:
+                reset_speech_sink(token)
+                db.close()
+                sink.close()
+
+        async def run_speech():
+            try:
+                async for event in stream_speech(sink.deltas(), get_streaming_tts()):
+                    await events.put(format_sse(event.to_dict()))
+            except Exception as e:
+                print(f"❌ [VOICE_STREAM] Speech streaming failed: {e}")
+
+        async def run_all():
+            await asyncio.gather(run_converse(), run_speech())
+            await events.put(None)
+
+        task = asyncio.create_task(run_all())
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            yield format_sse({"type": "done"})
+        except asyncio.CancelledError:
+            return
+        finally:
+            task.cancel()
+
+    return StreamingResponse(generator(), media_type="text/event-stream")
+
+
 def _parse_ids_from_path(current_page: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
     """Extract course/session IDs from the current URL path."""
     if not current_page:
@@ -3796,6 +3887,10 @@ def _execute_tool(db: Session, tool_name: str, args: Dict[str, Any]) -> Optional
     tool_info = TOOL_REGISTRY.get(tool_name)
     if not tool_info:
         return None
+    try:
+        args = validate_tool_args(tool_name, tool_info, args)
+    except ToolArgumentError as e:
+        return {"error": str(e)}
     handler = tool_info["handler"]
     return invoke_tool_handler(handler, args, db=db)
 
@@ -6185,31 +6280,32 @@ async def execute_action(
 
 
 def execute_plan_steps(steps: List[Dict[str, Any]], db: Session) -> tuple[list[dict], str]:
-    results = []
-    for step in steps:
+    """Run plan steps (independent reads concurrently) and summarize the results in plan order."""
+
+    def is_write(step: Dict[str, Any]) -> bool:
+        tool_entry = TOOL_REGISTRY.get(step.get("tool_name"))
+        return (tool_entry or {}).get("mode", step.get("mode")) == "write"
+
+    def run_step(step: Dict[str, Any], args: Dict[str, Any]) -> Any:
         tool_name = step.get("tool_name")
-        args = step.get("args", {})
         tool_entry = TOOL_REGISTRY.get(tool_name)
         if not tool_entry:
-            normalized = normalize_tool_result({"error": f"Unknown tool: {tool_name}"}, tool_name)
-            results.append({"tool": tool_name, "success": False, **normalized})
-            continue
+            raise ValueError(f"Unknown tool: {tool_name}")
+        args = validate_tool_args(tool_name, tool_entry, args)
+        if is_write(step):
+            # Writes run one at a time, on the request's session
+            return invoke_tool_handler(tool_entry["handler"], args, db=db)
+        return invoke_tool_handler_with_session(tool_entry["handler"], args)
 
-        error = _validate_tool_args(tool_name, args, tool_entry.get("parameters", {}))
-        if error:
-            normalized = normalize_tool_result({"error": error}, tool_name)
+    results = []
+    for step, outcome in zip(steps, run_plan_steps(steps, run_step, is_write)):
+        tool_name = step.get("tool_name")
+        if outcome.error is not None:
+            normalized = normalize_tool_result({"error": outcome.error}, tool_name)
             results.append({"tool": tool_name, "success": False, **normalized})
             continue
-
-        try:
-            normalized = normalize_tool_result(
-                invoke_tool_handler(tool_entry["handler"], args, db=db),
-                tool_name,
-            )
-            results.append({"tool": tool_name, "success": normalized.get("ok", True), **normalized})
-        except Exception as exc:
-            normalized = normalize_tool_result({"error": str(exc)}, tool_name)
-            results.append({"tool": tool_name, "success": False, **normalized})
+        normalized = normalize_tool_result(outcome.output, tool_name)
+        results.append({"tool": tool_name, "success": normalized.get("ok", True), **normalized})
 
     summary = generate_summary(results)
     return results, summary
@@ -6272,6 +6368,32 @@ async def _handle_open_question(question: str, current_page: Optional[str] = Non
         question=question,
     )
 
+    speech_sink = current_speech_sink()
+    if speech_sink is not None and hasattr(llm, "astream"):
+        # Streaming request: forward tokens so TTS starts on the first sentence.
+        try:
+            answer = ""
+            async for chunk in llm.astream(prompt):
+                delta = chunk.content if isinstance(chunk.content, str) else ""
+                delta = delta.replace("*", "").replace("`", "")
+                speech_sink.put(delta)
+                answer += delta
+                # Limit length for TTS
+                if len(answer) > 500:
+                    break
+            if answer.strip():
+                return {
+                    "message": answer.strip(),
+                    "action": "open_question",
+                }
+        except Exception as e:
+            print(f"⚠️ [OPEN_QUESTION] Streaming failed, falling back: {e}")
+            if speech_sink.streamed:
+                return {
+                    "message": answer.strip(),
+                    "action": "open_question",
+                }
+
     try:
         response = invoke_llm_with_metrics(llm, prompt, model_name)
         print(f"✅ [OPEN_QUESTION] LLM response success={response.success}, content_len={len(response.content) if response.content else 0}")
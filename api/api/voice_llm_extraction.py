@@ -16,6 +16,7 @@ Every voice command goes through a single LLM call that extracts:
 import json
 import logging
 from dataclasses import asdict
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
@@ -102,9 +103,20 @@ class UnifiedExtractionResult(BaseModel):
     needs_clarification: bool = False
     clarification_reason: Optional[str] = None
 
+    # Turn planning (only populated when include_turn_plan=True)
+    input_type: Optional[str] = Field(
+        None,
+        description="content, meta, command, confirm, ai_generate, or null"
+    )
+    ai_context: Optional[str] = None
+    voice_response: Optional[str] = None
+
     # Original input preserved
     original_text: str = ""
 
+    # True when the LLM call itself failed (as opposed to an unclear command)
+    extraction_failed: bool = False
+
 
 # ============================================================================
 # UNIFIED VOICE UNDERSTANDING PROMPT
@@ -218,7 +230,7 @@ For navigation intents, extract the target page:
 
 ### 8. Student Name Extraction
 - "select John Smith", "enroll Maria Garcia" → student_name: "John Smith" / "Maria Garcia"
-
+{turn_plan_instructions}
 ## Response Format
 
 Return ONLY valid JSON in this exact structure:
@@ -258,7 +270,7 @@ Return ONLY valid JSON in this exact structure:
     "target_page": "/courses|/sessions|/forum|/console|/reports|/dashboard|null",
 
     "needs_clarification": true|false,
-    "clarification_reason": "reason for clarification or null"
+    "clarification_reason": "reason for clarification or null"{turn_plan_fields}
 }}
 
 IMPORTANT: Return ONLY the JSON object, no explanation or markdown formatting.
@@ -307,6 +319,8 @@ class UnifiedVoiceExtractor:
         active_course: Optional[str],
         active_session: Optional[str],
         language: str,
+        turn_plan_instructions: str = "",
+        turn_plan_fields: str = "",
     ) -> str:
         """Build the unified understanding prompt with all context."""
 
@@ -340,6 +354,8 @@ class UnifiedVoiceExtractor:
             dropdown_options_json=dropdown_options_json,
             form_fields_json=form_fields_json,
             user_input=user_input,
+            turn_plan_instructions=turn_plan_instructions,
+            turn_plan_fields=turn_plan_fields,
         )
 
     def _parse_response(self, response_content: str, original_text: str) -> UnifiedExtractionResult:
@@ -399,6 +415,9 @@ class UnifiedVoiceExtractor:
                 target_page=parsed.get("target_page"),
                 needs_clarification=parsed.get("needs_clarification", False),
                 clarification_reason=parsed.get("clarification_reason"),
+                input_type=parsed.get("input_type"),
+                ai_context=parsed.get("ai_context"),
+                voice_response=parsed.get("voice_response"),
                 original_text=original_text,
             )
 
@@ -415,6 +434,7 @@ class UnifiedVoiceExtractor:
             needs_clarification=True,
             clarification_reason="Could not understand the command. Please try rephrasing.",
             original_text=original_text,
+            extraction_failed=True,
         )
 
     def extract(
@@ -430,6 +450,8 @@ class UnifiedVoiceExtractor:
         active_course: Optional[str] = None,
         active_session: Optional[str] = None,
         language: str = "en",
+        turn_plan_instructions: str = "",
+        turn_plan_fields: str = "",
     ) -> UnifiedExtractionResult:
         """
         Extract all relevant information from voice input using LLM.
@@ -446,6 +468,9 @@ class UnifiedVoiceExtractor:
             active_course: Name of the currently selected course
             active_session: Name of the currently selected session
             language: User's preferred language ("en" or "es")
+            turn_plan_instructions: Extra prompt section appended by the turn
+                planner (see voice_turn_planner.py)
+            turn_plan_fields: Extra JSON response fields requested by the planner
 
         Returns:
             UnifiedExtractionResult with all extracted information
@@ -476,6 +501,8 @@ class UnifiedVoiceExtractor:
             active_course=active_course,
             active_session=active_session,
             language=language,
+            turn_plan_instructions=turn_plan_instructions,
+            turn_plan_fields=turn_plan_fields,
         )
 
         # Single LLM call
@@ -513,47 +540,50 @@ def get_unified_extractor() -> UnifiedVoiceExtractor:
 # UI CONTEXT AGGREGATION
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def aggregate_all_ui_elements() -> Dict[str, Any]:
     """
     Aggregate all UI elements from PAGE_STRUCTURES for LLM context.
 
+    PAGE_STRUCTURES is static, so this is built once per process and the
+    same dict is returned on every call: callers must not mutate it.
+
     Returns a dict with:
     - all_tabs: List of {name, voice_id, page} for all tabs across all pages
     - all_buttons: List of {name, voice_id, page} for all buttons across all pages
     - all_dropdowns: List of voice_ids for all dropdowns
+    - by_page: {page: {tabs, buttons, dropdowns}} for per-page lookups
     """
     from api.services.voice_conversation_state import PAGE_STRUCTURES
 
     all_tabs = []
     all_buttons = []
     all_dropdowns = []
+    by_page = {}
 
     for path, page_structure in PAGE_STRUCTURES.items():
-        # Aggregate tabs
-        for tab in page_structure.tabs:
-            all_tabs.append({
-                "name": tab.name,
-                "voice_id": tab.voice_id,
-                "page": path,
-            })
-
-        # Aggregate buttons
-        for button in page_structure.buttons:
-            all_buttons.append({
-                "name": button.name,
-                "voice_id": button.voice_id,
-                "page": path,
-            })
-
-        # Aggregate dropdowns
-        for dropdown in page_structure.dropdowns:
-            if dropdown.voice_id not in all_dropdowns:
-                all_dropdowns.append(dropdown.voice_id)
+        page_tabs = [
+            {"name": tab.name, "voice_id": tab.voice_id, "page": path}
+            for tab in page_structure.tabs
+        ]
+        page_buttons = [
+            {"name": button.name, "voice_id": button.voice_id, "page": path}
+            for button in page_structure.buttons
+        ]
+        page_dropdowns = [dropdown.voice_id for dropdown in page_structure.dropdowns]
+        by_page[path] = {"tabs": page_tabs, "buttons": page_buttons, "dropdowns": page_dropdowns}
+
+        all_tabs.extend(page_tabs)
+        all_buttons.extend(page_buttons)
+        for voice_id in page_dropdowns:
+            if voice_id not in all_dropdowns:
+                all_dropdowns.append(voice_id)
 
     return {
         "all_tabs": all_tabs,
         "all_buttons": all_buttons,
         "all_dropdowns": all_dropdowns,
+        "by_page": by_page,
     }
 
 
@@ -0,0 +1,417 @@
+"""Single-Call Voice Turn Planner.
+
+A voice turn used to chain several LLM round trips: `classify_form_input`,
+then `classify_intent`, then one of the UI element classifiers, and finally
+`generate_voice_response`. Each call carries its own large prompt, so a
+single utterance could cost 3-4 sequential completions.
+
+The turn planner makes ONE structured call per turn through
+`UnifiedVoiceExtractor`, asking for everything the router needs at once:
+- Intent category and action (using the classifier's action vocabulary)
+- UI target (tab / button / dropdown)
+- Dictation content and form input type
+- The spoken response
+
+The prompt context is driven by the current `ConversationState`: form fields
+while filling a form, dropdown options while awaiting a selection, and the
+current page's tabs/buttons otherwise.
+
+The existing classifiers remain the fallback path. When the planner call
+fails (no LLM, unparseable response) or is not confident enough, callers run
+the legacy classifier for that decision instead.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from api.api.voice_intent_classifier import (
+    ClassifiedIntent,
+    ControlType,
+    CreateType,
+    IntentCategory,
+    IntentParameters,
+    InputType,
+    InputTypeResult,
+    NavigationTarget,
+    PageContext,
+    QueryType,
+    UIActionType,
+    intent_to_legacy_format,
+)
+from api.api.voice_llm_extraction import (
+    UnifiedExtractionResult,
+    UnifiedVoiceExtractor,
+    aggregate_all_ui_elements,
+    get_unified_extractor,
+)
+from api.services.voice_conversation_state import (
+    PAGE_STRUCTURES,
+    ConversationContext,
+    ConversationState,
+    FormField,
+)
+
+logger = logging.getLogger(__name__)
+
+# Minimum planner confidence before the router trusts the planned intent
+# instead of falling back to classify_intent().
+TURN_PLAN_CONFIDENCE_THRESHOLD = 0.5
+
+
+# ============================================================================
+# PROMPT EXTENSIONS
+# ============================================================================
+
+def _render_action_vocabulary() -> str:
+    """Render the allowed intent_action values from the classifier enums.
+
+    Using the same vocabulary as the intent classification prompt keeps the
+    planner output compatible with intent_to_legacy_format().
+    """
+    navigate = [target.name.lower() for target in NavigationTarget]
+    return "\n".join([
+        f"- navigate: {', '.join(navigate)}",
+        f"- ui_action: {', '.join(a.value for a in UIActionType)}",
+        f"- query: {', '.join(q.value for q in QueryType)}",
+        f"- create: {', '.join(c.value for c in CreateType)}",
+        f"- control: {', '.join(c.value for c in ControlType)}",
+        "- confirm: yes, no, cancel, skip",
+        "- dictate: fill_input",
+    ])
+
+
+TURN_PLAN_INSTRUCTIONS = f'''
+### 9. Action Vocabulary (REQUIRED)
+`intent_action` MUST be one of these values for the chosen category:
+{_render_action_vocabulary()}
+
+### 10. Form Input Type (only when Conversation State starts with awaiting_field_input)
+Classify what the user said relative to the field being asked about:
+- `content` - actual value for the field ("Consider All Options" can be a title)
+- `meta` - hesitation or thinking aloud ("let me think", "hmm", "wait")
+- `command` - cancel / skip / help; put the command in dictation.command_type
+- `confirm` - bare yes/no with no content
+- `ai_generate` - asks AI to write the field ("generate it for me"); put any topic in `ai_context`
+Navigation or tab switches away from the form use `navigate` / `ui_action` as usual.
+Outside form filling set `input_type` to null.
+
+### 11. Spoken Response
+Write `voice_response`: one short sentence, in the user's Language ("en" = English,
+"es" = Spanish), confirming what will happen (e.g. "Taking you to sessions.").
+It will be read aloud, so no markdown, lists or emoji.
+'''
+
+TURN_PLAN_FIELDS = ''',
+
+    "input_type": "content|meta|command|confirm|ai_generate|null",
+    "ai_context": "topic for AI generation or null",
+    "voice_response": "short spoken confirmation in the user's language"'''
+
+
+# ============================================================================
+# TURN PLAN RESULT
+# ============================================================================
+
+class TurnPlan(BaseModel):
+    """Everything the router needs for one voice turn, from a single LLM call."""
+
+    extraction: UnifiedExtractionResult
+    conversation_state: str = ConversationState.IDLE.value
+    latency_seconds: float = Field(0.0, description="Wall time of the planner call")
+
+    @property
+    def succeeded(self) -> bool:
+        """False when the LLM call failed and callers should use fallbacks."""
+        return not self.extraction.extraction_failed
+
+    def is_confident(self, min_confidence: float = TURN_PLAN_CONFIDENCE_THRESHOLD) -> bool:
+        """True when the router should trust the plan's decisions, including "none of these"."""
+        return self.succeeded and self.extraction.confidence >= min_confidence
+
+    @property
+    def voice_response(self) -> Optional[str]:
+        return self.extraction.voice_response or None
+
+    def _category(self) -> IntentCategory:
+        try:
+            return IntentCategory(self.extraction.intent_category)
+        except ValueError:
+            return IntentCategory.UNCLEAR
+
+    def _tab_name(self) -> Optional[str]:
+        target = self.extraction.ui_target
+        if not target or target.element_type != "tab":
+            return None
+        name = target.element_name or target.voice_id
+        if not name:
+            return None
+        name = name.strip().lower()
+        return name[len("tab-"):] if name.startswith("tab-") else name
+
+    def to_classified_intent(
+        self,
+        min_confidence: float = TURN_PLAN_CONFIDENCE_THRESHOLD,
+    ) -> Optional[ClassifiedIntent]:
+        """Convert the plan to a ClassifiedIntent.
+
+        Returns None when the call failed or confidence is below
+        ``min_confidence``, signalling that classify_intent() should run.
+        """
+        if not self.succeeded:
+            return None
+        extraction = self.extraction
+        if extraction.confidence < min_confidence:
+            return None
+
+        category = self._category()
+        action = extraction.intent_action or "unknown"
+        if category == IntentCategory.CONFIRM and extraction.confirmation_type:
+            action = extraction.confirmation_type
+
+        params: Dict[str, Any] = {
+            "target_page": extraction.target_page,
+            "student_name": extraction.student_name,
+            "tab_name": self._tab_name(),
+        }
+
+        target = extraction.ui_target
+        if target and target.element_type == "button":
+            params["button_name"] = target.voice_id or target.element_name
+        elif target and target.element_type == "dropdown":
+            params["dropdown_target"] = target.voice_id or target.element_name
+
+        selection = extraction.selection
+        if selection and selection.selection_type != "none":
+            params["selection_index"] = selection.ordinal_index
+            params["selection_value"] = selection.matched_name
+
+        dictation = extraction.dictation
+        if dictation and dictation.has_content:
+            params["input_field"] = dictation.field_name
+            params["input_value"] = dictation.content
+
+        return ClassifiedIntent(
+            category=category,
+            action=action,
+            parameters=IntentParameters(**params),
+            confidence=extraction.confidence,
+            clarification_needed=extraction.needs_clarification,
+            clarification_message=extraction.clarification_reason,
+            original_text=extraction.original_text,
+            voice_response=self.voice_response,
+        )
+
+    def navigation_target(self) -> Optional[str]:
+        """Page path if this turn is a navigation, using the legacy normalization."""
+        if not self.succeeded or self._category() != IntentCategory.NAVIGATE:
+            return None
+        intent = self.to_classified_intent()
+        if not intent:
+            return None
+        legacy = intent_to_legacy_format(intent)
+        if legacy["type"] != "navigate":
+            return None
+        return legacy["value"]
+
+    def tab_target(self, available_tabs: Optional[List[str]] = None) -> Optional[str]:
+        """Tab name if this turn is a tab switch (restricted to ``available_tabs``)."""
+        if not self.is_confident() or self._category() != IntentCategory.UI_ACTION:
+            return None
+        tab_name = self._tab_name()
+        if tab_name and available_tabs is not None and tab_name not in available_tabs:
+            return None
+        return tab_name
+
+    def to_input_type_result(self) -> Optional[InputTypeResult]:
+        """Form input classification, or None if the planner did not provide one."""
+        if not self.succeeded or not self.extraction.input_type:
+            return None
+        try:
+            input_type = InputType(self.extraction.input_type)
+        except ValueError:
+            return None
+
+        extraction = self.extraction
+        command = None
+        confirm_value = None
+        if input_type == InputType.COMMAND:
+            dictation = extraction.dictation
+            command = (dictation.command_type if dictation else None) or extraction.confirmation_type
+        elif input_type == InputType.CONFIRM:
+            confirm_value = extraction.confirmation_type
+            if confirm_value in ("skip", "cancel"):
+                input_type = InputType.COMMAND
+                command, confirm_value = confirm_value, None
+
+        return InputTypeResult(
+            input_type=input_type,
+            confidence=extraction.confidence,
+            command=command,
+            confirm_value=confirm_value,
+            ai_context=extraction.ai_context,
+            reason="turn planner",
+        )
+
+
+# ============================================================================
+# TURN PLANNER
+# ============================================================================
+
+def _base_path(path: Optional[str]) -> str:
+    return "/" + path.strip("/").split("/")[0] if path else "/dashboard"
+
+
+class VoiceTurnPlanner:
+    """Plans a voice turn with one UnifiedVoiceExtractor call."""
+
+    def __init__(self, extractor: Optional[UnifiedVoiceExtractor] = None):
+        self._extractor = extractor
+
+    @property
+    def extractor(self) -> UnifiedVoiceExtractor:
+        if self._extractor is None:
+            self._extractor = get_unified_extractor()
+        return self._extractor
+
+    def _page_elements(
+        self,
+        current_page: Optional[str],
+        page_context: Optional[PageContext],
+    ) -> Dict[str, Any]:
+        """Tabs, buttons and dropdowns for the current page only."""
+        page = _base_path(current_page)
+        # Copies: the aggregated elements are shared across turns
+        elements = aggregate_all_ui_elements()["by_page"].get(page, {})
+        tabs = list(elements.get("tabs", []))
+        buttons = list(elements.get("buttons", []))
+        dropdowns = list(elements.get("dropdowns", []))
+
+        # Frontend-reported elements may include dynamic ones not in the registry
+        if page_context:
+            known_tabs = {t["name"].lower() for t in tabs} | {t["voice_id"] for t in tabs}
+            for tab in page_context.available_tabs or []:
+                if tab.lower() not in known_tabs and f"tab-{tab}" not in known_tabs:
+                    tabs.append({"name": tab, "voice_id": f"tab-{tab}", "page": page})
+            known_buttons = {b["voice_id"] for b in buttons}
+            for button in page_context.available_buttons or []:
+                if button not in known_buttons:
+                    buttons.append({"name": button, "voice_id": button, "page": page})
+
+        return {"tabs": tabs, "buttons": buttons, "dropdowns": dropdowns}
+
+    @staticmethod
+    def _form_fields(conv_context: ConversationContext) -> Optional[List[str]]:
+        structure = PAGE_STRUCTURES.get(_base_path(conv_context.current_page))
+        if not structure or not conv_context.active_form:
+            return None
+        fields = structure.forms.get(conv_context.active_form) or []
+        return [f.voice_id for f in fields] or None
+
+    @staticmethod
+    def _describe_state(
+        conv_context: ConversationContext,
+        current_field: Optional[FormField],
+    ) -> str:
+        state = conv_context.state.value
+        if conv_context.state == ConversationState.AWAITING_FIELD_INPUT and current_field:
+            return (
+                f"{state} (form: {conv_context.active_form}, field: {current_field.voice_id}, "
+                f"question asked: \"{current_field.prompt}\")"
+            )
+        if conv_context.state == ConversationState.AWAITING_DROPDOWN_SELECTION and conv_context.active_dropdown:
+            return f"{state} (dropdown: {conv_context.active_dropdown})"
+        return state
+
+    def plan(
+        self,
+        transcript: str,
+        conv_context: ConversationContext,
+        page_context: Optional[PageContext] = None,
+        language: str = "en",
+        current_field: Optional[FormField] = None,
+    ) -> TurnPlan:
+        """
+        Plan a voice turn with a single structured LLM call.
+
+        Args:
+            transcript: The user's utterance
+            conv_context: Current conversation context (drives what is sent)
+            page_context: Frontend-reported page state, if available
+            language: Response language ('en' or 'es')
+            current_field: Field being filled when awaiting field input
+
+        Returns:
+            TurnPlan; check ``succeeded`` before trusting it
+        """
+        current_page = (page_context.current_page if page_context else None) or conv_context.current_page
+        elements = self._page_elements(current_page, page_context)
+
+        dropdown_options = None
+        if conv_context.state == ConversationState.AWAITING_DROPDOWN_SELECTION:
+            dropdown_options = [
+                {"label": opt.label, "value": opt.value} for opt in conv_context.dropdown_options
+            ]
+
+        form_fields = None
+        if conv_context.state == ConversationState.AWAITING_FIELD_INPUT:
+            form_fields = self._form_fields(conv_context)
+
+        active_course = (page_context.active_course_name if page_context else None) or conv_context.active_course_name
+        active_session = (page_context.active_session_name if page_context else None) or conv_context.active_session_name
+
+        start = time.time()
+        extraction = self.extractor.extract(
+            user_input=transcript,
+            current_page=current_page,
+            conversation_state=self._describe_state(conv_context, current_field),
+            all_tabs=elements["tabs"],
+            all_buttons=elements["buttons"],
+            all_dropdowns=elements["dropdowns"],
+            dropdown_options=dropdown_options,
+            form_fields=form_fields,
+            active_course=active_course,
+            active_session=active_session,
+            language=language,
+            turn_plan_instructions=TURN_PLAN_INSTRUCTIONS,
+            turn_plan_fields=TURN_PLAN_FIELDS,
+        )
+        plan = TurnPlan(
+            extraction=extraction,
+            conversation_state=conv_context.state.value,
+            latency_seconds=round(time.time() - start, 3),
+        )
+        logger.info(
+            f"[TurnPlanner] state={plan.conversation_state} category={extraction.intent_category} "
+            f"action={extraction.intent_action} input_type={extraction.input_type} "
+            f"confidence={extraction.confidence} succeeded={plan.succeeded} latency={plan.latency_seconds}s"
+        )
+        return plan
+
+
+# ============================================================================
+# SINGLETON ACCESSOR
+# ============================================================================
+
+_planner: Optional[VoiceTurnPlanner] = None
+
+
+def get_turn_planner() -> VoiceTurnPlanner:
+    """Get or create the singleton VoiceTurnPlanner instance."""
+    global _planner
+    if _planner is None:
+        _planner = VoiceTurnPlanner()
+    return _planner
+
+
+def plan_voice_turn(
+    transcript: str,
+    conv_context: ConversationContext,
+    page_context: Optional[PageContext] = None,
+    language: str = "en",
+    current_field: Optional[FormField] = None,
+) -> TurnPlan:
+    """Convenience wrapper around get_turn_planner().plan()."""
+    return get_turn_planner().plan(transcript, conv_context, page_context, language, current_field)
@@ -10,12 +10,14 @@ This module provides the v2 voice API endpoints using the new architecture:
 Endpoints:
 - POST /voice/v2/process - Process a voice command
 - POST /voice/v2/ui-state - Receive UI state from frontend
+- POST /voice/v2/ui-state/diff - Receive incremental UI state changes
 - GET /voice/v2/tools - Get available voice tools
 """
 
 import logging
 from typing import Any, Dict, List, Optional
 
+import redis
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -31,6 +33,11 @@ from api.services.voice_processor import (
     DropdownState,
     DropdownOptionState,
 )
+from api.services.ui_state_store import (
+    StaleUiStateError,
+    UiStateDiff,
+    get_ui_state_store,
+)
 from api.services.voice_agent_tools import (
     get_voice_tools,
     execute_voice_tool,
@@ -76,6 +83,21 @@ class UiStateRequest(BaseModel):
     """Request to update UI state."""
     user_id: int
     ui_state: UiState
+    version: Optional[int] = Field(None, description="Client-side snapshot version, must increase")
+
+
+class UiStateDiffRequest(BaseModel):
+    """Request to update UI state with only the elements that changed."""
+    user_id: int
+    base_version: int = Field(..., description="Version the diff was computed against")
+    version: Optional[int] = Field(None, description="Version of the resulting snapshot")
+    diff: UiStateDiff
+
+
+class UiStateUpdateResponse(BaseModel):
+    """Result of a UI state update."""
+    status: str
+    version: int
 
 
 class ToolExecuteRequest(BaseModel):
@@ -97,19 +119,18 @@ class ToolExecuteResponse(BaseModel):
 # UI STATE CACHE
 # ============================================================================
 
-# Simple in-memory cache for UI state per user
-# In production, this should use Redis or similar
-_ui_state_cache: Dict[int, UiState] = {}
-
+# UI state is shared across API workers through Redis (see UiStateStore), so
+# /ui-state updates and /process reads may land on different processes.
 
 def get_cached_ui_state(user_id: int) -> Optional[UiState]:
     """Get cached UI state for a user."""
-    return _ui_state_cache.get(user_id)
+    snapshot = get_ui_state_store().get(user_id)
+    return snapshot.state if snapshot else None
 
 
-def set_cached_ui_state(user_id: int, ui_state: UiState) -> None:
-    """Cache UI state for a user."""
-    _ui_state_cache[user_id] = ui_state
+def set_cached_ui_state(user_id: int, ui_state: UiState, version: Optional[int] = None) -> int:
+    """Cache UI state for a user and return the stored version."""
+    return get_ui_state_store().set(user_id, ui_state, version=version).version
 
 
 # ============================================================================
@@ -159,18 +180,45 @@ async def process_voice_command(
     )
 
 
-@router.post("/ui-state")
-async def update_ui_state(request: UiStateRequest) -> Dict[str, str]:
+@router.post("/ui-state", response_model=UiStateUpdateResponse)
+async def update_ui_state(request: UiStateRequest) -> UiStateUpdateResponse:
     """
     Receive UI state from frontend.
 
     The frontend should call this endpoint periodically or on significant
     UI changes to keep the backend informed of the current UI state.
-    This enables smarter voice command processing.
+    This enables smarter voice command processing. Snapshots carrying a
+    version that is not newer than the stored one are rejected with 409.
+    """
+    try:
+        version = set_cached_ui_state(request.user_id, request.ui_state, request.version)
+    except StaleUiStateError as exc:
+        raise HTTPException(status_code=409, detail={"message": str(exc), "version": exc.current_version})
+    except redis.RedisError as exc:
+        logger.error(f"Failed to store UI state for user {request.user_id}: {exc}")
+        raise HTTPException(status_code=503, detail="UI state store unavailable")
+    logger.debug(f"Updated UI state for user {request.user_id}: {request.ui_state.route} (v{version})")
+    return UiStateUpdateResponse(status="ok", version=version)
+
+
+@router.post("/ui-state/diff", response_model=UiStateUpdateResponse)
+async def update_ui_state_diff(request: UiStateDiffRequest) -> UiStateUpdateResponse:
+    """
+    Apply changed tabs, buttons, inputs and dropdowns to the stored UI state.
+
+    Returns 409 with the stored version when the diff was not computed against
+    it; the frontend should then send a full snapshot to /ui-state.
     """
-    set_cached_ui_state(request.user_id, request.ui_state)
-    logger.debug(f"Updated UI state for user {request.user_id}: {request.ui_state.route}")
-    return {"status": "ok"}
+    store = get_ui_state_store()
+    try:
+        snapshot = store.apply_diff(request.user_id, request.diff, request.base_version, request.version)
+    except StaleUiStateError as exc:
+        raise HTTPException(status_code=409, detail={"message": str(exc), "version": exc.current_version})
+    except redis.RedisError as exc:
+        logger.error(f"Failed to update UI state for user {request.user_id}: {exc}")
+        raise HTTPException(status_code=503, detail="UI state store unavailable")
+    logger.debug(f"Applied UI state diff for user {request.user_id}: v{request.base_version} -> v{snapshot.version}")
+    return UiStateUpdateResponse(status="ok", version=snapshot.version)
 
 
 @router.get("/ui-state/{user_id}")
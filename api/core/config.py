@@ -26,6 +26,24 @@ class Settings(BaseSettings):
     aws_region: str = "us-east-1"
     aws_s3_max_file_size_mb: int = 100
 
+    # Document text extraction (runs in a process pool)
+    document_extraction_workers: int = 2
+    document_extraction_max_pages: int = 500
+    document_extraction_timeout_seconds: float = 60.0
+    document_extraction_max_memory_mb: int = 1024
+    document_extraction_cache_ttl_seconds: int = 7 * 24 * 3600
+
+    # MCP tool execution (shared by the stdio server, HTTP /execute and /api/mcp/execute)
+    mcp_tool_max_workers: int = 16
+    mcp_tool_max_per_tool: int = 8
+    mcp_tool_timeout_seconds: float = 20.0
+    mcp_tool_queue_timeout_seconds: float = 10.0
+
+    # Fuzzy name resolution for resolve_course / resolve_session / resolve_user
+    resolve_index_max_rows: int = 20000  # Larger scopes are searched with pg_trgm instead of in memory
+    resolve_index_max_age_seconds: float = 300.0  # Rebuild even without an invalidation (e.g. Redis down)
+    resolve_min_confidence: float = 0.35
+
     # Syllabus Tool
     syllabus_tool_url: str = "http://syllabus-tool:8002"
 
@@ -41,6 +59,9 @@ class Settings(BaseSettings):
     voice_rate_limit_per_min: int = 10
     voice_brand_denylist: str = "ElevenLabs,Eleven Labs,11lab,11labs,OpenAI,Google,Amazon,Microsoft,Anthropic"
     voice_brand_allowlist: str = ""
+    voice_tool_retrieval_enabled: bool = True  # False renders every MCP tool into the planner prompt
+    voice_tool_top_k: int = 12
+    voice_tool_min_score: float = 1.0  # Below this BM25 score (or without a name/two-word match) the full tool catalog is used
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
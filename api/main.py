@@ -67,5 +67,33 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/health/queues", tags=["health"])
+def queue_health():
+    """Celery backlog per queue, for autoscaling and alerting."""
+    from worker.celery_app import queue_depths
+
+    try:
+        return {"status": "ok", "queues": queue_depths()}
+    except Exception:
+        return {"status": "error", "queues": {}}
+
+
+@app.get("/health/tools", tags=["health"])
+def tool_executor_health():
+    """MCP tool executor load, tool cache hit rates, argument validation timing and registry import cost."""
+    from api.api.mcp_executor import get_tool_executor
+    from api.services.tool_cache import get_tool_cache
+    from api.services.tool_validation import validation_stats
+    from mcp_server.server import registry_stats
+
+    return {
+        "status": "ok",
+        **get_tool_executor().stats(),
+        "cache": get_tool_cache().stats(),
+        "validation": validation_stats(),
+        "registry": registry_stats(),
+    }
+
+
 # Include API routes
 app.include_router(api_router, prefix="/api")
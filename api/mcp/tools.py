@@ -148,9 +148,10 @@ def generate_session_plan(db: Session, course_id: int) -> dict:
     course = db.query(Course).filter(Course.id == course_id).first()
     if not course:
         return {"error": "Course not found"}
+    from worker.dedup import plans_fingerprint, submit_deduplicated
     from worker.tasks import generate_plans_task
-    task = generate_plans_task.delay(course_id)
-    return {"task_id": task.id, "status": "queued", "course_id": course_id}
+    submission = submit_deduplicated(generate_plans_task, (course_id,), plans_fingerprint(db, course_id))
+    return {"task_id": submission.task_id, "status": submission.status, "course_id": course_id}
 
 
 def post_case(db: Session, session_id: int, prompt: str) -> dict:
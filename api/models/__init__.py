@@ -9,7 +9,7 @@ from api.models.report import Report
 from api.models.enrollment import Enrollment
 from api.models.voice_audit import VoiceAudit
 from api.models.ui_action_run import UIActionRun, ActionRunStatus, ActionRiskTier
-from api.models.course_material import CourseMaterial
+from api.models.course_material import CourseMaterial, MaterialBlob
 from api.models.engagement import (
     StudentEngagement,
     EngagementLevel,
@@ -48,6 +48,7 @@ __all__ = [
     "ActionRunStatus",
     "ActionRiskTier",
     "CourseMaterial",
+    "MaterialBlob",
     # New engagement models
     "StudentEngagement",
     "EngagementLevel",
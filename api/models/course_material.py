@@ -6,6 +6,23 @@ from sqlalchemy.sql import func
 from api.core.database import Base
 
 
+class MaterialBlob(Base):
+    """
+    A stored file, addressed by the SHA-256 of its content.
+    Many CourseMaterial rows can share one blob; the S3 object is deleted
+    when the last of them is.
+    """
+    __tablename__ = "material_blobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), nullable=False, unique=True, index=True)
+    s3_key = Column(String(1000), nullable=False, unique=True)
+    file_size = Column(BigInteger, nullable=False)
+    content_type = Column(String(255), nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class CourseMaterial(Base):
     """
     Represents an uploaded file/material for a course.
@@ -19,9 +36,10 @@ class CourseMaterial(Base):
 
     # File metadata
     filename = Column(String(500), nullable=False)  # Original filename
-    s3_key = Column(String(1000), nullable=False, unique=True)  # S3 object key
+    s3_key = Column(String(1000), nullable=False, index=True)  # S3 object key (shared when deduplicated)
     file_size = Column(BigInteger, nullable=False)  # Size in bytes
     content_type = Column(String(255), nullable=False)  # MIME type
+    blob_id = Column(Integer, ForeignKey("material_blobs.id", ondelete="RESTRICT"), nullable=True, index=True)
 
     # User-facing metadata
     title = Column(String(500), nullable=True)  # Optional display title
@@ -40,4 +58,5 @@ class CourseMaterial(Base):
     course = relationship("Course", back_populates="materials")
     session = relationship("Session", back_populates="materials")
     uploader = relationship("User", foreign_keys=[uploaded_by])
+    blob = relationship("MaterialBlob")
     replaced_by = relationship("CourseMaterial", remote_side=[id], foreign_keys=[replaced_material_id])
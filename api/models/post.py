@@ -15,6 +15,7 @@ class Post(Base):
     labels_json = Column(JSON, nullable=True)  # e.g., ["high-quality", "needs-clarification"]
     pinned = Column(Boolean, default=False, nullable=False)  # Instructor can pin important posts
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     session = relationship("Session", back_populates="posts")
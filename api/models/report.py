@@ -32,5 +32,10 @@ class Report(Base):
     retry_count = Column(Integer, default=0)
     used_fallback = Column(Integer, default=0)  # 0=LLM used, 1=fallback used
 
+    # Incremental regeneration: fingerprint of all workflow inputs, and per-node
+    # {"fingerprint", "output", "model_name"} for nodes whose LLM call succeeded
+    input_fingerprint = Column(String(64), nullable=True)
+    node_cache_json = Column(JSON, nullable=True)
+
     # Relationships
     session = relationship("Session", back_populates="reports")
@@ -1,7 +1,8 @@
 """Preview builders for planned write actions."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 
@@ -56,6 +57,10 @@ def build_action_preview(
             "course_id": args.get("course_id"),
             "args": args,
         }
+    if tool_name in ("pin_posts", "label_posts"):
+        return _batch_posts_preview(tool_name, args, db)
+    if tool_name == "enroll_students_by_email":
+        return _enroll_by_email_preview(tool_name, args, db)
     if tool_name == "navigate_to_page":
         return {
             "tool_name": tool_name,
@@ -64,3 +69,65 @@ def build_action_preview(
             "args": args,
         }
     return {"tool_name": tool_name, "affected": {"items": 1}, "args": args}
+
+
+def _batch_posts_preview(tool_name: str, args: Dict[str, Any], db: Optional[Session]) -> Dict[str, Any]:
+    """One preview for the whole batch; with a db, count only posts that exist."""
+    post_ids = list(dict.fromkeys(args.get("post_ids") or []))
+    missing: List[int] = []
+    if db is not None and post_ids:
+        from api.models.post import Post
+
+        found = {row.id for row in db.query(Post.id).filter(Post.id.in_(post_ids)).all()}
+        missing = [post_id for post_id in post_ids if post_id not in found]
+    preview = {
+        "tool_name": tool_name,
+        "affected": {"posts": len(post_ids) - len(missing)},
+        "post_ids": post_ids,
+        "missing_post_ids": missing,
+        "args": args,
+    }
+    if tool_name == "pin_posts":
+        preview["pinned"] = args.get("pinned", True)
+    else:
+        preview["labels"] = args.get("labels", [])
+        preview["mode"] = args.get("mode", "add")
+    return preview
+
+
+def _enroll_by_email_preview(tool_name: str, args: Dict[str, Any], db: Optional[Session]) -> Dict[str, Any]:
+    """With a db, split the emails into new, already enrolled and without an account."""
+    emails = list(dict.fromkeys(e.strip().lower() for e in args.get("emails") or [] if e and "@" in e))
+    preview: Dict[str, Any] = {
+        "tool_name": tool_name,
+        "affected": {"enrollments": len(emails)},
+        "course_id": args.get("course_id"),
+        "args": args,
+    }
+    if db is None or not emails:
+        return preview
+
+    from api.models.enrollment import Enrollment
+    from api.models.user import User
+
+    # Case-insensitive; every account with the email (one per auth provider) is enrolled
+    users = db.query(User.id, User.email).filter(func.lower(User.email).in_(emails)).all()
+    user_ids_by_email: Dict[str, List[int]] = {}
+    for user in users:
+        user_ids_by_email.setdefault(user.email.lower(), []).append(user.id)
+    enrolled = set()
+    if users:
+        rows = db.query(Enrollment.user_id).filter(
+            Enrollment.course_id == args.get("course_id"),
+            Enrollment.user_id.in_([user.id for user in users]),
+        ).all()
+        enrolled = {row.user_id for row in rows}
+    to_enroll = {
+        user_id for e in emails for user_id in user_ids_by_email.get(e, []) if user_id not in enrolled
+    }
+    preview["affected"] = {"enrollments": len(to_enroll)}
+    preview["already_enrolled_emails"] = [
+        e for e in emails if e in user_ids_by_email and enrolled.issuperset(user_ids_by_email[e])
+    ]
+    preview["not_found_emails"] = [e for e in emails if e not in user_ids_by_email]
+    return preview
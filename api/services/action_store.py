@@ -37,7 +37,17 @@ class ActionStore:
         self._ttl_seconds = ttl_seconds
 
     def _key(self, action_id: str) -> str:
-        return f"mcp:action:{action_id}"
+        return f"mcp:action:h:{action_id}"
+
+    @staticmethod
+    def _encode_fields(values: Dict[str, Any]) -> Dict[str, str]:
+        return {key: json.dumps(value) for key, value in values.items()}
+
+    @staticmethod
+    def _decode_record(data: Optional[Dict[str, str]]) -> Optional[ActionRecord]:
+        if not data:
+            return None
+        return ActionRecord(**{key: json.loads(value) for key, value in data.items()})
 
     def create_action(
         self,
@@ -59,26 +69,37 @@ class ActionStore:
             expires_at=expires_at,
             status="planned",
         )
-        self._client.set(self._key(action_id), json.dumps(record.__dict__), ex=self._ttl_seconds)
+        pipe = self._client.pipeline()
+        pipe.hset(self._key(action_id), mapping=self._encode_fields(record.__dict__))
+        pipe.expire(self._key(action_id), self._ttl_seconds)
+        pipe.execute()
         return record
 
+    def _claim_key(self, action_id: str) -> str:
+        return f"mcp:action:claim:{action_id}"
+
+    def claim_action(self, action_id: str) -> bool:
+        """Atomically reserve an action for execution; False if it was already claimed."""
+        return bool(self._client.set(self._claim_key(action_id), "1", nx=True, ex=self._ttl_seconds))
+
     def get_action(self, action_id: str) -> Optional[ActionRecord]:
-        data = self._client.get(self._key(action_id))
-        if not data:
-            return None
-        payload = json.loads(data)
-        return ActionRecord(**payload)
+        return self._decode_record(self._client.hgetall(self._key(action_id)))
 
     def update_action(self, action_id: str, **updates: Any) -> Optional[ActionRecord]:
-        record = self.get_action(action_id)
-        if not record:
+        """Write only the updated fields; the key keeps its original TTL."""
+        if not updates:
+            return self.get_action(action_id)
+        key = self._key(action_id)
+        pipe = self._client.pipeline()
+        pipe.exists(key)
+        pipe.hset(key, mapping=self._encode_fields(updates))
+        pipe.hgetall(key)
+        existed, _, data = pipe.execute()
+        if not existed:
+            # HSET recreated an expired action without a TTL; drop it again.
+            self._client.delete(key)
             return None
-        for key, value in updates.items():
-            setattr(record, key, value)
-        ttl = self._client.ttl(self._key(action_id))
-        ttl = ttl if ttl and ttl > 0 else self._ttl_seconds
-        self._client.set(self._key(action_id), json.dumps(record.__dict__), ex=ttl)
-        return record
+        return self._decode_record(data)
 
     def delete_action(self, action_id: str) -> None:
         self._client.delete(self._key(action_id))
@@ -19,6 +19,9 @@ class ContextStore:
     - Last action for undo capability
     - Action history for context
     - Current page for context-aware responses
+
+    The context is a Redis hash with one JSON-encoded value per field, so
+    updates write only the fields that changed; history is a capped list.
     """
 
     MAX_ACTION_HISTORY = 10  # Keep last 10 actions for undo
@@ -32,26 +35,43 @@ class ContextStore:
 
     def _key(self, user_id: Optional[int]) -> str:
         key_suffix = str(user_id) if user_id is not None else "anon"
-        return f"mcp:context:{key_suffix}"
+        return f"mcp:context:h:{key_suffix}"
 
     def _action_history_key(self, user_id: Optional[int]) -> str:
         key_suffix = str(user_id) if user_id is not None else "anon"
-        return f"mcp:action_history:{key_suffix}"
+        return f"mcp:action_history:l:{key_suffix}"
+
+    @staticmethod
+    def _encode_fields(values: Dict[str, Any]) -> Dict[str, str]:
+        return {key: json.dumps(value) for key, value in values.items()}
+
+    @staticmethod
+    def _decode_fields(data: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        return {key: json.loads(value) for key, value in (data or {}).items()}
 
     def get_context(self, user_id: Optional[int]) -> Dict[str, Any]:
-        data = self._client.get(self._key(user_id))
-        if not data:
-            return {}
-        return json.loads(data)
+        return self._decode_fields(self._client.hgetall(self._key(user_id)))
 
     def set_context(self, user_id: Optional[int], context: Dict[str, Any]) -> Dict[str, Any]:
-        self._client.set(self._key(user_id), json.dumps(context), ex=self._ttl_seconds)
+        key = self._key(user_id)
+        pipe = self._client.pipeline()
+        pipe.delete(key)
+        if context:
+            pipe.hset(key, mapping=self._encode_fields(context))
+            pipe.expire(key, self._ttl_seconds)
+        pipe.execute()
         return context
 
     def update_context(self, user_id: Optional[int], **updates: Any) -> Dict[str, Any]:
-        context = self.get_context(user_id)
-        context.update({k: v for k, v in updates.items() if v is not None})
-        return self.set_context(user_id, context)
+        """Write only the changed fields and return the full context, in one round trip."""
+        key = self._key(user_id)
+        changes = {k: v for k, v in updates.items() if v is not None}
+        pipe = self._client.pipeline()
+        if changes:
+            pipe.hset(key, mapping=self._encode_fields(changes))
+            pipe.expire(key, self._ttl_seconds)
+        pipe.hgetall(key)
+        return self._decode_fields(pipe.execute()[-1])
 
     def clear_context(self, user_id: Optional[int]) -> Dict[str, Any]:
         """Clear user context."""
@@ -86,38 +106,26 @@ class ContextStore:
             "undone": False,
         }
 
-        # Get current history
-        history = self.get_action_history(user_id)
-
-        # Add new action at the beginning
-        history.insert(0, action_entry)
-
-        # Trim to max size
-        history = history[:self.MAX_ACTION_HISTORY]
-
-        # Save
-        self._client.set(
-            self._action_history_key(user_id),
-            json.dumps(history),
-            ex=self._ttl_seconds
-        )
-
-        # Also update context with last action
-        self.update_context(
-            user_id,
-            last_action_type=action_type,
-            last_action_time=action_entry["timestamp"],
-        )
+        # Push, trim, and update the context's last action in one round trip
+        history_key = self._action_history_key(user_id)
+        context_key = self._key(user_id)
+        pipe = self._client.pipeline()
+        pipe.lpush(history_key, json.dumps(action_entry))
+        pipe.ltrim(history_key, 0, self.MAX_ACTION_HISTORY - 1)
+        pipe.expire(history_key, self._ttl_seconds)
+        pipe.hset(context_key, mapping=self._encode_fields({
+            "last_action_type": action_type,
+            "last_action_time": action_entry["timestamp"],
+        }))
+        pipe.expire(context_key, self._ttl_seconds)
+        pipe.execute()
 
         return action_entry
 
     def get_action_history(self, user_id: Optional[int], limit: int = 5) -> List[Dict[str, Any]]:
         """Get recent action history."""
-        data = self._client.get(self._action_history_key(user_id))
-        if not data:
-            return []
-        history = json.loads(data)
-        return history[:limit]
+        entries = self._client.lrange(self._action_history_key(user_id), 0, limit - 1)
+        return [json.loads(entry) for entry in entries]
 
     def get_last_undoable_action(self, user_id: Optional[int]) -> Optional[Dict[str, Any]]:
         """Get the most recent action that can be undone."""
@@ -128,18 +136,29 @@ class ContextStore:
         return None
 
     def mark_action_undone(self, user_id: Optional[int], timestamp: float) -> bool:
-        """Mark an action as undone."""
-        history = self.get_action_history(user_id, limit=self.MAX_ACTION_HISTORY)
-        for action in history:
-            if action.get("timestamp") == timestamp:
-                action["undone"] = True
-                self._client.set(
-                    self._action_history_key(user_id),
-                    json.dumps(history),
-                    ex=self._ttl_seconds
-                )
-                return True
-        return False
+        """Mark an action as undone.
+
+        Finds the entry and rewrites it under WATCH, so an action recorded
+        in between (which shifts every index) retries instead of
+        overwriting the wrong entry.
+        """
+        history_key = self._action_history_key(user_id)
+        marked: Dict[str, bool] = {"found": False}
+
+        def transaction(pipe) -> None:
+            entries = pipe.lrange(history_key, 0, self.MAX_ACTION_HISTORY - 1)
+            pipe.multi()
+            marked["found"] = False
+            for index, entry in enumerate(entries):
+                action = json.loads(entry)
+                if action.get("timestamp") == timestamp:
+                    action["undone"] = True
+                    pipe.lset(history_key, index, json.dumps(action))
+                    marked["found"] = True
+                    return
+
+        self._client.transaction(transaction, history_key)
+        return marked["found"]
 
     # === Context-Aware Helpers ===
 
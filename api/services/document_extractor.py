@@ -1,8 +1,19 @@
 """Document text extraction service for syllabus and other uploads."""
 
+import asyncio
+import hashlib
 import io
 import logging
-from typing import Optional, Tuple
+import multiprocessing
+import threading
+from concurrent import futures
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+import redis
+
+from api.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -127,29 +138,21 @@ def extract_text(file_content: bytes, filename: str, content_type: str) -> Tuple
         If successful, error_message is None
         If failed, extracted_text is empty and error_message contains the error
     """
-    lower_filename = filename.lower()
-
     try:
         # Determine file type and extract
-        if lower_filename.endswith('.pdf') or content_type == 'application/pdf':
+        kind = detect_document_kind(filename, content_type)
+        if kind == "pdf":
             text = extract_text_from_pdf(file_content)
-        elif lower_filename.endswith('.docx') or content_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
+        elif kind == "docx":
             text = extract_text_from_docx(file_content)
-        elif lower_filename.endswith('.doc') or content_type == 'application/msword':
+        elif kind == "doc":
             text = extract_text_from_doc(file_content)
-        elif lower_filename.endswith('.txt') or content_type == 'text/plain':
+        elif kind == "txt":
             text = extract_text_from_txt(file_content)
         else:
             return "", f"Unsupported file type: {filename}"
 
-        # Clean up the text
-        text = text.strip()
-
-        if not text:
-            return "", "The document appears to be empty or contains no extractable text."
-
-        logger.info(f"Successfully extracted {len(text)} characters from {filename}")
-        return text, None
+        return clean_extracted_text(text, filename)
 
     except ValueError as e:
         return "", str(e)
@@ -158,6 +161,245 @@ def extract_text(file_content: bytes, filename: str, content_type: str) -> Tuple
         return "", f"Failed to extract text: {str(e)}"
 
 
+def detect_document_kind(filename: str, content_type: str) -> Optional[str]:
+    """Return "pdf", "docx", "doc" or "txt", or None for unsupported files."""
+    lower_filename = filename.lower()
+    if lower_filename.endswith('.pdf') or content_type == 'application/pdf':
+        return "pdf"
+    if lower_filename.endswith('.docx') or content_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
+        return "docx"
+    if lower_filename.endswith('.doc') or content_type == 'application/msword':
+        return "doc"
+    if lower_filename.endswith('.txt') or content_type == 'text/plain':
+        return "txt"
+    return None
+
+
+def clean_extracted_text(text: str, filename: str) -> Tuple[str, Optional[str]]:
+    """Strip extracted text and reject documents with no text."""
+    text = text.strip()
+
+    if not text:
+        return "", "The document appears to be empty or contains no extractable text."
+
+    logger.info(f"Successfully extracted {len(text)} characters from {filename}")
+    return text, None
+
+
 def get_supported_extensions_display() -> str:
     """Get a human-readable list of supported extensions."""
     return ", ".join(sorted(SUPPORTED_EXTENSIONS.keys()))
+
+
+# --- Off-event-loop extraction ---
+
+# PDF pages handed to one worker process at a time
+PDF_PAGES_PER_TASK = 16
+
+
+class DocumentLimitError(ValueError):
+    """Raised when a document exceeds the page, time or memory caps."""
+
+
+def _limit_worker_memory(max_memory_mb: int) -> None:
+    """Process pool initializer: cap the worker's address space."""
+    try:
+        import resource
+
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not cap extraction worker memory: {e}")
+
+
+def _count_pdf_pages(file_content: bytes) -> int:
+    from PyPDF2 import PdfReader
+
+    return len(PdfReader(io.BytesIO(file_content)).pages)
+
+
+def _extract_pdf_page_range(file_content: bytes, start: int, end: int) -> List[str]:
+    """Extract pages [start, end) of a PDF; runs in a worker process."""
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(io.BytesIO(file_content))
+    return [reader.pages[index].extract_text() or "" for index in range(start, end)]
+
+
+class DocumentExtractionService:
+    """
+    Extracts document text in a process pool so the event loop is never blocked.
+
+    PDF pages are extracted in parallel ranges and can be consumed page by page
+    with iter_pdf_pages(). Results are cached in Redis by content hash, so
+    re-uploads and re-analysis of the same file skip extraction entirely.
+    """
+
+    CACHE_PREFIX = "doc_text:v1"
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        max_workers: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        max_memory_mb: Optional[int] = None,
+        cache_ttl_seconds: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self._redis = redis_client or redis.Redis.from_url(settings.redis_url)
+        self.max_workers = max_workers or settings.document_extraction_workers
+        self.max_pages = max_pages or settings.document_extraction_max_pages
+        self.timeout_seconds = timeout_seconds or settings.document_extraction_timeout_seconds
+        self.max_memory_mb = max_memory_mb or settings.document_extraction_max_memory_mb
+        self.cache_ttl_seconds = cache_ttl_seconds or settings.document_extraction_cache_ttl_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Set[futures.Future] = set()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a threaded API worker is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_limit_worker_memory,
+                initargs=(self.max_memory_mb,),
+            )
+        return self._executor
+
+    def _retire_pool(self) -> None:
+        """Swap in a fresh pool after a task overran its time cap or crashed a worker.
+
+        The pool cannot say which worker runs the overrunning task, so the old
+        pool is left to drain: other documents still extracting in it get up
+        to timeout_seconds to finish, then its remaining workers are killed.
+        """
+        executor, self._executor = self._executor, None
+        pending, self._pending = self._pending, set()
+        if executor is None:
+            return
+        threading.Thread(
+            target=self._drain_and_kill, args=(executor, pending), name="extraction-pool-drain", daemon=True
+        ).start()
+
+    def _drain_and_kill(self, executor: ProcessPoolExecutor, pending: Set[futures.Future]) -> None:
+        futures.wait(list(pending), timeout=self.timeout_seconds)
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending = set()
+
+    def _run(self, func, *args) -> asyncio.Future:
+        future = self._pool().submit(func, *args)
+        pending = self._pending
+        pending.add(future)
+        future.add_done_callback(pending.discard)
+        return asyncio.wrap_future(future)
+
+    def _cache_key(self, kind: str, file_content: bytes) -> str:
+        return f"{self.CACHE_PREFIX}:{kind}:{hashlib.sha256(file_content).hexdigest()}"
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        try:
+            cached = self._redis.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Extraction cache unavailable: {e}")
+            return None
+        return cached.decode("utf-8") if isinstance(cached, bytes) else cached
+
+    def _cache_set(self, key: str, text: str) -> None:
+        try:
+            self._redis.set(key, text.encode("utf-8"), ex=self.cache_ttl_seconds)
+        except redis.RedisError as e:
+            logger.warning(f"Extraction cache unavailable: {e}")
+
+    async def iter_pdf_pages(self, file_content: bytes) -> AsyncIterator[Tuple[int, str]]:
+        """Yield (page_number, text) in order, extracting page ranges in parallel."""
+        page_count = await self._run(_count_pdf_pages, file_content)
+        if page_count > self.max_pages:
+            raise DocumentLimitError(
+                f"PDF has {page_count} pages; the maximum is {self.max_pages}."
+            )
+
+        ranges = [
+            (start, min(start + PDF_PAGES_PER_TASK, page_count))
+            for start in range(0, page_count, PDF_PAGES_PER_TASK)
+        ]
+        tasks = [
+            asyncio.ensure_future(self._run(_extract_pdf_page_range, file_content, start, end))
+            for start, end in ranges
+        ]
+        try:
+            for (start, _), task in zip(ranges, tasks):
+                for offset, page_text in enumerate(await task):
+                    yield start + offset + 1, page_text
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _extract_uncached(self, file_content: bytes, kind: str, filename: str, content_type: str) -> str:
+        if kind == "pdf":
+            pages = [page_text async for _, page_text in self.iter_pdf_pages(file_content)]
+            return "\n\n".join(page_text for page_text in pages if page_text)
+
+        text, error = await self._run(extract_text, file_content, filename, content_type)
+        if error:
+            raise ValueError(error)
+        return text
+
+    async def extract(self, file_content: bytes, filename: str, content_type: str) -> Tuple[str, Optional[str]]:
+        """
+        Async counterpart of extract_text() with caching and resource caps.
+
+        Returns:
+            Tuple of (extracted_text, error_message), as extract_text()
+        """
+        kind = detect_document_kind(filename, content_type)
+        if kind is None:
+            return "", f"Unsupported file type: {filename}"
+
+        cache_key = self._cache_key(kind, file_content)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Extraction cache hit for {filename}")
+            return cached, None
+
+        try:
+            text = await asyncio.wait_for(
+                self._extract_uncached(file_content, kind, filename, content_type),
+                timeout=self.timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            self._retire_pool()
+            return "", f"Text extraction took longer than {self.timeout_seconds:g} seconds. Try a smaller document."
+        except BrokenProcessPool:
+            self._retire_pool()
+            return "", "The document is too large or complex to extract text from."
+        except MemoryError:
+            return "", "The document is too large or complex to extract text from."
+        except ValueError as e:
+            return "", str(e)
+        except Exception as e:
+            logger.error(f"Unexpected error extracting text from {filename}: {e}")
+            return "", f"Failed to extract text: {str(e)}"
+
+        text, error = clean_extracted_text(text, filename)
+        if not error:
+            self._cache_set(cache_key, text)
+        return text, error
+
+
+_document_extraction_service: Optional[DocumentExtractionService] = None
+
+
+def get_document_extraction_service() -> DocumentExtractionService:
+    """Get the shared document extraction service instance."""
+    global _document_extraction_service
+    if _document_extraction_service is None:
+        _document_extraction_service = DocumentExtractionService()
+    return _document_extraction_service
@@ -1,10 +1,11 @@
 """
 ElevenLabs Agent service for realtime conversation support.
 
-Provides signed URLs for direct browser-to-ElevenLabs WebSocket connections.
+Provides signed URLs for direct browser-to-ElevenLabs WebSocket connections,
+and a streaming text-to-speech helper for server-side spoken responses.
 """
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import httpx
 from api.core.config import get_settings
@@ -75,4 +76,60 @@ async def get_signed_url(language: str = "en") -> str:
         raise
     except Exception as e:
         logger.error(f"Unexpected error getting signed URL: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+async def stream_tts_audio(
+    text: str,
+    voice_id: Optional[str] = None,
+    output_format: str = "mp3_44100_64",
+    chunk_size: int = 4096,
+) -> AsyncIterator[bytes]:
+    """
+    Stream synthesized audio for a piece of text from ElevenLabs.
+
+    Uses the ``/stream`` text-to-speech endpoint so audio bytes are yielded as
+    soon as ElevenLabs produces them instead of after the whole clip is ready.
+
+    Args:
+        text: Text to synthesize (already sanitized for speech)
+        voice_id: Voice to use, defaults to ELEVENLABS_VOICE_ID
+        output_format: ElevenLabs output format identifier
+        chunk_size: Size of the byte chunks yielded to the caller
+
+    Yields:
+        bytes: Encoded audio chunks in ``output_format``
+
+    Raises:
+        ValueError: If ELEVENLABS_API_KEY is not configured
+        httpx.HTTPError: If the ElevenLabs API request fails
+    """
+    settings = get_settings()
+
+    if not settings.elevenlabs_api_key:
+        raise ValueError("ELEVENLABS_API_KEY environment variable is required")
+
+    voice = voice_id or settings.elevenlabs_voice_id
+    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice}/stream?output_format={output_format}"
+    headers = {
+        "xi-api-key": settings.elevenlabs_api_key,
+        "Content-Type": "application/json",
+    }
+    payload = {
+        "text": text,
+        "model_id": settings.elevenlabs_model_id,
+    }
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        async with client.stream("POST", url, headers=headers, json=payload) as response:
+            if response.status_code != 200:
+                body = await response.aread()
+                logger.error(f"ElevenLabs TTS error {response.status_code}: {body[:200]!r}")
+                raise httpx.HTTPStatusError(
+                    f"ElevenLabs API returned {response.status_code}",
+                    request=response.request,
+                    response=response
+                )
+            async for chunk in response.aiter_bytes(chunk_size):
+                if chunk:
+                    yield chunk
@@ -37,6 +37,7 @@ from api.models.engagement import (
     CheckpointCompletion,
     AIResponseDraft,
 )
+from api.services.tool_cache import invalidate_tags
 
 logger = logging.getLogger(__name__)
 
@@ -445,6 +446,7 @@ def clone_session(db: Session, session_id: int, new_title: str, course_id: int =
     )
     db.add(new_session)
     db.commit()
+    invalidate_tags("sessions", f"course:{new_session.course_id}")
     db.refresh(new_session)
 
     return {
@@ -472,6 +474,7 @@ def create_session_from_template(db: Session, template_id: int, course_id: int,
     template.use_count += 1
 
     db.commit()
+    invalidate_tags("sessions", f"course:{course_id}")
     db.refresh(new_session)
 
     return {
@@ -0,0 +1,126 @@
+"""
+Content-addressed storage for course material files.
+
+Files are stored once per SHA-256 in a MaterialBlob; CourseMaterial rows take a
+reference on the blob, and the S3 object is deleted with the last reference.
+None of these helpers commit; callers commit together with their own changes.
+"""
+
+import hashlib
+import logging
+from typing import BinaryIO, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from api.models.course_material import CourseMaterial, MaterialBlob
+from api.services.s3_service import get_s3_service
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class MaterialStorageError(Exception):
+    """Raised when a material file cannot be stored."""
+
+
+def hash_file(file_obj: BinaryIO) -> Tuple[str, int]:
+    """
+    Hash a file in chunks without loading it into memory.
+
+    Returns:
+        Tuple of (sha256_hex, size_bytes). The file is rewound afterwards.
+    """
+    file_obj.seek(0)
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in iter(lambda: file_obj.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+        size += len(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest(), size
+
+
+def _lock_blob(db: Session, sha256: str) -> Optional[MaterialBlob]:
+    return db.query(MaterialBlob).filter(MaterialBlob.sha256 == sha256).with_for_update().first()
+
+
+def acquire_blob(
+    db: Session,
+    sha256: str,
+    file_size: int,
+    content_type: str,
+    filename: str,
+    file_obj: Optional[BinaryIO] = None,
+) -> Tuple[MaterialBlob, bool]:
+    """
+    Take a reference on the blob for ``sha256``, uploading ``file_obj`` if it is new.
+
+    Returns:
+        Tuple of (blob, created). When created is True the caller must delete
+        blob.s3_key from S3 if its transaction is rolled back.
+    """
+    blob = _lock_blob(db, sha256)
+    if blob:
+        blob.ref_count += 1
+        return blob, False
+
+    if file_obj is None:
+        raise MaterialStorageError(f"No stored file with checksum {sha256}")
+
+    s3_service = get_s3_service()
+    s3_key = s3_service.generate_blob_key(sha256)
+    success, error = s3_service.upload_file(file_obj, s3_key, content_type, filename)
+    if not success:
+        raise MaterialStorageError(error or "S3 upload failed.")
+
+    blob = MaterialBlob(
+        sha256=sha256,
+        s3_key=s3_key,
+        file_size=file_size,
+        content_type=content_type,
+        ref_count=1,
+    )
+    try:
+        with db.begin_nested():
+            db.add(blob)
+    except IntegrityError:
+        # A concurrent upload of the same content committed first
+        s3_service.delete_file(s3_key)
+        blob = _lock_blob(db, sha256)
+        if blob is None:
+            raise MaterialStorageError(f"Could not store file with checksum {sha256}")
+        blob.ref_count += 1
+        return blob, False
+
+    return blob, True
+
+
+def delete_material_record(db: Session, material: CourseMaterial) -> Optional[str]:
+    """
+    Delete a material row and release its file reference.
+
+    Returns:
+        The S3 key to delete once the transaction commits, or None if the
+        file is still used by other materials.
+    """
+    blob_id = material.blob_id
+    s3_key = material.s3_key
+    db.delete(material)
+    db.flush()
+
+    if blob_id is None:
+        # Materials stored before deduplication own their object unless a copy shares the key
+        shared = db.query(CourseMaterial.id).filter(CourseMaterial.s3_key == s3_key).first()
+        return None if shared else s3_key
+
+    blob = db.query(MaterialBlob).filter(MaterialBlob.id == blob_id).with_for_update().first()
+    if blob is None:
+        return None
+    blob.ref_count -= 1
+    if blob.ref_count > 0:
+        return None
+
+    db.delete(blob)
+    return blob.s3_key
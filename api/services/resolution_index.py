@@ -0,0 +1,312 @@
+"""In-memory fuzzy name index for resolving spoken entity names to IDs.
+
+Voice commands name courses, sessions and students the way speech-to-text
+heard them: "intro to psych" for "Introduction to Psychology", "Gonsales" for
+"González". A substring filter misses these, so ResolutionIndex matches on:
+
+- character trigrams of each word (pg_trgm style), for typos and dropped letters,
+- word prefixes ("intro" -> "introduction", "psych" -> "psychology"),
+- phonetic keys that fold common English and Spanish spellings of the same
+  sound (c/k/qu, s/z/soft c, b/v, ll/y, silent h, accents).
+
+An inverted index over trigrams and phonetic keys limits scoring to entries
+that share something with the query, so a lookup touches a handful of
+entries instead of the whole scope.
+
+ResolutionIndexes keeps one index per scope (all courses, the sessions of a
+course, all users) and rebuilds it when one of the scope's tool cache tags
+is invalidated (see api.services.tool_cache), or when it is older than
+resolve_index_max_age_seconds.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from api.core.config import get_settings
+
+# Ignored when matching words (still part of the exact-match comparison)
+STOPWORDS = frozenset(
+    "a an and at for in of on the to with "
+    "de del el en la las los para por un una y".split()
+)
+
+_VOWELS = frozenset("aeiouwy")
+
+# Entries scored per search, picked by shared trigrams (a matching phonetic key counts as this many)
+MAX_SCORED_CANDIDATES = 64
+PHONETIC_HIT_WEIGHT = 4
+
+
+def normalize(text: str) -> str:
+    """Lower-case, strip accents, keep letters and digits separated by single spaces."""
+    folded = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join("".join(ch if ch.isalnum() else " " for ch in folded).split())
+
+
+def trigrams(word: str) -> FrozenSet[str]:
+    padded = f"  {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def phonetic_key(word: str) -> str:
+    """Sound-alike key for an English or Spanish word, e.g. Gonzalez/Gonsales -> "gnsls"."""
+    if not word:
+        return ""
+    if word.isdigit():
+        return word
+    out: List[str] = []
+    i, n = 0, len(word)
+    while i < n:
+        c = word[i]
+        nxt = word[i + 1] if i + 1 < n else ""
+        pair = word[i:i + 2]
+        if pair == "ph":
+            out.append("f")
+            i += 2
+            continue
+        if pair in ("ch", "sh"):
+            out.append("x")
+            i += 2
+            continue
+        if pair == "ll":
+            out.append("y")
+            i += 2
+            continue
+        if pair in ("qu", "ck"):
+            out.append("k")
+            i += 2
+            continue
+        if pair == "gu" and i + 2 < n and word[i + 2] in "ei":
+            out.append("g")  # Spanish "gue"/"gui": hard g, silent u
+            i += 2
+            continue
+        if c == "c":
+            out.append("s" if nxt in ("e", "i", "y") else "k")
+        elif c == "g":
+            out.append("j" if nxt in ("e", "i") else "g")
+        elif c in "kq":
+            out.append("k")
+        elif c == "z":
+            out.append("s")
+        elif c == "v":
+            out.append("b")
+        elif c == "x":
+            out.append("ks")
+        elif c == "h":
+            pass  # Silent in Spanish, weak in English
+        elif c in _VOWELS:
+            out.append("a" if not out else "")  # Only a leading vowel is kept
+        else:
+            out.append(c)
+        i += 1
+
+    key: List[str] = []
+    for part in "".join(out):
+        if not key or key[-1] != part:
+            key.append(part)
+    return "".join(key)
+
+
+@dataclass(frozen=True)
+class _Prepared:
+    normalized: str
+    words: Tuple[str, ...]  # Without stopwords (all words if that leaves none)
+    keys: Tuple[str, ...]
+    word_grams: Tuple[FrozenSet[str], ...]
+    grams: FrozenSet[str]
+
+
+def _prepare(text: str) -> _Prepared:
+    normalized = normalize(text)
+    all_words = tuple(normalized.split())
+    words = tuple(w for w in all_words if w not in STOPWORDS) or all_words
+    word_grams = tuple(trigrams(w) for w in words)
+    return _Prepared(
+        normalized=normalized,
+        words=words,
+        keys=tuple(phonetic_key(w) for w in words),
+        word_grams=word_grams,
+        grams=frozenset().union(*word_grams) if word_grams else frozenset(),
+    )
+
+
+def _dice(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def _score(query: _Prepared, entry: _Prepared) -> float:
+    if not query.words or not entry.words:
+        return 0.0
+    if query.normalized == entry.normalized:
+        return 1.0
+
+    total = 0.0
+    matched = set()
+    for q_word, q_key, q_grams in zip(query.words, query.keys, query.word_grams):
+        best, best_index = 0.0, None
+        for index, (e_word, e_key, e_grams) in enumerate(zip(entry.words, entry.keys, entry.word_grams)):
+            if q_word == e_word:
+                score = 1.0
+            elif len(q_word) >= 3 and e_word.startswith(q_word):
+                score = 0.9  # "intro" -> "introduction"
+            elif q_key and q_key == e_key and len(q_key) >= 2:
+                score = 0.85  # Sounds the same
+            elif len(e_word) >= 3 and q_word.startswith(e_word):
+                score = 0.8
+            else:
+                similarity = _dice(q_grams, e_grams)
+                score = 0.8 * similarity if similarity >= 0.5 else 0.0
+            if score > best:
+                best, best_index = score, index
+                if score == 1.0:
+                    break
+        total += best
+        if best_index is not None:
+            matched.add(best_index)
+
+    coverage = total / len(query.words)
+    # Prefer labels whose words are mostly accounted for
+    word_score = coverage * (0.85 + 0.15 * len(matched) / len(entry.words))
+    return max(word_score, _dice(query.grams, entry.grams))
+
+
+def similarity(query: str, label: str) -> float:
+    """Fuzzy similarity in [0, 1] between a spoken query and a label."""
+    return round(_score(_prepare(query), _prepare(label)), 3)
+
+
+@dataclass
+class IndexMatch:
+    id: int
+    label: str
+    confidence: float
+
+
+class ResolutionIndex:
+    """Fuzzy index over (id, label, search_texts) items; the label is searched when there are no texts."""
+
+    def __init__(self, items: Iterable[Tuple[int, str, Sequence[str]]] = ()):
+        self._labels: Dict[int, str] = {}
+        self._order: Dict[int, int] = {}
+        self._entries: List[Tuple[int, _Prepared]] = []
+        self._by_gram: Dict[str, List[int]] = {}
+        self._by_key: Dict[str, List[int]] = {}
+        for item_id, label, texts in items:
+            self.add(item_id, label, *texts)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def add(self, item_id: int, label: str, *texts: str) -> None:
+        """Index an item under its search texts (e.g. a user's name and email), or its label."""
+        self._labels[item_id] = label
+        self._order.setdefault(item_id, len(self._order))
+        for text in texts or (label,):
+            prepared = _prepare(text)
+            if not prepared.words:
+                continue
+            position = len(self._entries)
+            self._entries.append((item_id, prepared))
+            for gram in prepared.grams:
+                self._by_gram.setdefault(gram, []).append(position)
+            for key in prepared.keys:
+                if key:
+                    self._by_key.setdefault(key, []).append(position)
+
+    def search(self, query: str, limit: int = 5, min_confidence: float = 0.0) -> List[IndexMatch]:
+        prepared = _prepare(query)
+        if not prepared.words:
+            return []
+
+        # Score only the entries sharing the most trigrams / sound-alike words with the query
+        postings = [self._by_gram[gram] for gram in prepared.grams if gram in self._by_gram]
+        # Trigrams shared by a large share of the entries say little and cost the most to count
+        common = max(len(self._entries) // 8, MAX_SCORED_CANDIDATES)
+        hits: Counter = Counter()
+        for posting in [p for p in postings if len(p) <= common] or postings:
+            hits.update(posting)
+        for key in prepared.keys:
+            hits.update(dict.fromkeys(self._by_key.get(key, ()), PHONETIC_HIT_WEIGHT))
+        candidates = [position for position, _ in hits.most_common(max(MAX_SCORED_CANDIDATES, limit))]
+
+        best: Dict[int, float] = {}
+        for position in candidates:
+            item_id, entry = self._entries[position]
+            score = _score(prepared, entry)
+            if score >= min_confidence and score > best.get(item_id, -1.0):
+                best[item_id] = score
+
+        ranked = sorted(best, key=lambda item_id: (-best[item_id], self._order[item_id]))
+        return [IndexMatch(item_id, self._labels[item_id], round(best[item_id], 3)) for item_id in ranked[:limit]]
+
+
+# ============ Per-scope indexes, refreshed on invalidation ============
+
+Loader = Callable[[int], List[Tuple[int, str, Sequence[str]]]]
+
+
+@dataclass
+class _CachedIndex:
+    index: Optional[ResolutionIndex]  # None: scope too large to hold in memory
+    versions: Optional[Tuple[Optional[str], ...]]
+    built_at: float
+
+
+class ResolutionIndexes:
+    def __init__(self):
+        self._indexes: Dict[Tuple, _CachedIndex] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _tag_versions(tags: Tuple[str, ...]) -> Optional[Tuple[Optional[str], ...]]:
+        from api.services.tool_cache import get_tool_cache
+
+        return get_tool_cache().tag_versions(*tags) if tags else ()
+
+    def get(self, scope: Tuple, tags: Tuple[str, ...], load: Loader) -> Optional[ResolutionIndex]:
+        """Index for the scope, rebuilt when its tags were invalidated or it is too old.
+
+        load(max_rows) returns up to max_rows + 1 items; more than max_rows
+        means the scope is too large and None is returned (use the database).
+        """
+        settings = get_settings()
+        versions = self._tag_versions(tags)
+        now = time.monotonic()
+        cached = self._indexes.get(scope)
+        if (
+            cached is not None
+            and cached.versions == versions
+            and now - cached.built_at < settings.resolve_index_max_age_seconds
+        ):
+            return cached.index
+
+        with self._lock:
+            cached = self._indexes.get(scope)
+            if cached is not None and cached.versions == versions and cached.built_at >= now:
+                return cached.index  # Rebuilt by another thread while we waited
+            items = load(settings.resolve_index_max_rows)
+            index = ResolutionIndex(items) if len(items) <= settings.resolve_index_max_rows else None
+            self._indexes[scope] = _CachedIndex(index, versions, time.monotonic())
+            return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+_resolution_indexes: Optional[ResolutionIndexes] = None
+
+
+def get_resolution_indexes() -> ResolutionIndexes:
+    global _resolution_indexes
+    if _resolution_indexes is None:
+        _resolution_indexes = ResolutionIndexes()
+    return _resolution_indexes
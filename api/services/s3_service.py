@@ -1,17 +1,31 @@
 """S3 Service for Course Materials file operations."""
 
 import logging
+import math
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, BinaryIO
+from typing import Dict, List, Optional, Tuple, BinaryIO
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from api.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# S3 requires every part except the last to be at least 5MB, and at most 10,000 parts
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+MULTIPART_DEFAULT_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_PARTS = 10000
+
+# Server-side uploads stream the file in parts instead of a single PUT
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_DEFAULT_PART_SIZE,
+    multipart_chunksize=MULTIPART_DEFAULT_PART_SIZE,
+    max_concurrency=4,
+)
+
 
 class S3Service:
     """Service for interacting with AWS S3 for course materials."""
@@ -53,6 +67,15 @@ class S3Service:
         safe_filename = filename.replace(" ", "_")
         return f"courses/{course_id}/materials/{session_folder}/{unique_id}_{safe_filename}"
 
+    def generate_blob_key(self, sha256: str) -> str:
+        """
+        Generate the S3 key for a content-addressed blob.
+
+        Format: blobs/sha256/{hash[:2]}/{hash}_{uuid}. The suffix keeps a blob
+        re-created after deletion from colliding with a pending delete.
+        """
+        return f"blobs/sha256/{sha256[:2]}/{sha256}_{uuid.uuid4().hex[:8]}"
+
     def upload_file(
         self,
         file_obj: BinaryIO,
@@ -63,6 +86,9 @@ class S3Service:
         """
         Upload a file to S3.
 
+        The file is read and sent in 8MB parts, so it is never held in memory
+        in full. This call blocks; run it in a thread pool from async code.
+
         Args:
             file_obj: File-like object to upload
             s3_key: S3 object key
@@ -88,6 +114,7 @@ class S3Service:
                         "uploaded_at": datetime.utcnow().isoformat(),
                     },
                 },
+                Config=UPLOAD_TRANSFER_CONFIG,
             )
             logger.info(f"Successfully uploaded file to S3: {s3_key}")
             return True, None
@@ -101,6 +128,7 @@ class S3Service:
         s3_key: str,
         expiration_seconds: int = 3600,
         for_download: bool = True,
+        filename: Optional[str] = None,
     ) -> Optional[str]:
         """
         Generate a presigned URL for downloading or viewing a file.
@@ -109,6 +137,8 @@ class S3Service:
             s3_key: S3 object key
             expiration_seconds: URL expiration time in seconds (default 1 hour)
             for_download: If True, include Content-Disposition for download
+            filename: Download name; needed for shared blobs, whose stored
+                Content-Disposition is the first uploader's filename
 
         Returns:
             Presigned URL or None if error
@@ -121,9 +151,9 @@ class S3Service:
                 "Bucket": self.bucket_name,
                 "Key": s3_key,
             }
-            if for_download:
-                # Let S3 use the stored Content-Disposition
-                pass
+            if for_download and filename:
+                params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+            # Otherwise let S3 use the stored Content-Disposition
 
             url = self.s3_client.generate_presigned_url(
                 "get_object",
@@ -171,6 +201,139 @@ class S3Service:
             logger.error(f"Failed to generate presigned upload URL: {e}")
             return None
 
+    # --- Browser-direct multipart uploads ---
+
+    @staticmethod
+    def plan_multipart_parts(file_size: int) -> Tuple[int, int]:
+        """
+        Choose a part size and count for a multipart upload.
+
+        Returns:
+            Tuple of (part_size_bytes, part_count)
+        """
+        part_size = max(
+            MULTIPART_DEFAULT_PART_SIZE,
+            math.ceil(file_size / MULTIPART_MAX_PARTS),
+            MULTIPART_MIN_PART_SIZE,
+        )
+        return part_size, max(1, math.ceil(file_size / part_size))
+
+    def create_multipart_upload(
+        self,
+        s3_key: str,
+        content_type: str,
+        filename: str,
+    ) -> Optional[str]:
+        """
+        Start a multipart upload that the browser will send parts to directly.
+
+        Returns:
+            The S3 UploadId, or None on error
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                ContentType=content_type,
+                ContentDisposition=f'attachment; filename="{filename}"',
+                Metadata={
+                    "original_filename": filename,
+                    "uploaded_at": datetime.utcnow().isoformat(),
+                },
+            )
+            return response["UploadId"]
+        except ClientError as e:
+            logger.error(f"Failed to start multipart upload: {e}")
+            return None
+
+    def generate_presigned_part_urls(
+        self,
+        s3_key: str,
+        upload_id: str,
+        part_numbers: List[int],
+        expiration_seconds: int = 3600,
+    ) -> Optional[Dict[int, str]]:
+        """
+        Presign PUT URLs for parts of a multipart upload.
+
+        Returns:
+            Dict of part number to URL, or None on error
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            return {
+                part_number: self.s3_client.generate_presigned_url(
+                    "upload_part",
+                    Params={
+                        "Bucket": self.bucket_name,
+                        "Key": s3_key,
+                        "UploadId": upload_id,
+                        "PartNumber": part_number,
+                    },
+                    ExpiresIn=expiration_seconds,
+                )
+                for part_number in part_numbers
+            }
+        except ClientError as e:
+            logger.error(f"Failed to presign upload parts: {e}")
+            return None
+
+    def complete_multipart_upload(
+        self,
+        s3_key: str,
+        upload_id: str,
+        parts: List[Dict],
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Assemble uploaded parts into the final object.
+
+        Args:
+            s3_key: S3 object key
+            upload_id: UploadId from create_multipart_upload
+            parts: List of {"PartNumber": int, "ETag": str}
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if not self.enabled:
+            return False, "S3 service is not configured"
+
+        try:
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": sorted(parts, key=lambda part: part["PartNumber"])},
+            )
+            logger.info(f"Completed multipart upload to S3: {s3_key}")
+            return True, None
+        except ClientError as e:
+            error_msg = f"Failed to complete multipart upload: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+
+    def abort_multipart_upload(self, s3_key: str, upload_id: str) -> Tuple[bool, Optional[str]]:
+        """Abort a multipart upload and discard its parts."""
+        if not self.enabled:
+            return False, "S3 service is not configured"
+
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+            )
+            return True, None
+        except ClientError as e:
+            error_msg = f"Failed to abort multipart upload: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+
     def delete_file(self, s3_key: str) -> Tuple[bool, Optional[str]]:
         """
         Delete a file from S3.
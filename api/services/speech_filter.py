@@ -84,3 +84,74 @@ def sanitize_speech_text(
     if _contains_banned(sanitized, patterns, allowlist):
         return DEFAULT_FALLBACK
     return sanitized
+
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])[\"')\]]*\s+")
+
+
+class IncrementalSpeechSanitizer:
+    """Sanitize streamed text one complete sentence at a time.
+
+    LLM deltas are buffered until a sentence boundary is seen so the brand
+    filter always operates on whole sentences (a denylisted term can never be
+    split across two chunks). Each released sentence is passed through
+    ``sanitize_speech_text`` and is ready to hand to TTS.
+    """
+
+    def __init__(
+        self,
+        denylist: Optional[Iterable[str]] = None,
+        allowlist: Optional[Iterable[str]] = None,
+        min_chars: int = 20,
+        max_chars: int = 300,
+    ):
+        if denylist is None:
+            settings = get_settings()
+            denylist = _split_terms(settings.voice_brand_denylist)
+            if allowlist is None:
+                allowlist = _split_terms(settings.voice_brand_allowlist)
+        self.denylist = list(denylist)
+        self.allowlist = list(allowlist or [])
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._buffer = ""
+
+    def feed(self, delta: str) -> List[str]:
+        """Add a text delta and return any sentences that are now complete."""
+        if delta:
+            self._buffer += delta
+        return self._drain(final=False)
+
+    def flush(self) -> List[str]:
+        """Return whatever is left in the buffer as a final sentence."""
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> List[str]:
+        ready: List[str] = []
+        start = 0
+        for match in _SENTENCE_END.finditer(self._buffer):
+            # Merge very short fragments ("Sure.") into the following sentence.
+            if match.end() - start < self.min_chars:
+                continue
+            ready.append(self._buffer[start:match.end()])
+            start = match.end()
+        self._buffer = self._buffer[start:]
+
+        # Break run-on text without punctuation at the last space so TTS can start.
+        while len(self._buffer) > self.max_chars:
+            cut = self._buffer.rfind(" ", 0, self.max_chars)
+            if cut <= 0:
+                cut = self.max_chars
+            ready.append(self._buffer[:cut])
+            self._buffer = self._buffer[cut:].lstrip()
+
+        if final and self._buffer.strip():
+            ready.append(self._buffer)
+            self._buffer = ""
+
+        sentences = []
+        for sentence in ready:
+            sentence = sentence.strip()
+            if sentence:
+                sentences.append(sanitize_speech_text(sentence, self.denylist, self.allowlist))
+        return sentences
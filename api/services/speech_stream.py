@@ -0,0 +1,214 @@
+"""Sentence-level streaming from LLM text deltas to TTS audio.
+
+Text arrives as LLM deltas, is cut into sanitized sentences by
+``IncrementalSpeechSanitizer`` and each sentence is synthesized as soon as it
+is complete. Synthesis of the next sentence overlaps playback of the current
+one, while events are always emitted in sentence order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, AsyncIterable, Dict, List, Optional, Protocol
+
+from api.core.config import get_settings
+from api.services.speech_filter import IncrementalSpeechSanitizer
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingTTS(Protocol):
+    content_type: str
+
+    def synthesize(self, text: str) -> AsyncIterable[bytes]:
+        ...
+
+
+class StubSilenceTTS:
+    """Emits PCM16 silence sized to the spoken length of the text.
+
+    Used in development and tests so the pipeline can run without a vendor key.
+    """
+
+    content_type = "audio/pcm;rate=16000"
+
+    def __init__(self, sample_rate: int = 16000, words_per_minute: int = 150):
+        self.sample_rate = sample_rate
+        self.words_per_minute = words_per_minute
+
+    async def synthesize(self, text: str) -> AsyncGenerator[bytes, None]:
+        seconds = max(len(text.split()) / self.words_per_minute * 60, 0.2)
+        yield b"\x00\x00" * int(self.sample_rate * seconds)
+
+
+class ElevenLabsStreamingTTS:
+    """Streams MP3 audio from the ElevenLabs text-to-speech stream endpoint."""
+
+    content_type = "audio/mpeg"
+
+    def __init__(self, voice_id: Optional[str] = None):
+        self.voice_id = voice_id
+
+    async def synthesize(self, text: str) -> AsyncGenerator[bytes, None]:
+        from api.services.elevenlabs_agent import stream_tts_audio
+
+        async for chunk in stream_tts_audio(text, voice_id=self.voice_id):
+            yield chunk
+
+
+def get_streaming_tts() -> StreamingTTS:
+    """Return the streaming TTS provider configured by VOICE_TTS_PROVIDER."""
+    settings = get_settings()
+    if settings.voice_tts_provider.startswith("elevenlabs") and settings.elevenlabs_api_key:
+        return ElevenLabsStreamingTTS()
+    return StubSilenceTTS()
+
+
+@dataclass
+class SpeechEvent:
+    """One step of a spoken response: a sentence's text or a chunk of its audio."""
+
+    type: str  # 'text' | 'audio'
+    index: int
+    text: Optional[str] = None
+    audio: Optional[bytes] = None
+    content_type: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"type": self.type, "index": self.index}
+        if self.text is not None:
+            data["text"] = self.text
+        if self.audio is not None:
+            data["audio"] = base64.b64encode(self.audio).decode("ascii")
+            data["content_type"] = self.content_type
+        return data
+
+
+def format_sse(data: Dict[str, Any]) -> str:
+    return f"data: {json.dumps(data)}\n\n"
+
+
+class _SentenceSynthesis:
+    """Synthesizes one sentence in the background, buffering its audio chunks."""
+
+    def __init__(self, index: int, text: str, tts: StreamingTTS):
+        self.index = index
+        self.text = text
+        self.chunks: asyncio.Queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._run(tts))
+
+    async def _run(self, tts: StreamingTTS) -> None:
+        try:
+            async for chunk in tts.synthesize(self.text):
+                await self.chunks.put(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error(f"TTS failed for sentence {self.index}: {exc}")
+        finally:
+            self.chunks.put_nowait(None)
+
+
+async def stream_speech(
+    deltas: AsyncIterable[str],
+    tts: Optional[StreamingTTS] = None,
+    sanitizer: Optional[IncrementalSpeechSanitizer] = None,
+    max_in_flight: int = 2,
+) -> AsyncGenerator[SpeechEvent, None]:
+    """
+    Turn a stream of text deltas into ordered text and audio events.
+
+    Each complete sentence yields a ``text`` event followed by its ``audio``
+    events. Up to ``max_in_flight`` upcoming sentences are synthesized while
+    the current one is still being emitted; a failed sentence is logged and
+    skipped so the rest of the response is still spoken.
+    """
+    tts = tts or get_streaming_tts()
+    sanitizer = sanitizer or IncrementalSpeechSanitizer()
+    pending: asyncio.Queue = asyncio.Queue(maxsize=max(max_in_flight, 1))
+    started: List[_SentenceSynthesis] = []
+    error: List[BaseException] = []
+
+    async def produce() -> None:
+        index = 0
+        try:
+            async for delta in deltas:
+                for sentence in sanitizer.feed(delta):
+                    job = _SentenceSynthesis(index, sentence, tts)
+                    started.append(job)
+                    await pending.put(job)
+                    index += 1
+            for sentence in sanitizer.flush():
+                job = _SentenceSynthesis(index, sentence, tts)
+                started.append(job)
+                await pending.put(job)
+                index += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error.append(exc)
+        await pending.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            job = await pending.get()
+            if job is None:
+                break
+            yield SpeechEvent(type="text", index=job.index, text=job.text)
+            while True:
+                chunk = await job.chunks.get()
+                if chunk is None:
+                    break
+                yield SpeechEvent(type="audio", index=job.index, audio=chunk, content_type=tts.content_type)
+        if error:
+            raise error[0]
+    finally:
+        producer.cancel()
+        for job in started:
+            job.task.cancel()
+
+
+class SpeechSink:
+    """Collects text deltas produced while handling a streaming voice request."""
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self.streamed = False
+
+    def put(self, delta: str) -> None:
+        if delta:
+            self.streamed = True
+            self._queue.put_nowait(delta)
+
+    def close(self) -> None:
+        self._queue.put_nowait(None)
+
+    async def deltas(self) -> AsyncGenerator[str, None]:
+        while True:
+            delta = await self._queue.get()
+            if delta is None:
+                return
+            yield delta
+
+
+_speech_sink: ContextVar[Optional[SpeechSink]] = ContextVar("speech_sink", default=None)
+
+
+def current_speech_sink() -> Optional[SpeechSink]:
+    """Return the sink for the current streaming request, if any."""
+    return _speech_sink.get()
+
+
+def use_speech_sink(sink: Optional[SpeechSink]):
+    """Route LLM deltas for the current context into ``sink``; returns a reset token."""
+    return _speech_sink.set(sink)
+
+
+def reset_speech_sink(token) -> None:
+    _speech_sink.reset(token)
@@ -0,0 +1,203 @@
+"""Redis-backed read-through cache for MCP read tools.
+
+Read tools opt in at registration with a ToolCachePolicy (TTL and tags);
+write tools and REST routes declare the tags they invalidate. Tags are
+formatted from the tool arguments, e.g. "course:{course_id}" -> "course:12".
+
+Invalidation is by version counter: every tag has a counter in Redis, and a
+cached entry's key embeds the current counters of its tags. Bumping a tag
+makes every entry that depends on it unreachable (it then expires by TTL), so
+there is no scan and no race between a read refilling the cache and a write
+invalidating it.
+
+The key is built from the tool name and all arguments, so tools that take a
+user_id are cached per user. Hit and miss counts per tool are kept in Redis
+for stats(). If Redis is unavailable, tools run uncached.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import redis
+
+from api.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "tool_cache:v1"
+# After a Redis error, skip the cache for this long instead of failing every call
+REDIS_RETRY_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    ttl_seconds: int = 60
+    tags: Tuple[str, ...] = ()
+
+
+def format_tags(templates: Iterable[str], args: Dict[str, Any]) -> List[str]:
+    """Tag templates filled from tool arguments; templates whose arguments are missing are skipped."""
+    tags = []
+    for template in templates:
+        try:
+            tags.append(template.format(**args))
+        except (KeyError, IndexError):
+            continue
+    return tags
+
+
+class ToolCache:
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        settings = get_settings()
+        self._client = redis_client or redis.Redis.from_url(settings.redis_url, decode_responses=True)
+        self._disabled_until = 0.0
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"{KEY_PREFIX}:tag:{tag}"
+
+    @staticmethod
+    def _stats_key() -> str:
+        return f"{KEY_PREFIX}:stats"
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._disabled_until
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(f"Tool cache unavailable, running tools uncached for {REDIS_RETRY_SECONDS:.0f}s: {error}")
+        self._disabled_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    def _entry_key(self, tool_name: str, args: Dict[str, Any], tags: List[str]) -> str:
+        versions = self._client.mget([self._tag_key(tag) for tag in tags]) if tags else []
+        raw = json.dumps([args, list(zip(tags, versions))], sort_keys=True, default=str)
+        return f"{KEY_PREFIX}:{tool_name}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]}"
+
+    def get_or_call(
+        self,
+        tool_name: str,
+        policy: ToolCachePolicy,
+        args: Dict[str, Any],
+        call: Callable[[], Any],
+    ) -> Any:
+        """Return the cached result for (tool, args), calling the tool on a miss."""
+        if not self._available():
+            return call()
+        try:
+            key = self._entry_key(tool_name, args, format_tags(policy.tags, args))
+            cached = self._client.get(key)
+        except redis.RedisError as e:
+            self._disable(e)
+            return call()
+
+        if cached is not None:
+            self._count(tool_name, "hits")
+            return json.loads(cached)
+
+        result = call()
+        try:
+            pipe = self._client.pipeline()
+            if not (isinstance(result, dict) and "error" in result):
+                pipe.set(key, json.dumps(result, default=str), ex=policy.ttl_seconds)
+            pipe.hincrby(self._stats_key(), f"{tool_name}:misses", 1)
+            pipe.execute()
+        except (redis.RedisError, TypeError, ValueError) as e:
+            logger.warning(f"Could not cache result of {tool_name}: {e}")
+        return result
+
+    def _count(self, tool_name: str, field: str) -> None:
+        try:
+            self._client.hincrby(self._stats_key(), f"{tool_name}:{field}", 1)
+        except redis.RedisError:
+            pass
+
+    def invalidate(self, *tags: str) -> None:
+        """Make every cached entry depending on any of the tags stale."""
+        if not tags or not self._available():
+            return
+        try:
+            pipe = self._client.pipeline()
+            for tag in tags:
+                pipe.incr(self._tag_key(tag))
+            pipe.execute()
+        except redis.RedisError as e:
+            # A missed invalidation is bounded by the entries' TTL
+            self._disable(e)
+
+    def tag_versions(self, *tags: str) -> Optional[Tuple[Optional[str], ...]]:
+        """Current version counters of the tags, or None if Redis is unavailable."""
+        if not self._available():
+            return None
+        try:
+            return tuple(self._client.mget([self._tag_key(tag) for tag in tags]))
+        except redis.RedisError as e:
+            self._disable(e)
+            return None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses and hit rate per cached tool."""
+        try:
+            raw = self._client.hgetall(self._stats_key())
+        except redis.RedisError:
+            return {}
+        stats: Dict[str, Dict[str, Any]] = {}
+        for field, value in raw.items():
+            tool_name, _, kind = field.rpartition(":")
+            stats.setdefault(tool_name, {"hits": 0, "misses": 0})[kind] = int(value)
+        for entry in stats.values():
+            total = entry["hits"] + entry["misses"]
+            entry["hit_rate"] = round(entry["hits"] / total, 3) if total else 0.0
+        return stats
+
+
+_tool_cache: Optional[ToolCache] = None
+
+
+def get_tool_cache() -> ToolCache:
+    global _tool_cache
+    if _tool_cache is None:
+        _tool_cache = ToolCache()
+    return _tool_cache
+
+
+def invalidate_tags(*tags: str) -> None:
+    """For REST routes: invalidate cached tool results after a mutation."""
+    get_tool_cache().invalidate(*tags)
+
+
+# ============ Handler wrappers (applied by register_tool) ============
+
+def cached_handler(tool_name: str, handler: Callable[..., Any], policy: ToolCachePolicy) -> Callable[..., Any]:
+    """Wrap a read tool handler with the read-through cache. The db session is not part of the key."""
+
+    @functools.wraps(handler)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if args:
+            return handler(*args, **kwargs)  # Positional calls are not keyed reliably; run uncached
+        key_args = {name: value for name, value in kwargs.items() if name != "db"}
+        return get_tool_cache().get_or_call(tool_name, policy, key_args, lambda: handler(**kwargs))
+
+    return wrapper
+
+
+def invalidating_handler(handler: Callable[..., Any], tag_templates: Tuple[str, ...]) -> Callable[..., Any]:
+    """Wrap a write tool handler so a successful call invalidates its tags."""
+
+    @functools.wraps(handler)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = handler(*args, **kwargs)
+        if not (isinstance(result, dict) and "error" in result):
+            tag_args = dict(kwargs)
+            if isinstance(result, dict):
+                # Let templates use ids the write returned, e.g. a created course's course_id
+                tag_args = {**result, **tag_args}
+            get_tool_cache().invalidate(*format_tags(tag_templates, tag_args))
+        return result
+
+    return wrapper
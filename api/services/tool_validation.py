@@ -0,0 +1,235 @@
+"""Compiled argument validators for MCP tools.
+
+Each tool's JSON schema is compiled once, when the tool is registered, into
+a chain of small closures (one per property) instead of being interpreted
+on every call. Validators return a new argument dict with:
+
+- defaults applied for missing optional fields,
+- null optional fields dropped (LLMs often emit "field": null),
+- common LLM mistakes coerced: "12" -> 12 for integers, "true" -> True for
+  booleans, 5 -> "5" for strings, a bare value or JSON string -> list for
+  arrays, and enum values matched case-insensitively.
+
+Anything that cannot be coerced raises ToolArgumentError before the handler
+(and its database work) runs. Fields not in the schema pass through unchanged.
+
+Only the schema subset used by the tool registry is supported: type
+(integer, number, string, boolean, array, object), properties, required,
+items, enum and default.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Coercer = Callable[[Any, str], Any]
+Validator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+_INT_PATTERN = re.compile(r"^\s*[-+]?\d+\s*$")
+_TRUE_STRINGS = {"true", "yes", "y", "1", "on"}
+_FALSE_STRINGS = {"false", "no", "n", "0", "off"}
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool arguments do not match the tool's schema."""
+
+
+def _coerce_integer(value: Any, field: str) -> int:
+    if isinstance(value, bool):
+        raise ToolArgumentError(f"Field '{field}' must be integer")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and _INT_PATTERN.match(value):
+        return int(value)
+    raise ToolArgumentError(f"Field '{field}' must be integer")
+
+
+def _coerce_number(value: Any, field: str) -> float:
+    if isinstance(value, bool):
+        raise ToolArgumentError(f"Field '{field}' must be number")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise ToolArgumentError(f"Field '{field}' must be number")
+
+
+def _coerce_string(value: Any, field: str) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ToolArgumentError(f"Field '{field}' must be string")
+
+
+def _coerce_boolean(value: Any, field: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ToolArgumentError(f"Field '{field}' must be boolean")
+
+
+def _coerce_object(value: Any, field: str) -> dict:
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value.strip().startswith("{"):
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, dict):
+            return parsed
+    raise ToolArgumentError(f"Field '{field}' must be object")
+
+
+def _compile_array(schema: Dict[str, Any]) -> Coercer:
+    item_coercer = _compile_property(schema["items"]) if isinstance(schema.get("items"), dict) else None
+
+    def coerce(value: Any, field: str) -> list:
+        if isinstance(value, str) and value.strip().startswith("["):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        if isinstance(value, tuple):
+            value = list(value)
+        if not isinstance(value, list):
+            if value is None or isinstance(value, dict):
+                raise ToolArgumentError(f"Field '{field}' must be array")
+            value = [value]  # A single value where a list was expected
+        if item_coercer is None:
+            return value
+        return [item_coercer(item, f"{field}[{index}]") for index, item in enumerate(value)]
+
+    return coerce
+
+
+_TYPE_COERCERS: Dict[str, Coercer] = {
+    "integer": _coerce_integer,
+    "number": _coerce_number,
+    "string": _coerce_string,
+    "boolean": _coerce_boolean,
+    "object": _coerce_object,
+}
+
+
+def _compile_property(schema: Dict[str, Any]) -> Coercer:
+    type_name = schema.get("type")
+    if type_name == "array":
+        coercer = _compile_array(schema)
+    else:
+        coercer = _TYPE_COERCERS.get(type_name, lambda value, field: value)
+
+    enum = schema.get("enum")
+    if not enum:
+        return coercer
+
+    canonical = {str(option).lower(): option for option in enum}
+    allowed = ", ".join(str(option) for option in enum)
+
+    def coerce_enum(value: Any, field: str) -> Any:
+        value = coercer(value, field)
+        if value in enum:
+            return value
+        match = canonical.get(str(value).strip().lower())
+        if match is None:
+            raise ToolArgumentError(f"Field '{field}' must be one of: {allowed}")
+        return match
+
+    return coerce_enum
+
+
+def compile_tool_schema(tool_name: str, schema: Dict[str, Any]) -> Validator:
+    """Compile a tool's parameter schema into a validator: args -> coerced args."""
+    required: Tuple[str, ...] = tuple(schema.get("required", []))
+    properties = schema.get("properties", {})
+    coercers = [(field, _compile_property(field_schema)) for field, field_schema in properties.items()]
+    defaults = [
+        (field, field_schema["default"])
+        for field, field_schema in properties.items()
+        if "default" in field_schema
+    ]
+
+    def validate(args: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if args is None:
+            args = {}
+        if not isinstance(args, dict):
+            raise ToolArgumentError(f"Arguments for tool '{tool_name}' must be an object")
+        result = dict(args)
+        for field in required:
+            if result.get(field) is None:
+                raise ToolArgumentError(f"Missing required field '{field}' for tool '{tool_name}'")
+        for field, coerce in coercers:
+            if field not in result:
+                continue
+            if result[field] is None:
+                del result[field]  # Optional and null: treat as omitted
+                continue
+            result[field] = coerce(result[field], field)
+        for field, default in defaults:
+            if field not in result:
+                result[field] = copy.deepcopy(default)
+        return result
+
+    return validate
+
+
+# ============ Shared entry point and timing ============
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+def _record(tool_name: str, elapsed_ms: float, ok: bool) -> None:
+    with _stats_lock:
+        entry = _stats.setdefault(tool_name, {"calls": 0, "failures": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["calls"] += 1
+        entry["failures"] += 0 if ok else 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+
+def validate_tool_args(tool_name: str, tool_info: Dict[str, Any], args: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Validate and coerce arguments with the tool's compiled validator. Raises ToolArgumentError."""
+    validator = tool_info.get("validator")
+    if validator is None:
+        validator = tool_info["validator"] = compile_tool_schema(tool_name, tool_info.get("parameters", {}))
+    started = time.perf_counter()
+    ok = False
+    try:
+        validated = validator(args)
+        ok = True
+        return validated
+    finally:
+        _record(tool_name, (time.perf_counter() - started) * 1000, ok)
+
+
+def validation_stats() -> Dict[str, Dict[str, Any]]:
+    """Calls, failures and timing (ms) of argument validation per tool."""
+    with _stats_lock:
+        return {
+            name: {
+                "calls": int(entry["calls"]),
+                "failures": int(entry["failures"]),
+                "avg_ms": round(entry["total_ms"] / entry["calls"], 4) if entry["calls"] else 0.0,
+                "max_ms": round(entry["max_ms"], 4),
+            }
+            for name, entry in _stats.items()
+        }
@@ -0,0 +1,197 @@
+"""Redis-backed store for the latest UI state reported by each user's browser."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import msgpack
+import redis
+from pydantic import BaseModel, Field
+
+from api.core.config import get_settings
+from api.services.voice_processor import (
+    ButtonState,
+    DropdownState,
+    InputState,
+    TabState,
+    UiState,
+)
+
+logger = logging.getLogger(__name__)
+
+# Collections of a UiState that are keyed by element voice-id
+_ELEMENT_COLLECTIONS = ("tabs", "buttons", "inputs", "dropdowns")
+_SCALAR_FIELDS = ("route", "activeTab", "modal")
+
+
+class StaleUiStateError(Exception):
+    """Raised when an update is older than, or not based on, the stored snapshot."""
+
+    def __init__(self, message: str, current_version: int):
+        super().__init__(message)
+        self.current_version = current_version
+
+
+class UiStateDiff(BaseModel):
+    """Changes to apply on top of the stored UI state.
+
+    Scalar fields are applied only when present in the payload (so ``modal``
+    can be cleared by sending ``null``). Element lists are upserts keyed by
+    voice-id; ``removed`` maps a collection name to the ids that disappeared.
+    """
+    route: Optional[str] = None
+    activeTab: Optional[str] = None
+    modal: Optional[str] = None
+    tabs: List[TabState] = Field(default_factory=list)
+    buttons: List[ButtonState] = Field(default_factory=list)
+    inputs: List[InputState] = Field(default_factory=list)
+    dropdowns: List[DropdownState] = Field(default_factory=list)
+    removed: Dict[str, List[str]] = Field(default_factory=dict)
+
+
+def apply_ui_state_diff(state: UiState, diff: UiStateDiff) -> UiState:
+    """Return a new UiState with ``diff`` applied."""
+    data = state.model_dump()
+    for name in _SCALAR_FIELDS:
+        if name in diff.model_fields_set:
+            data[name] = getattr(diff, name)
+    for name in _ELEMENT_COLLECTIONS:
+        removed = set(diff.removed.get(name, []))
+        elements = {item["id"]: item for item in data[name] if item["id"] not in removed}
+        for item in getattr(diff, name):
+            elements[item.id] = item.model_dump()
+        data[name] = list(elements.values())
+    return UiState.model_validate(data)
+
+
+@dataclass
+class UiStateSnapshot:
+    version: int
+    state: UiState
+    updated_at: float
+
+
+class UiStateStore:
+    """Share UI state across API workers with versioned, msgpack-encoded snapshots.
+
+    Versions come from the client and must increase; an update carrying a
+    version at or below the stored one is stale and rejected. Updates without
+    a version are assigned the next one.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None, ttl_seconds: int = 1800):
+        settings = get_settings()
+        self._client = redis_client or redis.Redis.from_url(settings.redis_url)
+        self._ttl_seconds = ttl_seconds
+
+    def _key(self, user_id: int) -> str:
+        return f"voice:ui_state:{user_id}"
+
+    @staticmethod
+    def _encode(snapshot: UiStateSnapshot) -> bytes:
+        return msgpack.packb(
+            {
+                "v": snapshot.version,
+                "t": snapshot.updated_at,
+                "s": snapshot.state.model_dump(exclude_defaults=True),
+            },
+            use_bin_type=True,
+        )
+
+    @staticmethod
+    def _decode(raw: Optional[bytes]) -> Optional[UiStateSnapshot]:
+        if not raw:
+            return None
+        data = msgpack.unpackb(raw, raw=False)
+        return UiStateSnapshot(
+            version=data["v"],
+            state=UiState.model_validate(data["s"]),
+            updated_at=data["t"],
+        )
+
+    def get(self, user_id: int) -> Optional[UiStateSnapshot]:
+        try:
+            return self._decode(self._client.get(self._key(user_id)))
+        except (redis.RedisError, ValueError, KeyError) as exc:
+            logger.warning(f"Could not read UI state for user {user_id}: {exc}")
+            return None
+
+    def set(self, user_id: int, state: UiState, version: Optional[int] = None) -> UiStateSnapshot:
+        """Store a full snapshot, rejecting it if ``version`` is stale."""
+
+        def replace(current: Optional[UiStateSnapshot]) -> UiStateSnapshot:
+            current_version = current.version if current else 0
+            if version is not None and version <= current_version:
+                raise StaleUiStateError(
+                    f"UI state version {version} is not newer than {current_version}",
+                    current_version,
+                )
+            new_version = version if version is not None else current_version + 1
+            return UiStateSnapshot(version=new_version, state=state, updated_at=time.time())
+
+        return self._update(user_id, replace)
+
+    def apply_diff(
+        self,
+        user_id: int,
+        diff: UiStateDiff,
+        base_version: int,
+        version: Optional[int] = None,
+    ) -> UiStateSnapshot:
+        """Apply a diff made against ``base_version`` of the stored snapshot."""
+
+        def patch(current: Optional[UiStateSnapshot]) -> UiStateSnapshot:
+            current_version = current.version if current else 0
+            if current is None or base_version != current_version:
+                raise StaleUiStateError(
+                    f"UI state diff is based on version {base_version}, stored version is {current_version}",
+                    current_version,
+                )
+            new_version = version if version is not None else current_version + 1
+            if new_version <= current_version:
+                raise StaleUiStateError(
+                    f"UI state version {new_version} is not newer than {current_version}",
+                    current_version,
+                )
+            return UiStateSnapshot(
+                version=new_version,
+                state=apply_ui_state_diff(current.state, diff),
+                updated_at=time.time(),
+            )
+
+        return self._update(user_id, patch)
+
+    def clear(self, user_id: int) -> None:
+        self._client.delete(self._key(user_id))
+
+    def _update(
+        self,
+        user_id: int,
+        build: Callable[[Optional[UiStateSnapshot]], UiStateSnapshot],
+    ) -> UiStateSnapshot:
+        """Read-modify-write under WATCH so concurrent workers cannot interleave."""
+        key = self._key(user_id)
+        written: Dict[str, Any] = {}
+
+        def transaction(pipe) -> None:
+            snapshot = build(self._decode(pipe.get(key)))
+            pipe.multi()
+            pipe.set(key, self._encode(snapshot), ex=self._ttl_seconds)
+            written["snapshot"] = snapshot
+
+        self._client.transaction(transaction, key)
+        return written["snapshot"]
+
+
+_ui_state_store: Optional[UiStateStore] = None
+
+
+def get_ui_state_store() -> UiStateStore:
+    """Get the shared UI state store instance."""
+    global _ui_state_store
+    if _ui_state_store is None:
+        _ui_state_store = UiStateStore()
+    return _ui_state_store
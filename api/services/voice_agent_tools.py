@@ -35,6 +35,7 @@ from api.services.voice_page_registry import (
     get_tabs_for_page,
     is_tab_on_page,
     find_tab_page,
+    find_tab_by_spoken_name,
     find_feature_location,
     get_workflow,
     get_navigation_steps,
@@ -1340,6 +1341,12 @@ def handle_smart_switch_tab(tab_voice_id: str, current_route: Optional[str] = No
     if current_route:
         current_base = "/" + current_route.strip("/").split("/")[0]
 
+    # Accept spoken names ("AI tools", "advanced") as well as voice_ids
+    if not find_tab_page(tab_voice_id):
+        match = find_tab_by_spoken_name(tab_voice_id, current_route)
+        if match:
+            tab_voice_id = match[1]
+
     # FIRST: Check if the tab exists on the CURRENT page
     # This prevents navigating away when user is already on the right page
     if current_base and is_tab_on_page(tab_voice_id, current_base):
@@ -10,15 +10,20 @@ This module enables the voice controller to:
 from __future__ import annotations
 
 import json
+import logging
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import redis
 
 from api.core.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 class ConversationState(str, Enum):
     """States for the voice conversation flow."""
@@ -613,6 +618,21 @@ class ConversationContext:
         return cls(**data)
 
 
+@dataclass
+class _ConversationUnit:
+    """Context loaded once for a request and flushed when the request ends."""
+    key: str
+    raw: Optional[str]
+    context: ConversationContext
+    dirty: bool = False
+
+
+# Open units of work for the current request, keyed by Redis key
+_active_units: ContextVar[Optional[Dict[str, _ConversationUnit]]] = ContextVar(
+    "voice_conversation_units", default=None
+)
+
+
 class VoiceConversationManager:
     """Manages voice conversation state and page structure awareness."""
 
@@ -631,9 +651,8 @@ class VoiceConversationManager:
 
     # === Context Management ===
 
-    def get_context(self, user_id: Optional[int]) -> ConversationContext:
-        """Get current conversation context for user."""
-        data = self._client.get(self._key(user_id))
+    @staticmethod
+    def _decode_context(data: Optional[str]) -> ConversationContext:
         if not data:
             return ConversationContext()
         try:
@@ -641,9 +660,74 @@ class VoiceConversationManager:
         except (json.JSONDecodeError, TypeError):
             return ConversationContext()
 
+    def _active_unit(self, user_id: Optional[int]) -> Optional[_ConversationUnit]:
+        units = _active_units.get()
+        if not units:
+            return None
+        return units.get(self._key(user_id))
+
+    @contextmanager
+    def unit_of_work(self, user_id: Optional[int]) -> Iterator[ConversationContext]:
+        """Load the context once, keep helper mutations in memory, flush once.
+
+        Inside the block every helper (``get_context``, ``record_field_value``,
+        ``reset_retry_count``, ...) works on the same in-memory context instead
+        of doing its own GET/SET. The context is written back when the block
+        exits, including on error, so partial progress is kept as before.
+        Nested blocks for the same user share the outer unit.
+        """
+        key = self._key(user_id)
+        units = _active_units.get()
+        if units and key in units:
+            yield units[key].context
+            return
+
+        raw = self._client.get(key)
+        unit = _ConversationUnit(key=key, raw=raw, context=self._decode_context(raw))
+        token = _active_units.set({**(units or {}), key: unit})
+        try:
+            yield unit.context
+        finally:
+            _active_units.reset(token)
+            if unit.dirty:
+                self._flush(unit)
+
+    def _flush(self, unit: _ConversationUnit) -> None:
+        """Write a unit back with WATCH so concurrent tabs are not clobbered.
+
+        If another request wrote the context after this unit was loaded, only
+        the fields this request changed are applied on top of the newer value.
+        """
+        payload = json.loads(json.dumps(unit.context.to_dict()))
+        loaded = json.loads(unit.raw) if unit.raw else json.loads(json.dumps(ConversationContext().to_dict()))
+
+        def transaction(pipe) -> None:
+            current = pipe.get(unit.key)
+            data = payload
+            if current and current != unit.raw:
+                logger.info(f"Merging concurrent conversation update for {unit.key}")
+                data = json.loads(current)
+                data.update({k: v for k, v in payload.items() if loaded.get(k) != v})
+            pipe.multi()
+            pipe.set(unit.key, json.dumps(data), ex=self._ttl_seconds)
+
+        self._client.transaction(transaction, unit.key)
+
+    def get_context(self, user_id: Optional[int]) -> ConversationContext:
+        """Get current conversation context for user."""
+        unit = self._active_unit(user_id)
+        if unit is not None:
+            return unit.context
+        return self._decode_context(self._client.get(self._key(user_id)))
+
     def save_context(self, user_id: Optional[int], context: ConversationContext) -> None:
-        """Save conversation context."""
+        """Save conversation context (deferred to the flush inside a unit of work)."""
         context.last_interaction = time.time()
+        unit = self._active_unit(user_id)
+        if unit is not None:
+            unit.context = context
+            unit.dirty = True
+            return
         self._client.set(
             self._key(user_id),
             json.dumps(context.to_dict()),
@@ -653,6 +737,11 @@ class VoiceConversationManager:
     def clear_context(self, user_id: Optional[int]) -> None:
         """Clear conversation context (e.g., on logout)."""
         self._client.delete(self._key(user_id))
+        unit = self._active_unit(user_id)
+        if unit is not None:
+            unit.raw = None
+            unit.context = ConversationContext()
+            unit.dirty = False
 
     def cancel_form(self, user_id: Optional[int]) -> None:
         """Cancel form-filling state and reset to IDLE."""
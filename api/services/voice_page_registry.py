@@ -15,10 +15,15 @@ The LLM uses this registry to:
 NO REGEX OR KEYWORD MATCHING - This is structured data for the LLM to reason about.
 """
 
+import difflib
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from enum import Enum
 
+# Minimum difflib similarity for a spoken tab or page name to match a label
+SPOKEN_MATCH_CUTOFF = 0.75
+
 
 # ============================================================================
 # PAGE STRUCTURE DEFINITIONS
@@ -446,6 +451,191 @@ WORKFLOW_REGISTRY: Dict[str, WorkflowDefinition] = {
 }
 
 
+# ============================================================================
+# COMPILED INDEXES
+# ============================================================================
+# The registries above are static, so everything the query functions need is
+# compiled once at import: voice_id -> page maps, shortest navigation paths,
+# pre-rendered LLM context strings and a label index for spoken names.
+
+def _base_route(route: Optional[str]) -> str:
+    return "/" + route.strip("/").split("/")[0] if route else ""
+
+
+def _normalize_spoken(text: str) -> str:
+    """Lower-case, drop punctuation and filler words ("the", "tab", "page")."""
+    words = "".join(ch if ch.isalnum() else " " for ch in text.lower()).split()
+    return " ".join(word for word in words if word not in _SPOKEN_FILLER)
+
+
+_SPOKEN_FILLER = frozenset({"the", "tab", "page", "go", "to", "open", "switch", "show", "me", "my"})
+
+# voice_id -> routes that have the tab, in registry order (tab-create is on two pages)
+TAB_ROUTES: Dict[str, Tuple[str, ...]] = {}
+# route -> voice_id -> tab
+TABS_BY_PAGE: Dict[str, Dict[str, TabDefinition]] = {}
+
+for _route, _page in PAGE_REGISTRY.items():
+    TABS_BY_PAGE[_route] = {tab.voice_id: tab for tab in _page.tabs}
+    for _tab in _page.tabs:
+        TAB_ROUTES[_tab.voice_id] = TAB_ROUTES.get(_tab.voice_id, ()) + (_route,)
+
+# (feature, route, voice_id) in registry order, plus exact-match lookup
+_FEATURES: List[Tuple[str, str, str]] = [
+    (feature.lower(), route, tab.voice_id)
+    for route, page in PAGE_REGISTRY.items()
+    for tab in page.tabs
+    for feature in tab.features
+]
+_FEATURE_EXACT: Dict[str, Tuple[str, str]] = {}
+for _feature, _route, _voice_id in _FEATURES:
+    _FEATURE_EXACT.setdefault(_feature, (_route, _voice_id))
+
+_WORKFLOW_TRIGGERS: List[Tuple[str, WorkflowDefinition]] = [
+    (trigger.lower(), workflow)
+    for workflow in WORKFLOW_REGISTRY.values()
+    for trigger in workflow.triggers
+]
+
+# Spoken name -> [(route, voice_id)]: tab labels, voice_ids and voice_ids without "tab-"
+_TAB_LABELS: Dict[str, List[Tuple[str, str]]] = {}
+for _route, _page in PAGE_REGISTRY.items():
+    for _tab in _page.tabs:
+        for _name in (_tab.label, _tab.voice_id, _tab.voice_id.replace("tab-", "", 1)):
+            _key = _normalize_spoken(_name)
+            if _key and (_route, _tab.voice_id) not in _TAB_LABELS.get(_key, []):
+                _TAB_LABELS.setdefault(_key, []).append((_route, _tab.voice_id))
+
+# Spoken name -> route: page names and routes without the slash
+_PAGE_LABELS: Dict[str, str] = {}
+for _route, _page in PAGE_REGISTRY.items():
+    for _name in (_page.name, _route.strip("/").replace("-", " ")):
+        _PAGE_LABELS.setdefault(_normalize_spoken(_name), _route)
+
+
+def _navigation_graph() -> Dict[str, List[Tuple[str, WorkflowStep]]]:
+    """Edges: any page -> any other page (navigate), page -> its tabs (switch_tab).
+
+    Tab nodes are "route#voice_id" so the same tab on two pages stays distinct.
+    """
+    graph: Dict[str, List[Tuple[str, WorkflowStep]]] = {}
+    for route, page in PAGE_REGISTRY.items():
+        edges = graph.setdefault(route, [])
+        for tab in page.tabs:
+            edges.append((f"{route}#{tab.voice_id}", WorkflowStep(
+                action="switch_tab",
+                target=tab.voice_id,
+                description=f"Switch to {tab.label} tab",
+            )))
+        for other_route, other_page in PAGE_REGISTRY.items():
+            if other_route != route:
+                edges.append((other_route, WorkflowStep(
+                    action="navigate",
+                    target=other_route,
+                    description=f"Navigate to {other_page.name}",
+                    wait_for_load=True,
+                )))
+    return graph
+
+
+_NAVIGATION_GRAPH = _navigation_graph()
+
+
+def _shortest_path(start: str, target_tab: str) -> Tuple[WorkflowStep, ...]:
+    """Breadth-first search from a page to the nearest page that has the tab."""
+    routes = TAB_ROUTES.get(target_tab)
+    if not routes:
+        return ()
+    if start not in _NAVIGATION_GRAPH:
+        # Start outside the registry (no route or an unknown page): go to the first page with the tab
+        route = routes[0]
+        navigate = WorkflowStep(
+            action="navigate",
+            target=route,
+            description=f"Navigate to {PAGE_REGISTRY[route].name}",
+            wait_for_load=True,
+        )
+        return (navigate,) + _shortest_path(route, target_tab)
+
+    goals = {f"{route}#{target_tab}" for route in routes}
+    previous: Dict[str, Tuple[Optional[str], Optional[WorkflowStep]]] = {start: (None, None)}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        if node in goals:
+            path: List[WorkflowStep] = []
+            while previous[node][0] is not None:
+                parent, step = previous[node]
+                path.append(step)
+                node = parent
+            return tuple(reversed(path))
+        for neighbor, step in _NAVIGATION_GRAPH.get(node, []):
+            if neighbor not in previous:
+                previous[neighbor] = (node, step)
+                queue.append(neighbor)
+    return ()
+
+
+# (current page, tab voice_id) -> steps, for every page in the registry
+_NAVIGATION_PATHS: Dict[Tuple[str, str], Tuple[WorkflowStep, ...]] = {
+    (route, voice_id): _shortest_path(route, voice_id)
+    for route in PAGE_REGISTRY
+    for voice_id in TAB_ROUTES
+}
+
+
+def _render_page_context(page: PageDefinition) -> str:
+    lines = [
+        f"Current page: {page.name} ({page.route})",
+        f"Description: {page.description}",
+        "",
+        "Available tabs on THIS page:"
+    ]
+
+    for tab in page.tabs:
+        features_str = ", ".join(tab.features[:3])
+        if len(tab.features) > 3:
+            features_str += "..."
+        lines.append(f"  - {tab.voice_id}: {tab.label} - {tab.description}")
+        lines.append(f"    Features: {features_str}")
+
+    if not page.tabs:
+        lines.append("  (No tabs on this page)")
+
+    return "\n".join(lines)
+
+
+def _render_full_topology() -> str:
+    lines = ["=== APPLICATION PAGE TOPOLOGY ===", ""]
+
+    for route, page in PAGE_REGISTRY.items():
+        lines.append(f"## {page.name} ({route})")
+        lines.append(f"{page.description}")
+
+        if page.tabs:
+            lines.append("Tabs:")
+            for tab in page.tabs:
+                lines.append(f"  - {tab.voice_id}: {tab.label}")
+                lines.append(f"    → {tab.description}")
+        else:
+            lines.append("(No tabs)")
+
+        lines.append("")
+
+    lines.append("=== IMPORTANT RULES ===")
+    lines.append("1. ENROLLMENT is under /courses → tab-advanced (NOT create tab)")
+    lines.append("2. AI TOOLS is under /reports → tab-ai-tools (NOT sessions)")
+    lines.append("3. POLLS are under /console → tab-polls")
+    lines.append("4. CASES (post + view) are under /forum → tab-cases (NOT console)")
+    lines.append("5. If target tab is on DIFFERENT page, NAVIGATE FIRST then SWITCH TAB")
+
+    return "\n".join(lines)
+
+
+_PAGE_CONTEXTS: Dict[str, str] = {route: _render_page_context(page) for route, page in PAGE_REGISTRY.items()}
+_FULL_TOPOLOGY = _render_full_topology()
+
+
 # ============================================================================
 # REGISTRY QUERY FUNCTIONS
 # ============================================================================
@@ -453,7 +643,7 @@ WORKFLOW_REGISTRY: Dict[str, WorkflowDefinition] = {
 def get_page(route: str) -> Optional[PageDefinition]:
     """Get page definition by route."""
     # Handle routes with IDs (e.g., /courses/123)
-    base_route = "/" + route.strip("/").split("/")[0] if route else None
+    base_route = _base_route(route) or None
     if base_route:
         return PAGE_REGISTRY.get(base_route) or PAGE_REGISTRY.get(route)
     return PAGE_REGISTRY.get(route)
@@ -467,21 +657,23 @@ def get_tabs_for_page(route: str) -> List[TabDefinition]:
 
 def get_tab_voice_ids_for_page(route: str) -> List[str]:
     """Get list of tab voice_ids for a page."""
-    return [tab.voice_id for tab in get_tabs_for_page(route)]
+    page = get_page(route)
+    return list(TABS_BY_PAGE[page.route]) if page else []
 
 
 def is_tab_on_page(tab_voice_id: str, route: str) -> bool:
     """Check if a tab exists on a specific page."""
-    return tab_voice_id in get_tab_voice_ids_for_page(route)
+    page = get_page(route)
+    return page is not None and tab_voice_id in TABS_BY_PAGE[page.route]
 
 
-def find_tab_page(tab_voice_id: str) -> Optional[str]:
-    """Find which page a tab belongs to."""
-    for route, page in PAGE_REGISTRY.items():
-        for tab in page.tabs:
-            if tab.voice_id == tab_voice_id:
-                return route
-    return None
+def find_tab_page(tab_voice_id: str, current_route: Optional[str] = None) -> Optional[str]:
+    """Find which page a tab belongs to, preferring the current page when several have it."""
+    routes = TAB_ROUTES.get(tab_voice_id)
+    if not routes:
+        return None
+    current_base = _base_route(current_route)
+    return current_base if current_base in routes else routes[0]
 
 
 def find_feature_location(feature: str) -> Optional[tuple]:
@@ -490,21 +682,54 @@ def find_feature_location(feature: str) -> Optional[tuple]:
     Returns: (route, tab_voice_id) or None
     """
     feature_lower = feature.lower()
-    for route, page in PAGE_REGISTRY.items():
-        for tab in page.tabs:
-            for tab_feature in tab.features:
-                if feature_lower in tab_feature.lower() or tab_feature.lower() in feature_lower:
-                    return (route, tab.voice_id)
+    exact = _FEATURE_EXACT.get(feature_lower)
+    if exact:
+        return exact
+    for tab_feature, route, voice_id in _FEATURES:
+        if feature_lower in tab_feature or tab_feature in feature_lower:
+            return (route, voice_id)
     return None
 
 
+def find_tab_by_spoken_name(spoken: str, current_route: Optional[str] = None) -> Optional[Tuple[str, str]]:
+    """Resolve a spoken tab name ("the AI tools tab", "advanced") to (route, tab_voice_id).
+
+    Exact label/voice_id matches win; otherwise the closest label above a
+    similarity cutoff. The current page is preferred when several pages match.
+    """
+    key = _normalize_spoken(spoken)
+    if not key:
+        return None
+    candidates = _TAB_LABELS.get(key)
+    if candidates is None:
+        close = difflib.get_close_matches(key, _TAB_LABELS.keys(), n=1, cutoff=SPOKEN_MATCH_CUTOFF)
+        if not close:
+            return None
+        candidates = _TAB_LABELS[close[0]]
+    current_base = _base_route(current_route)
+    for route, voice_id in candidates:
+        if route == current_base:
+            return (route, voice_id)
+    return candidates[0]
+
+
+def find_page_by_spoken_name(spoken: str) -> Optional[str]:
+    """Resolve a spoken page name ("the forum", "platform guide") to its route."""
+    key = _normalize_spoken(spoken)
+    if not key:
+        return None
+    if key in _PAGE_LABELS:
+        return _PAGE_LABELS[key]
+    close = difflib.get_close_matches(key, _PAGE_LABELS.keys(), n=1, cutoff=SPOKEN_MATCH_CUTOFF)
+    return _PAGE_LABELS[close[0]] if close else None
+
+
 def get_workflow(intent: str) -> Optional[WorkflowDefinition]:
     """Find a workflow that matches the user's intent."""
     intent_lower = intent.lower()
-    for workflow in WORKFLOW_REGISTRY.values():
-        for trigger in workflow.triggers:
-            if trigger.lower() in intent_lower or intent_lower in trigger.lower():
-                return workflow
+    for trigger, workflow in _WORKFLOW_TRIGGERS:
+        if trigger in intent_lower or intent_lower in trigger:
+            return workflow
     return None
 
 
@@ -512,35 +737,13 @@ def get_navigation_steps(current_route: str, target_tab: str) -> List[WorkflowSt
     """Get the steps needed to navigate to a target tab from current location.
 
     Returns list of steps: may include navigation if tab is on different page.
+    Stays on the current page when it has the tab (e.g. tab-create on /sessions).
     """
-    steps = []
-
-    # Find which page the target tab is on
-    target_page = find_tab_page(target_tab)
-
-    if target_page is None:
-        return []  # Tab not found in registry
-
-    # Check if we need to navigate to a different page
-    current_base = "/" + current_route.strip("/").split("/")[0] if current_route else ""
-
-    if current_base != target_page:
-        # Need to navigate first
-        steps.append(WorkflowStep(
-            action="navigate",
-            target=target_page,
-            description=f"Navigate to {PAGE_REGISTRY[target_page].name}",
-            wait_for_load=True
-        ))
-
-    # Then switch to the tab
-    steps.append(WorkflowStep(
-        action="switch_tab",
-        target=target_tab,
-        description=f"Switch to tab"
-    ))
-
-    return steps
+    current_base = _base_route(current_route)
+    steps = _NAVIGATION_PATHS.get((current_base, target_tab))
+    if steps is None:
+        steps = _shortest_path(current_base, target_tab)
+    return list(steps)
 
 
 # ============================================================================
@@ -554,49 +757,9 @@ def generate_page_context_for_llm(current_route: str) -> str:
     if not page:
         return f"Current page: {current_route} (unknown page)"
 
-    lines = [
-        f"Current page: {page.name} ({page.route})",
-        f"Description: {page.description}",
-        "",
-        "Available tabs on THIS page:"
-    ]
-
-    for tab in page.tabs:
-        features_str = ", ".join(tab.features[:3])
-        if len(tab.features) > 3:
-            features_str += "..."
-        lines.append(f"  - {tab.voice_id}: {tab.label} - {tab.description}")
-        lines.append(f"    Features: {features_str}")
-
-    if not page.tabs:
-        lines.append("  (No tabs on this page)")
-
-    return "\n".join(lines)
+    return _PAGE_CONTEXTS[page.route]
 
 
 def generate_full_topology_for_llm() -> str:
     """Generate a complete page topology for the LLM prompt."""
-    lines = ["=== APPLICATION PAGE TOPOLOGY ===", ""]
-
-    for route, page in PAGE_REGISTRY.items():
-        lines.append(f"## {page.name} ({route})")
-        lines.append(f"{page.description}")
-
-        if page.tabs:
-            lines.append("Tabs:")
-            for tab in page.tabs:
-                lines.append(f"  - {tab.voice_id}: {tab.label}")
-                lines.append(f"    → {tab.description}")
-        else:
-            lines.append("(No tabs)")
-
-        lines.append("")
-
-    lines.append("=== IMPORTANT RULES ===")
-    lines.append("1. ENROLLMENT is under /courses → tab-advanced (NOT create tab)")
-    lines.append("2. AI TOOLS is under /reports → tab-ai-tools (NOT sessions)")
-    lines.append("3. POLLS are under /console → tab-polls")
-    lines.append("4. CASES (post + view) are under /forum → tab-cases (NOT console)")
-    lines.append("5. If target tab is on DIFFERENT page, NAVIGATE FIRST then SWITCH TAB")
-
-    return "\n".join(lines)
+    return _FULL_TOPOLOGY
@@ -1,13 +0,0 @@
-"""
-AristAI MCP Server Package.
-
-This package exposes AristAI's classroom forum functionality as a Model Context Protocol (MCP) server,
-enabling voice assistants and other MCP clients to interact with the platform without any clicks or keyboard input.
-
-Components:
-- server.py: Main MCP server implementation using FastMCP
-- tools/: Individual tool modules organized by domain
-- voice_loop.py: Continuous voice interaction controller
-"""
-
-__version__ = "1.0.0"
@@ -115,9 +115,10 @@ export default function MaterialsManager({
       setUploadProgress(10);
       setError(null);
 
-      await api.uploadMaterial(courseId, file, {
+      await api.uploadMaterialDirect(courseId, file, {
         sessionId,
         userId,
+        onProgress: (fraction) => setUploadProgress(10 + Math.round(fraction * 80)),
       });
 
       setUploadProgress(100);
@@ -186,7 +187,10 @@ export default function MaterialsManager({
 
       try {
         setUploading(true);
-        await api.replaceMaterial(courseId, materialId, file, userId);
+        await api.uploadMaterialDirect(courseId, file, {
+          userId,
+          replacesMaterialId: materialId,
+        });
         await fetchMaterials();
       } catch (err: any) {
         console.error('Replace failed:', err);
@@ -9,7 +9,7 @@
 
 import { useEffect, useCallback, useRef } from 'react';
 import { usePathname } from 'next/navigation';
-import { getCompactUiState, UiState } from '@/lib/voice-ui-state';
+import { getCompactUiState, CompactUiState, UiState } from '@/lib/voice-ui-state';
 import { API_BASE } from '@/lib/api';
 
 // ============================================================================
@@ -23,18 +23,101 @@ const UI_STATE_CHANGE_DEBOUNCE = 500; // Debounce rapid changes
 // API CALLS
 // ============================================================================
 
-async function syncUiState(userId: number, uiState: ReturnType<typeof getCompactUiState>): Promise<void> {
+type ElementCollection = 'tabs' | 'buttons' | 'inputs' | 'dropdowns';
+
+const ELEMENT_COLLECTIONS: ElementCollection[] = ['tabs', 'buttons', 'inputs', 'dropdowns'];
+const SCALAR_FIELDS = ['route', 'activeTab', 'modal'] as const;
+
+interface SyncedUiState {
+  version: number;
+  state: CompactUiState;
+}
+
+/**
+ * Compute the changes between two compact UI states.
+ * Elements are keyed by voice-id; only added/changed elements are sent.
+ */
+function diffUiState(previous: CompactUiState, next: CompactUiState): Record<string, unknown> {
+  const diff: Record<string, unknown> = {};
+  const removed: Record<string, string[]> = {};
+
+  for (const field of SCALAR_FIELDS) {
+    if (previous[field] !== next[field]) {
+      diff[field] = next[field];
+    }
+  }
+
+  for (const collection of ELEMENT_COLLECTIONS) {
+    const before = new Map<string, string>(
+      (previous[collection] as Array<{ id: string }>).map(item => [item.id, JSON.stringify(item)]),
+    );
+    const nextItems = next[collection] as Array<{ id: string }>;
+    const changed = nextItems.filter(item => before.get(item.id) !== JSON.stringify(item));
+    if (changed.length > 0) {
+      diff[collection] = changed;
+    }
+    const nextIds = new Set(nextItems.map(item => item.id));
+    const gone = Array.from(before.keys()).filter(id => !nextIds.has(id));
+    if (gone.length > 0) {
+      removed[collection] = gone;
+    }
+  }
+
+  if (Object.keys(removed).length > 0) {
+    diff.removed = removed;
+  }
+  return diff;
+}
+
+function nextVersion(previous?: SyncedUiState | null): number {
+  // Timestamps keep versions increasing across page reloads
+  return Math.max(Date.now(), (previous?.version ?? 0) + 1);
+}
+
+async function postUiState(path: string, body: Record<string, unknown>): Promise<{ version: number } | null> {
+  const response = await fetch(`${API_BASE}/voice/v2/${path}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(body),
+  });
+  if (!response.ok) {
+    return null;
+  }
+  return response.json();
+}
+
+/**
+ * Sync UI state to the backend, sending only a diff when the backend already
+ * has our previous snapshot. Falls back to a full snapshot when the diff is
+ * rejected (e.g. the stored state expired or another tab updated it).
+ */
+async function syncUiState(
+  userId: number,
+  uiState: CompactUiState,
+  previous: SyncedUiState | null,
+): Promise<SyncedUiState | null> {
   try {
-    await fetch(`${API_BASE}/voice/v2/ui-state`, {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({
+    const version = nextVersion(previous);
+    if (previous) {
+      const result = await postUiState('ui-state/diff', {
         user_id: userId,
-        ui_state: uiState,
-      }),
+        base_version: previous.version,
+        version,
+        diff: diffUiState(previous.state, uiState),
+      });
+      if (result) {
+        return { version: result.version, state: uiState };
+      }
+    }
+    const result = await postUiState('ui-state', {
+      user_id: userId,
+      ui_state: uiState,
+      version,
     });
+    return result ? { version: result.version, state: uiState } : null;
   } catch (error) {
     console.error('Failed to sync UI state:', error);
+    return null;
   }
 }
 
@@ -96,6 +179,7 @@ export function useVoiceUiState(options: UseVoiceUiStateOptions = {}) {
   const { userId, enabled = true, onUiAction } = options;
   const pathname = usePathname();
   const lastSyncRef = useRef<string>('');
+  const syncedStateRef = useRef<SyncedUiState | null>(null);
   const syncTimeoutRef = useRef<NodeJS.Timeout | null>(null);
 
   // Sync UI state to backend
@@ -108,7 +192,11 @@ export function useVoiceUiState(options: UseVoiceUiStateOptions = {}) {
     // Only sync if state changed
     if (stateJson !== lastSyncRef.current) {
       lastSyncRef.current = stateJson;
-      await syncUiState(userId, uiState);
+      syncedStateRef.current = await syncUiState(userId, uiState, syncedStateRef.current);
+      if (!syncedStateRef.current) {
+        // Retry with a full snapshot on the next tick
+        lastSyncRef.current = '';
+      }
     }
   }, [userId, enabled]);
 
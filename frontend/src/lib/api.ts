@@ -480,6 +480,86 @@ export const api = {
       body: JSON.stringify(data),
     }),
 
+  // Upload straight to S3 in parts, then register the material. The API
+  // server never handles file bytes, so large lecture videos do not tie it up.
+  uploadMaterialDirect: async (
+    courseId: number,
+    file: File,
+    options?: {
+      title?: string;
+      description?: string;
+      sessionId?: number;
+      userId?: number;
+      replacesMaterialId?: number;
+      onProgress?: (fraction: number) => void;
+    }
+  ) => {
+    const upload = await fetchApi<{
+      upload_id: string;
+      s3_key: string;
+      part_size: number;
+      part_count: number;
+      part_urls: Record<string, string>;
+    }>('/materials/multipart-uploads', {
+      method: 'POST',
+      body: JSON.stringify({
+        course_id: courseId,
+        filename: file.name,
+        content_type: file.type || 'application/octet-stream',
+        file_size: file.size,
+        session_id: options?.sessionId,
+        user_id: options?.userId,
+      }),
+    });
+    const uploadRef = {
+      course_id: courseId,
+      s3_key: upload.s3_key,
+      upload_id: upload.upload_id,
+      user_id: options?.userId,
+    };
+
+    try {
+      const parts: { part_number: number; etag: string }[] = [];
+      for (let partNumber = 1; partNumber <= upload.part_count; partNumber++) {
+        const start = (partNumber - 1) * upload.part_size;
+        const response = await fetch(upload.part_urls[String(partNumber)], {
+          method: 'PUT',
+          body: file.slice(start, start + upload.part_size),
+        });
+        const etag = response.headers.get('ETag');
+        if (!response.ok || !etag) {
+          throw new ApiError(response.status, `Failed to upload part ${partNumber}`);
+        }
+        parts.push({ part_number: partNumber, etag });
+        options?.onProgress?.(partNumber / upload.part_count);
+      }
+
+      await fetchApi('/materials/multipart-uploads/complete', {
+        method: 'POST',
+        body: JSON.stringify({ ...uploadRef, parts }),
+      });
+    } catch (err) {
+      await fetchApi('/materials/multipart-uploads/abort', {
+        method: 'POST',
+        body: JSON.stringify(uploadRef),
+      }).catch(() => undefined);
+      throw err;
+    }
+
+    return fetchApi<any>(`/courses/${courseId}/materials/finalize`, {
+      method: 'POST',
+      body: JSON.stringify({
+        s3_key: upload.s3_key,
+        filename: file.name,
+        title: options?.title,
+        description: options?.description,
+        session_id: options?.sessionId,
+        replaces_material_id: options?.replacesMaterialId,
+        user_id: options?.userId,
+      }),
+    });
+  },
+
   replaceMaterial: async (courseId: number, materialId: number, file: File, userId?: number) => {
     const url = `${API_PROXY_BASE}/courses/${courseId}/materials/${materialId}/replace`;
 
@@ -14,6 +14,8 @@ import uvicorn
 from mcp.types import CallToolRequest, ListToolsRequest
 from mcp.server.sse import SseServerTransport
 from mcp.server import Server
+from api.api.mcp_executor import ToolBusyError, ToolTimeoutError, get_tool_executor
+from api.services.tool_validation import ToolArgumentError, validate_tool_args
 
 # Initialize FastAPI app for HTTP transport
 app = FastAPI(title="AristAI MCP Server - HTTP/SSE")
@@ -57,36 +59,32 @@ async def http_execute_tool(request: CallToolRequest):
     if not tool_info:
         return {"error": f"Tool '{tool_name}' not found", "code": 404}
     
+    try:
+        arguments = validate_tool_args(tool_name, tool_info, arguments)
+    except ToolArgumentError as e:
+        return {"error": str(e), "tool": tool_name, "code": 400}
+
+    executor = get_tool_executor()
     try:
         if tool_info["mode"] == "write" and tool_name not in ACTION_TOOL_NAMES:
             # Plan write actions
-            db = SessionLocal()
-            try:
-                preview = build_action_preview(tool_name, arguments, db=db)
-                action = action_store.create_action(
-                    user_id=None,  # Will be set by ElevenLabs
-                    tool_name=tool_name,
-                    args=arguments,
-                    preview=preview,
-                )
-                return {
-                    "tool": tool_name,
-                    "action_id": action.action_id,
-                    "requires_confirmation": True,
-                    "preview": preview,
-                    "message": "Action planned. Please confirm to execute."
-                }
-            finally:
-                db.close()
+            planned = await executor.plan_write(tool_name, arguments, None, action_store)  # user_id set by ElevenLabs
+            return {
+                "tool": tool_name,
+                "action_id": planned["action_id"],
+                "requires_confirmation": True,
+                "preview": planned["preview"],
+                "message": "Action planned. Please confirm to execute."
+            }
         else:
-            # Execute read actions or confirmed actions
-            db = SessionLocal()
-            try:
-                result = invoke_tool_handler(tool_info["handler"], arguments, db=db)
-                return {"tool": tool_name, "result": result}
-            finally:
-                db.close()
-                
+            # Execute read actions or confirmed actions on the shared tool pool
+            result = await executor.invoke(tool_name, tool_info["handler"], arguments, category=tool_info.get("category"))
+            return {"tool": tool_name, "result": result}
+
+    except ToolBusyError as e:
+        return {"error": str(e), "tool": tool_name, "code": 429}
+    except ToolTimeoutError as e:
+        return {"error": str(e), "tool": tool_name, "code": 504}
     except Exception as e:
         return {"error": str(e), "tool": tool_name, "code": 500}
 
@@ -47,7 +47,7 @@ def include_voice_loop_router(app_router: APIRouter):
     """
     import asyncio
     from typing import Optional, Dict, Any
-    from fastapi import WebSocket, WebSocketDisconnect
+    from fastapi import WebSocket
     from pydantic import BaseModel
     
     voice_loop_router = APIRouter()
@@ -127,71 +127,10 @@ def include_voice_loop_router(app_router: APIRouter):
     
     @voice_loop_router.websocket("/ws")
     async def voice_websocket(websocket: WebSocket):
-        """WebSocket for real-time voice interaction."""
-        from mcp_server.voice_loop import VoiceLoopController
-        from api.services import asr
-        import base64
-        
-        await websocket.accept()
-        
-        controller = VoiceLoopController(
-            on_transcript=lambda t: asyncio.create_task(
-                websocket.send_json({"type": "transcript", "data": t})
-            ),
-            on_response=lambda r: asyncio.create_task(
-                websocket.send_json({"type": "response", "data": r})
-            ),
-        )
+        """WebSocket for real-time voice interaction (see serve_voice_websocket)."""
+        from mcp_server.voice_loop import serve_voice_websocket
         
-        try:
-            # Send ready message
-            await websocket.send_json({"type": "ready", "data": "Voice WebSocket connected"})
-            
-            while True:
-                data = await websocket.receive_json()
-                msg_type = data.get("type")
-                
-                if msg_type == "audio":
-                    # Decode and transcribe audio
-                    audio_bytes = base64.b64decode(data.get("data", ""))
-                    content_type = data.get("content_type", "audio/webm")
-                    
-                    result = asr.transcribe(audio_bytes, content_type)
-                    
-                    if result.transcript:
-                        await websocket.send_json({
-                            "type": "transcript",
-                            "data": result.transcript,
-                            "language": result.language,
-                        })
-                        
-                        # Process command
-                        response = await controller._process_command(result.transcript)
-                        await websocket.send_json({
-                            "type": "response",
-                            "data": response
-                        })
-                
-                elif msg_type == "text":
-                    # Direct text input
-                    transcript = data.get("data", "")
-                    if transcript:
-                        response = await controller._process_command(transcript)
-                        await websocket.send_json({
-                            "type": "response",
-                            "data": response
-                        })
-                
-                elif msg_type == "ping":
-                    await websocket.send_json({"type": "pong"})
-                
-                elif msg_type == "stop":
-                    break
-                    
-        except WebSocketDisconnect:
-            pass
-        finally:
-            controller._close_db()
+        await serve_voice_websocket(websocket, ready_message="Voice WebSocket connected")
     
     app_router.include_router(
         voice_loop_router,
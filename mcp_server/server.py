@@ -25,7 +25,8 @@ import inspect
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -39,25 +40,16 @@ from mcp.types import (
     ListToolsResult,
 )
 
+from api.api.mcp_executor import get_tool_executor
 from api.core.database import SessionLocal
 from api.services.action_preview import build_action_preview
 from api.services.action_store import ActionStore
+from api.services.tool_cache import ToolCachePolicy, cached_handler, invalidating_handler
 from api.services.tool_response import normalize_tool_result
+from api.services.tool_validation import ToolArgumentError, compile_tool_schema, validate_tool_args
 
-# Import all tool modules
-from mcp_server.tools import (
-    courses,
-    sessions,
-    forum,
-    polls,
-    reports,
-    copilot,
-    enrollment,
-    navigation,
-    resolve,
-    voice,
-    content_generation,
-)
+# Tool modules are imported on first call (see mcp_server.tools.LazyHandler)
+from mcp_server.tools import LazyHandler, import_stats
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -115,8 +107,18 @@ def register_tool(
     handler: callable,
     mode: str = "read",
     category: str = "general",
+    cache: Optional[ToolCachePolicy] = None,
+    invalidates: Tuple[str, ...] = (),
 ):
-    """Register a tool in the registry."""
+    """Register a tool in the registry.
+
+    cache: read-through cache policy for read tools (TTL and tags, see api.services.tool_cache).
+    invalidates: tags a write tool makes stale when it succeeds, formatted from its arguments.
+    """
+    if cache is not None and mode == "read":
+        handler = cached_handler(name, handler, cache)
+    if invalidates:
+        handler = invalidating_handler(handler, invalidates)
     TOOL_REGISTRY[name] = {
         "name": name,
         "description": description,
@@ -124,6 +126,7 @@ def register_tool(
         "handler": handler,
         "mode": mode,  # "read" or "write"
         "category": category,
+        "validator": compile_tool_schema(name, parameters),
     }
 
 
@@ -139,6 +142,10 @@ def plan_action(
         return {"success": False, "error": f"Unknown tool '{tool_name}'"}
     if tool_info.get("mode") != "write":
         return {"success": False, "error": f"Tool '{tool_name}' is not a write action"}
+    try:
+        args = validate_tool_args(tool_name, tool_info, args)
+    except ToolArgumentError as e:
+        return {"success": False, "error": str(e)}
     preview = build_action_preview(tool_name, args, db=db)
     action = action_store.create_action(
         user_id=user_id,
@@ -173,7 +180,15 @@ def execute_action(
     if not tool_info:
         action_store.update_action(action.action_id, status="failed", result={"error": "Unknown tool"})
         return {"success": False, "error": "Unknown tool"}
-    result = _invoke_tool_handler_with_db(tool_info["handler"], action.args, db=db)
+    # A retry after a timeout must not apply the write a second time
+    if not action_store.claim_action(action.action_id):
+        return {"success": False, "error": "Action is already being executed"}
+    action_store.update_action(action.action_id, status="executing")
+    try:
+        result = _invoke_tool_handler_with_db(tool_info["handler"], action.args, db=db)
+    except Exception as e:
+        action_store.update_action(action.action_id, status="failed", result={"error": str(e)})
+        raise
     action_store.update_action(
         action.action_id,
         status="executed",
@@ -214,9 +229,10 @@ def build_tool_registry():
             },
             "required": [],
         },
-        handler=courses.list_courses,
+        handler=LazyHandler("courses", "list_courses"),
         mode="read",
         category="courses",
+        cache=ToolCachePolicy(ttl_seconds=60, tags=("courses",)),
     )
     
     register_tool(
@@ -229,9 +245,10 @@ def build_tool_registry():
             },
             "required": ["course_id"],
         },
-        handler=courses.get_course,
+        handler=LazyHandler("courses", "get_course"),
         mode="read",
         category="courses",
+        cache=ToolCachePolicy(ttl_seconds=60, tags=("course:{course_id}", "sessions")),
     )
     
     register_tool(
@@ -246,9 +263,10 @@ def build_tool_registry():
             },
             "required": ["title"],
         },
-        handler=courses.create_course,
+        handler=LazyHandler("courses", "create_course"),
         mode="write",
         category="courses",
+        invalidates=("courses",),
     )
     
     register_tool(
@@ -261,9 +279,10 @@ def build_tool_registry():
             },
             "required": ["course_id"],
         },
-        handler=courses.generate_session_plans,
+        handler=LazyHandler("courses", "generate_session_plans"),
         mode="write",
         category="courses",
+        invalidates=("sessions", "course:{course_id}"),
     )
     
     # ============ SESSION TOOLS ============
@@ -279,9 +298,10 @@ def build_tool_registry():
             },
             "required": ["course_id"],
         },
-        handler=sessions.list_sessions,
+        handler=LazyHandler("sessions", "list_sessions"),
         mode="read",
         category="sessions",
+        cache=ToolCachePolicy(ttl_seconds=60, tags=("sessions",)),
     )
     
     register_tool(
@@ -294,9 +314,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=sessions.get_session,
+        handler=LazyHandler("sessions", "get_session"),
         mode="read",
         category="sessions",
+        cache=ToolCachePolicy(ttl_seconds=30, tags=("session:{session_id}",)),
     )
     
     register_tool(
@@ -309,9 +330,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=sessions.get_session_plan,
+        handler=LazyHandler("sessions", "get_session_plan"),
         mode="read",
         category="sessions",
+        cache=ToolCachePolicy(ttl_seconds=120, tags=("session:{session_id}",)),
     )
     
     register_tool(
@@ -325,9 +347,10 @@ def build_tool_registry():
             },
             "required": ["course_id", "title"],
         },
-        handler=sessions.create_session,
+        handler=LazyHandler("sessions", "create_session"),
         mode="write",
         category="sessions",
+        invalidates=("sessions", "course:{course_id}"),
     )
     
     register_tool(
@@ -341,9 +364,10 @@ def build_tool_registry():
             },
             "required": ["session_id", "status"],
         },
-        handler=sessions.update_session_status,
+        handler=LazyHandler("sessions", "update_session_status"),
         mode="write",
         category="sessions",
+        invalidates=("sessions", "session:{session_id}"),
     )
     
     register_tool(
@@ -356,9 +380,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=sessions.go_live,
+        handler=LazyHandler("sessions", "go_live"),
         mode="write",
         category="sessions",
+        invalidates=("sessions", "session:{session_id}"),
     )
     
     register_tool(
@@ -371,9 +396,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=sessions.end_session,
+        handler=LazyHandler("sessions", "end_session"),
         mode="write",
         category="sessions",
+        invalidates=("sessions", "session:{session_id}"),
     )
     
     # ============ FORUM TOOLS (Cases, Posts, Moderation) ============
@@ -388,7 +414,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=forum.get_session_cases,
+        handler=LazyHandler("forum", "get_session_cases"),
         mode="read",
         category="forum",
     )
@@ -404,9 +430,10 @@ def build_tool_registry():
             },
             "required": ["session_id", "prompt"],
         },
-        handler=forum.post_case,
+        handler=LazyHandler("forum", "post_case"),
         mode="write",
         category="forum",
+        invalidates=("posts",),
     )
     
     register_tool(
@@ -420,7 +447,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=forum.get_session_posts,
+        handler=LazyHandler("forum", "get_session_posts"),
         mode="read",
         category="forum",
     )
@@ -436,7 +463,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=forum.get_latest_posts,
+        handler=LazyHandler("forum", "get_latest_posts"),
         mode="read",
         category="forum",
     )
@@ -451,9 +478,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=forum.get_pinned_posts,
+        handler=LazyHandler("forum", "get_pinned_posts"),
         mode="read",
         category="forum",
+        cache=ToolCachePolicy(ttl_seconds=15, tags=("posts",)),
     )
     
     register_tool(
@@ -466,7 +494,7 @@ def build_tool_registry():
             },
             "required": ["post_id"],
         },
-        handler=forum.get_post,
+        handler=LazyHandler("forum", "get_post"),
         mode="read",
         category="forum",
     )
@@ -482,7 +510,7 @@ def build_tool_registry():
             },
             "required": ["session_id", "query"],
         },
-        handler=forum.search_posts,
+        handler=LazyHandler("forum", "search_posts"),
         mode="read",
         category="forum",
     )
@@ -499,9 +527,10 @@ def build_tool_registry():
             },
             "required": ["session_id", "user_id", "content"],
         },
-        handler=forum.create_post,
+        handler=LazyHandler("forum", "create_post"),
         mode="write",
         category="forum",
+        invalidates=("posts",),
     )
     
     register_tool(
@@ -517,9 +546,10 @@ def build_tool_registry():
             },
             "required": ["session_id", "parent_post_id", "user_id", "content"],
         },
-        handler=forum.reply_to_post,
+        handler=LazyHandler("forum", "reply_to_post"),
         mode="write",
         category="forum",
+        invalidates=("posts",),
     )
     
     register_tool(
@@ -533,9 +563,10 @@ def build_tool_registry():
             },
             "required": ["post_id", "pinned"],
         },
-        handler=forum.pin_post,
+        handler=LazyHandler("forum", "pin_post"),
         mode="write",
         category="forum",
+        invalidates=("posts",),
     )
     
     register_tool(
@@ -549,9 +580,50 @@ def build_tool_registry():
             },
             "required": ["post_id", "labels"],
         },
-        handler=forum.label_post,
+        handler=LazyHandler("forum", "label_post"),
         mode="write",
         category="forum",
+        invalidates=("posts",),
+    )
+    
+    register_tool(
+        name="pin_posts",
+        description="Pin or unpin several posts at once with a single confirmation. Prefer this over repeated pin_post calls.",
+        parameters={
+            "type": "object",
+            "properties": {
+                "post_ids": {"type": "array", "items": {"type": "integer"}, "description": "The post IDs"},
+                "pinned": {"type": "boolean", "description": "True to pin, False to unpin", "default": True},
+            },
+            "required": ["post_ids"],
+        },
+        handler=LazyHandler("forum", "pin_posts"),
+        mode="write",
+        category="forum",
+        invalidates=("posts",),
+    )
+    
+    register_tool(
+        name="label_posts",
+        description="Label several posts at once with a single confirmation. Labels: high-quality, needs-clarification, insightful, misconception, question. Prefer this over repeated label_post calls.",
+        parameters={
+            "type": "object",
+            "properties": {
+                "post_ids": {"type": "array", "items": {"type": "integer"}, "description": "The post IDs"},
+                "labels": {"type": "array", "items": {"type": "string"}, "description": "Labels to apply"},
+                "mode": {
+                    "type": "string",
+                    "enum": ["add", "replace"],
+                    "description": "add: merge with existing labels; replace: set exactly these labels",
+                    "default": "add",
+                },
+            },
+            "required": ["post_ids", "labels"],
+        },
+        handler=LazyHandler("forum", "label_posts"),
+        mode="write",
+        category="forum",
+        invalidates=("posts",),
     )
     
     register_tool(
@@ -564,9 +636,10 @@ def build_tool_registry():
             },
             "required": ["post_id"],
         },
-        handler=forum.mark_high_quality,
+        handler=LazyHandler("forum", "mark_high_quality"),
         mode="write",
         category="forum",
+        invalidates=("posts",),
     )
     
     register_tool(
@@ -579,9 +652,10 @@ def build_tool_registry():
             },
             "required": ["post_id"],
         },
-        handler=forum.mark_needs_clarification,
+        handler=LazyHandler("forum", "mark_needs_clarification"),
         mode="write",
         category="forum",
+        invalidates=("posts",),
     )
     
     # ============ POLL TOOLS ============
@@ -596,9 +670,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=polls.get_session_polls,
+        handler=LazyHandler("polls", "get_session_polls"),
         mode="read",
         category="polls",
+        cache=ToolCachePolicy(ttl_seconds=15, tags=("polls",)),
     )
     
     register_tool(
@@ -611,7 +686,7 @@ def build_tool_registry():
             },
             "required": ["poll_id"],
         },
-        handler=polls.get_poll_results,
+        handler=LazyHandler("polls", "get_poll_results"),
         mode="read",
         category="polls",
     )
@@ -628,9 +703,10 @@ def build_tool_registry():
             },
             "required": ["session_id", "question", "options"],
         },
-        handler=polls.create_poll,
+        handler=LazyHandler("polls", "create_poll"),
         mode="write",
         category="polls",
+        invalidates=("polls",),
     )
     
     register_tool(
@@ -645,9 +721,10 @@ def build_tool_registry():
             },
             "required": ["poll_id", "user_id", "option_index"],
         },
-        handler=polls.vote_on_poll,
+        handler=LazyHandler("polls", "vote_on_poll"),
         mode="write",
         category="polls",
+        invalidates=("polls",),
     )
     
     # ============ COPILOT TOOLS ============
@@ -662,7 +739,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=copilot.get_copilot_status,
+        handler=LazyHandler("copilot", "get_copilot_status"),
         mode="read",
         category="copilot",
     )
@@ -678,7 +755,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=copilot.get_copilot_suggestions,
+        handler=LazyHandler("copilot", "get_copilot_suggestions"),
         mode="read",
         category="copilot",
     )
@@ -693,7 +770,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=copilot.start_copilot,
+        handler=LazyHandler("copilot", "start_copilot"),
         mode="write",
         category="copilot",
     )
@@ -708,7 +785,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=copilot.stop_copilot,
+        handler=LazyHandler("copilot", "stop_copilot"),
         mode="write",
         category="copilot",
     )
@@ -725,9 +802,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=reports.get_report,
+        handler=LazyHandler("reports", "get_report"),
         mode="read",
         category="reports",
+        cache=ToolCachePolicy(ttl_seconds=60, tags=("report:{session_id}",)),
     )
     
     register_tool(
@@ -740,9 +818,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=reports.get_report_summary,
+        handler=LazyHandler("reports", "get_report_summary"),
         mode="read",
         category="reports",
+        cache=ToolCachePolicy(ttl_seconds=60, tags=("report:{session_id}",)),
     )
     
     register_tool(
@@ -755,7 +834,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=reports.get_participation_stats,
+        handler=LazyHandler("reports", "get_participation_stats"),
         mode="read",
         category="reports",
     )
@@ -770,7 +849,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=reports.get_student_scores,
+        handler=LazyHandler("reports", "get_student_scores"),
         mode="read",
         category="reports",
     )
@@ -785,9 +864,10 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=reports.generate_report,
+        handler=LazyHandler("reports", "generate_report"),
         mode="write",
         category="reports",
+        invalidates=("report:{session_id}",),
     )
     
     # ============ ENROLLMENT TOOLS ============
@@ -802,9 +882,10 @@ def build_tool_registry():
             },
             "required": ["course_id"],
         },
-        handler=enrollment.get_enrolled_students,
+        handler=LazyHandler("enrollment", "get_enrolled_students"),
         mode="read",
         category="enrollment",
+        cache=ToolCachePolicy(ttl_seconds=60, tags=("enrollment:{course_id}",)),
     )
     
     register_tool(
@@ -818,9 +899,10 @@ def build_tool_registry():
             },
             "required": ["user_id", "course_id"],
         },
-        handler=enrollment.enroll_student,
+        handler=LazyHandler("enrollment", "enroll_student"),
         mode="write",
         category="enrollment",
+        invalidates=("enrollment:{course_id}",),
     )
     
     register_tool(
@@ -833,7 +915,7 @@ def build_tool_registry():
             },
             "required": [],
         },
-        handler=enrollment.get_users,
+        handler=LazyHandler("enrollment", "get_users"),
         mode="read",
         category="enrollment",
     )
@@ -854,7 +936,7 @@ def build_tool_registry():
             },
             "required": ["page"],
         },
-        handler=navigation.navigate_to_page,
+        handler=LazyHandler("navigation", "navigate_to_page"),
         mode="read",
         category="navigation",
     )
@@ -867,9 +949,10 @@ def build_tool_registry():
             "properties": {},
             "required": [],
         },
-        handler=navigation.get_available_pages,
+        handler=LazyHandler("navigation", "get_available_pages"),
         mode="read",
         category="navigation",
+        cache=ToolCachePolicy(ttl_seconds=3600, tags=()),
     )
     
     register_tool(
@@ -889,7 +972,7 @@ def build_tool_registry():
             },
             "required": [],
         },
-        handler=navigation.get_current_context,
+        handler=LazyHandler("navigation", "get_current_context"),
         mode="read",
         category="navigation",
     )
@@ -908,9 +991,10 @@ def build_tool_registry():
             },
             "required": ["page"],
         },
-        handler=navigation.get_help_for_page,
+        handler=LazyHandler("navigation", "get_help_for_page"),
         mode="read",
         category="navigation",
+        cache=ToolCachePolicy(ttl_seconds=3600, tags=()),
     )
 
     # ============ ACTION TOOLS ============
@@ -977,7 +1061,7 @@ def build_tool_registry():
             },
             "required": ["query"],
         },
-        handler=resolve.resolve_course,
+        handler=LazyHandler("resolve", "resolve_course"),
         mode="read",
         category="context",
     )
@@ -994,7 +1078,7 @@ def build_tool_registry():
             },
             "required": ["course_id"],
         },
-        handler=resolve.resolve_session,
+        handler=LazyHandler("resolve", "resolve_session"),
         mode="read",
         category="context",
     )
@@ -1010,7 +1094,7 @@ def build_tool_registry():
             },
             "required": ["email_or_name"],
         },
-        handler=resolve.resolve_user,
+        handler=LazyHandler("resolve", "resolve_user"),
         mode="read",
         category="context",
     )
@@ -1025,7 +1109,7 @@ def build_tool_registry():
             },
             "required": [],
         },
-        handler=resolve.get_current_context,
+        handler=LazyHandler("resolve", "get_current_context"),
         mode="read",
         category="context",
     )
@@ -1041,7 +1125,7 @@ def build_tool_registry():
             },
             "required": ["course_id"],
         },
-        handler=resolve.set_active_course,
+        handler=LazyHandler("resolve", "set_active_course"),
         mode="write",
         category="context",
     )
@@ -1057,7 +1141,7 @@ def build_tool_registry():
             },
             "required": ["session_id"],
         },
-        handler=resolve.set_active_session,
+        handler=LazyHandler("resolve", "set_active_session"),
         mode="write",
         category="context",
     )
@@ -1077,7 +1161,7 @@ def build_tool_registry():
             },
             "required": ["target"],
         },
-        handler=voice.voice_open_page,
+        handler=LazyHandler("voice", "voice_open_page"),
         mode="read",
         category="voice",
     )
@@ -1097,7 +1181,7 @@ def build_tool_registry():
             },
             "required": ["course_query"],
         },
-        handler=voice.voice_create_poll,
+        handler=LazyHandler("voice", "voice_create_poll"),
         mode="read",
         category="voice",
     )
@@ -1115,7 +1199,7 @@ def build_tool_registry():
             },
             "required": ["course_query"],
         },
-        handler=voice.voice_generate_report,
+        handler=LazyHandler("voice", "voice_generate_report"),
         mode="read",
         category="voice",
     )
@@ -1136,7 +1220,7 @@ def build_tool_registry():
             },
             "required": ["course_query"],
         },
-        handler=voice.voice_enroll_students,
+        handler=LazyHandler("voice", "voice_enroll_students"),
         mode="read",
         category="voice",
     )
@@ -1152,9 +1236,27 @@ def build_tool_registry():
             },
             "required": ["course_id", "user_ids"],
         },
-        handler=enrollment.bulk_enroll_students,
+        handler=LazyHandler("enrollment", "bulk_enroll_students"),
+        mode="write",
+        category="enrollment",
+        invalidates=("enrollment:{course_id}",),
+    )
+
+    register_tool(
+        name="enroll_students_by_email",
+        description="Enroll several existing students in a course by email with a single confirmation.",
+        parameters={
+            "type": "object",
+            "properties": {
+                "course_id": {"type": "integer", "description": "The course ID"},
+                "emails": {"type": "array", "items": {"type": "string"}, "description": "Student email addresses"},
+            },
+            "required": ["course_id", "emails"],
+        },
+        handler=LazyHandler("enrollment", "enroll_students_by_email"),
         mode="write",
         category="enrollment",
+        invalidates=("enrollment:{course_id}",),
     )
 
     # ============ CONTENT GENERATION TOOLS ============
@@ -1170,7 +1272,7 @@ def build_tool_registry():
             },
             "required": ["course_name"],
         },
-        handler=content_generation.generate_syllabus,
+        handler=LazyHandler("content_generation", "generate_syllabus"),
         mode="read",
         category="content_generation",
     )
@@ -1186,7 +1288,7 @@ def build_tool_registry():
             },
             "required": ["course_name"],
         },
-        handler=content_generation.generate_objectives,
+        handler=LazyHandler("content_generation", "generate_objectives"),
         mode="read",
         category="content_generation",
     )
@@ -1204,7 +1306,7 @@ def build_tool_registry():
             },
             "required": ["course_name", "session_topic"],
         },
-        handler=content_generation.generate_session_plan,
+        handler=LazyHandler("content_generation", "generate_session_plan"),
         mode="read",
         category="content_generation",
     )
@@ -1221,7 +1323,7 @@ def build_tool_registry():
             },
             "required": ["course_name", "session_topic"],
         },
-        handler=content_generation.generate_case_study,
+        handler=LazyHandler("content_generation", "generate_case_study"),
         mode="read",
         category="content_generation",
     )
@@ -1238,14 +1340,26 @@ def build_tool_registry():
             },
             "required": ["course_name", "session_topic"],
         },
-        handler=content_generation.generate_discussion_prompts,
+        handler=LazyHandler("content_generation", "generate_discussion_prompts"),
         mode="read",
         category="content_generation",
     )
 
 
-# Build the registry on module load
+# Build the registry on module load. Only metadata is built here; handler
+# modules are imported when a tool is first called.
+_registry_started = time.perf_counter()
 build_tool_registry()
+REGISTRY_BUILD_MS = round((time.perf_counter() - _registry_started) * 1000, 2)
+
+
+def registry_stats() -> Dict[str, Any]:
+    """Registry build time and which tool modules have been imported so far."""
+    return {
+        "tools": len(TOOL_REGISTRY),
+        "build_ms": REGISTRY_BUILD_MS,
+        "modules": import_stats(),
+    }
 
 
 # ============ MCP Server Handlers ============
@@ -1278,10 +1392,12 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
     handler = tool_info["handler"]
     
     try:
+        arguments = validate_tool_args(name, tool_info, arguments)
+        executor = get_tool_executor()
         if tool_info["mode"] == "write" and name not in ACTION_TOOL_NAMES:
-            result = await asyncio.to_thread(_plan_action_in_thread, name, arguments, None)
+            result = await executor.run(name, _plan_action_in_thread, name, arguments, None)
         else:
-            result = await asyncio.to_thread(_invoke_tool_handler_in_thread, handler, arguments)
+            result = await executor.invoke(name, handler, arguments, category=tool_info["category"])
             
         normalized = normalize_tool_result(result, name)
         if not normalized.get("ok", True):
@@ -1310,7 +1426,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
 async def main():
     """Run the MCP server."""
     logger.info("Starting AristAI MCP Server...")
-    logger.info(f"Registered {len(TOOL_REGISTRY)} tools")
+    logger.info(f"Registered {len(TOOL_REGISTRY)} tools in {REGISTRY_BUILD_MS:.1f} ms")
     
     # Log tools by category
     categories = {}
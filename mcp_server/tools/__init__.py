@@ -10,21 +10,17 @@ This package contains all tool implementations organized by domain:
 - reports: Report generation and viewing
 - enrollment: Student enrollment management
 - content_generation: AI-powered content generation (syllabus, objectives, session plans)
+
+Tool modules are imported on first use, not when the package is imported:
+the registry in mcp_server.server refers to handlers through LazyHandler, so
+a cold MCP process only pays for the modules its calls actually touch.
+`from mcp_server.tools import courses` still works and loads the module.
 """
 
-from mcp_server.tools import (
-    courses,
-    sessions,
-    forum,
-    polls,
-    copilot,
-    reports,
-    enrollment,
-    navigation,
-    resolve,
-    voice,
-    content_generation,
-)
+import importlib
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
 
 __all__ = [
     "courses",
@@ -39,3 +35,73 @@ __all__ = [
     "voice",
     "content_generation",
 ]
+
+# First-import time (ms) per tool module, including the modules it pulls in
+_import_ms: Dict[str, float] = {}
+
+
+def load_tool_module(name: str):
+    """Import a tool module, recording how long the first import took."""
+    if name not in __all__:
+        raise ValueError(f"Unknown tool module '{name}'")
+    full_name = f"{__name__}.{name}"
+    module = sys.modules.get(full_name)
+    if module is not None:
+        return module
+    started = time.perf_counter()
+    module = importlib.import_module(full_name)
+    _import_ms.setdefault(name, round((time.perf_counter() - started) * 1000, 2))
+    return module
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return load_tool_module(name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+class LazyHandler:
+    """A tool handler named by module and function, imported on first call.
+
+    inspect.signature() follows __wrapped__, so signature checks (e.g. whether
+    the handler takes a db session) see the real function once it is loaded.
+    """
+
+    def __init__(self, module: str, function: str):
+        if module not in __all__:
+            raise ValueError(f"Unknown tool module '{module}'")
+        self.module = module
+        self.function = function
+        self.__name__ = function
+        self.__qualname__ = function
+        self.__doc__ = None
+        self._target: Optional[Callable[..., Any]] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def resolve(self) -> Callable[..., Any]:
+        if self._target is None:
+            self._target = getattr(load_tool_module(self.module), self.function)
+        return self._target
+
+    @property
+    def __wrapped__(self) -> Callable[..., Any]:
+        return self.resolve()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<LazyHandler {self.module}.{self.function}{'' if self.loaded else ' (not loaded)'}>"
+
+
+def import_stats() -> Dict[str, Any]:
+    """Which tool modules are loaded and what their first import cost."""
+    loaded = [name for name in __all__ if f"{__name__}.{name}" in sys.modules]
+    return {
+        "loaded": loaded,
+        "not_loaded": [name for name in __all__ if name not in loaded],
+        "import_ms": dict(_import_ms),
+    }
@@ -153,18 +153,24 @@ def generate_session_plans(db: Session, course_id: int) -> Dict[str, Any]:
         return {"error": "Course has no syllabus. Please add a syllabus first."}
     
     try:
+        from worker.dedup import plans_fingerprint, submit_deduplicated
         from worker.tasks import generate_plans_task
-        task = generate_plans_task.delay(course_id)
+        submission = submit_deduplicated(generate_plans_task, (course_id,), plans_fingerprint(db, course_id))
         
-        message = f"Started generating session plans for '{course.title}'. "
-        message += "This may take a minute or two. "
+        if submission.status == "in_progress":
+            message = f"Session plans for '{course.title}' are already being generated. "
+        elif submission.status == "completed":
+            message = f"Session plans for '{course.title}' were just generated from this syllabus. "
+        else:
+            message = f"Started generating session plans for '{course.title}'. "
+            message += "This may take a minute or two. "
         message += "Check back soon to see the generated sessions."
         
         return {
             "message": message,
-            "task_id": task.id,
+            "task_id": submission.task_id,
             "course_id": course_id,
-            "status": "queued",
+            "status": submission.status,
         }
         
     except Exception as e:
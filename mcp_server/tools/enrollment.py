@@ -5,8 +5,9 @@ Tools for managing student enrollment and user listings.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
 from api.models.user import User, UserRole
@@ -130,20 +131,8 @@ def bulk_enroll_students(db: Session, course_id: int, user_ids: list[int]) -> Di
     if invalid_ids:
         return {"error": f"Invalid user IDs: {invalid_ids}"}
 
-    existing = db.query(Enrollment.user_id).filter(Enrollment.course_id == course_id).all()
-    enrolled_ids = {row.user_id for row in existing}
-
-    newly_enrolled = []
-    already_enrolled = []
-    for user_id in user_ids:
-        if user_id in enrolled_ids:
-            already_enrolled.append(user_id)
-            continue
-        enrollment = Enrollment(user_id=user_id, course_id=course_id)
-        db.add(enrollment)
-        newly_enrolled.append(user_id)
-
     try:
+        newly_enrolled, already_enrolled = _insert_enrollments(db, course_id, user_ids)
         db.commit()
         return {
             "message": f"Enrolled {len(newly_enrolled)} students in '{course.title}'.",
@@ -158,6 +147,89 @@ def bulk_enroll_students(db: Session, course_id: int, user_ids: list[int]) -> Di
         return {"error": f"Failed to bulk enroll students: {str(e)}"}
 
 
+def _insert_enrollments(db: Session, course_id: int, user_ids: List[int]) -> Tuple[List[int], List[int]]:
+    """Insert missing enrollments with one INSERT. Returns (newly_enrolled, already_enrolled) user IDs."""
+    user_ids = list(dict.fromkeys(user_ids))
+    existing = (
+        db.query(Enrollment.user_id)
+        .filter(Enrollment.course_id == course_id, Enrollment.user_id.in_(user_ids))
+        .all()
+    )
+    enrolled_ids = {row.user_id for row in existing}
+    newly_enrolled = [user_id for user_id in user_ids if user_id not in enrolled_ids]
+    already_enrolled = [user_id for user_id in user_ids if user_id in enrolled_ids]
+    if newly_enrolled:
+        db.execute(
+            insert(Enrollment),
+            [{"user_id": user_id, "course_id": course_id} for user_id in newly_enrolled],
+        )
+    return newly_enrolled, already_enrolled
+
+
+def _user_ids_by_email(db: Session, emails: List[str]) -> Dict[str, List[int]]:
+    """Account IDs per lower-cased email; stored emails keep their original case."""
+    users = db.query(User.id, User.email).filter(func.lower(User.email).in_(emails)).order_by(User.id).all()
+    user_ids_by_email: Dict[str, List[int]] = {}
+    for user in users:
+        user_ids_by_email.setdefault(user.email.lower(), []).append(user.id)
+    return user_ids_by_email
+
+
+def enroll_students_by_email(db: Session, course_id: int, emails: List[str]) -> Dict[str, Any]:
+    """
+    Enroll existing users in a course by email, in one transaction.
+
+    Emails match case-insensitively. An email with several accounts (one per
+    auth provider) enrolls all of them, so the course shows up whichever way
+    the student signs in. Emails without an account are reported, not created;
+    use the CSV upload on the enrollment page to create accounts.
+    """
+    course = db.query(Course).filter(Course.id == course_id).first()
+    if not course:
+        return {"error": f"Course {course_id} not found"}
+
+    normalized = list(dict.fromkeys(e.strip().lower() for e in emails if e and "@" in e))
+    invalid = [e for e in emails if not e or "@" not in e]
+    if not normalized:
+        return {"error": "No valid email addresses provided"}
+
+    user_ids_by_email = _user_ids_by_email(db, normalized)
+    not_found = [email for email in normalized if email not in user_ids_by_email]
+    if not user_ids_by_email:
+        return {"error": "No users found with these emails", "not_found_emails": not_found}
+
+    try:
+        newly_enrolled, _ = _insert_enrollments(
+            db, course_id, [user_id for e in normalized for user_id in user_ids_by_email.get(e, [])]
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Failed to enroll students by email: {e}")
+        return {"error": f"Failed to enroll students: {str(e)}"}
+
+    newly_enrolled_ids = set(newly_enrolled)
+    found = [email for email in normalized if email in user_ids_by_email]
+    # An email counts as enrolled if any of its accounts was newly enrolled
+    enrolled_emails = [e for e in found if newly_enrolled_ids.intersection(user_ids_by_email[e])]
+    already_enrolled_emails = [e for e in found if not newly_enrolled_ids.intersection(user_ids_by_email[e])]
+    message = f"Enrolled {len(enrolled_emails)} student{'s' if len(enrolled_emails) != 1 else ''} in '{course.title}'."
+    if already_enrolled_emails:
+        message += f" {len(already_enrolled_emails)} already enrolled."
+    if not_found:
+        message += f" {len(not_found)} email{'s' if len(not_found) != 1 else ''} had no account."
+    return {
+        "message": message,
+        "course_id": course_id,
+        "course_title": course.title,
+        "enrolled_emails": enrolled_emails,
+        "already_enrolled_emails": already_enrolled_emails,
+        "not_found_emails": not_found,
+        "invalid_emails": invalid,
+        "success": True,
+    }
+
+
 def get_users(db: Session, role: Optional[str] = None) -> Dict[str, Any]:
     """
     Get list of users, optionally filtered by role.
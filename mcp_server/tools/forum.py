@@ -15,6 +15,8 @@ from api.models.user import User
 
 logger = logging.getLogger(__name__)
 
+VALID_LABELS = ("high-quality", "needs-clarification", "insightful", "misconception", "question")
+
 
 def get_session_cases(db: Session, session_id: int) -> Dict[str, Any]:
     """
@@ -512,11 +514,10 @@ def label_post(db: Session, post_id: int, labels: List[str]) -> Dict[str, Any]:
     if not post:
         return {"error": f"Post {post_id} not found"}
     
-    valid_labels = {"high-quality", "needs-clarification", "insightful", "misconception", "question"}
-    invalid = [l for l in labels if l not in valid_labels]
+    invalid = [l for l in labels if l not in VALID_LABELS]
     if invalid:
         return {
-            "error": f"Invalid labels: {', '.join(invalid)}. Valid labels are: {', '.join(valid_labels)}"
+            "error": f"Invalid labels: {', '.join(invalid)}. Valid labels are: {', '.join(VALID_LABELS)}"
         }
     
     try:
@@ -577,3 +578,121 @@ def mark_needs_clarification(db: Session, post_id: int) -> Dict[str, Any]:
         current_labels.remove("high-quality")
     
     return label_post(db, post_id, current_labels)
+
+
+# ============ Batch moderation ============
+# One set-based statement and one commit for the whole batch, so a voice
+# command like "pin posts 4, 7 and 9" is a single plan and confirmation.
+
+def _unique_ids(ids: List[int]) -> List[int]:
+    return list(dict.fromkeys(ids))
+
+
+def _describe_ids(ids: List[int]) -> str:
+    if len(ids) <= 5:
+        return ", ".join(str(i) for i in ids)
+    return f"{', '.join(str(i) for i in ids[:5])} and {len(ids) - 5} more"
+
+
+def pin_posts(db: Session, post_ids: List[int], pinned: bool = True) -> Dict[str, Any]:
+    """
+    Pin or unpin several posts at once.
+    """
+    post_ids = _unique_ids(post_ids)
+    if not post_ids:
+        return {"error": "No post IDs provided"}
+
+    found = [row.id for row in db.query(Post.id).filter(Post.id.in_(post_ids)).all()]
+    found_ids = set(found)
+    missing = [post_id for post_id in post_ids if post_id not in found_ids]
+    if not found:
+        return {"error": f"Posts not found: {_describe_ids(missing)}"}
+
+    try:
+        db.query(Post).filter(Post.id.in_(found)).update(
+            {Post.pinned: pinned}, synchronize_session=False
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Failed to pin posts: {e}")
+        return {"error": f"Failed to pin posts: {str(e)}"}
+
+    action = "pinned" if pinned else "unpinned"
+    message = f"{len(found)} post{'s' if len(found) != 1 else ''} {action}."
+    if missing:
+        message += f" Not found: {_describe_ids(missing)}."
+    return {
+        "message": message,
+        "post_ids": found,
+        "missing_post_ids": missing,
+        "pinned": pinned,
+        "success": True,
+    }
+
+
+def label_posts(
+    db: Session,
+    post_ids: List[int],
+    labels: List[str],
+    mode: str = "add",
+) -> Dict[str, Any]:
+    """
+    Label several posts at once.
+
+    mode "add" merges the labels into each post's existing labels
+    (high-quality and needs-clarification replace each other, as in
+    mark_high_quality); mode "replace" sets exactly these labels.
+    """
+    post_ids = _unique_ids(post_ids)
+    if not post_ids:
+        return {"error": "No post IDs provided"}
+    invalid = [l for l in labels if l not in VALID_LABELS]
+    if invalid:
+        return {
+            "error": f"Invalid labels: {', '.join(invalid)}. Valid labels are: {', '.join(VALID_LABELS)}"
+        }
+    if mode not in ("add", "replace"):
+        return {"error": f"Invalid mode: {mode}. Use 'add' or 'replace'."}
+    if not labels and mode == "add":
+        return {"error": "No labels provided. Use mode 'replace' with no labels to clear them."}
+
+    rows = db.query(Post.id, Post.labels_json).filter(Post.id.in_(post_ids)).all()
+    found = [row.id for row in rows]
+    found_ids = set(found)
+    missing = [post_id for post_id in post_ids if post_id not in found_ids]
+    if not found:
+        return {"error": f"Posts not found: {_describe_ids(missing)}"}
+
+    try:
+        if mode == "replace":
+            db.query(Post).filter(Post.id.in_(found)).update(
+                {Post.labels_json: list(labels)}, synchronize_session=False
+            )
+        else:
+            conflicts = {"high-quality": "needs-clarification", "needs-clarification": "high-quality"}
+            removed = {conflicts[label] for label in labels if label in conflicts}
+            mappings = []
+            for row in rows:
+                current = [l for l in (row.labels_json or []) if l not in removed]
+                mappings.append({"id": row.id, "labels_json": current + [l for l in labels if l not in current]})
+            db.bulk_update_mappings(Post, mappings)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Failed to label posts: {e}")
+        return {"error": f"Failed to label posts: {str(e)}"}
+
+    verb = "labeled as" if labels else "cleared of labels"
+    message = f"{len(found)} post{'s' if len(found) != 1 else ''} {verb}"
+    message += f": {', '.join(labels)}." if labels else "."
+    if missing:
+        message += f" Not found: {_describe_ids(missing)}."
+    return {
+        "message": message,
+        "post_ids": found,
+        "missing_post_ids": missing,
+        "labels": labels,
+        "mode": mode,
+        "success": True,
+    }
@@ -336,19 +336,26 @@ def generate_report(db: Session, session_id: int) -> Dict[str, Any]:
         }
     
     try:
+        from worker.dedup import report_fingerprint, submit_deduplicated
         from worker.tasks import generate_report_task
-        task = generate_report_task.delay(session_id)
+        submission = submit_deduplicated(generate_report_task, (session_id,), report_fingerprint(db, session_id))
         
-        message = f"Started generating report for session '{session.title}' with {post_count} posts. "
-        message += "This may take a minute. Check back soon to see the report."
+        if submission.status == "in_progress":
+            message = f"A report for session '{session.title}' is already being generated. "
+            message += "Check back soon to see the report."
+        elif submission.status == "completed":
+            message = f"The report for session '{session.title}' is already up to date with its {post_count} posts."
+        else:
+            message = f"Started generating report for session '{session.title}' with {post_count} posts. "
+            message += "This may take a minute. Check back soon to see the report."
         
         return {
             "message": message,
             "session_id": session_id,
             "session_title": session.title,
-            "task_id": task.id,
+            "task_id": submission.task_id,
             "post_count": post_count,
-            "status": "queued",
+            "status": submission.status,
             "success": True,
         }
         
@@ -6,17 +6,25 @@ Tools for resolving user-provided text into IDs and managing active context.
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from datetime import date
-from difflib import SequenceMatcher
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from sqlalchemy import func, literal, or_
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from api.core.config import get_settings
 from api.models.course import Course
 from api.models.session import Session as SessionModel, SessionStatus
 from api.models.user import User
 from api.services.context_store import ContextStore
+from api.services.resolution_index import get_resolution_indexes, similarity
+
+logger = logging.getLogger(__name__)
+
+SPECIAL_SESSION_QUERIES = {"latest", "recent", "live", "today"}
 
 
 @dataclass
@@ -26,29 +34,96 @@ class RankedCandidate:
     confidence: float
 
 
-def _similarity(a: str, b: str) -> float:
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
-
-
 def rank_candidates(items: Iterable[tuple[int, str]], query: str, limit: int = 5) -> List[RankedCandidate]:
     scored = [
-        RankedCandidate(item_id, label, _similarity(query, label))
+        RankedCandidate(item_id, label, similarity(query, label))
         for item_id, label in items
     ]
     scored.sort(key=lambda item: item.confidence, reverse=True)
     return scored[:limit]
 
 
-def resolve_course(db: Session, query: str, limit: int = 5) -> Dict[str, Any]:
-    courses = (
-        db.query(Course)
-        .filter(Course.title.ilike(f"%{query}%"))
-        .order_by(Course.created_at.desc())
-        .limit(limit)
+def _trigram_search(
+    db: Session,
+    columns: Tuple[Any, Any],
+    search_columns: Sequence[Any],
+    filters: Sequence[Any],
+    query: str,
+    limit: int,
+) -> Optional[List[Tuple[int, Optional[str], float]]]:
+    """Rank rows with pg_trgm (GIN indexes from migration 021); None if unavailable."""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    score = func.greatest(*(
+        func.greatest(func.similarity(column, query), func.word_similarity(query, column))
+        for column in search_columns
+    ))
+    matches = or_(*(literal(query).op("<%")(column) for column in search_columns))
+    try:
+        rows = (
+            db.query(*columns, score)
+            .filter(*filters, matches)
+            .order_by(score.desc())
+            .limit(limit)
+            .all()
+        )
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning(f"pg_trgm search failed, falling back to ILIKE: {e}")
+        return None
+    return [(row[0], row[1], round(float(row[2]), 3)) for row in rows]
+
+
+def _resolve(
+    db: Session,
+    scope: Tuple,
+    tags: Tuple[str, ...],
+    load: Callable[[int], List[Tuple[int, str, Sequence[str]]]],
+    columns: Tuple[Any, Any],
+    search_columns: Sequence[Any],
+    filters: Sequence[Any],
+    default_label: str,
+    query: str,
+    limit: int,
+) -> List[RankedCandidate]:
+    """Fuzzy-match query within a scope: in-memory index, else pg_trgm, else ILIKE."""
+    min_confidence = get_settings().resolve_min_confidence
+    index = get_resolution_indexes().get(scope, tags, load)
+    if index is not None:
+        return [
+            RankedCandidate(match.id, match.label, match.confidence)
+            for match in index.search(query, limit=limit, min_confidence=min_confidence)
+        ]
+
+    # Scope too large to hold in memory
+    rows = _trigram_search(db, columns, search_columns, filters, query, limit)
+    if rows is not None:
+        return [
+            RankedCandidate(item_id, label or default_label.format(id=item_id), confidence)
+            for item_id, label, confidence in rows
+            if confidence >= min_confidence
+        ]
+    rows = (
+        db.query(*columns)
+        .filter(*filters, or_(*(column.ilike(f"%{query}%") for column in search_columns)))
+        .limit(limit * 4)
         .all()
     )
-    items = [(course.id, course.title) for course in courses]
-    ranked = rank_candidates(items, query, limit=limit)
+    return rank_candidates(
+        ((item_id, label or default_label.format(id=item_id)) for item_id, label in rows), query, limit=limit
+    )
+
+
+def resolve_course(db: Session, query: str, limit: int = 5) -> Dict[str, Any]:
+    def load(max_rows: int):
+        rows = db.query(Course.id, Course.title).order_by(Course.created_at.desc()).limit(max_rows + 1).all()
+        return [(course_id, title, ()) for course_id, title in rows]
+
+    ranked = _resolve(
+        db, ("courses",), ("courses",), load,
+        columns=(Course.id, Course.title), search_columns=(Course.title,), filters=(),
+        default_label="Course {id}", query=query, limit=limit,
+    )
     return {
         "success": True,
         "candidates": [
@@ -58,47 +133,62 @@ def resolve_course(db: Session, query: str, limit: int = 5) -> Dict[str, Any]:
     }
 
 
-def resolve_session(
-    db: Session,
-    course_id: int,
-    query: str = "latest",
-    limit: int = 5,
-) -> Dict[str, Any]:
+def _special_sessions(db: Session, course_id: int, query: str, limit: int) -> List[SessionModel]:
     if query in {"latest", "recent"}:
-        sessions = (
+        return (
             db.query(SessionModel)
             .filter(SessionModel.course_id == course_id)
             .order_by(SessionModel.created_at.desc())
             .limit(limit)
             .all()
         )
-    elif query == "live":
-        sessions = (
+    if query == "live":
+        return (
             db.query(SessionModel)
             .filter(SessionModel.course_id == course_id, SessionModel.status == SessionStatus.live)
             .order_by(SessionModel.created_at.desc())
             .limit(limit)
             .all()
         )
-    elif query == "today":
-        today = date.today()
-        sessions = (
-            db.query(SessionModel)
-            .filter(SessionModel.course_id == course_id)
-            .order_by(SessionModel.created_at.desc())
-            .all()
-        )
-        sessions = [s for s in sessions if s.created_at.date() == today][:limit]
+    today = date.today()
+    sessions = (
+        db.query(SessionModel)
+        .filter(SessionModel.course_id == course_id)
+        .order_by(SessionModel.created_at.desc())
+        .all()
+    )
+    return [s for s in sessions if s.created_at.date() == today][:limit]
+
+
+def resolve_session(
+    db: Session,
+    course_id: int,
+    query: str = "latest",
+    limit: int = 5,
+) -> Dict[str, Any]:
+    if query in SPECIAL_SESSION_QUERIES:
+        # Every session the filter returns is an exact answer, newest first
+        ranked = [
+            RankedCandidate(session.id, session.title or f"Session {session.id}", 1.0)
+            for session in _special_sessions(db, course_id, query, limit)
+        ]
     else:
-        sessions = (
-            db.query(SessionModel)
-            .filter(SessionModel.course_id == course_id, SessionModel.title.ilike(f"%{query}%"))
-            .order_by(SessionModel.created_at.desc())
-            .limit(limit)
-            .all()
+        def load(max_rows: int):
+            rows = (
+                db.query(SessionModel.id, SessionModel.title)
+                .filter(SessionModel.course_id == course_id)
+                .order_by(SessionModel.created_at.desc())
+                .limit(max_rows + 1)
+                .all()
+            )
+            return [(session_id, title or f"Session {session_id}", ()) for session_id, title in rows]
+
+        ranked = _resolve(
+            db, ("sessions", course_id), ("sessions", f"course:{course_id}"), load,
+            columns=(SessionModel.id, SessionModel.title), search_columns=(SessionModel.title,),
+            filters=(SessionModel.course_id == course_id,),
+            default_label="Session {id}", query=query, limit=limit,
         )
-    items = [(session.id, session.title or f"Session {session.id}") for session in sessions]
-    ranked = rank_candidates(items, query, limit=limit)
     return {
         "success": True,
         "candidates": [
@@ -109,18 +199,40 @@ def resolve_session(
 
 
 def resolve_user(db: Session, email_or_name: str, limit: int = 5) -> Dict[str, Any]:
-    users = (
-        db.query(User)
-        .filter(
-            (User.email.ilike(f"%{email_or_name}%"))
-            | (User.name.ilike(f"%{email_or_name}%"))
+    def load(max_rows: int):
+        rows = (
+            db.query(User.id, User.name, User.email)
+            .order_by(User.created_at.desc())
+            .limit(max_rows + 1)
+            .all()
         )
-        .order_by(User.created_at.desc())
-        .limit(limit)
-        .all()
+        return [
+            (
+                user_id,
+                email or name or f"user-{user_id}",
+                # Match on the name and the email's local part, not its domain
+                tuple(text for text in (name, (email or "").split("@")[0]) if text),
+            )
+            for user_id, name, email in rows
+        ]
+
+    query = email_or_name.strip()
+    if "@" in query:
+        exact = db.query(User.id, User.email).filter(func.lower(User.email) == query.lower()).first()
+        if exact:
+            ranked = [RankedCandidate(exact[0], exact[1], 1.0)]
+            return _user_candidates(ranked)
+        query = query.split("@")[0]
+
+    ranked = _resolve(
+        db, ("users",), ("users",), load,
+        columns=(User.id, func.coalesce(User.email, User.name)), search_columns=(User.name, User.email),
+        filters=(), default_label="user-{id}", query=query, limit=limit,
     )
-    items = [(user.id, user.email or user.name or f"user-{user.id}") for user in users]
-    ranked = rank_candidates(items, email_or_name, limit=limit)
+    return _user_candidates(ranked)
+
+
+def _user_candidates(ranked: List[RankedCandidate]) -> Dict[str, Any]:
     return {
         "success": True,
         "candidates": [
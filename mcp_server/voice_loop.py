@@ -8,6 +8,12 @@ This module implements a continuous voice interaction loop that:
 4. Speaks the response back (via TTS)
 5. Repeats
 
+The loop is event-driven: transcripts from the WebSocket endpoint or
+voicemode are queued with submit_transcript() and the loop waits on the
+queue, so an idle loop costs nothing. Planning runs in a worker thread so a
+slow LLM call does not block other clients on the same event loop, and a new
+transcript while the assistant is speaking cancels the speech (barge-in).
+
 Supports multiple modes:
 - Push-to-talk: Activated by a button press
 - Wake-word: Activated by saying "Hey AristAI"
@@ -23,12 +29,13 @@ import asyncio
 import json
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from api.core.config import get_settings
-from api.services import asr, tts
+from api.services.speech_stream import get_streaming_tts, stream_speech
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +67,10 @@ class VoiceConfig:
     confirmation_required_for_writes: bool = True
     speak_confirmations: bool = True
     user_id: int = 1  # Default instructor user ID
+    greeting: Optional[str] = "AristAI voice assistant ready. How can I help you?"
+    max_queued_transcripts: int = 20  # Oldest transcripts are dropped beyond this
+    stop_phrases_enabled: bool = True  # "goodbye", "exit", ... end the loop
+    server_speech: bool = True  # Synthesize responses with TTS; off when the client voices them
     
     # Audio settings
     sample_rate: int = 16000
@@ -76,6 +87,18 @@ class VoiceContext:
     conversation_history: List[Dict[str, str]] = field(default_factory=list)
 
 
+@dataclass
+class TranscriptEvent:
+    """A transcript waiting to be handled by the voice loop."""
+    text: str
+    source: str = "text"  # "text", "audio" or "voicemode"
+    received_at: float = field(default_factory=time.perf_counter)
+
+
+# Number of recent samples kept per latency stage
+LATENCY_WINDOW = 200
+
+
 @dataclass
 class VoiceLoopStats:
     """Statistics for the voice loop session."""
@@ -85,6 +108,30 @@ class VoiceLoopStats:
     failed_commands: int = 0
     total_tokens_used: int = 0
     total_audio_seconds: float = 0.0
+    barge_ins: int = 0
+    dropped_transcripts: int = 0
+    # Recent latencies per stage: queue_wait, plan, execute, speak, turn
+    stage_latency_ms: Dict[str, Deque[float]] = field(default_factory=dict)
+
+    def record_latency(self, stage: str, elapsed_ms: float):
+        samples = self.stage_latency_ms.setdefault(stage, deque(maxlen=LATENCY_WINDOW))
+        samples.append(elapsed_ms)
+
+    def latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, average, p50, p95 and max per stage over the recent window."""
+        summary = {}
+        for stage, samples in self.stage_latency_ms.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            summary[stage] = {
+                "count": len(ordered),
+                "avg_ms": round(sum(ordered) / len(ordered), 1),
+                "p50_ms": round(ordered[len(ordered) // 2], 1),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+                "max_ms": round(ordered[-1], 1),
+            }
+        return summary
 
 
 class VoiceLoopController:
@@ -117,6 +164,9 @@ class VoiceLoopController:
         self.state = VoiceState.IDLE
         self._running = False
         self._stop_event = asyncio.Event()
+        self._events: asyncio.Queue = asyncio.Queue(maxsize=self.config.max_queued_transcripts)
+        self._speak_task: Optional[asyncio.Task] = None
+        self._last_event_received_at = 0.0
         
         # Callbacks
         self._on_state_change = on_state_change
@@ -146,6 +196,31 @@ class VoiceLoopController:
             self._db.close()
             self._db = None
     
+    def submit_transcript(self, text: str, source: str = "text") -> bool:
+        """
+        Queue a transcript for the loop. Safe to call from any coroutine on the loop's event loop.
+        
+        If the assistant is speaking, the speech is cancelled (barge-in) so the
+        new utterance is handled right away.
+        
+        Returns:
+            False if the transcript was empty and ignored
+        """
+        text = (text or "").strip()
+        if not text:
+            return False
+        if self._speak_task is not None and not self._speak_task.done():
+            self.stats.barge_ins += 1
+            self._speak_task.cancel()
+        event = TranscriptEvent(text=text, source=source)
+        while True:
+            try:
+                self._events.put_nowait(event)
+                return True
+            except asyncio.QueueFull:
+                self._events.get_nowait()  # Drop the oldest; the newest utterance matters most
+                self.stats.dropped_transcripts += 1
+    
     async def start(self):
         """Start the voice loop."""
         if self._running:
@@ -158,8 +233,8 @@ class VoiceLoopController:
         
         logger.info(f"Starting voice loop in {self.config.mode.value} mode")
         
-        # Speak welcome message
-        await self._speak("AristAI voice assistant ready. How can I help you?")
+        if self.config.greeting:
+            await self._speak(self.config.greeting)
         
         try:
             while self._running and not self._stop_event.is_set():
@@ -177,6 +252,8 @@ class VoiceLoopController:
         logger.info("Stopping voice loop...")
         self._running = False
         self._stop_event.set()
+        if self._speak_task is not None and not self._speak_task.done():
+            self._speak_task.cancel()
     
     async def _run_iteration(self):
         """Run a single listen -> process -> speak iteration."""
@@ -185,17 +262,17 @@ class VoiceLoopController:
             await self._handle_pending_confirmations()
             return
         
-        # Listen for input
+        # Wait for the next transcript
         self._set_state(VoiceState.LISTENING)
         transcript = await self._listen()
         
         if not transcript:
-            # No input received, continue loop
-            await asyncio.sleep(0.1)
+            # Woken up by stop()
             return
+        turn_started = self._last_event_received_at
         
         # Check for stop command
-        if self._is_stop_command(transcript):
+        if self.config.stop_phrases_enabled and self._is_stop_command(transcript):
             await self._speak("Goodbye!")
             await self.stop()
             return
@@ -207,6 +284,7 @@ class VoiceLoopController:
         # Process the command
         self._set_state(VoiceState.PROCESSING)
         response = await self._process_command(transcript)
+        self.stats.record_latency("turn", (time.perf_counter() - turn_started) * 1000)
         
         # Speak the response
         self._set_state(VoiceState.SPEAKING)
@@ -215,39 +293,35 @@ class VoiceLoopController:
         # Update stats
         self.stats.total_interactions += 1
         
-        # Return to idle (or listening if continuous)
-        if self.config.auto_listen_after_response:
-            # Small pause before next listen
-            await asyncio.sleep(0.5)
-        else:
+        if not self.config.auto_listen_after_response:
             self._set_state(VoiceState.IDLE)
     
     async def _listen(self) -> Optional[str]:
         """
-        Listen for voice input and return transcript.
+        Wait for the next queued transcript.
+        
+        Transcripts are queued by submit_transcript() from the WebSocket
+        endpoint, voicemode or any other ASR source.
         
         Returns:
-            Transcript string or None if no input
+            Transcript string, or None if the loop was stopped while waiting
         """
-        # For now, this is a placeholder that would be replaced with
-        # actual audio capture from microphone or voicemode integration
-        
-        # In a real implementation, this would:
-        # 1. Capture audio from microphone
-        # 2. Detect speech/silence
-        # 3. Send to ASR service
-        # 4. Return transcript
-        
-        # For testing, we can simulate with input
-        # In production, this would integrate with voicemode MCP server
-        
-        logger.debug("Listening for voice input...")
-        
-        # Placeholder: would be replaced with actual audio capture
-        # For now, simulate with a small delay
-        await asyncio.sleep(0.1)
+        if self._stop_event.is_set():
+            return None
+        get_event = asyncio.ensure_future(self._events.get())
+        stopped = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            await asyncio.wait({get_event, stopped}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopped.cancel()
+        if not get_event.done():
+            get_event.cancel()
+            return None
         
-        return None  # No input in this placeholder
+        event: TranscriptEvent = get_event.result()
+        self._last_event_received_at = event.received_at
+        self.stats.record_latency("queue_wait", (time.perf_counter() - event.received_at) * 1000)
+        return event.text
     
     async def _process_command(self, transcript: str) -> str:
         """
@@ -262,9 +336,11 @@ class VoiceLoopController:
         logger.info(f"Processing command: {transcript}")
         
         try:
-            # Use the voice orchestrator to create a plan
+            # Plan in a worker thread: the LLM call must not block the event loop
             from workflows.voice_orchestrator import run_voice_orchestrator
-            result = run_voice_orchestrator(transcript)
+            started = time.perf_counter()
+            result = await asyncio.to_thread(run_voice_orchestrator, transcript)
+            self.stats.record_latency("plan", (time.perf_counter() - started) * 1000)
             
             if result.get("error"):
                 return f"Sorry, I couldn't understand that. {result['error']}"
@@ -304,45 +380,51 @@ class VoiceLoopController:
         Returns:
             Summary of execution results
         """
+        from api.api.mcp_executor import invoke_tool_handler, invoke_tool_handler_with_session, run_plan_steps
+        from api.services.tool_validation import validate_tool_args
         from mcp_server.server import TOOL_REGISTRY
-        
-        db = self._get_db()
-        results = []
-        
-        for step in steps:
+
+        def is_write(step: Dict[str, Any]) -> bool:
+            return TOOL_REGISTRY.get(step.get("tool_name"), {}).get("mode", step.get("mode")) == "write"
+
+        def run_step(step: Dict[str, Any], args: Dict[str, Any]) -> Any:
             tool_name = step.get("tool_name")
-            args = step.get("args", {})
-            
             if tool_name not in TOOL_REGISTRY:
+                raise ValueError(f"Unknown tool: {tool_name}")
+            args = validate_tool_args(tool_name, TOOL_REGISTRY[tool_name], args)
+            handler = TOOL_REGISTRY[tool_name]["handler"]
+            if is_write(step):
+                # Writes are serialized by the executor and share the loop's session
+                return invoke_tool_handler(handler, args, db=self._get_db())
+            return invoke_tool_handler_with_session(handler, args)
+
+        # Independent reads run concurrently; results stay in plan order
+        started = time.perf_counter()
+        outcomes = await asyncio.to_thread(run_plan_steps, steps, run_step, is_write)
+        self.stats.record_latency("execute", (time.perf_counter() - started) * 1000)
+
+        results = []
+        for step, outcome in zip(steps, outcomes):
+            tool_name = step.get("tool_name")
+            if outcome.error is not None:
                 results.append({
                     "tool": tool_name,
                     "success": False,
-                    "error": f"Unknown tool: {tool_name}"
+                    "error": outcome.error
                 })
                 continue
-            
-            tool_info = TOOL_REGISTRY[tool_name]
-            handler = tool_info["handler"]
-            
-            try:
-                result = handler(db, **args)
-                results.append({
-                    "tool": tool_name,
-                    "success": "error" not in result,
-                    "result": result
-                })
-                
-                # Update context based on results
+
+            result = outcome.output
+            results.append({
+                "tool": tool_name,
+                "success": not (isinstance(result, dict) and "error" in result),
+                "result": result
+            })
+
+            # Update context based on results
+            if isinstance(result, dict):
                 self._update_context(tool_name, result)
-                
-            except Exception as e:
-                logger.exception(f"Tool execution error: {tool_name}")
-                results.append({
-                    "tool": tool_name,
-                    "success": False,
-                    "error": str(e)
-                })
-        
+
         # Store results in context
         self.context.last_tool_results = results
         
@@ -413,7 +495,7 @@ class VoiceLoopController:
     
     async def _speak(self, text: str):
         """
-        Speak text using TTS.
+        Speak text using TTS. Returns early if a new transcript barges in.
         
         Args:
             text: Text to speak
@@ -423,24 +505,45 @@ class VoiceLoopController:
         # Trigger callback
         if self._on_response:
             self._on_response(text)
+        if not self.config.server_speech:
+            return
         
-        # Use TTS service
+        started = time.perf_counter()
+        self._speak_task = asyncio.create_task(self._play_speech(text))
         try:
-            result = tts.synthesize(text)
-            
-            # In a real implementation, this would play the audio
-            # For now, just log it
-            if result.audio_bytes:
-                logger.debug(f"TTS generated {len(result.audio_bytes)} bytes of audio")
-            
-            # Simulate speaking time (rough estimate: 150 words/minute)
-            word_count = len(text.split())
-            speak_time = word_count / 150 * 60
+            await self._speak_task
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise  # The loop itself is being cancelled, not a barge-in
+            logger.info("Speech interrupted")
+        finally:
+            self._speak_task = None
+            self.stats.record_latency("speak", (time.perf_counter() - started) * 1000)
+    
+    async def _play_speech(self, text: str):
+        # Stream sentence by sentence so playback starts after the first sentence
+        try:
+            speak_time = 0.0
+            audio_bytes = 0
+            async for event in stream_speech(self._single_delta(text), get_streaming_tts()):
+                if event.type == "text":
+                    # Simulate speaking time (rough estimate: 150 words/minute)
+                    speak_time += len(event.text.split()) / 150 * 60
+                elif event.audio:
+                    # In a real implementation, this would play the audio
+                    audio_bytes += len(event.audio)
+
+            if audio_bytes:
+                logger.debug(f"TTS generated {audio_bytes} bytes of audio")
             await asyncio.sleep(min(speak_time, 5.0))  # Cap at 5 seconds
-            
+
         except Exception as e:
             logger.error(f"TTS error: {e}")
-    
+
+    @staticmethod
+    async def _single_delta(text: str):
+        yield text
+
     def _is_stop_command(self, transcript: str) -> bool:
         """Check if the transcript is a stop command."""
         stop_phrases = [
@@ -466,6 +569,10 @@ class VoiceLoopController:
                 "total_interactions": self.stats.total_interactions,
                 "successful_commands": self.stats.successful_commands,
                 "failed_commands": self.stats.failed_commands,
+                "barge_ins": self.stats.barge_ins,
+                "dropped_transcripts": self.stats.dropped_transcripts,
+                "queued_transcripts": self._events.qsize(),
+                "latency_ms": self.stats.latency_summary(),
             },
             "context": {
                 "current_course_id": self.context.current_course_id,
@@ -519,30 +626,111 @@ class VoiceModeIntegration:
         """
         Handle a transcript received from voicemode.
         
+        The transcript is queued on the controller's loop, which plans,
+        executes and speaks the response (interrupting any current speech).
+        
         Args:
             transcript: The transcribed text from voicemode
         """
-        # Process the command using the controller
-        response = await self.controller._process_command(transcript)
-        
-        # Send response back through voicemode for TTS
-        await self._send_to_voicemode_tts(response)
-    
-    async def _send_to_voicemode_tts(self, text: str):
-        """Send text to voicemode for TTS."""
-        # Placeholder for voicemode TTS integration
-        pass
+        self.controller.submit_transcript(transcript, source="voicemode")
 
 
 # ============ HTTP/WebSocket API for voice control ============
 
+async def transcribe_audio(audio_bytes: bytes, content_type: str = "audio/webm") -> Optional[Any]:
+    """
+    Transcribe audio with the ASR service in a worker thread.
+    
+    Returns:
+        The ASR result (with .transcript), or None if no ASR service is installed
+    """
+    try:
+        from api.services import asr
+    except ImportError:
+        logger.warning("No ASR service installed; send text transcripts instead of audio")
+        return None
+    return await asyncio.to_thread(asr.transcribe, audio_bytes, content_type)
+
+
+async def serve_voice_websocket(websocket: Any, ready_message: Optional[str] = None):
+    """
+    Run a voice loop for one WebSocket client until it disconnects.
+    
+    Protocol:
+    - Client sends: {"type": "audio", "data": "<base64 audio>", "content_type": "audio/webm"},
+      {"type": "text", "data": "<transcript>"}, {"type": "ping"} or {"type": "stop"}
+    - Server sends: {"type": "transcript" | "response" | "error", "data": "<text>"},
+      {"type": "pong"}, and {"type": "ready"} first if ready_message is given
+    
+    Responses are sent as text for the client to voice, so no server-side TTS
+    runs, and stop phrases are ordinary commands ("end session" is a tool).
+    If the loop stops on its own, the client gets an error and the socket is closed.
+    """
+    import base64
+    from fastapi import WebSocketDisconnect
+    
+    await websocket.accept()
+    
+    # Transcripts and responses are sent by the loop's callbacks
+    controller = VoiceLoopController(
+        config=VoiceConfig(greeting=None, stop_phrases_enabled=False, server_speech=False),
+        on_transcript=lambda t: asyncio.create_task(
+            websocket.send_json({"type": "transcript", "data": t})
+        ),
+        on_response=lambda r: asyncio.create_task(
+            websocket.send_json({"type": "response", "data": r})
+        ),
+    )
+    loop_task = asyncio.create_task(controller.start())
+    
+    try:
+        if ready_message:
+            await websocket.send_json({"type": "ready", "data": ready_message})
+        
+        while True:
+            receive = asyncio.ensure_future(websocket.receive_json())
+            await asyncio.wait({receive, loop_task}, return_when=asyncio.FIRST_COMPLETED)
+            if not receive.done():
+                receive.cancel()
+                await websocket.send_json({"type": "error", "data": "Voice loop stopped"})
+                await websocket.close(code=1011)
+                break
+            
+            data = receive.result()
+            msg_type = data.get("type")
+            
+            if msg_type == "audio":
+                audio_bytes = base64.b64decode(data.get("data", ""))
+                result = await transcribe_audio(audio_bytes, data.get("content_type", "audio/webm"))
+                
+                if result is None:
+                    await websocket.send_json({"type": "error", "data": "Speech recognition is not available"})
+                elif result.transcript:
+                    controller.submit_transcript(result.transcript, source="audio")
+            
+            elif msg_type == "text":
+                controller.submit_transcript(data.get("data", ""), source="text")
+            
+            elif msg_type == "ping":
+                await websocket.send_json({"type": "pong"})
+            
+            elif msg_type == "stop":
+                break
+    
+    except WebSocketDisconnect:
+        logger.info("Voice WebSocket disconnected")
+    finally:
+        await controller.stop()
+        await loop_task
+
+
 async def create_voice_api_router():
     """
     Create FastAPI router for voice control endpoints.
     
     This allows the frontend to control the voice loop via HTTP/WebSocket.
     """
-    from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+    from fastapi import APIRouter, WebSocket
     
     router = APIRouter()
     
@@ -608,65 +796,8 @@ async def create_voice_api_router():
     
     @router.websocket("/voice/ws")
     async def voice_websocket(websocket: WebSocket):
-        """
-        WebSocket endpoint for real-time voice interaction.
-        
-        Protocol:
-        - Client sends: {"type": "audio", "data": "<base64 audio>"} or {"type": "text", "data": "<transcript>"}
-        - Server sends: {"type": "transcript", "data": "<text>"} or {"type": "response", "data": "<text>"}
-        """
-        await websocket.accept()
-        
-        ws_controller = VoiceLoopController(
-            on_transcript=lambda t: asyncio.create_task(
-                websocket.send_json({"type": "transcript", "data": t})
-            ),
-            on_response=lambda r: asyncio.create_task(
-                websocket.send_json({"type": "response", "data": r})
-            ),
-        )
-        
-        try:
-            while True:
-                data = await websocket.receive_json()
-                
-                if data.get("type") == "audio":
-                    # Decode audio and transcribe
-                    import base64
-                    audio_bytes = base64.b64decode(data.get("data", ""))
-                    result = asr.transcribe(audio_bytes)
-                    
-                    if result.transcript:
-                        # Send transcript
-                        await websocket.send_json({
-                            "type": "transcript",
-                            "data": result.transcript
-                        })
-                        
-                        # Process command
-                        response = await ws_controller._process_command(result.transcript)
-                        await websocket.send_json({
-                            "type": "response",
-                            "data": response
-                        })
-                
-                elif data.get("type") == "text":
-                    # Direct text input
-                    transcript = data.get("data", "")
-                    if transcript:
-                        response = await ws_controller._process_command(transcript)
-                        await websocket.send_json({
-                            "type": "response",
-                            "data": response
-                        })
-                
-                elif data.get("type") == "stop":
-                    break
-                    
-        except WebSocketDisconnect:
-            logger.info("Voice WebSocket disconnected")
-        finally:
-            ws_controller._close_db()
+        """WebSocket endpoint for real-time voice interaction (see serve_voice_websocket)."""
+        await serve_voice_websocket(websocket)
     
     return router
 
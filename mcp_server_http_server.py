@@ -20,11 +20,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Direct imports to access your MCP tools
 sys.path.insert(0, '.')
-from api.core.database import SessionLocal
-from api.api.mcp_executor import invoke_tool_handler
-from api.services.action_preview import build_action_preview
+from api.api.mcp_executor import ToolBusyError, ToolTimeoutError, get_tool_executor
 from api.services.action_store import ActionStore
 from api.services.tool_response import normalize_tool_result
+from api.services.tool_validation import ToolArgumentError, validate_tool_args
 
 # Import your MCP server to get tool registry
 try:
@@ -125,50 +124,48 @@ async def http_execute_tool(request: dict):
     if not tool_info:
         raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
     
+    try:
+        arguments = validate_tool_args(tool_name, tool_info, arguments)
+    except ToolArgumentError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    executor = get_tool_executor()
     try:
         if tool_info["mode"] == "write" and tool_name not in ACTION_TOOL_NAMES:
             # Plan write actions
-            db = SessionLocal()
-            try:
-                preview = build_action_preview(tool_name, arguments, db=db)
-                action = action_store.create_action(
-                    user_id=user_id,
-                    tool_name=tool_name,
-                    args=arguments,
-                    preview=preview,
-                )
-                result = {
-                    "tool": tool_name,
-                    "success": True,
-                    "action_id": action.action_id,
-                    "requires_confirmation": True,
-                    "preview": preview,
-                    "message": "Action planned. Please confirm to execute.",
-                    "elevenlabs_response": True
-                }
-                logger.info(f"✅ Write action planned: {tool_name} -> {action.action_id}")
-                return result
-            finally:
-                db.close()
+            planned = await executor.plan_write(tool_name, arguments, user_id, action_store)
+            result = {
+                "tool": tool_name,
+                "success": True,
+                "action_id": planned["action_id"],
+                "requires_confirmation": True,
+                "preview": planned["preview"],
+                "message": "Action planned. Please confirm to execute.",
+                "elevenlabs_response": True
+            }
+            logger.info(f"✅ Write action planned: {tool_name} -> {planned['action_id']}")
+            return result
         else:
-            # Execute read actions directly
-            db = SessionLocal()
-            try:
-                handler_result = invoke_tool_handler(tool_info["handler"], arguments, db=db)
-                normalized_result = normalize_tool_result(handler_result, tool_name)
-                
-                result = {
-                    "tool": tool_name,
-                    "success": normalized_result.get("ok", True),
-                    "result": normalized_result,
-                    "executed": True,
-                    "elevenlabs_response": True
-                }
-                logger.info(f"✅ Tool executed: {tool_name}")
-                return result
-            finally:
-                db.close()
-                    
+            # Execute read actions on the shared tool pool
+            handler_result = await executor.invoke(
+                tool_name, tool_info["handler"], arguments, category=tool_info.get("category")
+            )
+            normalized_result = normalize_tool_result(handler_result, tool_name)
+
+            result = {
+                "tool": tool_name,
+                "success": normalized_result.get("ok", True),
+                "result": normalized_result,
+                "executed": True,
+                "elevenlabs_response": True
+            }
+            logger.info(f"✅ Tool executed: {tool_name}")
+            return result
+
+    except ToolBusyError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except ToolTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"❌ Tool execution failed: {tool_name} - {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
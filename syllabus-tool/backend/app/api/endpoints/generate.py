@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.uploaded_file import UploadedFile
 from app.services.storage import StorageService
-from app.services.parser import parse_file
+from app.services.parser import parse_file_async
 from app.schemas.generator import (
     GenerateRequest, FillTemplateRequest, FillTemplateResponse,
     FillTemplateJobResponse, FillTemplateStatusResponse,
@@ -16,13 +16,13 @@ from app.services.template_filler import (
 )
 from app.schemas.syllabus import SyllabusData, CourseInfo, LearningGoal, ScheduleItem, Policies
 from app.services.llm_factory import invoke_llm
+from app.services.fill_jobs import FillJobProgress, QueueFullError, fill_job_queue
 from langchain_core.messages import SystemMessage, HumanMessage
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import re
 import logging
-import uuid
-import threading
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +40,6 @@ def _language_directive(lang: str) -> str:
         f"Only [P#] markers and JSON structure keys remain in English."
     )
 
-# In-memory job store for async fill-template jobs
-_fill_jobs: dict[str, dict] = {}
-
 @router.post("/draft", response_model=SyllabusData)
 async def generate_draft(request: GenerateRequest, db: Session = Depends(get_db)):
     try:
@@ -58,7 +55,7 @@ async def generate_draft(request: GenerateRequest, db: Session = Depends(get_db)
                     content = storage.get_file(file_record.object_name)
                     print(f"[GENERATE] Storage returned content: {len(content) if content else 0} bytes", flush=True)
                     if content:
-                        parsed_text = parse_file(file_record.filename, content)
+                        parsed_text = await parse_file_async(file_record.filename, content)
                         print(f"[GENERATE] Parsed text length: {len(parsed_text)} chars", flush=True)
                         print(f"[GENERATE] First 300 chars: {parsed_text[:300]}", flush=True)
                         reference_context = f"\n\n--- REFERENCE DOCUMENT ({file_record.filename}) ---\n{parsed_text[:20000]}\n--- END REFERENCE DOCUMENT ---"
@@ -344,14 +341,28 @@ COURSE INFORMATION:
     return parse_llm_response(response.content, max(p["index"] for p in body_paragraphs) + 1)
 
 
-def _fill_body_parallel(all_body_paragraphs: list[dict], course_info: dict) -> dict[int, str]:
-    """Split body paragraphs into chunks and fill them in parallel."""
+def _body_chunk_count(body_paragraphs: list[dict]) -> int:
+    if not body_paragraphs:
+        return 0
+    return -(-len(body_paragraphs) // _BODY_CHUNK_SIZE)
+
+
+def _fill_body_parallel(all_body_paragraphs: list[dict], course_info: dict,
+                        on_chunk: Optional[Callable[[dict[int, str]], None]] = None) -> dict[int, str]:
+    """Split body paragraphs into chunks and fill them in parallel.
+
+    on_chunk is called with each finished chunk's replacements (empty on error);
+    if it raises, chunks not yet started are cancelled and the error propagates.
+    """
     if not all_body_paragraphs:
         return {}
 
     # Small enough for a single call — no chunking needed
     if len(all_body_paragraphs) <= _BODY_CHUNK_SIZE:
-        return _fill_body_chunk(all_body_paragraphs, course_info)
+        merged = _fill_body_chunk(all_body_paragraphs, course_info)
+        if on_chunk:
+            on_chunk(merged)
+        return merged
 
     # Split into chunks
     chunks = [
@@ -366,14 +377,22 @@ def _fill_body_parallel(all_body_paragraphs: list[dict], course_info: dict) -> d
             executor.submit(_fill_body_chunk, chunk, course_info): idx
             for idx, chunk in enumerate(chunks)
         }
-        for future in as_completed(futures):
-            chunk_idx = futures[future]
-            try:
-                chunk_map = future.result()
-                print(f"[FILL-TEMPLATE] Body chunk {chunk_idx + 1}/{len(chunks)} filled: {len(chunk_map)} replacements", flush=True)
-                merged.update(chunk_map)
-            except Exception as e:
-                print(f"[FILL-TEMPLATE] Body chunk {chunk_idx + 1}/{len(chunks)} ERROR: {e}", flush=True)
+        try:
+            for future in as_completed(futures):
+                chunk_idx = futures[future]
+                chunk_map: dict[int, str] = {}
+                try:
+                    chunk_map = future.result()
+                    print(f"[FILL-TEMPLATE] Body chunk {chunk_idx + 1}/{len(chunks)} filled: {len(chunk_map)} replacements", flush=True)
+                    merged.update(chunk_map)
+                except Exception as e:
+                    print(f"[FILL-TEMPLATE] Body chunk {chunk_idx + 1}/{len(chunks)} ERROR: {e}", flush=True)
+                if on_chunk:
+                    on_chunk(chunk_map)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
     return merged
 
 
@@ -459,64 +478,67 @@ def _infer_table_label(table_group: dict) -> str:
     return first or f"Table {table_group['table_index']}"
 
 
-def _run_fill_template_job(job_id: str, file_object_name: str, reference_file_id: int,
-                            course_title: str, target_audience: str, duration: str,
-                            language: str = "en", syllabus_content: dict | None = None):
-    """Background worker for fill-template LLM call — chunked body + parallel tables."""
-    print(f"[FILL-TEMPLATE] Job {job_id} started, language={language}, has_syllabus={syllabus_content is not None}", flush=True)
-    try:
-        _fill_jobs[job_id]["status"] = "running"
+def _run_fill_template_job(params: dict, progress: FillJobProgress) -> dict:
+    """Queue runner for fill-template jobs — chunked body + parallel tables.
 
-        storage = StorageService()
-        content = storage.get_file(file_object_name)
-        print(f"[FILL-TEMPLATE] Storage returned {len(content) if content else 0} bytes", flush=True)
-        if not content:
-            _fill_jobs[job_id] = {"status": "failed", "error": "File content not found in storage"}
-            return
-
-        # 1. Extract paragraphs with table metadata
-        numbered_paragraphs = extract_numbered_paragraphs(content)
-        print(f"[FILL-TEMPLATE] Extracted {len(numbered_paragraphs)} paragraphs", flush=True)
-
-        if not numbered_paragraphs:
-            _fill_jobs[job_id] = {"status": "failed", "error": "No content found in the template document."}
-            return
-
-        # 2. Group into body + tables
-        groups = group_paragraphs_by_section(numbered_paragraphs)
-        print(f"[FILL-TEMPLATE] Body: {len(groups['body'])} paragraphs, Tables: {len(groups['tables'])}", flush=True)
-
-        course_info = {
-            "course_title": course_title,
-            "target_audience": target_audience,
-            "duration": duration,
-            "language": language,
-            "syllabus_content": syllabus_content,
-        }
-
-        # 3. Split body into content vs policy paragraphs
-        content_paragraphs, policy_paragraphs = _split_policy_paragraphs(groups["body"])
-        print(f"[FILL-TEMPLATE] Policy: {len(policy_paragraphs)} paragraphs preserved verbatim", flush=True)
-
-        # 4. Fill content body — chunked in parallel for large templates
-        print(f"[FILL-TEMPLATE] Filling body ({len(content_paragraphs)} content paragraphs)...", flush=True)
-        merged_map: dict[int, str] = _fill_body_parallel(content_paragraphs, course_info)
-        print(f"[FILL-TEMPLATE] Body filled: {len(merged_map)} replacements", flush=True)
-
-        # 5. Copy policy paragraphs verbatim into merged_map
-        for p in policy_paragraphs:
-            merged_map[p["index"]] = p["text"]
-
-        # 6. Fill tables in parallel
-        if groups["tables"]:
-            print(f"[FILL-TEMPLATE] Filling {len(groups['tables'])} table(s) in parallel...", flush=True)
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = {
-                    executor.submit(_fill_table_chunk, tg, course_info): tg
-                    for tg in groups["tables"]
-                }
+    Reports each finished body chunk and table to progress, which stops the job
+    if it was cancelled. Returns a FillTemplateResult dict.
+    """
+    language = params.get("language", "en")
+    syllabus_content = params.get("syllabus_content")
+    print(f"[FILL-TEMPLATE] Job {progress.job_id} language={language}, has_syllabus={syllabus_content is not None}", flush=True)
+
+    storage = StorageService()
+    content = storage.get_file(params["file_object_name"])
+    print(f"[FILL-TEMPLATE] Storage returned {len(content) if content else 0} bytes", flush=True)
+    if not content:
+        raise RuntimeError("File content not found in storage")
+
+    # 1. Extract paragraphs with table metadata
+    numbered_paragraphs = extract_numbered_paragraphs(content)
+    print(f"[FILL-TEMPLATE] Extracted {len(numbered_paragraphs)} paragraphs", flush=True)
+
+    if not numbered_paragraphs:
+        raise RuntimeError("No content found in the template document.")
+
+    # 2. Group into body + tables
+    groups = group_paragraphs_by_section(numbered_paragraphs)
+    print(f"[FILL-TEMPLATE] Body: {len(groups['body'])} paragraphs, Tables: {len(groups['tables'])}", flush=True)
+
+    course_info = {
+        "course_title": params["course_title"],
+        "target_audience": params.get("target_audience", ""),
+        "duration": params.get("duration", ""),
+        "language": language,
+        "syllabus_content": syllabus_content,
+    }
+
+    # 3. Split body into content vs policy paragraphs
+    content_paragraphs, policy_paragraphs = _split_policy_paragraphs(groups["body"])
+    print(f"[FILL-TEMPLATE] Policy: {len(policy_paragraphs)} paragraphs preserved verbatim", flush=True)
+    progress.set_total(_body_chunk_count(content_paragraphs) + len(groups["tables"]))
+
+    # 4. Fill content body — chunked in parallel for large templates
+    print(f"[FILL-TEMPLATE] Filling body ({len(content_paragraphs)} content paragraphs)...", flush=True)
+    merged_map: dict[int, str] = _fill_body_parallel(content_paragraphs, course_info, on_chunk=progress.chunk_done)
+    print(f"[FILL-TEMPLATE] Body filled: {len(merged_map)} replacements", flush=True)
+
+    # 5. Copy policy paragraphs verbatim into merged_map
+    for p in policy_paragraphs:
+        merged_map[p["index"]] = p["text"]
+
+    # 6. Fill tables in parallel
+    if groups["tables"]:
+        print(f"[FILL-TEMPLATE] Filling {len(groups['tables'])} table(s) in parallel...", flush=True)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                executor.submit(_fill_table_chunk, tg, course_info): tg
+                for tg in groups["tables"]
+            }
+            try:
                 for future in as_completed(futures):
                     tg = futures[future]
+                    table_map: dict[int, str] = {}
                     try:
                         table_map = future.result()
                         print(f"[FILL-TEMPLATE] Table {tg['table_index']} filled: {len(table_map)} replacements", flush=True)
@@ -524,86 +546,87 @@ def _run_fill_template_job(job_id: str, file_object_name: str, reference_file_id
                     except Exception as e:
                         print(f"[FILL-TEMPLATE] Table {tg['table_index']} ERROR: {e}", flush=True)
                         # Continue — partial fill is better than total failure
+                    progress.chunk_done(table_map)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    # 6b. Post-process: remove any remaining template instruction markers [[[[[...]]]]]
+    for p in numbered_paragraphs:
+        idx = p["index"]
+        original = p["text"]
+        if "[[[[[" in original:
+            current = merged_map.get(idx, original)
+            if "[[[[[" in current:
+                merged_map[idx] = ""
 
-        # 6b. Post-process: remove any remaining template instruction markers [[[[[...]]]]]
-        for p in numbered_paragraphs:
-            idx = p["index"]
-            original = p["text"]
-            if "[[[[[" in original:
-                current = merged_map.get(idx, original)
-                if "[[[[[" in current:
-                    merged_map[idx] = ""
-
-        print(f"[FILL-TEMPLATE] Total replacements: {len(merged_map)}", flush=True)
-
-        # 7. Build sections for frontend
-        sections = []
-        if content_paragraphs:
-            sections.append(_build_section("body", "Course Content", content_paragraphs, merged_map))
-        if policy_paragraphs:
-            sections.append(_build_section("policy", "Policies (preserved)", policy_paragraphs, merged_map, is_policy=True))
-        for tg in groups["tables"]:
-            label = _infer_table_label(tg)
-            sections.append(_build_section(f"table_{tg['table_index']}", label, tg["paragraphs"], merged_map))
-
-        # 8. Build flat paragraph_map (string keys for JSON)
-        paragraph_map = {str(k): v for k, v in merged_map.items()}
-
-        _fill_jobs[job_id] = {
-            "status": "completed",
-            "result": FillTemplateResult(
-                sections=sections,
-                paragraph_map=paragraph_map,
-                original_file_id=reference_file_id,
-            ).model_dump(),
-        }
-    except Exception as e:
-        print(f"[FILL-TEMPLATE] ERROR: {e}", flush=True)
-        _fill_jobs[job_id] = {"status": "failed", "error": str(e)}
+    print(f"[FILL-TEMPLATE] Total replacements: {len(merged_map)}", flush=True)
+
+    # 7. Build sections for frontend
+    sections = []
+    if content_paragraphs:
+        sections.append(_build_section("body", "Course Content", content_paragraphs, merged_map))
+    if policy_paragraphs:
+        sections.append(_build_section("policy", "Policies (preserved)", policy_paragraphs, merged_map, is_policy=True))
+    for tg in groups["tables"]:
+        label = _infer_table_label(tg)
+        sections.append(_build_section(f"table_{tg['table_index']}", label, tg["paragraphs"], merged_map))
+
+    # 8. Build flat paragraph_map (string keys for JSON)
+    paragraph_map = {str(k): v for k, v in merged_map.items()}
+
+    return FillTemplateResult(
+        sections=sections,
+        paragraph_map=paragraph_map,
+        original_file_id=params["reference_file_id"],
+    ).model_dump()
+
+
+fill_job_queue.register_runner(_run_fill_template_job)
 
 
 @router.post("/fill-template", response_model=FillTemplateJobResponse)
 async def fill_template(request: FillTemplateRequest, db: Session = Depends(get_db)):
-    """Kick off async fill-template job. Returns job_id immediately."""
-    # Validate file exists before starting background work
+    """Queue a fill-template job. Returns job_id immediately."""
+    # Validate file exists before queueing background work
     file_record = db.query(UploadedFile).filter(UploadedFile.id == request.reference_file_id).first()
     if not file_record:
         raise HTTPException(status_code=404, detail="Reference file not found")
 
-    job_id = str(uuid.uuid4())
-    _fill_jobs[job_id] = {"status": "pending"}
-
-    def _safe_run():
-        try:
-            _run_fill_template_job(
-                job_id, file_record.object_name, request.reference_file_id,
-                request.course_title, request.target_audience, request.duration,
-                request.language, request.syllabus_content,
-            )
-        except Exception as e:
-            print(f"[FILL-TEMPLATE] THREAD CRASH: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
-            _fill_jobs[job_id] = {"status": "failed", "error": f"Thread crash: {e}"}
-
-    thread = threading.Thread(target=_safe_run, daemon=True)
-    thread.start()
+    try:
+        job_id = fill_job_queue.submit({
+            "file_object_name": file_record.object_name,
+            "reference_file_id": request.reference_file_id,
+            "course_title": request.course_title,
+            "target_audience": request.target_audience,
+            "duration": request.duration,
+            "language": request.language,
+            "syllabus_content": request.syllabus_content,
+        })
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
 
     return FillTemplateJobResponse(job_id=job_id)
 
 
 @router.get("/fill-template/status/{job_id}", response_model=FillTemplateStatusResponse)
 async def fill_template_status(job_id: str):
-    """Poll for fill-template job status."""
-    job = _fill_jobs.get(job_id)
+    """Poll for fill-template job status, progress and partial results."""
+    job = fill_job_queue.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return FillTemplateStatusResponse(
-        status=job["status"],
-        result=job.get("result"),
-        error=job.get("error"),
-    )
+    return FillTemplateStatusResponse(**job)
+
+
+@router.post("/fill-template/cancel/{job_id}", response_model=FillTemplateStatusResponse)
+async def cancel_fill_template(job_id: str):
+    """Cancel a queued or running fill-template job. Running jobs stop after their current chunk."""
+    if not fill_job_queue.cancel(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return FillTemplateStatusResponse(**fill_job_queue.get(job_id))
 
 
 @router.post("/fill-template/regenerate-section", response_model=RegenerateSectionResponse)
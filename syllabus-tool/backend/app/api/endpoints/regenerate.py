@@ -5,8 +5,7 @@ from pydantic import BaseModel
 
 from app.db.session import get_db
 from app.models.uploaded_file import UploadedFile
-from app.services.storage import storage_service
-from app.services.parser import parse_file
+from app.services.extraction_cache import get_file_text
 from app.services.llm_factory import invoke_llm
 from langchain_core.messages import HumanMessage, SystemMessage
 
@@ -28,9 +27,8 @@ def regenerate_field(request: RegenerateRequest, db: Session = Depends(get_db)):
     
     full_text = ""
     for file in files:
-        content = storage_service.get_file(file.object_name)
-        if content:
-            text = parse_file(file.filename, content)
+        text = get_file_text(db, file)
+        if text:
             full_text += f"\n\n--- {file.filename} ---\n{text}"
             
     if not full_text:
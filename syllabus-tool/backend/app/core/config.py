@@ -32,6 +32,22 @@ class Settings(BaseSettings):
     MINIO_BUCKET_NAME: str = "syllabus-files"
     MINIO_SECURE: bool = False
 
+    # Document text extraction (process pool)
+    EXTRACTION_WORKERS: int = 2
+    EXTRACTION_MAX_PAGES: int = 500
+    EXTRACTION_TIMEOUT_SECONDS: float = 60.0
+    EXTRACTION_MAX_MEMORY_MB: int = 1024
+    EXTRACTION_CACHE_MAX_ENTRIES: int = 256
+
+    # Fill-template job queue. FILL_JOB_WORKERS is per API process, so up to
+    # FILL_JOB_WORKERS x gunicorn workers (cpu * 2 + 1) jobs run at once, never
+    # more than FILL_JOB_MAX_QUEUED, which is counted across all processes.
+    FILL_JOB_WORKERS: int = 2
+    FILL_JOB_MAX_QUEUED: int = 20  # pending + running jobs before new submissions get 429
+    FILL_JOB_TTL_SECONDS: int = 86400  # finished jobs are deleted after this
+    FILL_JOB_STALE_SECONDS: int = 600  # running jobs without a heartbeat this long are requeued
+    FILL_JOB_LEASE_CHECK_SECONDS: int = 60  # how often each process heartbeats its jobs and requeues stale ones
+
     # AI / LLM (DeepSeek)
     DEEPSEEK_API_KEY: str = ""
     DEEPSEEK_BASE_URL: str = "https://api.deepseek.com/v1"
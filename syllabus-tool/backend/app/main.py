@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI, UploadFile, File, Form, Depends, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional
@@ -6,23 +7,48 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from sqlalchemy.sql import func
 from app.core.config import settings
-from app.db.session import engine, get_db
+from app.db.session import SessionLocal, engine, get_db
 
 from app.db.base import Base
 from app.models.syllabus import Syllabus
 from app.models.uploaded_file import UploadedFile
 from app.models.analysis_history import AnalysisHistory
 from app.models.standard_policy import StandardPolicy
+from app.models.extraction_cache import AnalysisLookup, ExtractedText, ExtractionCacheEntry
+from app.models.fill_job import FillTemplateJob
 from app.services.storage import storage_service
-from app.services.parser import parse_file, extract_metadata, extract_syllabus_data, merge_structured_data
+from app.services.parser import parse_file_async, extract_metadata, merge_structured_data
 from app.services.converter import convert_to_pdf
+from app.services.extraction_cache import (
+    backfill_analysis_lookup,
+    cached_extract_syllabus_data,
+    find_saved_analysis,
+    get_file_text,
+    index_saved_analysis,
+    save_file_text,
+)
 from app.api.endpoints import chat, export, policies, regenerate, generate, syllabi, voice
+from app.services.fill_jobs import fill_job_queue
 from app.core.logger import log, log_step, log_buffer, setup_logging
 from pydantic import BaseModel
 
 # Create tables
 Base.metadata.create_all(bind=engine)
 
+# Index saved analyses created before the lookup table existed
+try:
+    with SessionLocal() as _db:
+        backfill_analysis_lookup(_db)
+except Exception as e:
+    print(f"Analysis lookup backfill failed: {e}")
+
+# Resume fill-template jobs interrupted by a restart, then keep requeueing jobs whose worker died
+try:
+    fill_job_queue.recover()
+except Exception as e:
+    print(f"Fill job recovery failed: {e}")
+fill_job_queue.start_lease_monitor()
+
 # Initialize logging
 setup_logging()
 
@@ -98,7 +124,7 @@ async def upload_files(
         
         if object_name:
             log_step(f"File {filename} uploaded to storage. Parsing content...")
-            extracted_text = parse_file(filename, content)
+            extracted_text = await parse_file_async(filename, content)
             metadata = extract_metadata(filename, extracted_text)
             
             db_file = UploadedFile(
@@ -116,6 +142,7 @@ async def upload_files(
             try:
                 db.commit()
                 db.refresh(db_file)
+                save_file_text(db, db_file, extracted_text)
             except Exception as e:
                 db.rollback()
                 print(f"DB Error: {e}")
@@ -165,12 +192,11 @@ def analyze_file(file_id: int, db: Session = Depends(get_db)):
     if not db_file:
         raise HTTPException(status_code=404, detail="File not found")
     
-    content = storage_service.get_file(db_file.object_name)
-    if not content:
+    # Reuses the text extracted at upload; only downloads and parses the first time
+    extracted_text = get_file_text(db, db_file)
+    if extracted_text is None:
         raise HTTPException(status_code=404, detail="File content not found in storage")
     
-    extracted_text = parse_file(db_file.filename, content)
-    
     # Check if we already have parsed data
     if db_file.parsed_data:
         return {
@@ -181,8 +207,8 @@ def analyze_file(file_id: int, db: Session = Depends(get_db)):
             "structured_data": db_file.parsed_data
         }
     
-    # Run structured extraction
-    structured_data = extract_syllabus_data(extracted_text)
+    # Run structured extraction (cached by text hash)
+    structured_data = cached_extract_syllabus_data(db, extracted_text)
     
     # Update DB
     db_file.parsed_data = structured_data
@@ -209,6 +235,7 @@ def delete_file(file_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="File not found")
     
     object_name = db_file.object_name
+    db.query(ExtractedText).filter(ExtractedText.uploaded_file_id == file_id).delete()
     db.delete(db_file)
     db.commit()
     
@@ -228,16 +255,13 @@ async def analyze_batch(request: AnalyzeBatchRequest, db: Session = Depends(get_
     log_step(f"Starting batch analysis for {len(request.file_ids)} files.")
     # Check for existing cache (skip if guidance is used)
     if not request.guidance_file_id:
-        histories = db.query(AnalysisHistory).filter(AnalysisHistory.is_deleted == False).order_by(AnalysisHistory.created_at.desc()).all()
-        request_file_ids_set = set(request.file_ids)
-        
-        for history in histories:
-            if history.file_ids and set(history.file_ids) == request_file_ids_set:
-                log_step("Found cached analysis result. Returning cached data.")
-                return {
-                    "combined_text": history.combined_text,
-                    "structured_data": history.structured_data
-                }
+        history = find_saved_analysis(db, request.file_ids)
+        if history:
+            log_step("Found cached analysis result. Returning cached data.")
+            return {
+                "combined_text": history.combined_text,
+                "structured_data": history.structured_data
+            }
 
     combined_text = ""
     last_structured_data = None
@@ -247,9 +271,7 @@ async def analyze_batch(request: AnalyzeBatchRequest, db: Session = Depends(get_
         guidance_file = db.query(UploadedFile).filter(UploadedFile.id == request.guidance_file_id).first()
         if guidance_file:
             log_step(f"Loading guidance file: {guidance_file.filename}")
-            guidance_content = storage_service.get_file(guidance_file.object_name)
-            if guidance_content:
-                guidance_text = parse_file(guidance_file.filename, guidance_content)
+            guidance_text = await asyncio.to_thread(get_file_text, db, guidance_file)
     
     # Verify files exist
     files = db.query(UploadedFile).filter(UploadedFile.id.in_(request.file_ids)).all()
@@ -261,12 +283,13 @@ async def analyze_batch(request: AnalyzeBatchRequest, db: Session = Depends(get_
     def process_file_task(file_data):
         f_id, f_name, f_obj_name, f_ver = file_data
         # Note: Cannot use async log here easily as it runs in thread pool
-        content = storage_service.get_file(f_obj_name)
-        if not content:
-            return f_id, None, None
-        
-        ext_text = parse_file(f_name, content)
-        struct_data = extract_syllabus_data(ext_text, guidance_text, request.template_id)
+        # Each thread needs its own session for the text and extraction caches
+        with SessionLocal() as task_db:
+            task_file = task_db.get(UploadedFile, f_id)
+            ext_text = get_file_text(task_db, task_file) if task_file else None
+            if not ext_text:
+                return f_id, None, None
+            struct_data = cached_extract_syllabus_data(task_db, ext_text, guidance_text, request.template_id)
         return f_id, ext_text, struct_data
 
     # Extract necessary data from DB objects to pass to threads
@@ -343,6 +366,8 @@ def create_analysis_history(request: CreateHistoryRequest, db: Session = Depends
     db.add(history)
     db.commit()
     db.refresh(history)
+    index_saved_analysis(db, history)
+    db.commit()
     return history
 
 @app.get("/api/v1/analysis_history/")
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class ExtractedText(Base):
+    """Text parsed from an uploaded file; stored objects never change, so it is reused as-is."""
+    __tablename__ = "extracted_texts"
+
+    uploaded_file_id = Column(Integer, primary_key=True)
+    object_name = Column(String, nullable=False)  # Must match the file's current object
+    text_hash = Column(String(64), index=True, nullable=False)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class ExtractionCacheEntry(Base):
+    """Structured extraction result keyed by (text, guidance, template, prompt version)."""
+    __tablename__ = "extraction_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), unique=True, index=True, nullable=False)
+    text_hash = Column(String(64), index=True, nullable=False)
+    guidance_hash = Column(String(64), nullable=True)
+    template_id = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    structured_data = Column(JSON, nullable=False)
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class AnalysisLookup(Base):
+    """Indexed file-set key for saved analyses, so a cached analysis is one lookup."""
+    __tablename__ = "analysis_lookup"
+
+    history_id = Column(Integer, primary_key=True)
+    file_set_key = Column(String(64), index=True, nullable=False)
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class FillTemplateJob(Base):
+    """A queued or finished fill-template job; shared by all worker processes."""
+    __tablename__ = "fill_template_jobs"
+
+    id = Column(String(36), primary_key=True)
+    status = Column(String, index=True, default="pending")  # pending, running, completed, failed, cancelled
+    params = Column(JSON, nullable=False)  # Arguments for the fill run
+    progress_done = Column(Integer, default=0)  # Chunks (body chunks + tables) finished
+    progress_total = Column(Integer, default=0)
+    partial_map = Column(JSON, nullable=True)  # Paragraph replacements filled so far
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)  # Last progress write by the running worker
+    finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -39,9 +39,12 @@ class FillTemplateResult(BaseModel):
 
 
 class FillTemplateStatusResponse(BaseModel):
-    status: Literal["pending", "running", "completed", "failed"]
+    status: Literal["pending", "running", "completed", "failed", "cancelled"]
     result: Optional[FillTemplateResult] = None
     error: Optional[str] = None
+    progress_done: int = 0                  # body chunks + tables finished
+    progress_total: int = 0
+    partial_paragraph_map: Optional[dict[str, str]] = None  # replacements so far while running
 
 
 class FillTemplateResponse(BaseModel):
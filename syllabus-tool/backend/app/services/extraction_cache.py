@@ -0,0 +1,138 @@
+"""Database-backed caches for extracted file text and structured syllabus extraction."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Iterable, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.models.analysis_history import AnalysisHistory
+from app.models.extraction_cache import AnalysisLookup, ExtractedText, ExtractionCacheEntry
+from app.models.uploaded_file import UploadedFile
+from app.services.parser import EXTRACTION_PROMPT_VERSION, extract_syllabus_data_with_status, parse_file
+from app.services.storage import storage_service
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def extraction_cache_key(text_hash: str, guidance_hash: Optional[str], template_id: str) -> str:
+    raw = json.dumps([text_hash, guidance_hash, template_id, EXTRACTION_PROMPT_VERSION])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def file_set_key(file_ids: Iterable[int]) -> str:
+    return hashlib.sha256(json.dumps(sorted(set(file_ids))).encode("utf-8")).hexdigest()
+
+
+# --- Extracted text ---
+
+def save_file_text(db: Session, db_file: UploadedFile, text: str) -> None:
+    db.merge(ExtractedText(
+        uploaded_file_id=db_file.id,
+        object_name=db_file.object_name,
+        text_hash=sha256_text(text),
+        text=text,
+    ))
+    try:
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"DB Error saving extracted text: {e}")
+
+
+def get_cached_file_text(db: Session, db_file: UploadedFile) -> Optional[str]:
+    row = db.query(ExtractedText).filter(ExtractedText.uploaded_file_id == db_file.id).first()
+    if row and row.object_name == db_file.object_name:
+        return row.text
+    return None
+
+
+def get_file_text(db: Session, db_file: UploadedFile) -> Optional[str]:
+    """Text of an uploaded file, downloading and parsing it only the first time."""
+    text = get_cached_file_text(db, db_file)
+    if text is not None:
+        return text
+
+    content = storage_service.get_file(db_file.object_name)
+    if not content:
+        return None
+    text = parse_file(db_file.filename, content)
+    save_file_text(db, db_file, text)
+    return text
+
+
+# --- Structured extraction ---
+
+def cached_extract_syllabus_data(
+    db: Session,
+    text: str,
+    guidance_text: str = None,
+    template_id: str = "BGSU_Standard",
+) -> dict:
+    """extract_syllabus_data with results reused for identical text, guidance and template."""
+    text_hash = sha256_text(text)
+    guidance_hash = sha256_text(guidance_text) if guidance_text else None
+    key = extraction_cache_key(text_hash, guidance_hash, template_id)
+
+    entry = db.query(ExtractionCacheEntry).filter(ExtractionCacheEntry.cache_key == key).first()
+    if entry:
+        entry.hit_count = (entry.hit_count or 0) + 1
+        entry.last_used_at = func.now()
+        try:
+            db.commit()
+        except Exception:
+            db.rollback()
+        return entry.structured_data
+
+    structured_data, complete = extract_syllabus_data_with_status(text, guidance_text, template_id)
+    if not complete:
+        # Do not pin a degraded (regex-only) result
+        return structured_data
+
+    db.add(ExtractionCacheEntry(
+        cache_key=key,
+        text_hash=text_hash,
+        guidance_hash=guidance_hash,
+        template_id=template_id,
+        prompt_version=EXTRACTION_PROMPT_VERSION,
+        structured_data=structured_data,
+    ))
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another request cached the same extraction first
+        db.rollback()
+    return structured_data
+
+
+# --- Saved analyses ---
+
+def find_saved_analysis(db: Session, file_ids: Iterable[int]) -> Optional[AnalysisHistory]:
+    """Most recent non-deleted saved analysis over exactly this set of files."""
+    return (
+        db.query(AnalysisHistory)
+        .join(AnalysisLookup, AnalysisLookup.history_id == AnalysisHistory.id)
+        .filter(AnalysisLookup.file_set_key == file_set_key(file_ids), AnalysisHistory.is_deleted == False)
+        .order_by(AnalysisHistory.created_at.desc())
+        .first()
+    )
+
+
+def index_saved_analysis(db: Session, history: AnalysisHistory) -> None:
+    db.merge(AnalysisLookup(history_id=history.id, file_set_key=file_set_key(history.file_ids or [])))
+
+
+def backfill_analysis_lookup(db: Session) -> int:
+    """Index saved analyses created before the lookup table existed. Returns rows added."""
+    indexed = db.query(AnalysisLookup.history_id)
+    missing = db.query(AnalysisHistory).filter(~AnalysisHistory.id.in_(indexed)).all()
+    for history in missing:
+        index_saved_analysis(db, history)
+    db.commit()
+    return len(missing)
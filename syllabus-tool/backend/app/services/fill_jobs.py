@@ -0,0 +1,280 @@
+"""Durable, bounded job queue for fill-template runs.
+
+Jobs live in the fill_template_jobs table, so any worker process can report
+their status and they survive restarts. Each process runs jobs on a bounded
+thread pool; a job is claimed with a conditional UPDATE so it runs once.
+
+A running job holds a lease: its heartbeat_at is refreshed by every progress
+write and by its process's lease monitor. The monitor also requeues jobs whose
+heartbeat is older than FILL_JOB_STALE_SECONDS, so a job whose process died
+is picked up by a surviving one without waiting for a restart.
+
+The pool is per process: with gunicorn's cpu * 2 + 1 workers, up to
+FILL_JOB_WORKERS times that many jobs can run at once. FILL_JOB_MAX_QUEUED
+counts jobs in the database, so it bounds the total across processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.fill_job import FillTemplateJob
+
+ACTIVE_STATUSES = ("pending", "running")
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+
+class QueueFullError(Exception):
+    """Raised when too many fill jobs are already queued or running."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once cancellation was requested."""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class FillJobProgress:
+    """Handed to the runner: records per-chunk progress and partial results."""
+
+    def __init__(self, queue: "FillJobQueue", job_id: str):
+        self._queue = queue
+        self.job_id = job_id
+        self._done = 0
+        self._partial: dict[str, str] = {}
+
+    def set_total(self, total: int) -> None:
+        self._write(progress_total=total)
+
+    def chunk_done(self, replacements: dict[int, str]) -> None:
+        """Record one finished body chunk or table; raises JobCancelled if cancelled."""
+        self._done += 1
+        self._partial.update({str(k): v for k, v in replacements.items()})
+        self._write(progress_done=self._done, partial_map=dict(self._partial))
+
+    def check_cancelled(self) -> None:
+        with self._queue.session_factory() as db:
+            cancelled = db.query(FillTemplateJob.cancel_requested).filter(FillTemplateJob.id == self.job_id).scalar()
+        if cancelled:
+            raise JobCancelled()
+
+    def _write(self, **fields) -> None:
+        with self._queue.session_factory() as db:
+            job = db.get(FillTemplateJob, self.job_id)
+            if job is None:
+                raise JobCancelled()
+            for name, value in fields.items():
+                setattr(job, name, value)
+            job.heartbeat_at = _now()
+            cancelled = job.cancel_requested
+            db.commit()
+        if cancelled:
+            raise JobCancelled()
+
+
+class FillJobQueue:
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queued: int | None = None,
+        ttl_seconds: int | None = None,
+        stale_seconds: int | None = None,
+        lease_check_seconds: int | None = None,
+        session_factory=SessionLocal,
+    ):
+        self.max_workers = max_workers or settings.FILL_JOB_WORKERS
+        self.max_queued = max_queued or settings.FILL_JOB_MAX_QUEUED
+        self.ttl_seconds = ttl_seconds or settings.FILL_JOB_TTL_SECONDS
+        self.stale_seconds = stale_seconds or settings.FILL_JOB_STALE_SECONDS
+        self.lease_check_seconds = lease_check_seconds or settings.FILL_JOB_LEASE_CHECK_SECONDS
+        self.session_factory = session_factory
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fill-job")
+        self._runner: Optional[Callable[[dict, FillJobProgress], dict]] = None
+        self._lock = threading.Lock()
+        self._queued: set[str] = set()  # Submitted to this process's pool, not started yet
+        self._running: set[str] = set()  # Claimed and running in this process
+        self._monitor: Optional[threading.Thread] = None
+
+    def register_runner(self, runner: Callable[[dict, FillJobProgress], dict]) -> None:
+        """Set the function that performs a job: runner(params, progress) -> result dict."""
+        self._runner = runner
+
+    # --- Submission and control ---
+
+    def submit(self, params: dict) -> str:
+        self.cleanup_expired()
+        with self.session_factory() as db:
+            active = db.query(FillTemplateJob).filter(FillTemplateJob.status.in_(ACTIVE_STATUSES)).count()
+            if active >= self.max_queued:
+                raise QueueFullError(f"{active} template fills are already in progress. Please try again shortly.")
+            job = FillTemplateJob(id=str(uuid.uuid4()), status="pending", params=params)
+            db.add(job)
+            db.commit()
+            job_id = job.id
+        self._enqueue(job_id)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self.session_factory() as db:
+            job = db.get(FillTemplateJob, job_id)
+            if job is None:
+                return None
+            return {
+                "status": job.status,
+                "result": job.result,
+                "error": job.error,
+                "progress_done": job.progress_done or 0,
+                "progress_total": job.progress_total or 0,
+                "partial_paragraph_map": job.partial_map if job.status == "running" else None,
+            }
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation. Pending jobs stop immediately, running ones after their current chunk."""
+        with self.session_factory() as db:
+            job = db.get(FillTemplateJob, job_id)
+            if job is None:
+                return False
+            if job.status in ACTIVE_STATUSES:
+                job.cancel_requested = True
+                if job.status == "pending":
+                    job.status = "cancelled"
+                    job.finished_at = _now()
+                db.commit()
+            return True
+
+    def cleanup_expired(self) -> int:
+        """Delete finished jobs older than the TTL. Returns rows deleted."""
+        cutoff = _now() - timedelta(seconds=self.ttl_seconds)
+        with self.session_factory() as db:
+            deleted = db.query(FillTemplateJob).filter(
+                FillTemplateJob.status.in_(FINISHED_STATUSES),
+                FillTemplateJob.finished_at < cutoff,
+            ).delete(synchronize_session=False)
+            db.commit()
+        return deleted
+
+    def recover(self) -> int:
+        """Requeue running jobs whose lease expired and pick up pending jobs. Returns jobs enqueued.
+
+        Expired jobs that were cancelled while running are finished as cancelled
+        instead. Runs at startup and on every lease check.
+        """
+        now = _now()
+        stale_cutoff = now - timedelta(seconds=self.stale_seconds)
+        expired = (
+            FillTemplateJob.status == "running",
+            (FillTemplateJob.heartbeat_at == None) | (FillTemplateJob.heartbeat_at < stale_cutoff),
+        )
+        with self.session_factory() as db:
+            # Conditional UPDATEs, so a job another process just heartbeated is left alone
+            db.query(FillTemplateJob).filter(*expired, FillTemplateJob.cancel_requested == True).update(
+                {"status": "cancelled", "partial_map": None, "finished_at": now}, synchronize_session=False
+            )
+            db.query(FillTemplateJob).filter(*expired, FillTemplateJob.cancel_requested == False).update(
+                {"status": "pending", "progress_done": 0, "partial_map": None}, synchronize_session=False
+            )
+            db.commit()
+            pending_ids = [
+                job_id for (job_id,) in db.query(FillTemplateJob.id)
+                .filter(FillTemplateJob.status == "pending")
+                .order_by(FillTemplateJob.created_at)
+            ]
+        return sum(self._enqueue(job_id) for job_id in pending_ids)
+
+    def heartbeat_running(self) -> None:
+        """Renew the lease of every job running in this process."""
+        with self._lock:
+            running = list(self._running)
+        if not running:
+            return
+        with self.session_factory() as db:
+            db.query(FillTemplateJob).filter(
+                FillTemplateJob.id.in_(running),
+                FillTemplateJob.status == "running",
+            ).update({"heartbeat_at": _now()}, synchronize_session=False)
+            db.commit()
+
+    def start_lease_monitor(self) -> None:
+        """Heartbeat this process's jobs and requeue expired ones every lease_check_seconds."""
+        with self._lock:
+            if self._monitor is not None:
+                return
+            self._monitor = threading.Thread(target=self._monitor_leases, name="fill-job-leases", daemon=True)
+        self._monitor.start()
+
+    def _monitor_leases(self) -> None:
+        while True:
+            time.sleep(self.lease_check_seconds)
+            try:
+                self.heartbeat_running()
+                self.recover()
+            except Exception as e:
+                print(f"[FILL-TEMPLATE] Lease check failed: {e}", flush=True)
+
+    # --- Execution ---
+
+    def _claim(self, job_id: str) -> Optional[dict]:
+        with self.session_factory() as db:
+            claimed = db.query(FillTemplateJob).filter(
+                FillTemplateJob.id == job_id,
+                FillTemplateJob.status == "pending",
+            ).update({"status": "running", "heartbeat_at": _now()}, synchronize_session=False)
+            db.commit()
+            if not claimed:
+                return None
+            return db.get(FillTemplateJob, job_id).params
+
+    def _finish(self, job_id: str, status: str, result: dict | None = None, error: str | None = None) -> None:
+        with self.session_factory() as db:
+            job = db.get(FillTemplateJob, job_id)
+            if job is None:
+                return
+            job.status = status
+            job.result = result
+            job.error = error
+            job.partial_map = None
+            job.finished_at = _now()
+            db.commit()
+
+    def _enqueue(self, job_id: str) -> bool:
+        with self._lock:
+            if job_id in self._queued or job_id in self._running:
+                return False
+            self._queued.add(job_id)
+        self._executor.submit(self._execute, job_id)
+        return True
+
+    def _execute(self, job_id: str) -> None:
+        params = self._claim(job_id)
+        with self._lock:
+            self._queued.discard(job_id)
+            if params is None:
+                return  # Cancelled, or claimed by another worker
+            self._running.add(job_id)
+
+        print(f"[FILL-TEMPLATE] Job {job_id} started", flush=True)
+        try:
+            if self._runner is None:
+                raise RuntimeError("No fill-template runner registered")
+            result = self._runner(params, FillJobProgress(self, job_id))
+            self._finish(job_id, "completed", result=result)
+        except JobCancelled:
+            print(f"[FILL-TEMPLATE] Job {job_id} cancelled", flush=True)
+            self._finish(job_id, "cancelled")
+        except Exception as e:
+            print(f"[FILL-TEMPLATE] Job {job_id} ERROR: {e}", flush=True)
+            self._finish(job_id, "failed", error=str(e))
+        finally:
+            with self._lock:
+                self._running.discard(job_id)
+
+fill_job_queue = FillJobQueue()
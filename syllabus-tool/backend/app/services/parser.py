@@ -1,6 +1,3 @@
-import fitz  # PyMuPDF
-import docx
-import io
 import json
 import concurrent.futures
 
@@ -10,47 +7,14 @@ from app.core.config import settings
 from app.schemas.extraction import ExtractedSyllabusData, ExtractedSuggestions, ExtractedValidation, ValidationIssue
 from app.services.json_extraction import JsonExtractionError, extract_first_json_object
 from app.services.llm_factory import invoke_llm
-
-def extract_text_from_pdf(file_content: bytes) -> str:
-    text = ""
-    with fitz.open(stream=file_content, filetype="pdf") as doc:
-        for page in doc:
-            text += page.get_text()
-    return text
-
-def extract_text_from_docx(file_content: bytes) -> str:
-    doc = docx.Document(io.BytesIO(file_content))
-    full_text = []
-    
-    # Extract paragraphs
-    for para in doc.paragraphs:
-        full_text.append(para.text)
-        
-    # Extract tables
-    # Note: This appends tables at the end, which might lose context order,
-    # but ensures the text is available for extraction.
-    for table in doc.tables:
-        for row in table.rows:
-            # Join cells with spaces to mimic visual layout for regex
-            row_text = [cell.text.strip() for cell in row.cells]
-            # Filter out empty cells to avoid excessive spaces
-            row_text = [t for t in row_text if t]
-            if row_text:
-                full_text.append("   ".join(row_text))
-            
-    return "\n".join(full_text)
+from app.services.text_extraction import extract_text_from_docx, extract_text_from_pdf, text_extraction_service
 
 def parse_file(filename: str, content: bytes) -> str:
-    if filename.lower().endswith(".pdf"):
-        return extract_text_from_pdf(content)
-    elif filename.lower().endswith(".docx"):
-        return extract_text_from_docx(content)
-    else:
-        # Try to read as text for any other extension (txt, md, py, etc.)
-        try:
-            return content.decode("utf-8")
-        except UnicodeDecodeError:
-            return content.decode("latin-1", errors="ignore")
+    # Runs in the extraction process pool; cached by content hash
+    return text_extraction_service.extract(filename, content)
+
+async def parse_file_async(filename: str, content: bytes) -> str:
+    return await text_extraction_service.extract_async(filename, content)
 
 def extract_metadata(filename: str, text: str) -> dict:
     metadata = {
@@ -803,9 +767,25 @@ def merge_syllabus_data(regex_data: dict, llm_data: dict) -> dict:
             
     return merged
 
+# Bump when the regex rules or LLM prompts change, so cached extractions are not reused
+EXTRACTION_PROMPT_VERSION = "1"
+
+def _has_llm_content(llm_data: dict) -> bool:
+    return bool(
+        llm_data.get("learning_goals")
+        or llm_data.get("schedule")
+        or any((llm_data.get("course_info") or {}).values())
+        or any((llm_data.get("policies") or {}).values())
+    )
+
 def extract_syllabus_data(text: str, guidance_text: str = None, template_id: str = "BGSU_Standard") -> dict:
+    return extract_syllabus_data_with_status(text, guidance_text, template_id)[0]
+
+def extract_syllabus_data_with_status(text: str, guidance_text: str = None, template_id: str = "BGSU_Standard") -> tuple[dict, bool]:
+    """Like extract_syllabus_data, also reporting whether both passes succeeded (safe to cache)."""
     import concurrent.futures
     
+    complete = True
     # Run Regex and LLM extraction in parallel to save time
     with concurrent.futures.ThreadPoolExecutor() as executor:
         future_regex = executor.submit(extract_syllabus_data_regex, text)
@@ -816,17 +796,21 @@ def extract_syllabus_data(text: str, guidance_text: str = None, template_id: str
         except Exception as e:
             print(f"Regex extraction failed: {e}")
             regex_data = {}
+            complete = False
             
         try:
             llm_data = future_llm.result()
         except Exception as e:
             print(f"LLM extraction failed: {e}")
             llm_data = {}
+        # extract_syllabus_data_llm swallows LLM errors and returns empty fields
+        if not _has_llm_content(llm_data):
+            complete = False
     
     # 3. Merge Results
     final_data = merge_syllabus_data(regex_data, llm_data)
     
-    return final_data
+    return final_data, complete
 
 def merge_structured_data(data1: dict, data2: dict) -> dict:
     """
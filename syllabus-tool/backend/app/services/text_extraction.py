@@ -0,0 +1,241 @@
+"""Document text extraction in a process pool, with page-parallel PDFs and a content-hash cache."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent import futures
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# PDF pages handed to one worker process at a time
+PDF_PAGES_PER_TASK = 16
+
+
+class DocumentLimitError(ValueError):
+    """Raised when a document exceeds the page, time or memory caps."""
+
+
+# --- Worker functions (run in the pool; keep imports local and light) ---
+
+def _limit_worker_memory(max_memory_mb: int) -> None:
+    try:
+        import resource
+
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not cap extraction worker memory: {e}")
+
+
+def _count_pdf_pages(file_content: bytes) -> int:
+    import fitz  # PyMuPDF
+
+    with fitz.open(stream=file_content, filetype="pdf") as doc:
+        return doc.page_count
+
+
+def _extract_pdf_page_range(file_content: bytes, start: int, end: int) -> list[str]:
+    import fitz  # PyMuPDF
+
+    with fitz.open(stream=file_content, filetype="pdf") as doc:
+        return [doc[index].get_text() for index in range(start, end)]
+
+
+def extract_text_from_pdf(file_content: bytes) -> str:
+    return "".join(_extract_pdf_page_range(file_content, 0, _count_pdf_pages(file_content)))
+
+
+def extract_text_from_docx(file_content: bytes) -> str:
+    import docx
+
+    doc = docx.Document(io.BytesIO(file_content))
+    full_text = []
+
+    # Extract paragraphs
+    for para in doc.paragraphs:
+        full_text.append(para.text)
+
+    # Extract tables
+    # Note: This appends tables at the end, which might lose context order,
+    # but ensures the text is available for extraction.
+    for table in doc.tables:
+        for row in table.rows:
+            # Join cells with spaces to mimic visual layout for regex
+            row_text = [cell.text.strip() for cell in row.cells]
+            # Filter out empty cells to avoid excessive spaces
+            row_text = [t for t in row_text if t]
+            if row_text:
+                full_text.append("   ".join(row_text))
+
+    return "\n".join(full_text)
+
+
+def decode_text(file_content: bytes) -> str:
+    # Try to read as text for any other extension (txt, md, py, etc.)
+    try:
+        return file_content.decode("utf-8")
+    except UnicodeDecodeError:
+        return file_content.decode("latin-1", errors="ignore")
+
+
+# --- Service ---
+
+class TextExtractionService:
+    """
+    Extracts text off the request thread and caches it by content hash.
+
+    PDFs are split into page ranges extracted in parallel worker processes;
+    iter_pdf_pages() yields their text page by page. Workers are capped in
+    memory, documents in pages, and each extraction in wall-clock time.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pages: int | None = None,
+        timeout_seconds: float | None = None,
+        max_memory_mb: int | None = None,
+        cache_max_entries: int | None = None,
+    ):
+        self.max_workers = max_workers or settings.EXTRACTION_WORKERS
+        self.max_pages = max_pages or settings.EXTRACTION_MAX_PAGES
+        self.timeout_seconds = timeout_seconds or settings.EXTRACTION_TIMEOUT_SECONDS
+        self.max_memory_mb = max_memory_mb or settings.EXTRACTION_MAX_MEMORY_MB
+        self.cache_max_entries = cache_max_entries or settings.EXTRACTION_CACHE_MAX_ENTRIES
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Set[futures.Future] = set()
+        self._lock = threading.RLock()
+        self._cache: OrderedDict[str, str] = OrderedDict()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a threaded server process is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_limit_worker_memory,
+                    initargs=(self.max_memory_mb,),
+                )
+            return self._executor
+
+    def _submit(self, fn, *args) -> futures.Future:
+        with self._lock:  # Reentrant: _pool() takes it too
+            pending = self._pending
+            future = self._pool().submit(fn, *args)
+        pending.add(future)
+        future.add_done_callback(pending.discard)
+        return future
+
+    def _retire_pool(self) -> None:
+        """Swap in a fresh pool after a task overran its time cap or crashed a worker.
+
+        Other documents still extracting in the old pool get up to
+        timeout_seconds to finish before its remaining workers are killed.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pending, self._pending = self._pending, set()
+        if executor is None:
+            return
+        threading.Thread(
+            target=self._drain_and_kill, args=(executor, pending), name="extraction-pool-drain", daemon=True
+        ).start()
+
+    def _drain_and_kill(self, executor: ProcessPoolExecutor, pending: Set[futures.Future]) -> None:
+        futures.wait(list(pending), timeout=self.timeout_seconds)
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._cache.get(key)
+            if text is not None:
+                self._cache.move_to_end(key)
+            return text
+
+    def _cache_set(self, key: str, text: str) -> None:
+        with self._lock:
+            self._cache[key] = text
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def iter_pdf_pages(self, content: bytes, deadline_seconds: float | None = None) -> Iterator[str]:
+        """Yield the text of each PDF page in order, extracting ranges in parallel.
+
+        deadline_seconds (default timeout_seconds) bounds the whole document,
+        not each page range.
+        """
+        deadline = time.monotonic() + (deadline_seconds or self.timeout_seconds)
+
+        def remaining() -> float:
+            return max(0.0, deadline - time.monotonic())
+
+        page_count = self._submit(_count_pdf_pages, content).result(timeout=remaining())
+        if page_count > self.max_pages:
+            raise DocumentLimitError(f"PDF has {page_count} pages; the maximum is {self.max_pages}.")
+
+        page_futures = [
+            self._submit(_extract_pdf_page_range, content, start, min(start + PDF_PAGES_PER_TASK, page_count))
+            for start in range(0, page_count, PDF_PAGES_PER_TASK)
+        ]
+        try:
+            for future in page_futures:
+                yield from future.result(timeout=remaining())
+        finally:
+            for future in page_futures:
+                future.cancel()
+
+    def _extract_uncached(self, filename: str, content: bytes) -> str:
+        lower_name = filename.lower()
+        if lower_name.endswith(".pdf"):
+            return "".join(self.iter_pdf_pages(content))
+        if lower_name.endswith(".docx"):
+            return self._submit(extract_text_from_docx, content).result(timeout=self.timeout_seconds)
+        return decode_text(content)
+
+    def extract(self, filename: str, content: bytes) -> str:
+        """Return the text of a document, from cache when the same bytes were seen before."""
+        key = f"{filename.lower().rsplit('.', 1)[-1]}:{self.content_hash(content)}"
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            text = self._extract_uncached(filename, content)
+        except FutureTimeoutError:
+            self._retire_pool()
+            raise DocumentLimitError(
+                f"Text extraction for {filename} took longer than {self.timeout_seconds:g} seconds."
+            )
+        except (BrokenProcessPool, MemoryError):
+            self._retire_pool()
+            raise DocumentLimitError(f"{filename} is too large or complex to extract text from.")
+
+        self._cache_set(key, text)
+        return text
+
+    async def extract_async(self, filename: str, content: bytes) -> str:
+        """extract() for async endpoints; waits in a thread so the event loop keeps running."""
+        return await asyncio.to_thread(self.extract, filename, content)
+
+
+text_extraction_service = TextExtractionService()
@@ -0,0 +1,4 @@
+import os
+
+# Settings require a database URL at import; tests bind their own SQLite engines
+os.environ.setdefault("SQLALCHEMY_DATABASE_URI", "sqlite://")
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.fill_job import FillTemplateJob
+from app.services.fill_jobs import FillJobQueue
+
+
+@pytest.fixture
+def queue():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    FillTemplateJob.__table__.create(engine)
+    queue = FillJobQueue(max_workers=1, max_queued=2, stale_seconds=60, session_factory=sessionmaker(bind=engine))
+    queue.register_runner(lambda params, progress: {"filled": params})
+    yield queue
+    queue._executor.shutdown(wait=True)
+
+
+def _add_running_job(queue, job_id, cancel_requested=False):
+    with queue.session_factory() as db:
+        db.add(FillTemplateJob(
+            id=job_id,
+            status="running",
+            params={"job": job_id},
+            cancel_requested=cancel_requested,
+            heartbeat_at=datetime.now(timezone.utc) - timedelta(minutes=10),
+        ))
+        db.commit()
+
+
+def test_expired_job_is_requeued_and_run(queue):
+    _add_running_job(queue, "dead-worker")
+
+    assert queue.recover() == 1
+    queue._executor.shutdown(wait=True)
+
+    assert queue.get("dead-worker")["status"] == "completed"
+
+
+def test_expired_job_cancelled_while_running_is_finished(queue):
+    _add_running_job(queue, "cancelled-then-died", cancel_requested=True)
+    _add_running_job(queue, "other", cancel_requested=True)
+
+    assert queue.recover() == 0
+
+    with queue.session_factory() as db:
+        job = db.get(FillTemplateJob, "cancelled-then-died")
+        assert (job.status, job.finished_at is not None) == ("cancelled", True)
+    # No longer counts toward the queue limit
+    assert queue.submit({"template": 1})
@@ -601,6 +601,7 @@ function App() {
                     syllabus_content: draftInfo.syllabusContent,
                 }),
             });
+            if (startRes.status === 429) throw new Error('Too many template fills are running. Please try again shortly.');
             if (!startRes.ok) throw new Error('Failed to start template fill');
             const { job_id } = await startRes.json();
 
@@ -621,8 +622,15 @@ function App() {
                 if (statusData.status === 'failed') {
                     throw new Error(statusData.error || 'Template fill failed');
                 }
+                if (statusData.status === 'cancelled') {
+                    throw new Error('Template fill was cancelled');
+                }
+            }
+            if (!result) {
+                // Free the worker instead of leaving the job running unobserved
+                fetchWithAuth(`${apiUrl}/generate/fill-template/cancel/${job_id}`, { method: 'POST' }).catch(() => {});
+                throw new Error('Template fill timed out');
             }
-            if (!result) throw new Error('Template fill timed out');
 
             setTemplateFillMode(true);
             setTemplateCourseInfo({ title: draftInfo.title, audience: draftInfo.audience, duration: draftInfo.duration, language: draftInfo.language });
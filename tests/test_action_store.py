@@ -8,30 +8,60 @@ from api.services.action_store import ActionStore, ActionRecord
 class FakeRedis:
     def __init__(self):
         self._store = {}
+        self._expires = {}
 
-    def set(self, key, value, ex=None):
-        expires_at = time.time() + ex if ex else None
-        self._store[key] = (value, expires_at)
-
-    def get(self, key):
-        value, expires_at = self._store.get(key, (None, None))
-        if value is None:
-            return None
+    def _alive(self, key):
+        expires_at = self._expires.get(key)
         if expires_at is not None and time.time() >= expires_at:
             self._store.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._store
+
+    def hset(self, key, mapping):
+        if not self._alive(key):
+            self._store[key] = {}
+        self._store[key].update(mapping)
+        return len(mapping)
+
+    def hgetall(self, key):
+        return dict(self._store[key]) if self._alive(key) else {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and self._alive(key):
             return None
-        return value
+        self._store[key] = value
+        if ex is not None:
+            self._expires[key] = time.time() + ex
+        return True
+
+    def exists(self, key):
+        return int(self._alive(key))
+
+    def expire(self, key, seconds):
+        if self._alive(key):
+            self._expires[key] = time.time() + seconds
 
     def delete(self, key):
         self._store.pop(key, None)
+        self._expires.pop(key, None)
 
-    def ttl(self, key):
-        value, expires_at = self._store.get(key, (None, None))
-        if value is None:
-            return -2
-        if expires_at is None:
-            return -1
-        return int(expires_at - time.time())
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._calls]
 
 
 def test_action_store_ownership():
@@ -58,3 +88,29 @@ def test_action_store_ttl_expiry():
     assert store.get_action(record.action_id) is not None
     time.sleep(1.1)
     assert store.get_action(record.action_id) is None
+
+
+def test_action_store_partial_update():
+    store = ActionStore(redis_client=FakeRedis(), ttl_seconds=60)
+    record = store.create_action(
+        user_id=1,
+        tool_name="create_course",
+        args={"title": "History"},
+        preview={"affected": {"courses": 1}},
+    )
+
+    updated = store.update_action(record.action_id, status="executed", result={"ok": True})
+
+    assert updated.status == "executed"
+    assert updated.result == {"ok": True}
+    assert updated.args == {"title": "History"}
+    assert store.update_action("missing", status="executed") is None
+    assert store.get_action("missing") is None
+
+
+def test_action_can_be_claimed_once():
+    store = ActionStore(redis_client=FakeRedis(), ttl_seconds=60)
+    record = store.create_action(user_id=1, tool_name="create_course", args={}, preview={})
+
+    assert store.claim_action(record.action_id)
+    assert not store.claim_action(record.action_id)
@@ -0,0 +1,124 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import api.models  # noqa: F401  (registers all mappers)
+from api.models.course import Course
+from api.models.enrollment import Enrollment
+from api.models.post import Post
+from api.models.session import Session as SessionModel
+from api.models.user import User
+from api.services.action_preview import build_action_preview
+from mcp_server.tools.enrollment import bulk_enroll_students, enroll_students_by_email
+from mcp_server.tools.forum import label_posts, pin_posts
+
+
+@pytest.fixture()
+def db():
+    engine = create_engine("sqlite://")
+    for model in (User, Course, SessionModel, Post, Enrollment):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        User(id=1, name="Ada", email="ada@example.edu"),
+        User(id=2, name="Ben", email="ben@example.edu"),
+        User(id=3, name="Cy", email="cy@example.edu"),
+        Course(id=1, title="Ethics"),
+        SessionModel(id=1, course_id=1, title="Week 1"),
+    ])
+    session.add_all([
+        Post(id=post_id, session_id=1, user_id=1, content=f"post {post_id}", labels_json=labels)
+        for post_id, labels in ((1, None), (2, ["needs-clarification"]), (3, ["question"]))
+    ])
+    session.add(Enrollment(user_id=1, course_id=1))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _count_statements(db):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_pin_posts_updates_all_rows_in_one_statement(db):
+    statements = _count_statements(db)
+
+    result = pin_posts(db, post_ids=[1, 3, 3, 99], pinned=True)
+
+    assert result["post_ids"] == [1, 3]
+    assert result["missing_post_ids"] == [99]
+    assert "2 posts pinned" in result["message"]
+    assert sum(s.lstrip().upper().startswith("UPDATE") for s in statements) == 1
+    assert {p.id for p in db.query(Post).filter(Post.pinned.is_(True))} == {1, 3}
+
+
+def test_label_posts_add_merges_and_resolves_conflicts(db):
+    result = label_posts(db, post_ids=[1, 2, 3], labels=["high-quality"])
+
+    assert result["success"]
+    db.expire_all()
+    labels = {p.id: p.labels_json for p in db.query(Post)}
+    assert labels == {1: ["high-quality"], 2: ["high-quality"], 3: ["question", "high-quality"]}
+
+
+def test_label_posts_replace_and_validation(db):
+    assert "Invalid labels" in label_posts(db, post_ids=[1], labels=["great"])["error"]
+    assert "error" in label_posts(db, post_ids=[1], labels=[], mode="add")
+
+    result = label_posts(db, post_ids=[2, 3], labels=[], mode="replace")
+
+    assert result["message"] == "2 posts cleared of labels."
+    db.expire_all()
+    assert [p.labels_json for p in db.query(Post).filter(Post.id.in_([2, 3]))] == [[], []]
+
+
+def test_enroll_students_by_email_inserts_new_enrollments_once(db):
+    result = enroll_students_by_email(
+        db, course_id=1, emails=["ADA@example.edu", "ben@example.edu", "cy@example.edu", "zed@example.edu", "nope"],
+    )
+
+    assert result["enrolled_emails"] == ["ben@example.edu", "cy@example.edu"]
+    assert result["already_enrolled_emails"] == ["ada@example.edu"]
+    assert result["not_found_emails"] == ["zed@example.edu"]
+    assert result["invalid_emails"] == ["nope"]
+    assert db.query(Enrollment).filter(Enrollment.course_id == 1).count() == 3
+
+
+def test_bulk_enroll_students_still_skips_existing(db):
+    result = bulk_enroll_students(db, course_id=1, user_ids=[1, 2, 2])
+
+    assert result["newly_enrolled_user_ids"] == [2]
+    assert result["already_enrolled_user_ids"] == [1]
+
+
+def test_batch_previews_count_affected_rows(db):
+    pin_preview = build_action_preview("pin_posts", {"post_ids": [1, 2, 99]}, db=db)
+    assert pin_preview["affected"] == {"posts": 2}
+    assert pin_preview["missing_post_ids"] == [99]
+    assert pin_preview["pinned"] is True
+
+    enroll_preview = build_action_preview(
+        "enroll_students_by_email", {"course_id": 1, "emails": ["ada@example.edu", "ben@example.edu", "x@y.z"]}, db=db,
+    )
+    assert enroll_preview["affected"] == {"enrollments": 1}
+    assert enroll_preview["already_enrolled_emails"] == ["ada@example.edu"]
+    assert enroll_preview["not_found_emails"] == ["x@y.z"]
+
+
+def test_enroll_by_email_matches_mixed_case_and_all_accounts(db):
+    db.add_all([
+        User(id=4, name="Dee", email="Dee.Smith@Example.edu", auth_provider="cognito"),
+        User(id=5, name="Dee", email="dee.smith@example.edu", auth_provider="google"),
+    ])
+    db.commit()
+
+    preview = build_action_preview("enroll_students_by_email", {"course_id": 1, "emails": ["DEE.smith@example.edu"]}, db=db)
+    result = enroll_students_by_email(db, course_id=1, emails=["DEE.smith@example.edu"])
+
+    assert preview["affected"] == {"enrollments": 2}
+    assert result["enrolled_emails"] == ["dee.smith@example.edu"]
+    assert result["not_found_emails"] == []
+    enrolled = {e.user_id for e in db.query(Enrollment).filter(Enrollment.course_id == 1)}
+    assert {4, 5} <= enrolled
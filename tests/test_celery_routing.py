@@ -0,0 +1,62 @@
+from worker import tasks
+from worker.celery_app import (
+    QUEUE_BULK,
+    QUEUE_COPILOT,
+    QUEUE_REALTIME,
+    QUEUES,
+    TASK_POLICIES,
+    celery_app,
+    queue_depths,
+)
+
+
+def _queue_for(task):
+    return celery_app.amqp.router.route({}, task.name, (), {})["queue"].name
+
+
+def test_every_task_has_a_policy():
+    registered = {name for name in celery_app.tasks if name.startswith("worker.tasks.")}
+
+    assert registered == set(TASK_POLICIES)
+    assert {policy["queue"] for policy in TASK_POLICIES.values()} <= set(QUEUES)
+
+
+def test_long_jobs_do_not_share_the_realtime_queue():
+    assert _queue_for(tasks.generate_live_summary_task) == QUEUE_REALTIME
+    assert _queue_for(tasks.generate_ai_assistant_response_task) == QUEUE_REALTIME
+    assert _queue_for(tasks.sync_integration_materials_task) == QUEUE_BULK
+    assert _queue_for(tasks.transcribe_recording_task) == QUEUE_BULK
+    assert _queue_for(tasks.translate_session_posts_task) == QUEUE_BULK
+    assert _queue_for(tasks.start_live_copilot_task) == QUEUE_COPILOT
+
+
+def test_copilot_outlives_its_max_duration():
+    from workflows.copilot import COPILOT_MAX_DURATION_SECONDS
+
+    assert tasks.start_live_copilot_task.time_limit > COPILOT_MAX_DURATION_SECONDS
+
+
+class FakePipeline:
+    def __init__(self, lengths):
+        self._lengths = lengths
+        self._keys = []
+
+    def llen(self, key):
+        self._keys.append(key)
+
+    def execute(self):
+        return [self._lengths.get(key, 0) for key in self._keys]
+
+
+class FakeRedis:
+    def __init__(self, lengths):
+        self._lengths = lengths
+
+    def pipeline(self):
+        return FakePipeline(self._lengths)
+
+
+def test_queue_depths_sum_priority_buckets():
+    depths = queue_depths(FakeRedis({"bulk": 2, "bulk\x06\x166": 3, "realtime": 1}))
+
+    assert depths == {"realtime": 1, "default": 0, "bulk": 5, "copilot": 0}
@@ -0,0 +1,62 @@
+import json
+
+from api.services.context_store import ContextStore
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._queued = []
+
+    def lrange(self, key, start, end):
+        if self._client.on_read:
+            self._client.on_read.pop(0)()
+        items = self._client.lists.get(key, [])
+        return list(items[start:None if end == -1 else end + 1])
+
+    def multi(self):
+        pass
+
+    def lset(self, key, index, value):
+        self._queued.append((key, index, value))
+
+
+class FakeRedis:
+    """Just enough of redis-py for undo marking, with WATCH retry semantics."""
+
+    def __init__(self):
+        self.lists = {}
+        self.versions = {}
+        self.on_read = []
+
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def transaction(self, func, *keys):
+        while True:
+            watched = [self.versions.get(key, 0) for key in keys]
+            pipe = FakePipeline(self)
+            func(pipe)
+            if watched != [self.versions.get(key, 0) for key in keys]:
+                continue  # WatchError: redis-py retries
+            for key, index, value in pipe._queued:
+                self.lists[key][index] = value
+            return
+
+
+def test_mark_undone_survives_concurrent_record():
+    client = FakeRedis()
+    store = ContextStore(redis_client=client)
+    key = store._action_history_key(7)
+    client.lpush(key, json.dumps({"action_type": "create_poll", "timestamp": 1.0, "undone": False}))
+    # Another request records an action between the read and the write
+    client.on_read.append(
+        lambda: client.lpush(key, json.dumps({"action_type": "enroll_student", "timestamp": 2.0, "undone": False}))
+    )
+
+    assert store.mark_action_undone(7, 1.0) is True
+
+    entries = {entry["action_type"]: entry["undone"] for entry in map(json.loads, client.lists[key])}
+    assert entries == {"create_poll": True, "enroll_student": False}
+    assert store.mark_action_undone(7, 3.0) is False
@@ -0,0 +1,113 @@
+import asyncio
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from api.services import document_extractor
+from api.services.document_extractor import DocumentExtractionService
+
+
+class FakeRedis:
+    def __init__(self):
+        self._store = {}
+
+    def get(self, key):
+        return self._store.get(key)
+
+    def set(self, key, value, ex=None):
+        self._store[key] = value
+
+
+def _pdf(pages):
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    page_ids = [4 + 2 * index for index in range(len(pages))]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % pid for pid in page_ids)
+        + b"] /Count %d >>" % len(pages),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for pid, text in zip(page_ids, pages):
+        stream = b"BT /F1 12 Tf 72 720 Td (" + text.encode() + b") Tj ET"
+        objects[pid] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (pid + 1)
+        )
+        objects[pid + 1] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(out)
+        out += b"%d 0 obj\n" % number + objects[number] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for number in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[number]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+@pytest.fixture
+def service():
+    service = DocumentExtractionService(redis_client=FakeRedis(), max_workers=2, max_pages=5)
+    yield service
+    service.shutdown()
+
+
+def test_pdf_pages_stream_in_order(service, monkeypatch):
+    monkeypatch.setattr(document_extractor, "PDF_PAGES_PER_TASK", 1)
+    content = _pdf(["Week one", "Week two", "Week three"])
+
+    async def collect():
+        return [page async for page in service.iter_pdf_pages(content)]
+
+    pages = asyncio.run(collect())
+
+    assert [number for number, _ in pages] == [1, 2, 3]
+    assert [text.strip() for _, text in pages] == ["Week one", "Week two", "Week three"]
+
+
+def test_page_cap_rejects_long_pdf(service):
+    text, error = asyncio.run(service.extract(_pdf(["p"] * 6), "long.pdf", "application/pdf"))
+
+    assert text == ""
+    assert "maximum is 5" in error
+
+
+def test_result_is_cached_by_content_hash(service):
+    content = _pdf(["Syllabus"])
+
+    first = asyncio.run(service.extract(content, "a.pdf", "application/pdf"))
+    service.shutdown()
+    service._pool = None  # a cache miss would now fail
+    second = asyncio.run(service.extract(content, "renamed.pdf", "application/pdf"))
+
+    assert first == ("Syllabus", None)
+    assert second == first
+
+
+def test_unsupported_and_text_files(service):
+    assert asyncio.run(service.extract(b"x", "a.png", "image/png"))[1] == "Unsupported file type: a.png"
+    assert asyncio.run(service.extract(b"  Course notes \n", "a.txt", "text/plain")) == ("Course notes", None)
+
+
+def test_overrun_leaves_other_extractions_running(service):
+    service.timeout_seconds = 3
+
+    async def scenario():
+        overrun = service._run(time.sleep, 60)
+        other = service._run(time.sleep, 1)
+        await asyncio.sleep(0.5)
+        old_pool = service._executor
+        service._retire_pool()
+
+        assert await other is None
+        assert await service._run(time.sleep, 0) is None
+        assert service._executor is not old_pool
+        # The overrunning worker is killed once the old pool has drained
+        done, _ = await asyncio.wait([overrun], timeout=10)
+        assert done and isinstance(overrun.exception(), BrokenProcessPool)
+
+    asyncio.run(scenario())
@@ -0,0 +1,143 @@
+import hashlib
+import io
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.models.course_material import CourseMaterial, MaterialBlob
+from api.services import material_storage
+from api.services.material_storage import (
+    MaterialStorageError,
+    acquire_blob,
+    delete_material_record,
+    hash_file,
+)
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects = {}
+        self.uploads = 0
+
+    def generate_blob_key(self, sha256):
+        return f"blobs/sha256/{sha256[:2]}/{sha256}_{len(self.objects)}"
+
+    def upload_file(self, file_obj, s3_key, content_type, filename):
+        self.uploads += 1
+        self.objects[s3_key] = file_obj.read()
+        return True, None
+
+    def delete_file(self, s3_key):
+        self.objects.pop(s3_key, None)
+        return True, None
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine("sqlite://")
+    MaterialBlob.__table__.create(engine)
+    CourseMaterial.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    s3 = FakeS3()
+    monkeypatch.setattr(material_storage, "get_s3_service", lambda: s3)
+    session.s3 = s3
+    yield session
+    session.close()
+
+
+def _add_material(db, blob, course_id):
+    material = CourseMaterial(
+        course_id=course_id,
+        filename="notes.pdf",
+        s3_key=blob.s3_key,
+        blob_id=blob.id,
+        file_size=blob.file_size,
+        content_type=blob.content_type,
+    )
+    db.add(material)
+    db.commit()
+    return material
+
+
+def test_hash_file_streams_and_rewinds():
+    data = b"lecture" * 300_000
+    file_obj = io.BytesIO(data)
+
+    assert hash_file(file_obj) == (hashlib.sha256(data).hexdigest(), len(data))
+    assert file_obj.tell() == 0
+
+
+def test_identical_content_is_uploaded_once(db):
+    sha256, size = hash_file(io.BytesIO(b"same pdf"))
+
+    first, created_first = acquire_blob(db, sha256, size, "application/pdf", "a.pdf", io.BytesIO(b"same pdf"))
+    _add_material(db, first, course_id=1)
+    second, created_second = acquire_blob(db, sha256, size, "application/pdf", "b.pdf", io.BytesIO(b"same pdf"))
+    _add_material(db, second, course_id=2)
+
+    assert created_first and not created_second
+    assert first.id == second.id and second.ref_count == 2
+    assert db.s3.uploads == 1
+
+
+def test_unknown_blob_requires_content(db):
+    with pytest.raises(MaterialStorageError):
+        acquire_blob(db, "0" * 64, 10, "application/pdf", "a.pdf")
+
+
+def test_object_deleted_with_last_reference(db):
+    sha256, size = hash_file(io.BytesIO(b"shared"))
+    blob, _ = acquire_blob(db, sha256, size, "application/pdf", "a.pdf", io.BytesIO(b"shared"))
+    first = _add_material(db, blob, course_id=1)
+    acquire_blob(db, sha256, size, "application/pdf", "a.pdf")
+    second = _add_material(db, blob, course_id=2)
+    s3_key = blob.s3_key
+
+    assert delete_material_record(db, first) is None
+    db.commit()
+    assert delete_material_record(db, second) == s3_key
+    db.commit()
+    assert db.query(MaterialBlob).count() == 0
+
+
+def test_legacy_material_owns_its_key(db):
+    material = CourseMaterial(
+        course_id=1,
+        filename="old.pdf",
+        s3_key="courses/1/materials/general/abc_old.pdf",
+        file_size=3,
+        content_type="application/pdf",
+    )
+    db.add(material)
+    db.commit()
+
+    assert delete_material_record(db, material) == "courses/1/materials/general/abc_old.pdf"
+
+
+def test_deleting_course_releases_material_blobs(db, monkeypatch):
+    import api.models  # noqa: F401  (registers all mappers)
+    from api.api.routes import courses
+    from api.models.course import Course, CourseResource
+    from api.models.enrollment import Enrollment
+    from api.models.session import Session as SessionModel
+    from api.models.user import User
+
+    engine = db.get_bind()
+    for model in (User, Course, CourseResource, SessionModel, Enrollment):
+        model.__table__.create(engine)
+    monkeypatch.setattr(courses, "get_s3_service", lambda: db.s3)
+    monkeypatch.setattr(courses, "invalidate_tags", lambda *tags: None)
+    db.add_all([User(id=1, name="Ada", email="ada@example.edu"), Course(id=1, title="Ethics", created_by=1)])
+    db.commit()
+    sha256, size = hash_file(io.BytesIO(b"notes"))
+    blob, _ = acquire_blob(db, sha256, size, "application/pdf", "a.pdf", io.BytesIO(b"notes"))
+    _add_material(db, blob, course_id=1)
+    acquire_blob(db, sha256, size, "application/pdf", "a.pdf")
+    _add_material(db, blob, course_id=1)
+
+    courses.delete_course(course_id=1, user_id=1, db=db)
+
+    assert db.query(MaterialBlob).count() == 0
+    assert db.query(CourseMaterial).count() == 0
+    assert db.s3.objects == {}
@@ -1,5 +1,6 @@
 import asyncio
 import threading
+import time
 
 import pytest
 from fastapi.testclient import TestClient
@@ -30,17 +31,38 @@ class FakeRedis:
     def __init__(self):
         self._store = {}
 
-    def set(self, key, value, ex=None):
-        self._store[key] = value
+    def hset(self, key, mapping):
+        self._store.setdefault(key, {}).update(mapping)
 
-    def get(self, key):
-        return self._store.get(key)
+    def hgetall(self, key):
+        return dict(self._store.get(key, {}))
+
+    def exists(self, key):
+        return int(key in self._store)
+
+    def expire(self, key, seconds):
+        pass
 
     def delete(self, key):
         self._store.pop(key, None)
 
-    def ttl(self, key):
-        return 60
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._calls]
 
 
 def test_navigation_tool_execute_ok(monkeypatch):
@@ -101,3 +123,87 @@ def test_write_tool_returns_plan(monkeypatch):
     payload = response.json()
     assert payload["requires_confirmation"] is True
     assert "action_id" in payload
+
+
+def test_tool_executor_runs_handlers_off_the_event_loop():
+    from api.api.mcp_executor import ToolExecutor
+
+    executor = ToolExecutor(max_workers=4, max_per_tool=4, timeout_seconds=2, queue_timeout_seconds=2)
+    barrier = threading.Barrier(3, timeout=2)
+
+    def handler(**kwargs):
+        barrier.wait()  # Only passes when three calls run at once
+        return threading.get_ident()
+
+    async def burst():
+        loop_thread = threading.get_ident()
+        results = await asyncio.gather(*(executor.invoke("get_session", handler, {}) for _ in range(3)))
+        return loop_thread, results
+
+    loop_thread, results = asyncio.run(burst())
+    assert loop_thread not in results
+    assert len(set(results)) == 3
+
+
+def test_tool_executor_limits_concurrency_per_tool():
+    from api.api.mcp_executor import ToolExecutor
+
+    executor = ToolExecutor(max_workers=8, max_per_tool=2, timeout_seconds=2, queue_timeout_seconds=2)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def handler(**kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return {}
+
+    async def burst():
+        await asyncio.gather(*(executor.invoke("get_report", handler, {}) for _ in range(6)))
+
+    asyncio.run(burst())
+    assert active["peak"] == 2
+    assert executor.stats()["running"] == {}
+
+
+def test_tool_executor_timeouts_and_busy():
+    from api.api.mcp_executor import ToolBusyError, ToolExecutor, ToolTimeoutError
+
+    executor = ToolExecutor(max_workers=1, max_per_tool=1, timeout_seconds=0.05, queue_timeout_seconds=0.05)
+    release = threading.Event()
+
+    def slow_handler(**kwargs):
+        release.wait(2)
+        return {}
+
+    async def run():
+        with pytest.raises(ToolTimeoutError):
+            await executor.invoke("get_copilot_status", slow_handler, {})
+        # The timed-out call still holds its slot until the thread finishes
+        with pytest.raises(ToolBusyError):
+            await executor.invoke("get_copilot_status", slow_handler, {})
+        release.set()
+
+    asyncio.run(run())
+    assert executor.stats()["timeouts"] == 1
+    assert executor.stats()["rejected"] == 1
+
+
+def test_timed_out_write_says_it_may_still_complete(monkeypatch):
+    from api.api import mcp_executor
+    from api.api.mcp_executor import ToolExecutor, ToolTimeoutError
+
+    monkeypatch.setitem(mcp_executor.CATEGORY_TIMEOUTS, "actions", 0.05)
+    executor = ToolExecutor(max_workers=1, max_per_tool=1, timeout_seconds=0.05, queue_timeout_seconds=0.05)
+    release = threading.Event()
+
+    async def run():
+        with pytest.raises(ToolTimeoutError) as excinfo:
+            await executor.invoke("execute_action", lambda **kwargs: release.wait(2), {}, category="actions")
+        release.set()
+        return str(excinfo.value)
+
+    assert "may still complete" in asyncio.run(run())
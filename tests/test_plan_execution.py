@@ -0,0 +1,116 @@
+import threading
+import time
+
+from api.api import voice_converse_router
+from api.api.mcp_executor import plan_step_dependencies, run_plan_steps
+
+
+def _is_write(step):
+    return step.get("mode") == "write"
+
+
+def test_dependencies_follow_references_and_write_barriers():
+    steps = [
+        {"tool_name": "resolve_course", "args": {"query": "physics"}},
+        {"tool_name": "get_course", "args": {"course_id": "$steps.0.course_id"}},
+        {"tool_name": "list_sessions", "args": {}},
+        {"tool_name": "create_session", "args": {}, "mode": "write"},
+        {"tool_name": "get_session", "args": {}},
+        {"tool_name": "get_report", "args": {}},
+    ]
+
+    assert plan_step_dependencies(steps, _is_write) == [set(), {0}, set(), {0, 1, 2}, {3}, {3}]
+
+
+def test_independent_reads_run_concurrently():
+    barrier = threading.Barrier(3, timeout=2)
+
+    def run_step(step, args):
+        barrier.wait()  # Only passes if all three reads are in flight together
+        return {"tool": step["tool_name"]}
+
+    steps = [{"tool_name": name, "args": {}} for name in ("get_session", "get_participation_stats", "get_pinned_posts")]
+    outcomes = run_plan_steps(steps, run_step, _is_write)
+
+    assert [outcome.output["tool"] for outcome in outcomes] == [step["tool_name"] for step in steps]
+    assert all(outcome.error is None for outcome in outcomes)
+
+
+def test_writes_are_serialized_in_plan_order():
+    events = []
+
+    def run_step(step, args):
+        events.append(("start", step["tool_name"]))
+        time.sleep(0.01)
+        events.append(("end", step["tool_name"]))
+        return {}
+
+    steps = [
+        {"tool_name": "get_session", "args": {}},
+        {"tool_name": "create_poll", "args": {}, "mode": "write"},
+        {"tool_name": "pin_post", "args": {}, "mode": "write"},
+        {"tool_name": "get_poll_results", "args": {}},
+    ]
+    run_plan_steps(steps, run_step, _is_write)
+
+    assert events == [
+        ("start", "get_session"), ("end", "get_session"),
+        ("start", "create_poll"), ("end", "create_poll"),
+        ("start", "pin_post"), ("end", "pin_post"),
+        ("start", "get_poll_results"), ("end", "get_poll_results"),
+    ]
+
+
+def test_references_resolve_and_failures_propagate():
+    def run_step(step, args):
+        if step["tool_name"] == "resolve_course":
+            return {"course_id": 7, "matches": [{"id": 7}]}
+        if step["tool_name"] == "resolve_session":
+            raise RuntimeError("no such session")
+        return args
+
+    steps = [
+        {"tool_name": "resolve_course", "args": {}},
+        {"tool_name": "get_course", "args": {"course_id": "$steps.0.course_id", "first": "$steps.0.matches.0.id"}},
+        {"tool_name": "resolve_session", "args": {}},
+        {"tool_name": "get_session", "args": {"session_id": "$steps.2.session_id"}},
+    ]
+    outcomes = run_plan_steps(steps, run_step, _is_write)
+
+    assert outcomes[1].output == {"course_id": 7, "first": 7}
+    assert outcomes[2].error == "no such session"
+    assert "Step 2 did not succeed" in outcomes[3].error
+
+
+def test_execute_plan_steps_uses_thread_sessions_for_reads(monkeypatch):
+    sessions = []
+
+    class FakeSession:
+        def close(self):
+            pass
+
+    def make_session():
+        session = FakeSession()
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr("api.core.database.SessionLocal", make_session)
+    registry = {
+        "read_a": {"handler": lambda db: {"message": "a"}, "mode": "read", "parameters": {}},
+        "read_b": {"handler": lambda db: {"message": "b"}, "mode": "read", "parameters": {}},
+        "write_c": {"handler": lambda db: {"message": "c", "db": db}, "mode": "write", "parameters": {}},
+    }
+    monkeypatch.setattr(voice_converse_router, "TOOL_REGISTRY", registry)
+    monkeypatch.setattr(voice_converse_router, "generate_summary", lambda results: "done")
+    request_db = FakeSession()
+
+    results, summary = voice_converse_router.execute_plan_steps(
+        [{"tool_name": "read_a"}, {"tool_name": "read_b"}, {"tool_name": "write_c"}, {"tool_name": "missing"}],
+        request_db,
+    )
+
+    assert [r["tool"] for r in results] == ["read_a", "read_b", "write_c", "missing"]
+    assert [r["success"] for r in results] == [True, True, True, False]
+    assert len(sessions) == 2
+    assert results[2]["data"]["db"] is request_db
+    assert summary == "done"
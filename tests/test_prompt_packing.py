@@ -0,0 +1,85 @@
+import pytest
+
+from workflows import llm_utils
+from workflows.llm_utils import (
+    create_rolling_summary,
+    estimate_tokens,
+    format_posts_for_prompt,
+    pack_posts,
+    truncate_to_tokens,
+)
+
+
+class WordEncoding:
+    """One token per whitespace-separated word."""
+
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+@pytest.fixture
+def word_tokens(monkeypatch):
+    monkeypatch.setattr(llm_utils, "_get_encoding", lambda name: WordEncoding())
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    monkeypatch.setattr(llm_utils, "_get_encoding", lambda name: None)
+
+
+def _post(post_id, words=10, pinned=False, labels=None):
+    return {"post_id": post_id, "author_role": "student", "content": " ".join(["word"] * words),
+            "timestamp": "", "pinned": pinned, "labels": labels or []}
+
+
+def test_model_families_map_to_encodings():
+    assert llm_utils._encoding_name("gpt-4o-mini") == "o200k_base"
+    assert llm_utils._encoding_name("gpt-3.5-turbo") == "cl100k_base"
+    assert llm_utils._encoding_name("claude-3-haiku-20240307") == "cl100k_base"
+
+
+def test_offline_fallback_uses_length_heuristic(offline):
+    assert estimate_tokens("x" * 40, "gpt-4o-mini") == 10
+    assert truncate_to_tokens("x" * 400, 20, marker=" [cut]") == "x" * 76 + " [cut]"
+
+
+def test_unbudgeted_format_includes_everything(word_tokens):
+    posts = [_post(i) for i in range(1, 4)]
+
+    assert format_posts_for_prompt(posts).count("[Post #") == 3
+
+
+def test_pack_prefers_pinned_labeled_then_recent(word_tokens):
+    posts = [_post(1, pinned=True), _post(2), _post(3, labels=["high-quality"]), _post(4), _post(5)]
+    budget = sum(estimate_tokens(llm_utils._format_post(posts[i])) for i in (0, 2, 4))
+    budget += estimate_tokens("[999 more posts omitted to fit the context budget]")
+
+    packed = pack_posts(posts, max_tokens=budget)
+
+    assert packed.included_post_ids == [1, 3, 5]
+    assert packed.truncated_post_ids == []
+    assert packed.omitted_count == 2
+    assert packed.text.endswith("[2 more posts omitted to fit the context budget]")
+    assert packed.tokens <= budget
+
+
+def test_long_post_is_truncated_not_dropped(word_tokens):
+    packed = pack_posts([_post(1, words=500)], max_tokens=120)
+
+    assert packed.included_post_ids == [1]
+    assert packed.truncated_post_ids == [1]
+    assert "...[truncated]" in packed.text
+    assert packed.tokens <= 120
+
+
+def test_rolling_summary_window_by_tokens(word_tokens):
+    posts = [_post(i, words=50) for i in range(1, 11)]
+    per_post = estimate_tokens(llm_utils._format_post(posts[0]))
+
+    recent, summary = create_rolling_summary(posts, max_posts=30, max_tokens=3 * per_post)
+
+    assert [p["post_id"] for p in recent] == [8, 9, 10]
+    assert "7 posts summarized" in summary
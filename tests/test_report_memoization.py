@@ -0,0 +1,87 @@
+import itertools
+import json
+
+import pytest
+
+from workflows import report
+from workflows.llm_utils import LLMMetrics, LLMResponse
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+    counter = itertools.count(1)
+
+    def fake_invoke(llm, prompt, model_name, json_mode=False):
+        calls.append(prompt)
+        content = {
+            "call": next(counter),
+            "best_practice_answer": {"summary": "Use elasticity"},
+            "student_scores": [{"post_id": 1, "score": 80}],
+        }
+        return LLMResponse(content=json.dumps(content), metrics=LLMMetrics(model_name=model_name), success=True)
+
+    monkeypatch.setattr(report, "get_llm_with_tracking", lambda: (object(), "test-model"))
+    monkeypatch.setattr(report, "invoke_llm_with_metrics", fake_invoke)
+    return calls
+
+
+def _post(post_id, content, role="student"):
+    return {"post_id": post_id, "user_id": post_id, "user_name": f"User {post_id}", "author_role": role,
+            "content": content, "timestamp": "", "pinned": False, "labels": []}
+
+
+def _state(posts, node_cache=None):
+    return {
+        "session_id": 1, "session_title": "Pricing", "session_plan": {"topics": ["Elasticity"]},
+        "case_prompt": "Should we raise prices?", "syllabus_text": "Microeconomics", "objectives": ["Explain elasticity"],
+        "resources_text": "", "posts": posts, "older_posts_summary": None, "rolling_summary_metadata": None,
+        "poll_results": [], "participation_metrics": {}, "clusters": None, "objectives_alignment": None,
+        "misconceptions": None, "best_practice": None, "student_summary": None, "answer_scores": None,
+        "report_json": None, "report_md": None, "model_name": "", "prompt_version": "v1.0", "errors": [],
+        "llm_metrics": [], "start_time": 0.0, "node_cache": node_cache or {}, "node_outputs": {},
+        "llm_nodes": [], "nodes_reused": [],
+    }
+
+
+def test_unchanged_inputs_reuse_every_node(llm_calls):
+    graph = report.build_report_graph()
+    posts = [_post(1, "Demand is elastic")]
+
+    first = graph.invoke(_state(posts))
+    second = graph.invoke(_state(posts, node_cache=first["node_outputs"]))
+
+    assert len(llm_calls) == len(report.NODE_OUTPUT_FIELDS)
+    assert sorted(second["nodes_reused"]) == sorted(report.NODE_OUTPUT_FIELDS)
+    assert second["best_practice"] == first["best_practice"]
+    assert second["model_name"] == "test-model"
+
+
+def test_new_post_keeps_post_independent_nodes(llm_calls):
+    graph = report.build_report_graph()
+    first = graph.invoke(_state([_post(1, "Demand is elastic")]))
+    llm_calls.clear()
+
+    second = graph.invoke(_state([_post(1, "Demand is elastic"), _post(2, "Prices signal value")],
+                                 node_cache=first["node_outputs"]))
+
+    assert second["nodes_reused"] == ["generate_best_practice"]
+    assert len(llm_calls) == len(report.NODE_OUTPUT_FIELDS) - 1
+
+
+def test_fallback_outputs_are_not_stored(monkeypatch):
+    monkeypatch.setattr(report, "get_llm_with_tracking", lambda: (None, None))
+
+    final = report.build_report_graph().invoke(_state([_post(1, "Demand is elastic")]))
+
+    assert final["node_outputs"] == {}
+
+
+def test_input_fingerprint_tracks_polls_and_posts():
+    base = report.report_input_fingerprint(_state([_post(1, "a")]))
+    with_poll = _state([_post(1, "a")])
+    with_poll["poll_results"] = [{"poll_id": 1, "vote_counts": [3, 1]}]
+
+    assert report.report_input_fingerprint(_state([_post(1, "a")])) == base
+    assert report.report_input_fingerprint(_state([_post(1, "b")])) != base
+    assert report.report_input_fingerprint(with_poll) != base
@@ -0,0 +1,78 @@
+import json
+import re
+import threading
+
+from workflows import report
+from workflows.llm_utils import LLMMetrics, LLMResponse, chunk_posts_for_analysis
+
+
+def _post(post_id, content="Elastic demand means buyers react to price", role="student"):
+    return {"post_id": post_id, "user_id": 100 + post_id, "user_name": f"User {post_id}", "author_role": role,
+            "content": content, "labels": [], "pinned": False}
+
+
+def _state(posts):
+    return {
+        "posts": posts,
+        "best_practice": {"best_practice_answer": {"summary": "Use elasticity", "key_concepts": ["elasticity"]}},
+        "llm_metrics": [],
+        "llm_nodes": [],
+    }
+
+
+def _fake_llm(monkeypatch, fail_posts=()):
+    threads = set()
+
+    def fake_invoke(llm, prompt, model_name, json_mode=False):
+        threads.add(threading.get_ident())
+        post_ids = [int(i) for i in re.findall(r"\[Post #(\d+)", prompt)]
+        if set(post_ids) & set(fail_posts):
+            return LLMResponse(content=None, metrics=LLMMetrics(error_message="timeout"), success=False)
+        scores = [{"post_id": pid, "user_id": 999, "score": pid * 10} for pid in post_ids]
+        scores.append({"post_id": 4242, "score": 100})  # hallucinated post
+        content = json.dumps({"student_scores": scores, "class_statistics": {"average_score": 1}})
+        return LLMResponse(content=content, metrics=LLMMetrics(model_name=model_name), success=True)
+
+    monkeypatch.setattr(report, "get_llm_with_tracking", lambda: (object(), "test-model"))
+    monkeypatch.setattr(report, "invoke_llm_with_metrics", fake_invoke)
+    monkeypatch.setattr(report, "SCORE_CHUNK_MAX_POSTS", 3)
+    return threads
+
+
+def test_chunks_respect_token_budget():
+    posts = [_post(i, "x" * 400) for i in range(1, 6)]  # ~100 tokens each
+
+    chunks = chunk_posts_for_analysis(posts, chunk_size=10, max_tokens=250, format_post=lambda p: p["content"])
+
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert chunk_posts_for_analysis(posts, chunk_size=2) == [posts[0:2], posts[2:4], posts[4:5]]
+
+
+def test_batches_are_merged_and_statistics_computed(monkeypatch):
+    _fake_llm(monkeypatch)
+    posts = [_post(i) for i in range(1, 8)] + [_post(50, role="instructor")]
+
+    state = report.score_student_answers(_state(posts))
+    scores = state["answer_scores"]
+
+    assert [s["post_id"] for s in scores["student_scores"]] == [1, 2, 3, 4, 5, 6, 7]
+    assert scores["student_scores"][0]["user_id"] == 101
+    assert scores["class_statistics"]["average_score"] == 40.0
+    assert scores["class_statistics"]["score_distribution"]["insufficient"] == 3
+    assert scores["closest_to_correct"]["post_id"] == 7
+    assert scores["furthest_from_correct"]["post_id"] == 1
+    assert len(state["llm_metrics"]) == 3
+    assert state["llm_nodes"] == ["score_student_answers"]
+
+
+def test_failed_batch_falls_back_for_its_posts_only(monkeypatch):
+    _fake_llm(monkeypatch, fail_posts={4})
+    posts = [_post(i) for i in range(1, 7)]
+
+    state = report.score_student_answers(_state(posts))
+    scores = {s["post_id"]: s for s in state["answer_scores"]["student_scores"]}
+
+    assert scores[1]["score"] == 10
+    assert scores[4]["feedback"].startswith("Automated scoring")
+    assert state["answer_scores"]["note"] == "Fallback scoring used for 1 of 2 batches"
+    assert state["llm_nodes"] == []
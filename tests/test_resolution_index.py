@@ -0,0 +1,130 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import api.models  # noqa: F401  (registers all mappers)
+from api.models.course import Course
+from api.models.enrollment import Enrollment
+from api.models.session import Session as SessionModel
+from api.models.user import User
+from api.services.resolution_index import (
+    ResolutionIndex,
+    ResolutionIndexes,
+    get_resolution_indexes,
+    phonetic_key,
+    similarity,
+)
+from mcp_server.tools.resolve import resolve_course, resolve_session, resolve_user
+
+
+@pytest.fixture()
+def tag_versions(monkeypatch):
+    versions = {}
+    monkeypatch.setattr(
+        ResolutionIndexes, "_tag_versions", staticmethod(lambda tags: tuple(versions.get(tag) for tag in tags)),
+    )
+    get_resolution_indexes().clear()
+    yield versions
+    get_resolution_indexes().clear()
+
+
+@pytest.fixture()
+def db(tag_versions):
+    engine = create_engine("sqlite://")
+    for model in (User, Course, SessionModel, Enrollment):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Course(id=1, title="Introduction to Psychology"),
+        Course(id=2, title="Intro to Biology"),
+        Course(id=3, title="Ethics"),
+        SessionModel(id=1, course_id=1, title="Week 3: Cognitive Biases"),
+        SessionModel(id=2, course_id=1, title="Week 4: Memory"),
+        SessionModel(id=3, course_id=2, title="Week 3: Cells"),
+        User(id=1, name="José González", email="jgonzalez@example.edu"),
+        User(id=2, name="Catherine Smith", email="csmith@example.edu"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_phonetic_keys_fold_spanish_and_english_spellings():
+    assert phonetic_key("gonzalez") == phonetic_key("gonsales")
+    assert phonetic_key("katherine") == phonetic_key("catherine")
+    assert phonetic_key("victoria") == phonetic_key("bictoria")
+    assert phonetic_key("guillermo") != phonetic_key("gonzalez")
+
+
+def test_similarity_tolerates_abbreviations_and_accents():
+    assert similarity("intro to psych", "Introduction to Psychology") >= 0.85
+    assert similarity("Jose Gonsales", "José González") > similarity("Jose Gonsales", "Catherine Smith")
+    assert similarity("etics", "Ethics") > 0.5
+    assert similarity("", "Ethics") == 0.0
+
+
+def test_index_ranks_best_match_first_and_applies_threshold():
+    index = ResolutionIndex([(1, "Introduction to Psychology", ()), (2, "Intro to Biology", ()), (3, "Ethics", ())])
+
+    matches = index.search("intro to psych", limit=5, min_confidence=0.35)
+
+    assert [match.id for match in matches] == [1, 2]
+    assert index.search("quantum chromodynamics", min_confidence=0.35) == []
+
+
+def test_resolve_tools_use_fuzzy_index(db):
+    assert resolve_course(db, "intro to psych")["candidates"][0]["course_id"] == 1
+
+    sessions = resolve_session(db, course_id=1, query="week three cognitive")["candidates"]
+    assert sessions[0]["session_id"] == 1
+    assert all(candidate["session_id"] != 3 for candidate in sessions)
+
+    user = resolve_user(db, "Jose Gonsales")["candidates"][0]
+    assert (user["user_id"], user["label"]) == (1, "jgonzalez@example.edu")
+    assert resolve_user(db, "CSmith@example.edu")["candidates"] == [
+        {"user_id": 2, "label": "csmith@example.edu", "confidence": 1.0}
+    ]
+
+
+def test_index_is_rebuilt_when_tag_is_invalidated(db, tag_versions):
+    assert resolve_course(db, "organic chemistry")["candidates"] == []
+    db.add(Course(id=4, title="Organic Chemistry"))
+    db.commit()
+
+    # Cached until the "courses" tag moves on
+    assert resolve_course(db, "organic chemistry")["candidates"] == []
+    tag_versions["courses"] = "1"
+    assert resolve_course(db, "organic chemistry")["candidates"][0]["course_id"] == 4
+
+
+def test_scope_over_row_limit_falls_back_to_database(db, monkeypatch):
+    from api.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "resolve_index_max_rows", 1)
+
+    candidates = resolve_course(db, "Psychology")["candidates"]
+
+    assert [candidate["course_id"] for candidate in candidates] == [1]
+
+
+def test_roster_sync_makes_new_students_resolvable(db, tag_versions, monkeypatch):
+    from api.api.routes import integrations
+    from api.services.integrations.base import ExternalEnrollment
+
+    class FakeProvider:
+        def list_enrollments(self, course_external_id):
+            return [ExternalEnrollment("canvas", "u-9", "student", name="Valentina Ruiz", email="vruiz@example.edu")]
+
+    def bump(*tags):
+        for tag in tags:
+            tag_versions[tag] = str(int(tag_versions.get(tag) or 0) + 1)
+
+    monkeypatch.setattr(integrations, "_resolve_provider", lambda *args, **kwargs: FakeProvider())
+    monkeypatch.setattr(integrations, "invalidate_tags", bump)
+    assert resolve_user(db, "Valentina Ruiz")["candidates"] == []  # Users index is now cached
+
+    integrations.sync_roster(
+        "canvas", integrations.SyncRosterRequest(target_course_id=1, source_course_external_id="c-1"), db=db,
+    )
+
+    assert resolve_user(db, "Valentina Ruiz")["candidates"][0]["label"] == "vruiz@example.edu"
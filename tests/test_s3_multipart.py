@@ -0,0 +1,118 @@
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import api.models  # noqa: F401  (registers all mappers)
+from api.api.routes.materials import (
+    MultipartUploadAbortRequest,
+    MultipartUploadCompleteRequest,
+    abort_multipart_upload,
+    check_course_s3_key,
+    complete_multipart_upload,
+    get_upload_size,
+)
+from api.models.course import Course
+from api.services.s3_service import (
+    MULTIPART_DEFAULT_PART_SIZE,
+    MULTIPART_MAX_PARTS,
+    S3Service,
+)
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.calls = []
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append(("create", kwargs))
+        return {"UploadId": "upload-1"}
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"https://s3.test/{Params['Key']}?part={Params['PartNumber']}&upload={Params['UploadId']}"
+
+    def complete_multipart_upload(self, **kwargs):
+        self.calls.append(("complete", kwargs))
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append(("abort", kwargs))
+
+
+def _service():
+    service = S3Service()
+    service.s3_client = FakeS3Client()
+    service.enabled = True
+    service.bucket_name = "materials"
+    return service
+
+
+def test_part_plan_respects_s3_limits():
+    assert S3Service.plan_multipart_parts(1024) == (MULTIPART_DEFAULT_PART_SIZE, 1)
+    assert S3Service.plan_multipart_parts(3 * MULTIPART_DEFAULT_PART_SIZE + 1)[1] == 4
+
+    huge = 200 * 1024 ** 3
+    part_size, part_count = S3Service.plan_multipart_parts(huge)
+    assert part_count <= MULTIPART_MAX_PARTS
+    assert part_size * part_count >= huge
+
+
+def test_multipart_round_trip():
+    service = _service()
+
+    upload_id = service.create_multipart_upload("courses/1/materials/general/a.pdf", "application/pdf", "a.pdf")
+    urls = service.generate_presigned_part_urls("courses/1/materials/general/a.pdf", upload_id, [1, 2])
+    success, error = service.complete_multipart_upload(
+        "courses/1/materials/general/a.pdf",
+        upload_id,
+        [{"PartNumber": 2, "ETag": "b"}, {"PartNumber": 1, "ETag": "a"}],
+    )
+
+    assert upload_id == "upload-1"
+    assert sorted(urls) == [1, 2] and "part=2" in urls[2]
+    assert success and error is None
+    complete = service.s3_client.calls[-1][1]
+    assert [part["PartNumber"] for part in complete["MultipartUpload"]["Parts"]] == [1, 2]
+
+
+def test_finalize_key_must_belong_to_course():
+    check_course_s3_key(1, "courses/1/materials/general/abc_a.pdf")
+    for key in ("courses/2/materials/general/abc_a.pdf", "courses/1/materials/../../2/x.pdf"):
+        with pytest.raises(HTTPException):
+            check_course_s3_key(1, key)
+
+
+def test_upload_size_is_measured_without_reading():
+    upload = UploadFile(file=io.BytesIO(b"x" * 1000), filename="a.pdf")
+    upload.size = None
+
+    assert get_upload_size(upload) == 1000
+    assert upload.file.tell() == 0
+
+
+def test_complete_and_abort_check_course_ownership(monkeypatch):
+    service = _service()
+    monkeypatch.setattr("api.api.routes.materials.get_s3_service", lambda: service)
+    engine = create_engine("sqlite://")
+    Course.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Course(id=1, title="Ethics"))
+    db.commit()
+
+    foreign_key = "courses/2/materials/general/abc_a.pdf"
+    with pytest.raises(HTTPException) as excinfo:
+        complete_multipart_upload(MultipartUploadCompleteRequest(
+            course_id=1, s3_key=foreign_key, upload_id="u", parts=[{"part_number": 1, "etag": "a"}],
+        ), db=db)
+    assert excinfo.value.status_code == 400
+    with pytest.raises(HTTPException) as excinfo:
+        abort_multipart_upload(MultipartUploadAbortRequest(course_id=2, s3_key=foreign_key, upload_id="u"), db=db)
+    assert excinfo.value.status_code == 404
+    assert service.s3_client.calls == []
+
+    abort_multipart_upload(
+        MultipartUploadAbortRequest(course_id=1, s3_key="courses/1/materials/general/abc_a.pdf", upload_id="u"), db=db,
+    )
+    assert [call[0] for call in service.s3_client.calls] == ["abort"]
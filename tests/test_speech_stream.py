@@ -0,0 +1,80 @@
+import asyncio
+
+from api.services.speech_filter import IncrementalSpeechSanitizer
+from api.services.speech_stream import SpeechSink, StubSilenceTTS, stream_speech
+
+
+async def _deltas(*parts):
+    for part in parts:
+        yield part
+
+
+def _collect(deltas, tts=None, sanitizer=None):
+    async def run():
+        return [event async for event in stream_speech(deltas, tts or StubSilenceTTS(), sanitizer)]
+
+    return asyncio.run(run())
+
+
+def test_sanitizer_releases_complete_sentences():
+    sanitizer = IncrementalSpeechSanitizer(denylist=[], allowlist=[], min_chars=5)
+
+    assert sanitizer.feed("Hello there, this is") == []
+    assert sanitizer.feed(" the first sentence. And the sec") == ["Hello there, this is the first sentence."]
+    assert sanitizer.flush() == ["And the sec"]
+
+
+def test_sanitizer_filters_terms_split_across_deltas():
+    sanitizer = IncrementalSpeechSanitizer(denylist=["OpenAI"], allowlist=[], min_chars=5)
+
+    sentences = sanitizer.feed("We use Op") + sanitizer.feed("enAI for answers. ") + sanitizer.flush()
+
+    assert sentences
+    assert all("OpenAI" not in sentence for sentence in sentences)
+
+
+def test_stream_speech_orders_text_and_audio():
+    sanitizer = IncrementalSpeechSanitizer(denylist=[], allowlist=[], min_chars=5)
+
+    events = _collect(_deltas("First sentence here. Second ", "sentence here. Third"), sanitizer=sanitizer)
+
+    texts = [event.text for event in events if event.type == "text"]
+    assert texts == ["First sentence here.", "Second sentence here.", "Third"]
+    indexes = [event.index for event in events]
+    assert indexes == sorted(indexes)
+    for index in range(3):
+        kinds = [event.type for event in events if event.index == index]
+        assert kinds[0] == "text" and "audio" in kinds
+
+
+def test_stream_speech_skips_failed_sentence():
+    class FlakyTTS(StubSilenceTTS):
+        async def synthesize(self, text):
+            if text.startswith("Broken"):
+                raise RuntimeError("tts down")
+            async for chunk in super().synthesize(text):
+                yield chunk
+
+    sanitizer = IncrementalSpeechSanitizer(denylist=[], allowlist=[], min_chars=5)
+    events = _collect(_deltas("Broken sentence here. Working sentence here."), tts=FlakyTTS(), sanitizer=sanitizer)
+
+    audio_indexes = {event.index for event in events if event.type == "audio"}
+    assert audio_indexes == {1}
+
+
+def test_speech_sink_feeds_pipeline():
+    async def run():
+        sink = SpeechSink()
+        sink.put("Streaming tokens straight ")
+        sink.put("into speech.")
+        sink.close()
+        sanitizer = IncrementalSpeechSanitizer(denylist=[], allowlist=[])
+        return [event async for event in stream_speech(sink.deltas(), StubSilenceTTS(), sanitizer)]
+
+    events = asyncio.run(run())
+
+    assert sink_text(events) == "Streaming tokens straight into speech."
+
+
+def sink_text(events):
+    return " ".join(event.text for event in events if event.type == "text")
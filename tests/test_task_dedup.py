@@ -0,0 +1,145 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import api.models  # noqa: F401  (registers all mappers)
+from api.models.poll import Poll, PollVote
+from api.models.post import Post
+
+from worker import dedup
+from worker.dedup import TaskDeduplicator
+
+
+class FakeRedis:
+    def __init__(self):
+        self._store = {}
+
+    def get(self, key):
+        return self._store.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self._store:
+            return None
+        self._store[key] = value
+        return True
+
+    def delete(self, key):
+        self._store.pop(key, None)
+
+
+class FakeTask:
+    name = "worker.tasks.generate_report_task"
+    time_limit = 300
+
+    def __init__(self):
+        self.submitted = []
+
+    def apply_async(self, args=(), task_id=None):
+        self.submitted.append((args, task_id))
+        return type("AsyncResult", (), {"id": task_id})()
+
+
+@pytest.fixture
+def states(monkeypatch):
+    states = {}
+
+    class FakeAsyncResult:
+        def __init__(self, task_id):
+            self.state = states.get(task_id, "PENDING")
+
+    monkeypatch.setattr(dedup.celery_app, "AsyncResult", FakeAsyncResult)
+    return states
+
+
+def test_duplicate_attaches_to_in_flight_task(states):
+    deduplicator, task = TaskDeduplicator(FakeRedis()), FakeTask()
+
+    first = deduplicator.submit(task, (7,), "posts-v1")
+    queued_duplicate = deduplicator.submit(task, (7,), "posts-v1")
+    deduplicator.record_start(first.task_id, task)
+    states[first.task_id] = "STARTED"
+    second = deduplicator.submit(task, (7,), "posts-v1")
+    other_session = deduplicator.submit(task, (8,), "posts-v1")
+    deduplicator.record_completion(first.task_id, "SUCCESS", None)
+
+    assert first.status == "queued"
+    assert (queued_duplicate.status, queued_duplicate.task_id) == ("in_progress", first.task_id)
+    assert (second.status, second.task_id) == ("in_progress", first.task_id)
+    assert other_session.status == "queued"
+    assert len(task.submitted) == 2
+
+
+def test_completed_result_is_served_until_inputs_change(states):
+    deduplicator, task = TaskDeduplicator(FakeRedis()), FakeTask()
+
+    first = deduplicator.submit(task, (7,), "posts-v1")
+    deduplicator.record_completion(first.task_id, "SUCCESS", {"session_id": 7, "status": "completed"})
+    repeat = deduplicator.submit(task, (7,), "posts-v1")
+    after_new_posts = deduplicator.submit(task, (7,), "posts-v2")
+
+    assert repeat.status == "completed"
+    assert repeat.task_id == first.task_id
+    assert repeat.result == {"session_id": 7, "status": "completed"}
+    assert after_new_posts.status == "queued"
+    assert len(task.submitted) == 2
+
+
+def test_failed_run_releases_lock_without_caching(states):
+    deduplicator, task = TaskDeduplicator(FakeRedis()), FakeTask()
+
+    first = deduplicator.submit(task, (7,), "posts-v1")
+    deduplicator.record_completion(first.task_id, "FAILURE", RuntimeError("LLM down"))
+    retry = deduplicator.submit(task, (7,), "posts-v1")
+
+    assert retry.status == "queued" and retry.task_id != first.task_id
+
+
+def test_stale_lock_from_dead_worker_is_taken_over(states):
+    deduplicator, task = TaskDeduplicator(FakeRedis()), FakeTask()
+
+    first = deduplicator.submit(task, (7,), "posts-v1")
+    states[first.task_id] = "FAILURE"  # Worker died before the postrun hook ran
+    second = deduplicator.submit(task, (7,), "posts-v1")
+
+    assert second.status == "queued" and second.task_id != first.task_id
+
+
+def test_started_orphan_without_heartbeat_is_taken_over(states):
+    client, task = FakeRedis(), FakeTask()
+    deduplicator = TaskDeduplicator(client)
+
+    first = deduplicator.submit(task, (7,), "posts-v1")
+    deduplicator.record_start(first.task_id, task)
+    states[first.task_id] = "STARTED"
+    # Worker SIGKILLed mid-run: postrun never fires and the heartbeat key expires
+    deduplicator._heartbeats.pop(first.task_id).set()
+    client.delete(f"{dedup.DEDUP_KEY_PREFIX}:alive:{first.task_id}")
+    second = deduplicator.submit(task, (7,), "posts-v1")
+
+    assert second.status == "queued" and second.task_id != first.task_id
+    assert client.get(deduplicator.dedup_key(task.name, (7,), "posts-v1") + ":lock") == second.task_id
+
+
+def test_report_fingerprint_tracks_post_edits_and_votes():
+    engine = create_engine("sqlite://")
+    for model in (Post, Poll, PollVote):
+        model.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    post = Post(session_id=7, user_id=1, content="why?")
+    poll = Poll(session_id=7, question="Ready?", options_json=["yes", "no"])
+    db.add_all([post, poll])
+    db.commit()
+    base = dedup.report_fingerprint(db, 7)
+
+    post.pinned = True
+    post.updated_at = post.updated_at + timedelta(minutes=1)
+    db.commit()
+    after_pin = dedup.report_fingerprint(db, 7)
+    db.add(PollVote(poll_id=poll.id, user_id=2, option_index=0))
+    db.commit()
+    after_vote = dedup.report_fingerprint(db, 7)
+
+    assert len({base, after_pin, after_vote}) == 3
+    assert dedup.report_fingerprint(db, 8) != base
@@ -0,0 +1,180 @@
+import redis
+
+from api.services import tool_cache
+from api.services.tool_cache import ToolCache, ToolCachePolicy, cached_handler, invalidating_handler
+
+
+class FakeRedis:
+    def __init__(self):
+        self._store = {}
+        self._hashes = {}
+
+    def get(self, key):
+        return self._store.get(key)
+
+    def mget(self, keys):
+        return [self._store.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        self._store[key] = value
+
+    def incr(self, key):
+        self._store[key] = str(int(self._store.get(key, 0)) + 1)
+
+    def hincrby(self, key, field, amount):
+        bucket = self._hashes.setdefault(key, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+
+    def hgetall(self, key):
+        return dict(self._hashes.get(key, {}))
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+
+
+class BrokenRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis.ConnectionError("down")
+        return fail
+
+
+def _use_cache(monkeypatch, client):
+    cache = ToolCache(redis_client=client)
+    monkeypatch.setattr(tool_cache, "_tool_cache", cache)
+    return cache
+
+
+def test_read_tool_is_cached_per_arguments(monkeypatch):
+    cache = _use_cache(monkeypatch, FakeRedis())
+    calls = []
+
+    def get_course(db, course_id):
+        calls.append(course_id)
+        return {"id": course_id, "title": f"Course {course_id}"}
+
+    handler = cached_handler("get_course", get_course, ToolCachePolicy(ttl_seconds=60, tags=("course:{course_id}",)))
+
+    assert handler(db="session-1", course_id=1) == {"id": 1, "title": "Course 1"}
+    assert handler(db="session-2", course_id=1) == {"id": 1, "title": "Course 1"}
+    handler(db="session-1", course_id=2)
+
+    assert calls == [1, 2]
+    assert cache.stats()["get_course"] == {"hits": 1, "misses": 2, "hit_rate": 0.333}
+
+
+def test_write_tool_invalidates_matching_tags(monkeypatch):
+    _use_cache(monkeypatch, FakeRedis())
+    calls = []
+
+    def list_sessions(db, course_id):
+        calls.append(course_id)
+        return {"sessions": len(calls)}
+
+    def update_session_status(db, session_id, status):
+        return {"session_id": session_id, "status": status}
+
+    def create_course(db, title):
+        return {"error": "Course title taken"}
+
+    read = cached_handler("list_sessions", list_sessions, ToolCachePolicy(tags=("sessions",)))
+    write = invalidating_handler(update_session_status, ("sessions", "session:{session_id}"))
+    failing_write = invalidating_handler(create_course, ("sessions",))
+
+    read(db=None, course_id=1)
+    read(db=None, course_id=1)
+    failing_write(db=None, title="Ethics")
+    read(db=None, course_id=1)
+    assert calls == [1]
+
+    write(db=None, session_id=5, status="live")
+    assert read(db=None, course_id=1) == {"sessions": 2}
+
+
+def test_errors_are_not_cached(monkeypatch):
+    _use_cache(monkeypatch, FakeRedis())
+    calls = []
+
+    def get_session(db, session_id):
+        calls.append(session_id)
+        return {"error": "Session not found"}
+
+    handler = cached_handler("get_session", get_session, ToolCachePolicy(tags=("session:{session_id}",)))
+    handler(db=None, session_id=9)
+    handler(db=None, session_id=9)
+
+    assert calls == [9, 9]
+
+
+def test_redis_outage_runs_tools_uncached(monkeypatch):
+    _use_cache(monkeypatch, BrokenRedis())
+    calls = []
+
+    def list_courses(db):
+        calls.append(1)
+        return {"courses": []}
+
+    handler = cached_handler("list_courses", list_courses, ToolCachePolicy(tags=("courses",)))
+
+    assert handler(db=None) == {"courses": []}
+    assert handler(db=None) == {"courses": []}
+    tool_cache.invalidate_tags("courses")
+    assert len(calls) == 2
+
+
+def test_registry_wraps_cached_and_invalidating_tools():
+    from mcp_server.server import TOOL_REGISTRY, _handler_requires_db
+
+    assert TOOL_REGISTRY["get_course"]["handler"].__wrapped__.__name__ == "get_course"
+    assert TOOL_REGISTRY["create_course"]["handler"].__wrapped__.__name__ == "create_course"
+    assert _handler_requires_db(TOOL_REGISTRY["get_course"]["handler"])
+    assert not hasattr(TOOL_REGISTRY["plan_action"]["handler"], "__wrapped__")
+
+
+def test_plan_generation_invalidates_rewritten_sessions(monkeypatch):
+    from worker import tasks
+
+    invalidated = []
+    monkeypatch.setattr("workflows.planning.run_planning_workflow", lambda course_id: {"updated_session_ids": [7, 9]})
+    monkeypatch.setattr(tool_cache, "invalidate_tags", lambda *tags: invalidated.extend(tags))
+
+    tasks.generate_plans_task.run(3)
+
+    assert invalidated == ["sessions", "course:3", "session:7", "session:9"]
+
+
+def test_session_clone_invalidates_course_sessions(monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import api.models  # noqa: F401  (registers all mappers)
+    from api.models.session import Session as SessionModel
+    from api.services import instructor_features
+
+    invalidated = []
+    monkeypatch.setattr(instructor_features, "invalidate_tags", lambda *tags: invalidated.extend(tags))
+    engine = create_engine("sqlite://")
+    SessionModel.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(SessionModel(id=1, course_id=4, title="Week 1"))
+    db.commit()
+
+    clone = instructor_features.clone_session(db, 1, "Week 1 (copy)")
+
+    assert clone["cloned_from"] == 1
+    assert invalidated == ["sessions", "course:4"]
@@ -0,0 +1,46 @@
+import inspect
+import json
+import subprocess
+import sys
+
+import pytest
+
+from mcp_server.server import TOOL_REGISTRY, _handler_requires_db, registry_stats
+from mcp_server.tools import LazyHandler, import_stats
+
+
+def test_importing_server_does_not_import_tool_modules():
+    code = (
+        "import json, sys\n"
+        "import mcp_server.server as server\n"
+        "print(json.dumps({'stats': server.registry_stats(),"
+        " 'imported': sorted(m for m in sys.modules if m.startswith('mcp_server.tools.'))}))\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert result["imported"] == []
+    assert result["stats"]["tools"] > 50
+    assert result["stats"]["modules"]["loaded"] == []
+    assert result["stats"]["build_ms"] >= 0
+
+
+def test_lazy_handler_loads_on_first_use_and_keeps_signature():
+    handler = LazyHandler("voice", "voice_open_page")
+
+    assert handler.__name__ == "voice_open_page"
+    signature = inspect.signature(handler)
+    assert handler.loaded
+    assert list(signature.parameters) == list(inspect.signature(handler.resolve()).parameters)
+    assert "voice" in import_stats()["loaded"]
+
+
+def test_registry_handlers_detect_db_parameter():
+    assert _handler_requires_db(TOOL_REGISTRY["list_courses"]["handler"])
+    assert _handler_requires_db(TOOL_REGISTRY["get_course"]["handler"])
+    assert registry_stats()["tools"] == len(TOOL_REGISTRY)
+
+
+def test_unknown_module_is_rejected():
+    with pytest.raises(ValueError):
+        LazyHandler("grading", "grade")
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_server.server import TOOL_REGISTRY
+from workflows import tool_retrieval
+from workflows.tool_retrieval import ToolCatalog, get_tool_catalog, select_tools_for_prompt
+
+
+def _tool(description, category, mode="read", properties=None, required=None):
+    return {
+        "description": description,
+        "parameters": {"type": "object", "properties": properties or {}, "required": required or []},
+        "mode": mode,
+        "category": category,
+    }
+
+
+REGISTRY = {
+    "list_courses": _tool("List all courses.", "courses"),
+    "create_poll": _tool(
+        "Create a poll in a session.", "polls", mode="write",
+        properties={"session_id": {"type": "integer"}, "question": {"type": "string"}},
+        required=["session_id", "question"],
+    ),
+    "get_poll_results": _tool("Get results of a poll.", "polls", properties={"poll_id": {"type": "integer"}}),
+    "pin_post": _tool("Pin a forum post.", "forum", mode="write", properties={"post_id": {"type": "integer"}}),
+    "get_session_posts": _tool("Get posts in a session.", "forum", properties={"session_id": {"type": "integer"}}),
+    "get_report": _tool("Get the session report.", "reports", properties={"session_id": {"type": "integer"}}),
+    "resolve_course": _tool("Resolve a course by name.", "context", properties={"query": {"type": "string"}}),
+    "set_active_course": _tool("Set the active course.", "context", mode="write"),
+}
+
+
+def test_tool_lines_include_signature_and_description():
+    catalog = ToolCatalog.build(REGISTRY)
+
+    assert catalog.lines["create_poll"] == (
+        "- create_poll(session_id: integer (required), question: string (required)) "
+        "[mode=write]: Create a poll in a session."
+    )
+    assert catalog.full_text.count("\n") == len(REGISTRY) - 1
+
+
+def test_select_keeps_relevant_and_context_tools():
+    selection = ToolCatalog.build(REGISTRY).select("create a poll about ethics", top_k=2, min_score=0.5)
+
+    assert not selection.fallback
+    assert "create_poll" in selection.tool_names
+    assert "resolve_course" in selection.tool_names  # Always included
+    assert "set_active_course" not in selection.tool_names  # Context, but not read-only
+    assert "list_courses" not in selection.tool_names
+    assert len(selection.text) < len(ToolCatalog.build(REGISTRY).full_text)
+
+
+def test_current_page_boosts_its_categories():
+    catalog = ToolCatalog.build(REGISTRY)
+
+    on_forum = catalog.select("session", current_page="/forum/12", top_k=1, min_score=0.1)
+    on_reports = catalog.select("session", current_page="/reports", top_k=1, min_score=0.1)
+
+    assert "get_session_posts" in on_forum.tool_names
+    assert "get_report" in on_reports.tool_names
+
+
+def test_low_confidence_falls_back_to_full_catalog():
+    catalog = ToolCatalog.build(REGISTRY)
+
+    selection = catalog.select("hmm okay", top_k=2, min_score=0.5)
+
+    assert selection.fallback
+    assert selection.text == catalog.full_text
+
+
+def test_catalog_is_cached_until_registry_changes():
+    registry = dict(REGISTRY)
+
+    first = get_tool_catalog(registry)
+    assert get_tool_catalog(registry) is first
+
+    registry["get_users"] = _tool("List users.", "enrollment")
+    assert get_tool_catalog(registry) is not first
+
+
+def test_retrieval_can_be_disabled(monkeypatch):
+    settings = SimpleNamespace(voice_tool_retrieval_enabled=False, voice_tool_top_k=2, voice_tool_min_score=0.5)
+    monkeypatch.setattr(tool_retrieval, "get_settings", lambda: settings)
+
+    selection = select_tools_for_prompt("create a poll", registry=REGISTRY)
+
+    assert selection.fallback
+    assert selection.tool_names == list(REGISTRY)
+
+
+@pytest.mark.parametrize("transcript, page, tool", [
+    ("start the copilot", "/console", "start_copilot"),
+    ("create a poll about ethics", "/console", "create_poll"),
+    ("pin the last post", "/forum", "pin_post"),
+    ("enroll jane doe in biology", "/courses", "enroll_student"),
+    ("show me the participation rate", "/reports", "get_participation_stats"),
+])
+def test_registry_clear_requests_are_narrowed(transcript, page, tool):
+    selection = ToolCatalog.build(TOOL_REGISTRY).select(transcript, current_page=page)
+
+    assert not selection.fallback
+    assert tool in selection.tool_names
+    assert len(selection.tool_names) < len(TOOL_REGISTRY) / 2
+
+
+def test_registry_page_tools_are_kept_without_matching_words():
+    # "students" matches the enrollment tools; nothing matches "misunderstand"
+    selection = ToolCatalog.build(TOOL_REGISTRY).select("what did students misunderstand", current_page="/reports")
+
+    assert not selection.fallback
+    assert {"get_report", "get_report_summary", "get_student_scores"} <= set(selection.tool_names)
+
+
+def test_registry_description_only_match_falls_back():
+    # Only "class" matches, in the go_live / end_session descriptions
+    selection = ToolCatalog.build(TOOL_REGISTRY).select("how's the class doing", current_page="/console")
+
+    assert selection.fallback
+    assert {"get_participation_stats", "get_report_summary"} <= set(selection.tool_names)
@@ -0,0 +1,95 @@
+import pytest
+
+from api.services.tool_validation import (
+    ToolArgumentError,
+    compile_tool_schema,
+    validate_tool_args,
+    validation_stats,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "session_id": {"type": "integer"},
+        "question": {"type": "string"},
+        "options": {"type": "array", "items": {"type": "string"}},
+        "anonymous": {"type": "boolean", "default": False},
+        "status": {"type": "string", "enum": ["draft", "live"]},
+        "limit": {"type": "integer", "default": 100},
+    },
+    "required": ["session_id", "question"],
+}
+
+
+def test_coerces_common_llm_mistakes_and_applies_defaults():
+    validate = compile_tool_schema("create_poll", SCHEMA)
+
+    args = validate({
+        "session_id": "12",
+        "question": 42,
+        "options": '["Yes", "No"]',
+        "anonymous": "true",
+        "status": "LIVE",
+        "limit": None,
+        "extra": "kept",
+    })
+
+    assert args == {
+        "session_id": 12,
+        "question": "42",
+        "options": ["Yes", "No"],
+        "anonymous": True,
+        "status": "live",
+        "limit": 100,
+        "extra": "kept",
+    }
+
+
+def test_single_value_becomes_list_and_input_is_not_mutated():
+    validate = compile_tool_schema("create_poll", SCHEMA)
+    raw = {"session_id": 1, "question": "Ready?", "options": 5}
+
+    assert validate(raw)["options"] == ["5"]
+    assert raw["options"] == 5
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        ({"question": "Ready?"}, "Missing required field 'session_id' for tool 'create_poll'"),
+        ({"session_id": None, "question": "Ready?"}, "Missing required field 'session_id'"),
+        ({"session_id": "twelve", "question": "Ready?"}, "Field 'session_id' must be integer"),
+        ({"session_id": True, "question": "Ready?"}, "Field 'session_id' must be integer"),
+        ({"session_id": 1, "question": "Ready?", "status": "closed"}, "Field 'status' must be one of: draft, live"),
+        ({"session_id": 1, "question": "Ready?", "options": [{"a": 1}]}, "Field 'options[0]' must be string"),
+        ({"session_id": 1, "question": "Ready?", "anonymous": "maybe"}, "Field 'anonymous' must be boolean"),
+    ],
+)
+def test_invalid_arguments_fail_fast(args, message):
+    validate = compile_tool_schema("create_poll", SCHEMA)
+
+    with pytest.raises(ToolArgumentError) as excinfo:
+        validate(args)
+    assert message in str(excinfo.value)
+
+
+def test_shared_entry_point_records_timing():
+    tool_info = {"parameters": SCHEMA}
+
+    validate_tool_args("timed_tool", tool_info, {"session_id": 1, "question": "q"})
+    with pytest.raises(ToolArgumentError):
+        validate_tool_args("timed_tool", tool_info, {})
+
+    stats = validation_stats()["timed_tool"]
+    assert stats["calls"] == 2
+    assert stats["failures"] == 1
+    assert stats["max_ms"] >= stats["avg_ms"] >= 0
+    assert "validator" in tool_info  # Compiled once, then reused
+
+
+def test_registry_tools_have_compiled_validators():
+    from mcp_server.server import TOOL_REGISTRY
+
+    assert all(callable(entry["validator"]) for entry in TOOL_REGISTRY.values())
+    assert TOOL_REGISTRY["list_courses"]["validator"]({}) == {"skip": 0, "limit": 100}
+    assert TOOL_REGISTRY["get_course"]["validator"]({"course_id": "7"}) == {"course_id": 7}
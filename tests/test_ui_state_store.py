@@ -0,0 +1,103 @@
+import pytest
+
+from api.services.ui_state_store import (
+    StaleUiStateError,
+    UiStateDiff,
+    UiStateStore,
+    apply_ui_state_diff,
+)
+from api.services.voice_processor import ButtonState, TabState, UiState
+
+
+class FakeRedis:
+    def __init__(self):
+        self._store = {}
+        self.expirations = {}
+
+    def get(self, key):
+        return self._store.get(key)
+
+    def set(self, key, value, ex=None):
+        self._store[key] = value
+        self.expirations[key] = ex
+
+    def delete(self, key):
+        self._store.pop(key, None)
+
+    def multi(self):
+        pass
+
+    def transaction(self, func, *watches):
+        func(self)
+
+
+def _state(**fields):
+    fields.setdefault("route", "/courses")
+    return UiState(**fields)
+
+
+def test_snapshot_round_trip_with_ttl():
+    client = FakeRedis()
+    store = UiStateStore(redis_client=client, ttl_seconds=120)
+    state = _state(tabs=[TabState(id="tab-create", label="Create", active=True)])
+
+    snapshot = store.set(1, state)
+
+    assert snapshot.version == 1
+    assert store.get(1).state == state
+    assert client.expirations["voice:ui_state:1"] == 120
+    assert isinstance(client.get("voice:ui_state:1"), bytes)
+
+
+def test_stale_snapshot_rejected():
+    store = UiStateStore(redis_client=FakeRedis())
+    store.set(1, _state(), version=5)
+
+    with pytest.raises(StaleUiStateError) as exc:
+        store.set(1, _state(route="/sessions"), version=4)
+
+    assert exc.value.current_version == 5
+    assert store.get(1).state.route == "/courses"
+
+
+def test_diff_applies_upserts_and_removals():
+    store = UiStateStore(redis_client=FakeRedis())
+    store.set(1, _state(
+        tabs=[TabState(id="tab-create", label="Create"), TabState(id="tab-manage", label="Manage")],
+        buttons=[ButtonState(id="save", label="Save")],
+        modal="Confirm",
+    ))
+
+    diff = UiStateDiff(
+        tabs=[TabState(id="tab-manage", label="Manage", active=True)],
+        removed={"tabs": ["tab-create"], "buttons": ["save"]},
+        modal=None,
+    )
+    snapshot = store.apply_diff(1, diff, base_version=1)
+
+    assert snapshot.version == 2
+    assert [(tab.id, tab.active) for tab in snapshot.state.tabs] == [("tab-manage", True)]
+    assert snapshot.state.buttons == []
+    assert snapshot.state.modal is None
+    assert snapshot.state.route == "/courses"
+
+
+def test_diff_against_old_version_rejected():
+    store = UiStateStore(redis_client=FakeRedis())
+    store.set(1, _state())
+    store.set(1, _state(route="/sessions"))
+
+    with pytest.raises(StaleUiStateError):
+        store.apply_diff(1, UiStateDiff(route="/reports"), base_version=1)
+    with pytest.raises(StaleUiStateError):
+        store.apply_diff(2, UiStateDiff(route="/reports"), base_version=0)
+
+
+def test_unset_scalar_fields_are_kept():
+    state = _state(activeTab="tab-create", modal="Confirm")
+
+    updated = apply_ui_state_diff(state, UiStateDiff(buttons=[ButtonState(id="go", label="Go")]))
+
+    assert updated.activeTab == "tab-create"
+    assert updated.modal == "Confirm"
+    assert [button.id for button in updated.buttons] == ["go"]
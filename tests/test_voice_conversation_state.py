@@ -0,0 +1,91 @@
+import json
+
+from api.services.voice_conversation_state import (
+    ConversationContext,
+    ConversationState,
+    VoiceConversationManager,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self._store = {}
+        self.calls = []
+
+    def get(self, key):
+        self.calls.append("get")
+        return self._store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.calls.append("set")
+        self._store[key] = value
+
+    def delete(self, key):
+        self.calls.append("delete")
+        self._store.pop(key, None)
+
+    def multi(self):
+        pass
+
+    def transaction(self, func, *watches):
+        self.calls.append("transaction")
+        func(self)
+
+
+def test_unit_of_work_loads_and_flushes_once():
+    client = FakeRedis()
+    manager = VoiceConversationManager(redis_client=client)
+
+    with manager.unit_of_work(7) as context:
+        manager.update_current_page(7, "/sessions")
+        manager.reset_retry_count(7)
+        manager.set_pending_action(7, "create_poll", {"question": "Ready?"})
+        assert manager.get_context(7) is context
+        assert client.calls == ["get"]
+
+    assert client.calls == ["get", "transaction", "get", "set"]
+    stored = manager.get_context(7)
+    assert stored.current_page == "/sessions"
+    assert stored.pending_action == "create_poll"
+
+
+def test_unit_without_changes_does_not_write():
+    client = FakeRedis()
+    manager = VoiceConversationManager(redis_client=client)
+
+    with manager.unit_of_work(7):
+        manager.get_context(7)
+        manager.has_pending_action(7)
+
+    assert client.calls == ["get"]
+
+
+def test_concurrent_write_is_merged():
+    client = FakeRedis()
+    manager = VoiceConversationManager(redis_client=client)
+    manager.save_context(7, ConversationContext(current_page="/courses"))
+
+    with manager.unit_of_work(7):
+        manager.update_active_session(7, 12, "Week 3")
+        # Another tab changes a different field before this turn flushes
+        other = ConversationContext.from_dict(json.loads(client._store["voice:conversation:7"]))
+        other.state = ConversationState.AWAITING_CONFIRMATION
+        other.current_page = "/forum"
+        client._store["voice:conversation:7"] = json.dumps(other.to_dict())
+
+    stored = manager.get_context(7)
+    assert stored.active_session_id == 12
+    assert stored.current_page == "/forum"
+    assert stored.state == ConversationState.AWAITING_CONFIRMATION
+
+
+def test_clear_inside_unit_resets_context():
+    client = FakeRedis()
+    manager = VoiceConversationManager(redis_client=client)
+    manager.save_context(7, ConversationContext(current_page="/courses"))
+
+    with manager.unit_of_work(7):
+        manager.clear_context(7)
+        assert manager.get_context(7).current_page == "/dashboard"
+
+    assert "voice:conversation:7" not in client._store
@@ -0,0 +1,180 @@
+import asyncio
+import threading
+
+from mcp_server.voice_loop import VoiceConfig, VoiceLoopController
+
+
+def _controller(responses, **config):
+    return VoiceLoopController(config=VoiceConfig(greeting=None, **config), on_response=responses.append)
+
+
+def _plan_with_no_steps(transcript):
+    return {"plan": {"steps": []}}
+
+
+def test_loop_handles_queued_transcripts_and_records_latency(monkeypatch):
+    monkeypatch.setattr("workflows.voice_orchestrator.run_voice_orchestrator", _plan_with_no_steps)
+    responses = []
+    controller = _controller(responses)
+
+    async def play(text):
+        pass
+
+    monkeypatch.setattr(controller, "_play_speech", play)
+
+    async def run():
+        loop_task = asyncio.create_task(controller.start())
+        controller.submit_transcript("list my courses")
+        controller.submit_transcript("   ")  # Ignored
+        while controller.stats.total_interactions < 1:
+            await asyncio.sleep(0.01)
+        await controller.stop()
+        await asyncio.wait_for(loop_task, timeout=2)
+
+    asyncio.run(run())
+
+    assert len(responses) == 1
+    assert "not sure what action" in responses[0]
+    latency = controller.get_status()["stats"]["latency_ms"]
+    assert {"queue_wait", "plan", "speak", "turn"} <= set(latency)
+    assert latency["plan"]["count"] == 1
+
+
+def test_idle_loop_waits_without_polling_and_stops_promptly():
+    controller = _controller([])
+
+    async def run():
+        loop_task = asyncio.create_task(controller.start())
+        await asyncio.sleep(0.05)
+        assert not loop_task.done()
+        await controller.stop()
+        await asyncio.wait_for(loop_task, timeout=1)
+
+    asyncio.run(run())
+
+    assert controller.stats.total_interactions == 0
+    assert not controller._running
+
+
+def test_planner_runs_off_the_event_loop(monkeypatch):
+    planner_started = threading.Event()
+    release = threading.Event()
+
+    def slow_planner(transcript):
+        planner_started.set()
+        release.wait(timeout=2)
+        return {"plan": {"steps": []}}
+
+    monkeypatch.setattr("workflows.voice_orchestrator.run_voice_orchestrator", slow_planner)
+    controller = _controller([])
+
+    async def run():
+        command = asyncio.create_task(controller._process_command("open the forum"))
+        while not planner_started.is_set():
+            await asyncio.sleep(0.01)
+        # The event loop is still responsive while the planner thread is busy
+        await asyncio.sleep(0.01)
+        release.set()
+        return await command
+
+    assert "not sure what action" in asyncio.run(run())
+
+
+def test_new_transcript_barges_in_on_speech():
+    controller = _controller([])
+
+    async def run():
+        cancelled = asyncio.Event()
+
+        async def long_speech(text):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        controller._play_speech = long_speech
+        speak = asyncio.create_task(controller._speak("a very long answer"))
+        await asyncio.sleep(0.01)
+        controller.submit_transcript("stop, open the reports instead")
+        await asyncio.wait_for(speak, timeout=1)
+        return cancelled.is_set()
+
+    assert asyncio.run(run())
+    assert controller.stats.barge_ins == 1
+    assert controller._events.qsize() == 1
+
+
+def test_full_queue_drops_oldest_transcript():
+    controller = _controller([], max_queued_transcripts=2)
+
+    for text in ("first", "second", "third"):
+        controller.submit_transcript(text)
+
+    assert controller.stats.dropped_transcripts == 1
+    assert [controller._events.get_nowait().text for _ in range(2)] == ["second", "third"]
+
+
+class FakeWebSocket:
+    def __init__(self, messages):
+        self.incoming = asyncio.Queue()
+        for message in messages:
+            self.incoming.put_nowait(message)
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def receive_json(self):
+        return await self.incoming.get()
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+def test_websocket_treats_stop_phrases_as_commands_without_server_tts(monkeypatch):
+    from mcp_server import voice_loop
+
+    commands = []
+
+    async def process(self, transcript):
+        commands.append(transcript)
+        return f"done: {transcript}"
+
+    async def no_tts(self, text):
+        raise AssertionError("WebSocket responses must not be synthesized on the server")
+
+    monkeypatch.setattr(VoiceLoopController, "_process_command", process)
+    monkeypatch.setattr(VoiceLoopController, "_play_speech", no_tts)
+    websocket = FakeWebSocket([{"type": "text", "data": "end session"}])
+
+    async def run():
+        serving = asyncio.create_task(voice_loop.serve_voice_websocket(websocket))
+        while not any(message["type"] == "response" for message in websocket.sent):
+            await asyncio.sleep(0.01)
+        websocket.incoming.put_nowait({"type": "stop"})
+        await asyncio.wait_for(serving, timeout=2)
+
+    asyncio.run(run())
+
+    assert commands == ["end session"]
+    assert {"type": "response", "data": "done: end session"} in websocket.sent
+
+
+def test_websocket_reports_and_closes_when_loop_ends(monkeypatch):
+    from mcp_server import voice_loop
+
+    async def crashed_loop(self):
+        self._running = False
+
+    monkeypatch.setattr(VoiceLoopController, "start", crashed_loop)
+    websocket = FakeWebSocket([])
+
+    asyncio.run(asyncio.wait_for(voice_loop.serve_voice_websocket(websocket, ready_message="hi"), timeout=2))
+
+    assert websocket.sent == [{"type": "ready", "data": "hi"}, {"type": "error", "data": "Voice loop stopped"}]
+    assert websocket.closed_with == 1011
@@ -0,0 +1,72 @@
+from api.api.voice_llm_extraction import aggregate_all_ui_elements
+from api.services.voice_page_registry import (
+    TAB_ROUTES,
+    find_feature_location,
+    find_page_by_spoken_name,
+    find_tab_by_spoken_name,
+    find_tab_page,
+    generate_full_topology_for_llm,
+    generate_page_context_for_llm,
+    get_navigation_steps,
+    get_workflow,
+    is_tab_on_page,
+)
+
+
+def _steps(current_route, tab):
+    return [(step.action, step.target) for step in get_navigation_steps(current_route, tab)]
+
+
+def test_tab_shared_by_pages_maps_to_all_of_them():
+    assert TAB_ROUTES["tab-create"] == ("/courses", "/sessions")
+    assert find_tab_page("tab-create") == "/courses"
+    assert find_tab_page("tab-create", current_route="/sessions/12") == "/sessions"
+    assert find_tab_page("tab-missing") is None
+    assert is_tab_on_page("tab-polls", "/console/5")
+    assert not is_tab_on_page("tab-polls", "/forum")
+
+
+def test_navigation_takes_the_shortest_path():
+    assert _steps("/sessions/12", "tab-create") == [("switch_tab", "tab-create")]
+    assert _steps("/forum", "tab-create") == [("navigate", "/courses"), ("switch_tab", "tab-create")]
+    assert _steps("", "tab-polls") == [("navigate", "/console"), ("switch_tab", "tab-polls")]
+    assert _steps("/forum", "tab-missing") == []
+
+
+def test_navigation_steps_are_fresh_lists():
+    steps = get_navigation_steps("/forum", "tab-polls")
+    steps.clear()
+
+    assert len(get_navigation_steps("/forum", "tab-polls")) == 2
+
+
+def test_spoken_names_resolve_to_tabs_and_pages():
+    assert find_tab_by_spoken_name("the AI tools tab") == ("/reports", "tab-ai-tools")
+    assert find_tab_by_spoken_name("advanse") == ("/courses", "tab-advanced")
+    assert find_tab_by_spoken_name("create", current_route="/sessions") == ("/sessions", "tab-create")
+    assert find_tab_by_spoken_name("weather forecast") is None
+    assert find_page_by_spoken_name("the forum") == "/forum"
+    assert find_page_by_spoken_name("reprots") == "/reports"
+
+
+def test_feature_and_workflow_lookups():
+    assert find_feature_location("enroll students") == ("/courses", "tab-advanced")
+    assert find_feature_location("please launch poll now") == ("/console", "tab-polls")
+    assert get_workflow("I want to create session for tomorrow").name == "create_session"
+
+
+def test_llm_context_is_prerendered():
+    assert generate_full_topology_for_llm() is generate_full_topology_for_llm()
+    context = generate_page_context_for_llm("/console/3")
+    assert context.startswith("Current page: Console (/console)")
+    assert "tab-polls" in context
+    assert generate_page_context_for_llm("/nowhere") == "Current page: /nowhere (unknown page)"
+
+
+def test_ui_elements_are_aggregated_once_with_per_page_groups():
+    elements = aggregate_all_ui_elements()
+
+    assert aggregate_all_ui_elements() is elements
+    for page, group in elements["by_page"].items():
+        assert all(tab["page"] == page for tab in group["tabs"])
+    assert sum(len(group["tabs"]) for group in elements["by_page"].values()) == len(elements["all_tabs"])
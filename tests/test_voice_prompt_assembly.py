@@ -0,0 +1,54 @@
+from api.api.voice_prompt_assembly import (
+    INTENT_PROMPT_STATIC_PREFIX,
+    build_intent_messages,
+    build_intent_prompt_suffix,
+    minify_context,
+    prompt_token_report,
+)
+
+
+def test_static_prefix_is_request_independent():
+    first = build_intent_messages("go to courses", "/courses", None, "en", "gpt-4o-mini")
+    second = build_intent_messages("crear encuesta", "/console/5", {"current_page": "/console/5"}, "es", "gpt-4o-mini")
+
+    assert first[0].content == second[0].content == INTENT_PROMPT_STATIC_PREFIX
+    assert "crear encuesta" not in INTENT_PROMPT_STATIC_PREFIX
+    assert "{language}" not in INTENT_PROMPT_STATIC_PREFIX
+
+
+def test_suffix_only_includes_current_page():
+    suffix = build_intent_prompt_suffix("start a timer", "/console/12", None, "en")
+
+    assert "/console - Live Instructor Console" in suffix
+    assert "get_timer_status" in suffix
+    assert "/courses - Course Management" not in suffix
+    assert "compare_sessions" not in suffix
+    assert '"start a timer"' in suffix
+
+
+def test_unknown_page_falls_back_to_all_sections():
+    suffix = build_intent_prompt_suffix("help", None, None, "en")
+
+    assert "/courses - Course Management" in suffix
+    assert "/reports - Analytics and Reports" in suffix
+
+
+def test_context_is_minified():
+    assert minify_context({"current_page": "/forum", "available_tabs": ["discussion", "cases"]}) == (
+        '{"current_page":"/forum","available_tabs":["discussion","cases"]}'
+    )
+    assert minify_context(None) == "No page context available"
+
+
+def test_anthropic_prefix_marked_for_caching():
+    system = build_intent_messages("hi", "/forum", None, "en", "claude-3-haiku")[0]
+
+    assert system.content[0]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_token_report_shows_savings():
+    report = prompt_token_report()
+
+    for variant in report["variants"].values():
+        assert variant["dynamic_suffix"] < variant["all_pages"]
+        assert variant["uncached_savings"] > 0
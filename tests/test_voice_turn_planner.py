@@ -0,0 +1,117 @@
+from api.api.voice_intent_classifier import IntentCategory, InputType
+from api.api.voice_llm_extraction import (
+    ExtractedDictation,
+    ExtractedUITarget,
+    UnifiedExtractionResult,
+)
+from api.api.voice_turn_planner import TurnPlan, VoiceTurnPlanner
+from api.services.voice_conversation_state import (
+    ConversationContext,
+    ConversationState,
+    DropdownOption,
+)
+
+
+class FakeExtractor:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def extract(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.result.model_copy(update={"original_text": kwargs["user_input"]})
+
+
+def _plan(**fields):
+    return TurnPlan(extraction=UnifiedExtractionResult(**fields))
+
+
+def test_single_extractor_call_per_turn():
+    extractor = FakeExtractor(UnifiedExtractionResult(intent_category="navigate", intent_action="sessions", confidence=0.9))
+    planner = VoiceTurnPlanner(extractor=extractor)
+
+    plan = planner.plan("go to sessions", ConversationContext(current_page="/courses"))
+
+    assert len(extractor.calls) == 1
+    assert extractor.calls[0]["turn_plan_instructions"]
+    assert plan.navigation_target() == "/sessions"
+
+
+def test_current_page_elements_only():
+    extractor = FakeExtractor(UnifiedExtractionResult())
+    planner = VoiceTurnPlanner(extractor=extractor)
+
+    planner.plan("open the polls tab", ConversationContext(current_page="/console"))
+
+    pages = {tab["page"] for tab in extractor.calls[0]["all_tabs"]}
+    assert pages <= {"/console"}
+
+
+def test_dropdown_state_sends_options():
+    extractor = FakeExtractor(UnifiedExtractionResult())
+    planner = VoiceTurnPlanner(extractor=extractor)
+    context = ConversationContext(
+        state=ConversationState.AWAITING_DROPDOWN_SELECTION,
+        active_dropdown="select-course",
+        dropdown_options=[DropdownOption(label="Statistics 101", value="1")],
+    )
+
+    planner.plan("the first one", context)
+
+    call = extractor.calls[0]
+    assert call["dropdown_options"] == [{"label": "Statistics 101", "value": "1"}]
+    assert call["conversation_state"].startswith("awaiting_dropdown_selection")
+
+
+def test_classified_intent_mapping():
+    plan = _plan(
+        intent_category="ui_action",
+        intent_action="switch_tab",
+        confidence=0.9,
+        ui_target=ExtractedUITarget(element_type="tab", element_name="Polls", voice_id="tab-polls", confidence=0.9),
+        voice_response="Opening the polls tab.",
+    )
+
+    intent = plan.to_classified_intent()
+
+    assert intent.category == IntentCategory.UI_ACTION
+    assert intent.parameters.tab_name == "polls"
+    assert intent.voice_response == "Opening the polls tab."
+    assert plan.tab_target(["polls", "copilot"]) == "polls"
+    assert plan.tab_target(["create"]) is None
+
+
+def test_low_confidence_and_failure_fall_back():
+    assert _plan(intent_category="query", intent_action="list_courses", confidence=0.2).to_classified_intent() is None
+
+    # Not confident: the router must run detect_navigation_intent / classify_tab_switch itself
+    unsure = _plan(
+        intent_category="ui_action",
+        confidence=0.3,
+        ui_target=ExtractedUITarget(element_type="tab", element_name="manage", confidence=0.3),
+    )
+    assert unsure.succeeded and not unsure.is_confident()
+    assert unsure.tab_target() is None
+
+    failed = _plan(extraction_failed=True, intent_category="navigate", intent_action="courses", confidence=0.9)
+    assert not failed.succeeded
+    assert failed.to_classified_intent() is None
+    assert failed.navigation_target() is None
+
+
+def test_input_type_mapping():
+    command = _plan(
+        intent_category="dictate",
+        confidence=0.9,
+        input_type="command",
+        dictation=ExtractedDictation(is_command=True, command_type="skip"),
+    ).to_input_type_result()
+    assert command.input_type == InputType.COMMAND
+    assert command.command == "skip"
+
+    cancel = _plan(intent_category="confirm", confidence=0.9, input_type="confirm", confirmation_type="cancel")
+    result = cancel.to_input_type_result()
+    assert result.input_type == InputType.COMMAND
+    assert result.command == "cancel"
+
+    assert _plan(confidence=0.9).to_input_type_result() is None
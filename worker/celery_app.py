@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from kombu import Queue
 
 # Read Redis URL from environment
 # Default uses docker-compose service name; for local dev use: redis://localhost:6379/0
@@ -12,6 +13,68 @@ celery_app = Celery(
     include=["worker.tasks"],
 )
 
+# ============ Queues ============
+#
+# Tasks are split by workload class so long jobs never hold the slots that
+# latency-sensitive work needs. Each class is consumed by its own worker
+# deployment (see docker-compose.yml):
+#
+#   profile       queues             command flags                   notes
+#   interactive   realtime, default  -Q realtime,default             realtime listed first, so it is
+#                                    --autoscale=8,2                 drained before default
+#   bulk          bulk               -Q bulk --autoscale=4,1         LMS sync/push, transcription,
+#                                                                    batch translation
+#   copilot       copilot            -Q copilot --concurrency=4      one slot per live session for up
+#                                                                    to COPILOT_MAX_DURATION_SECONDS
+#
+# Scale a profile out by running more containers of it. queue_depths() below
+# reports the backlog per queue (exposed at GET /health/queues).
+
+QUEUE_REALTIME = "realtime"  # A user is waiting on the result during a live class
+QUEUE_DEFAULT = "default"  # Instructor-triggered generation, minutes are acceptable
+QUEUE_BULK = "bulk"  # Imports, exports, transcription, batch translation
+QUEUE_COPILOT = "copilot"  # Long-running live copilot loops
+
+QUEUES = (QUEUE_REALTIME, QUEUE_DEFAULT, QUEUE_BULK, QUEUE_COPILOT)
+
+# Redis priorities: 0 is served first. Messages are bucketed into PRIORITY_STEPS.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 3
+PRIORITY_LOW = 6
+PRIORITY_STEPS = [0, 3, 6, 9]
+
+# Routing, priority and limits per task, in one place.
+#   queue: queue the task is published to
+#   priority: default priority within that queue (callers may override)
+#   rate_limit: per-worker-process Celery rate limit, for tasks hitting external APIs
+#   time_limit: hard limit in seconds, when it differs from the task's decorator
+TASK_POLICIES = {
+    "worker.tasks.test_task": {"queue": QUEUE_REALTIME, "priority": PRIORITY_NORMAL},
+    # Live class
+    "worker.tasks.generate_live_summary_task": {"queue": QUEUE_REALTIME, "priority": PRIORITY_HIGH},
+    "worker.tasks.generate_ai_assistant_response_task": {"queue": QUEUE_REALTIME, "priority": PRIORITY_HIGH},
+    "worker.tasks.translate_post_task": {"queue": QUEUE_REALTIME, "priority": PRIORITY_NORMAL},
+    "worker.tasks.generate_questions_task": {"queue": QUEUE_REALTIME, "priority": PRIORITY_NORMAL},
+    # Instructor-triggered generation
+    "worker.tasks.generate_plans_task": {"queue": QUEUE_DEFAULT, "priority": PRIORITY_NORMAL},
+    "worker.tasks.generate_report_task": {"queue": QUEUE_DEFAULT, "priority": PRIORITY_NORMAL},
+    "worker.tasks.generate_student_groups_task": {"queue": QUEUE_DEFAULT, "priority": PRIORITY_NORMAL},
+    "worker.tasks.generate_followups_task": {"queue": QUEUE_DEFAULT, "priority": PRIORITY_NORMAL},
+    "worker.tasks.create_peer_review_assignments_task": {"queue": QUEUE_DEFAULT, "priority": PRIORITY_NORMAL},
+    "worker.tasks.analyze_participation_task": {"queue": QUEUE_DEFAULT, "priority": PRIORITY_LOW},
+    "worker.tasks.analyze_objective_coverage_task": {"queue": QUEUE_DEFAULT, "priority": PRIORITY_LOW},
+    # Bulk
+    "worker.tasks.sync_integration_materials_task": {"queue": QUEUE_BULK, "priority": PRIORITY_NORMAL, "rate_limit": "30/m"},
+    "worker.tasks.push_to_canvas_task": {"queue": QUEUE_BULK, "priority": PRIORITY_NORMAL, "rate_limit": "30/m"},
+    "worker.tasks.transcribe_recording_task": {"queue": QUEUE_BULK, "priority": PRIORITY_LOW, "rate_limit": "10/m"},
+    "worker.tasks.translate_session_posts_task": {"queue": QUEUE_BULK, "priority": PRIORITY_LOW, "rate_limit": "10/m"},
+    # Copilot runs until stopped or COPILOT_MAX_DURATION_SECONDS (1 hour); allow for shutdown
+    "worker.tasks.start_live_copilot_task": {"queue": QUEUE_COPILOT, "priority": PRIORITY_NORMAL, "time_limit": 3900},
+}
+
+_ROUTE_KEYS = ("queue",)
+_ANNOTATION_KEYS = ("priority", "rate_limit", "time_limit")
+
 # Celery configuration
 celery_app.conf.update(
     task_serializer="json",
@@ -22,4 +85,40 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=600,  # 10 minutes max per task
     worker_prefetch_multiplier=1,  # Fair task distribution
+    task_queues=[Queue(name, routing_key=name) for name in QUEUES],
+    task_default_queue=QUEUE_DEFAULT,
+    task_default_priority=PRIORITY_NORMAL,
+    task_routes={
+        name: {key: policy[key] for key in _ROUTE_KEYS if key in policy}
+        for name, policy in TASK_POLICIES.items()
+    },
+    task_annotations={
+        name: {key: policy[key] for key in _ANNOTATION_KEYS if key in policy}
+        for name, policy in TASK_POLICIES.items()
+    },
+    broker_transport_options={
+        "priority_steps": PRIORITY_STEPS,
+        "queue_order_strategy": "priority",
+    },
+    worker_send_task_events=True,  # Lets Flower/inspect report per-queue activity
 )
+
+
+def _priority_queue_keys(queue: str) -> list[str]:
+    """Redis list names backing one queue: Celery keeps a list per priority step."""
+    # Same naming as kombu's redis transport (default separator "\x06\x16")
+    sep = "\x06\x16"
+    return [queue if step == 0 else f"{queue}{sep}{step}" for step in PRIORITY_STEPS]
+
+
+def queue_depths(redis_client=None) -> dict[str, int]:
+    """Messages waiting (not yet reserved by a worker) in each queue."""
+    import redis
+
+    client = redis_client or redis.Redis.from_url(redis_url)
+    pipe = client.pipeline()
+    for queue in QUEUES:
+        for key in _priority_queue_keys(queue):
+            pipe.llen(key)
+    lengths = iter(pipe.execute())
+    return {queue: sum(next(lengths) for _ in PRIORITY_STEPS) for queue in QUEUES}
@@ -0,0 +1,247 @@
+"""
+Deduplicated submission for expensive Celery workflows.
+
+Each submission is keyed on (task name, target arguments, input fingerprint).
+The first submission takes a Redis lock holding its task id; duplicates that
+arrive while it runs attach to that task id instead of enqueueing again. When
+the task succeeds its result is kept for DEDUP_RESULT_TTL_SECONDS, and repeated
+requests with the same fingerprint are answered from it without a new run.
+
+Fingerprints summarize the inputs a workflow reads (posts, syllabus,
+objectives), so a request made after those change starts a fresh run.
+
+A lock is a lease. While the task waits in the queue it lasts
+DEDUP_QUEUE_TTL_SECONDS. When the task starts, the lease restarts for the
+task's hard time limit, and the worker heartbeats every
+DEDUP_HEARTBEAT_INTERVAL_SECONDS. If a worker is SIGKILLed or OOM-killed, its
+task stays STARTED in the result backend, but the heartbeat stops. The next
+duplicate then takes the lock over instead of attaching to a dead run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import redis
+from celery.signals import task_postrun, task_prerun
+
+from worker.celery_app import celery_app, redis_url
+
+logger = logging.getLogger(__name__)
+
+DEDUP_KEY_PREFIX = "task_dedup:v1"
+DEDUP_RESULT_TTL_SECONDS = 300
+# Locks outlive the task's hard time limit so a crashed worker cannot pin them forever
+DEDUP_LOCK_GRACE_SECONDS = 60
+# How long a queued task holds its lock before it must have started
+DEDUP_QUEUE_TTL_SECONDS = 900
+DEDUP_HEARTBEAT_INTERVAL_SECONDS = 15
+DEDUP_HEARTBEAT_TTL_SECONDS = 3 * DEDUP_HEARTBEAT_INTERVAL_SECONDS
+
+# Not running yet; trusted for as long as the queue lease lasts
+_QUEUED_STATES = ("PENDING", "RECEIVED", "RETRY")
+
+
+@dataclass
+class DedupSubmission:
+    task_id: str
+    status: str  # "queued" (new run), "in_progress" (attached to a running task), "completed" (cached)
+    result: Optional[Any] = None
+
+    @property
+    def deduplicated(self) -> bool:
+        return self.status != "queued"
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable short hash of JSON-serializable input parts."""
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class TaskDeduplicator:
+    def __init__(self, redis_client: Optional[redis.Redis] = None, result_ttl_seconds: int = DEDUP_RESULT_TTL_SECONDS):
+        self._client = redis_client or redis.Redis.from_url(redis_url, decode_responses=True)
+        self.result_ttl_seconds = result_ttl_seconds
+        self._heartbeats: Dict[str, threading.Event] = {}
+
+    @staticmethod
+    def dedup_key(task_name: str, args: tuple, input_fingerprint: str = "") -> str:
+        return f"{DEDUP_KEY_PREFIX}:{task_name}:{fingerprint(list(args), input_fingerprint)}"
+
+    @staticmethod
+    def _lock_ttl(task) -> int:
+        time_limit = getattr(task, "time_limit", None) or celery_app.conf.task_time_limit or 600
+        return int(time_limit) + DEDUP_LOCK_GRACE_SECONDS
+
+    def submit(self, task, args: tuple = (), input_fingerprint: str = "") -> DedupSubmission:
+        """Enqueue task(*args) unless an identical run is in flight or recently finished."""
+        key = self.dedup_key(task.name, args, input_fingerprint)
+
+        cached = self._client.get(f"{key}:result")
+        if cached:
+            payload = json.loads(cached)
+            return DedupSubmission(task_id=payload["task_id"], status="completed", result=payload["result"])
+
+        for _ in range(2):
+            task_id = str(uuid.uuid4())
+            if self._client.set(f"{key}:lock", task_id, nx=True, ex=DEDUP_QUEUE_TTL_SECONDS):
+                self._client.set(
+                    f"{DEDUP_KEY_PREFIX}:task:{task_id}", key, ex=DEDUP_QUEUE_TTL_SECONDS + self._lock_ttl(task)
+                )
+                try:
+                    task.apply_async(args=args, task_id=task_id)
+                except Exception:
+                    self._release(key, task_id)
+                    raise
+                return DedupSubmission(task_id=task_id, status="queued")
+
+            holder = self._client.get(f"{key}:lock")
+            if holder is None:
+                continue  # Released between SET and GET; try to take it
+            if self._holder_alive(holder):
+                logger.info(f"Attached duplicate {task.name}{args} to in-flight task {holder}")
+                return DedupSubmission(task_id=holder, status="in_progress")
+            # The holder finished without releasing, or its worker died mid-run; take over
+            self._release(key, holder)
+
+        # Lost the race twice; fall back to a plain submission rather than failing the request
+        return DedupSubmission(task_id=task.apply_async(args=args).id, status="queued")
+
+    def _holder_alive(self, task_id: str) -> bool:
+        if self._client.get(f"{DEDUP_KEY_PREFIX}:alive:{task_id}"):
+            return True  # Its worker is heartbeating
+        # STARTED without a heartbeat is an orphan; an unknown id also reads as PENDING,
+        # which the queue lease on the lock bounds
+        return celery_app.AsyncResult(task_id).state in _QUEUED_STATES
+
+    def record_start(self, task_id: str, task) -> None:
+        """Called when a task starts: restart the lock lease from now and heartbeat until it ends."""
+        key = self._client.get(f"{DEDUP_KEY_PREFIX}:task:{task_id}")
+        if not key:
+            return  # Not submitted through the deduplicator
+        if self._client.get(f"{key}:lock") == task_id:
+            self._client.set(f"{key}:lock", task_id, ex=self._lock_ttl(task))
+        self._client.set(f"{DEDUP_KEY_PREFIX}:task:{task_id}", key, ex=self._lock_ttl(task))
+
+        self._beat(task_id)
+        stop = self._heartbeats[task_id] = threading.Event()
+        threading.Thread(
+            target=self._heartbeat_loop, args=(task_id, stop), name=f"dedup-heartbeat-{task_id}", daemon=True
+        ).start()
+
+    def _beat(self, task_id: str) -> None:
+        self._client.set(f"{DEDUP_KEY_PREFIX}:alive:{task_id}", "1", ex=DEDUP_HEARTBEAT_TTL_SECONDS)
+
+    def _heartbeat_loop(self, task_id: str, stop: threading.Event) -> None:
+        while not stop.wait(DEDUP_HEARTBEAT_INTERVAL_SECONDS):
+            try:
+                self._beat(task_id)
+            except redis.RedisError as e:
+                logger.warning(f"Could not refresh dedup heartbeat for task {task_id}: {e}")
+
+    def record_completion(self, task_id: str, state: str, result: Any) -> None:
+        """Called when a task ends: cache successful results and release the lock."""
+        stop = self._heartbeats.pop(task_id, None)
+        if stop is not None:
+            stop.set()
+            self._client.delete(f"{DEDUP_KEY_PREFIX}:alive:{task_id}")
+        key = self._client.get(f"{DEDUP_KEY_PREFIX}:task:{task_id}")
+        if not key:
+            return  # Not submitted through the deduplicator
+        if state == "SUCCESS":
+            try:
+                payload = json.dumps({"task_id": task_id, "result": result}, default=str)
+                self._client.set(f"{key}:result", payload, ex=self.result_ttl_seconds)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Could not cache result of task {task_id}: {e}")
+        self._release(key, task_id)
+        self._client.delete(f"{DEDUP_KEY_PREFIX}:task:{task_id}")
+
+    def _release(self, key: str, task_id: str) -> None:
+        # Only the holder releases; a newer run's lock is left alone
+        if self._client.get(f"{key}:lock") == task_id:
+            self._client.delete(f"{key}:lock")
+
+
+_deduplicator: Optional[TaskDeduplicator] = None
+
+
+def get_task_deduplicator() -> TaskDeduplicator:
+    global _deduplicator
+    if _deduplicator is None:
+        _deduplicator = TaskDeduplicator()
+    return _deduplicator
+
+
+def submit_deduplicated(task, args: tuple = (), input_fingerprint: str = "") -> DedupSubmission:
+    """Submit through the shared deduplicator, falling back to a plain submission if Redis is down."""
+    try:
+        return get_task_deduplicator().submit(task, args, input_fingerprint)
+    except redis.RedisError as e:
+        logger.warning(f"Task dedup unavailable, submitting {task.name} directly: {e}")
+        return DedupSubmission(task_id=task.apply_async(args=args).id, status="queued")
+
+
+@task_prerun.connect
+def _start_dedup_lease(sender=None, task_id=None, task=None, **kwargs):
+    try:
+        get_task_deduplicator().record_start(task_id, task or sender)
+    except redis.RedisError as e:
+        logger.warning(f"Could not start dedup lease for task {task_id}: {e}")
+
+
+@task_postrun.connect
+def _release_dedup_lock(sender=None, task_id=None, retval=None, state=None, **kwargs):
+    try:
+        get_task_deduplicator().record_completion(task_id, state, retval)
+    except redis.RedisError as e:
+        logger.warning(f"Could not release dedup lock for task {task_id}: {e}")
+
+
+# ============ Input fingerprints ============
+
+def report_fingerprint(db, session_id: int) -> str:
+    """Changes whenever the session's posts are added, removed or edited, or its polls get votes."""
+    from sqlalchemy import func
+
+    from api.models.poll import Poll, PollVote
+    from api.models.post import Post
+
+    posts = db.query(func.count(Post.id), func.max(Post.id), func.max(Post.updated_at)).filter(
+        Post.session_id == session_id
+    ).one()
+    votes = db.query(func.count(PollVote.id), func.max(PollVote.id)).join(Poll).filter(
+        Poll.session_id == session_id
+    ).one()
+    return fingerprint(list(posts), list(votes))
+
+
+def plans_fingerprint(db, course_id: int) -> str:
+    """Changes whenever the course syllabus or objectives change."""
+    from api.models.course import Course
+
+    course = db.query(Course).filter(Course.id == course_id).first()
+    if not course:
+        return ""
+    return fingerprint(course.syllabus_text, course.syllabus_json, course.objectives_json)
+
+
+def coverage_fingerprint(db, course_id: int) -> str:
+    """Changes whenever the objectives or any session plan of the course change."""
+    from sqlalchemy import func
+
+    from api.models.course import Course
+    from api.models.session import Session as SessionModel
+
+    course = db.query(Course).filter(Course.id == course_id).first()
+    count, last_updated = db.query(func.count(SessionModel.id), func.max(SessionModel.updated_at)).filter(
+        SessionModel.course_id == course_id
+    ).one()
+    return fingerprint(course.objectives_json if course else None, count, last_updated)
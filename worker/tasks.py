@@ -1,4 +1,5 @@
 from worker.celery_app import celery_app
+import worker.dedup  # noqa: F401  (registers the dedup lock release hook)
 
 
 @celery_app.task(bind=True)
@@ -11,9 +12,13 @@ def test_task(self, message: str) -> dict:
 def generate_plans_task(self, course_id: int) -> dict:
     """Generate session plans from course syllabus using LLM workflow."""
     # Import here to avoid circular imports and ensure DB connection
+    from api.services.tool_cache import invalidate_tags
     from workflows.planning import run_planning_workflow
 
     result = run_planning_workflow(course_id)
+    # Rewritten plans live on existing sessions, cached per session
+    session_tags = [f"session:{session_id}" for session_id in result.get("updated_session_ids") or []]
+    invalidate_tags("sessions", f"course:{course_id}", *session_tags)
     return {"course_id": course_id, "status": "completed", "result": result}
 
 
@@ -29,9 +34,11 @@ def start_live_copilot_task(self, session_id: int) -> dict:
 @celery_app.task(bind=True)
 def generate_report_task(self, session_id: int) -> dict:
     """Generate post-discussion feedback report using LLM workflow."""
+    from api.services.tool_cache import invalidate_tags
     from workflows.report import run_report_workflow
 
     result = run_report_workflow(session_id)
+    invalidate_tags(f"report:{session_id}")
     return {"session_id": session_id, "status": "completed", "result": result}
 
 
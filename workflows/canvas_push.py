@@ -31,6 +31,7 @@ from workflows.llm_utils import (
     invoke_llm_with_metrics,
     format_posts_for_prompt,
     LLMMetrics,
+    DEFAULT_POSTS_TOKEN_BUDGET,
 )
 
 logger = logging.getLogger(__name__)
@@ -289,7 +290,7 @@ def run_canvas_push_workflow(
         session = content["session"]
 
         # Format posts for LLM
-        posts_formatted = format_posts_for_prompt(content["posts"][:50])  # Limit to 50 posts
+        posts_formatted = format_posts_for_prompt(content["posts"], max_tokens=DEFAULT_POSTS_TOKEN_BUDGET)
         poll_results_formatted = format_poll_results(content["polls"])
         topics_str = ", ".join(content["topics"]) if content["topics"] else "General discussion"
 
@@ -40,6 +40,7 @@ from workflows.llm_utils import (
     format_posts_for_prompt,
     create_rolling_summary,
     LLMMetrics,
+    DEFAULT_POSTS_TOKEN_BUDGET,
 )
 from workflows.prompts.copilot_prompts import COPILOT_ANALYSIS_PROMPT
 
@@ -354,8 +355,10 @@ def run_copilot_single_iteration(
     posts_data = get_posts_data(posts, db)
 
     # Apply rolling summary for token control (Milestone 6)
-    recent_posts, older_summary = create_rolling_summary(posts_data, max_posts=posts_limit)
-    posts_text = format_posts_for_prompt(recent_posts)
+    recent_posts, older_summary = create_rolling_summary(
+        posts_data, max_posts=posts_limit, max_tokens=DEFAULT_POSTS_TOKEN_BUDGET
+    )
+    posts_text = format_posts_for_prompt(recent_posts, max_tokens=DEFAULT_POSTS_TOKEN_BUDGET)
     if older_summary:
         posts_text = older_summary + "\n\n" + posts_text
 
@@ -42,6 +42,7 @@ from workflows.llm_utils import (
     get_llm_with_tracking,
     invoke_llm_with_metrics,
     format_posts_for_prompt,
+    DEFAULT_POSTS_TOKEN_BUDGET,
     parse_json_response,
     LLMMetrics,
 )
@@ -288,7 +289,6 @@ def generate_live_summary(session_id: int) -> Dict[str, Any]:
             for p in posts
         ]
 
-        posts_formatted = format_posts_for_prompt(posts_data[:50])
         topics = session.plan_json.get("topics", []) if session.plan_json else []
 
         # Get LLM
@@ -296,6 +296,8 @@ def generate_live_summary(session_id: int) -> Dict[str, Any]:
         if not llm:
             return {"error": "No LLM configured"}
 
+        posts_formatted = format_posts_for_prompt(posts_data, max_tokens=DEFAULT_POSTS_TOKEN_BUDGET, model_name=model_name)
+
         prompt = LIVE_SUMMARY_PROMPT.format(
             session_title=session.title,
             topics=", ".join(topics) if topics else "General discussion",
@@ -582,7 +584,7 @@ def generate_questions(
             }
             for p in posts
         ]
-        posts_formatted = format_posts_for_prompt(posts_data[:30])
+        posts_formatted = format_posts_for_prompt(posts_data, max_tokens=DEFAULT_POSTS_TOKEN_BUDGET // 2)
 
         # 2. Fetch case studies
         cases = db.query(Case).filter(Case.session_id == session_id).all()
@@ -906,7 +908,7 @@ def analyze_objective_coverage(course_id: int) -> Dict[str, Any]:
         coverage_created = 0
 
         for session in sessions:
-            posts = db.query(Post).filter(Post.session_id == session.id).all()
+            posts = db.query(Post).filter(Post.session_id == session.id).order_by(Post.created_at.asc()).all()
             if not posts:
                 continue
 
@@ -919,7 +921,9 @@ def analyze_objective_coverage(course_id: int) -> Dict[str, Any]:
                 }
                 for p in posts
             ]
-            posts_formatted = format_posts_for_prompt(posts_data[:30])
+            posts_formatted = format_posts_for_prompt(
+                posts_data, max_tokens=DEFAULT_POSTS_TOKEN_BUDGET, model_name=model_name
+            )
 
             prompt = OBJECTIVE_COVERAGE_PROMPT.format(
                 objectives=json.dumps(objectives, indent=2),
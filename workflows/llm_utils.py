@@ -4,14 +4,16 @@ Shared LLM utilities for all workflows.
 Provides:
 - LLM initialization with token tracking
 - Cost calculation for OpenAI and Anthropic
-- Token counting utilities
+- Token counting utilities (tiktoken when available, character heuristic offline)
+- Token-budgeted post packing for prompts
 - Rolling summary for token control
 """
 import json
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from api.core.config import get_settings
 
@@ -30,6 +32,10 @@ COST_PER_1M_TOKENS = {
 # Default token limits
 DEFAULT_MAX_INPUT_TOKENS = 8000
 DEFAULT_MAX_OUTPUT_TOKENS = 4000
+# Share of the input limit given to discussion posts in a single prompt
+DEFAULT_POSTS_TOKEN_BUDGET = 4000
+# A post is truncated rather than dropped only if at least this much budget is left
+MIN_TRUNCATED_POST_TOKENS = 40
 
 
 @dataclass
@@ -44,6 +50,7 @@ class LLMMetrics:
     used_fallback: bool = False
     error_message: Optional[str] = None
     retry_count: int = 0  # Number of retries for this invocation
+    cached_prompt_tokens: int = 0  # Prompt tokens served from the provider's prompt cache
 
 
 @dataclass
@@ -157,23 +164,84 @@ def calculate_cost(model_name: str, prompt_tokens: int, completion_tokens: int)
     return round(input_cost + output_cost, 6)
 
 
-def estimate_tokens(text: str) -> int:
+def _encoding_name(model_name: Optional[str]) -> str:
+    """tiktoken encoding for a model family."""
+    name = (model_name or "").lower()
+    if name.startswith(("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")):
+        return "o200k_base"
+    if name.startswith(("gpt-4", "gpt-3.5")):
+        return "cl100k_base"
+    if "claude" in name:
+        # Anthropic has no public tokenizer; cl100k_base is the closest approximation
+        return "cl100k_base"
+    return "o200k_base"
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str):
     """
-    Estimate token count for text.
-    Rough estimate: ~4 characters per token for English text.
+    Load a tiktoken encoding once per process, or None if unavailable.
+
+    tiktoken downloads encodings on first use; offline hosts can pre-seed
+    TIKTOKEN_CACHE_DIR, and otherwise fall back to the character heuristic.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding {encoding_name} unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def estimate_tokens(text: str, model_name: Optional[str] = None) -> int:
+    """
+    Count tokens in text for the given model family.
+
+    Uses tiktoken when it is installed and its encoding can be loaded;
+    otherwise estimates ~4 characters per token for English text.
     """
     if not text:
         return 0
-    return len(text) // 4
+    encoding = _get_encoding(_encoding_name(model_name))
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model_name: Optional[str] = None,
+                       marker: str = " ...[truncated]") -> str:
+    """Cut text to at most max_tokens tokens (marker included), keeping the beginning."""
+    if estimate_tokens(text, model_name) <= max_tokens:
+        return text
+    budget = max(max_tokens - estimate_tokens(marker, model_name), 0)
+    encoding = _get_encoding(_encoding_name(model_name))
+    if encoding is None:
+        return text[:budget * 4] + marker
+    return encoding.decode(encoding.encode(text, disallowed_special=())[:budget]) + marker
+
+
+def _prompt_text(prompt) -> str:
+    """Flatten a prompt string or list of chat messages into text for estimation."""
+    if isinstance(prompt, str):
+        return prompt
+    parts = []
+    for message in prompt:
+        content = getattr(message, "content", message)
+        if isinstance(content, list):
+            parts.extend(block.get("text", "") if isinstance(block, dict) else str(block) for block in content)
+        else:
+            parts.append(str(content))
+    return "\n".join(parts)
 
 
-def invoke_llm_with_metrics(llm, prompt: str, model_name: str, json_mode: bool = False) -> LLMResponse:
+def invoke_llm_with_metrics(llm, prompt, model_name: str, json_mode: bool = False) -> LLMResponse:
     """
     Invoke LLM and return response with metrics.
 
     Args:
         llm: LangChain LLM instance
-        prompt: The prompt to send
+        prompt: The prompt to send (a string or a list of chat messages)
         model_name: Name of the model for cost calculation
         json_mode: If True, enforce JSON output format (OpenAI only)
 
@@ -202,16 +270,18 @@ def invoke_llm_with_metrics(llm, prompt: str, model_name: str, json_mode: bool =
                 metrics.prompt_tokens = usage.get('prompt_tokens', 0)
                 metrics.completion_tokens = usage.get('completion_tokens', 0)
                 metrics.total_tokens = usage.get('total_tokens', 0)
+                metrics.cached_prompt_tokens = (usage.get('prompt_tokens_details') or {}).get('cached_tokens', 0) or 0
             # Anthropic format
             elif 'usage' in metadata:
                 usage = metadata['usage']
                 metrics.prompt_tokens = usage.get('input_tokens', 0)
                 metrics.completion_tokens = usage.get('output_tokens', 0)
                 metrics.total_tokens = metrics.prompt_tokens + metrics.completion_tokens
+                metrics.cached_prompt_tokens = usage.get('cache_read_input_tokens', 0) or 0
 
         # If no token info from API, estimate
         if metrics.total_tokens == 0:
-            metrics.prompt_tokens = estimate_tokens(prompt)
+            metrics.prompt_tokens = estimate_tokens(_prompt_text(prompt))
             metrics.completion_tokens = estimate_tokens(response.content) if response.content else 0
             metrics.total_tokens = metrics.prompt_tokens + metrics.completion_tokens
 
@@ -311,30 +381,50 @@ class RollingSummaryResult:
     recent_posts_count: int = 0
 
 
+def _recent_window(posts: List[Dict[str, Any]], max_posts: int, max_tokens: Optional[int],
+                   model_name: Optional[str] = None) -> int:
+    """How many of the newest posts fit within max_posts and, if given, max_tokens (at least one)."""
+    if max_tokens is None:
+        return min(len(posts), max_posts)
+    used = 0
+    count = 0
+    for post in reversed(posts[-max_posts:]):
+        used += estimate_tokens(_format_post(post), model_name)
+        if count and used > max_tokens:
+            break
+        count += 1
+    return count
+
+
 def create_rolling_summary(
     posts: List[Dict[str, Any]],
     max_posts: int = 20,
     summarize_older: bool = True,
+    max_tokens: Optional[int] = None,
+    model_name: Optional[str] = None,
 ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Create a rolling summary of posts to control token usage.
 
-    If there are more than max_posts, keeps the most recent max_posts
-    and summarizes the older ones.
+    Keeps the most recent posts that fit within max_posts and, if given,
+    max_tokens, and summarizes the older ones.
 
     Args:
         posts: List of post dictionaries
         max_posts: Maximum number of full posts to include
         summarize_older: Whether to summarize older posts
+        max_tokens: Optional token budget for the full posts kept
+        model_name: Model whose tokenizer is used for max_tokens
 
     Returns:
         Tuple of (recent_posts, older_summary_text)
     """
-    if len(posts) <= max_posts:
+    window = _recent_window(posts, max_posts, max_tokens, model_name)
+    if window >= len(posts):
         return posts, None
 
-    recent_posts = posts[-max_posts:]
-    older_posts = posts[:-max_posts]
+    recent_posts = posts[-window:]
+    older_posts = posts[:-window]
 
     if not summarize_older:
         return recent_posts, None
@@ -372,6 +462,8 @@ def create_rolling_summary_with_metadata(
     posts: List[Dict[str, Any]],
     max_posts: int = 20,
     summarize_older: bool = True,
+    max_tokens: Optional[int] = None,
+    model_name: Optional[str] = None,
 ) -> RollingSummaryResult:
     """
     Create a rolling summary of posts with full metadata.
@@ -382,13 +474,15 @@ def create_rolling_summary_with_metadata(
         posts: List of post dictionaries
         max_posts: Maximum number of full posts to include
         summarize_older: Whether to summarize older posts
+        max_tokens: Optional token budget for the full posts kept
+        model_name: Model whose tokenizer is used for max_tokens
 
     Returns:
         RollingSummaryResult with posts, summary text, and metadata
     """
     total_posts = len(posts)
 
-    if total_posts <= max_posts:
+    if _recent_window(posts, max_posts, max_tokens, model_name) >= total_posts:
         return RollingSummaryResult(
             recent_posts=posts,
             older_summary_text=None,
@@ -398,7 +492,7 @@ def create_rolling_summary_with_metadata(
             recent_posts_count=total_posts,
         )
 
-    recent_posts, older_summary = create_rolling_summary(posts, max_posts, summarize_older)
+    recent_posts, older_summary = create_rolling_summary(posts, max_posts, summarize_older, max_tokens, model_name)
     posts_summarized = total_posts - len(recent_posts)
 
     return RollingSummaryResult(
@@ -414,6 +508,9 @@ def create_rolling_summary_with_metadata(
 def chunk_posts_for_analysis(
     posts: List[Dict[str, Any]],
     chunk_size: int = 15,
+    max_tokens: Optional[int] = None,
+    format_post: Optional[Callable[[Dict[str, Any]], str]] = None,
+    model_name: Optional[str] = None,
 ) -> List[List[Dict[str, Any]]]:
     """
     Split posts into chunks for batch analysis.
@@ -421,6 +518,11 @@ def chunk_posts_for_analysis(
     Args:
         posts: List of post dictionaries
         chunk_size: Maximum posts per chunk
+        max_tokens: Optional token budget per chunk; a chunk is closed before it
+            would exceed it (a single oversized post still gets its own chunk)
+        format_post: How a post is rendered in the prompt, for token estimates
+            (defaults to format_posts_for_prompt)
+        model_name: Model whose tokenizer is used for max_tokens
 
     Returns:
         List of post chunks
@@ -428,26 +530,114 @@ def chunk_posts_for_analysis(
     if not posts:
         return []
 
-    chunks = []
-    for i in range(0, len(posts), chunk_size):
-        chunks.append(posts[i:i + chunk_size])
+    if max_tokens is None:
+        return [posts[i:i + chunk_size] for i in range(0, len(posts), chunk_size)]
+
+    render = format_post or (lambda p: format_posts_for_prompt([p]))
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+    for post in posts:
+        post_tokens = estimate_tokens(render(post), model_name)
+        if current and (len(current) >= chunk_size or current_tokens + post_tokens > max_tokens):
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(post)
+        current_tokens += post_tokens
+    if current:
+        chunks.append(current)
     return chunks
 
 
-def format_posts_for_prompt(posts: List[Dict[str, Any]]) -> str:
-    """Format posts for inclusion in prompts."""
+def _format_post(p: Dict[str, Any]) -> str:
+    role_label = "INSTRUCTOR" if p.get("author_role") == "instructor" else "STUDENT"
+    pinned = " [PINNED]" if p.get("pinned") else ""
+    labels = f" [{', '.join(p.get('labels', []))}]" if p.get("labels") else ""
+    return f"[Post #{p['post_id']}] ({role_label}{pinned}{labels}) {p.get('timestamp', '')}\n  {p['content']}\n"
+
+
+@dataclass
+class PackedPosts:
+    """Posts packed into a token budget."""
+    text: str
+    tokens: int = 0
+    included_post_ids: List[int] = field(default_factory=list)
+    truncated_post_ids: List[int] = field(default_factory=list)
+    omitted_count: int = 0
+
+
+def pack_posts(
+    posts: List[Dict[str, Any]],
+    max_tokens: int,
+    model_name: Optional[str] = None,
+    max_post_tokens: Optional[int] = None,
+) -> PackedPosts:
+    """
+    Fill a token budget with posts, greedily by priority.
+
+    Pinned posts go first, then labeled posts, then the rest newest first
+    (posts are expected in chronological order). A post that does not fit is
+    truncated mid-content if enough budget remains, otherwise omitted. Posts
+    are emitted in their original order, followed by an omission note.
+    """
     if not posts:
-        return "No posts in this discussion."
+        return PackedPosts(text="No posts in this discussion.")
+
+    note_reserve = estimate_tokens("[999 more posts omitted to fit the context budget]", model_name)
+    remaining = max_tokens - note_reserve
+    priority = sorted(
+        range(len(posts)),
+        key=lambda i: (not posts[i].get("pinned"), not posts[i].get("labels"), -i),
+    )
 
-    lines = []
-    for p in posts:
-        role_label = "INSTRUCTOR" if p.get("author_role") == "instructor" else "STUDENT"
-        pinned = " [PINNED]" if p.get("pinned") else ""
-        labels = f" [{', '.join(p.get('labels', []))}]" if p.get("labels") else ""
-        lines.append(f"[Post #{p['post_id']}] ({role_label}{pinned}{labels}) {p.get('timestamp', '')}")
-        lines.append(f"  {p['content']}")
-        lines.append("")
-    return "\n".join(lines)
+    chosen: Dict[int, str] = {}
+    truncated: List[int] = []
+    for index in priority:
+        post = posts[index]
+        block = _format_post(post)
+        cost = estimate_tokens(block, model_name)
+        cap = min(remaining, max_post_tokens) if max_post_tokens else remaining
+        if cost > cap:
+            header_cost = estimate_tokens(_format_post({**post, "content": ""}), model_name)
+            content_budget = cap - header_cost
+            if cap < MIN_TRUNCATED_POST_TOKENS or content_budget <= 0:
+                continue
+            block = _format_post({**post, "content": truncate_to_tokens(post["content"], content_budget, model_name)})
+            cost = estimate_tokens(block, model_name)
+            truncated.append(post["post_id"])
+        chosen[index] = block
+        remaining -= cost
+
+    blocks = [chosen[i] for i in sorted(chosen)]
+    omitted = len(posts) - len(chosen)
+    if omitted:
+        blocks.append(f"[{omitted} more posts omitted to fit the context budget]")
+    text = "\n".join(blocks)
+    return PackedPosts(
+        text=text,
+        tokens=estimate_tokens(text, model_name),
+        included_post_ids=[posts[i]["post_id"] for i in sorted(chosen)],
+        truncated_post_ids=truncated,
+        omitted_count=omitted,
+    )
+
+
+def format_posts_for_prompt(
+    posts: List[Dict[str, Any]],
+    max_tokens: Optional[int] = None,
+    model_name: Optional[str] = None,
+) -> str:
+    """
+    Format posts for inclusion in prompts.
+
+    With max_tokens, posts are packed into that budget by priority (see
+    pack_posts); without it, every post is included in full.
+    """
+    if not posts:
+        return "No posts in this discussion."
+    if max_tokens is not None:
+        return pack_posts(posts, max_tokens, model_name).text
+    return "\n".join(_format_post(p) for p in posts)
 
 
 # ============ Aggregation Helpers ============
@@ -446,6 +446,7 @@ def run_planning_workflow(course_id: int) -> Dict[str, Any]:
 
         sessions_updated = 0
         sessions_created = 0
+        updated_session_ids = []
 
         for plan in final_state["sessions_with_flow"]:
             session_num = plan.get("session_number", 0)
@@ -470,6 +471,7 @@ def run_planning_workflow(course_id: int) -> Dict[str, Any]:
                     # Keep original title but could enhance it
                     pass
                 sessions_updated += 1
+                updated_session_ids.append(matching_session.id)
                 logger.info(f"Updated existing session {matching_session.id} ({matching_session.title}) with plan")
             else:
                 # CREATE new session (no matching imported session)
@@ -503,6 +505,7 @@ def run_planning_workflow(course_id: int) -> Dict[str, Any]:
             "sessions_generated": len(final_state["sessions_with_flow"]),
             "sessions_updated": sessions_updated,
             "sessions_created": sessions_created,
+            "updated_session_ids": updated_session_ids,
             "sessions": final_state["sessions_with_flow"],
             "consistency_report": final_state["consistency_report"],
             "model_name": final_state["model_name"],
@@ -274,31 +274,7 @@ Return JSON in this exact format:
             "missing_points": ["<concept3>"],
             "feedback": "<brief constructive feedback>"
         }}
-    ],
-    "class_statistics": {{
-        "average_score": <float>,
-        "highest_score": <int>,
-        "lowest_score": <int>,
-        "score_distribution": {{
-            "excellent": <count 90-100>,
-            "good": <count 75-89>,
-            "satisfactory": <count 60-74>,
-            "needs_improvement": <count 40-59>,
-            "insufficient": <count 0-39>
-        }}
-    }},
-    "closest_to_correct": {{
-        "user_id": <int>,
-        "user_name": "<string or null>",
-        "post_id": <int>,
-        "score": <int>
-    }},
-    "furthest_from_correct": {{
-        "user_id": <int>,
-        "user_name": "<string or null>",
-        "post_id": <int>,
-        "score": <int>
-    }}
+    ]
 }}
 
 Guidelines:
@@ -27,6 +27,8 @@ Rules:
 6. Be conservative: if the intent is ambiguous, prefer read tools first to gather context.
 7. If the transcript mentions specific IDs (course, session), use them. Otherwise use read tools to look them up.
 8. Do not mention vendor or commercial company names (including "11lab"/"11labs"). Do not suggest visiting vendor websites. Use generic terms like "voice service" or "settings page".
+9. To pass a value returned by an earlier step, use the string "$steps.<index>.<field>" as the arg (e.g. "$steps.0.course_id"). Steps that do not reference each other may run in parallel, so only reference a step when you need its result.
+10. When the same write applies to several items (pin, label, enroll), use the batch tool (pin_posts, label_posts, enroll_students_by_email) in one step instead of repeating the single-item tool, so the instructor confirms once.
 
 Respond with ONLY valid JSON (no markdown, no code fences) matching this schema:
 {{
@@ -14,10 +14,16 @@ Includes:
 
 All claims about student contributions include post_id citations.
 Hallucination guardrails: "insufficient evidence" when claims aren't supported.
+
+Regeneration is incremental: each LLM node's inputs are fingerprinted and its
+output stored on the report, so only nodes whose inputs changed are re-run, and
+a regeneration with no changed inputs returns the existing report version.
 """
+import hashlib
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, TypedDict, Optional
 
@@ -38,7 +44,11 @@ from workflows.llm_utils import (
     invoke_llm_with_metrics,
     parse_json_response,
     format_posts_for_prompt,
+    chunk_posts_for_analysis,
+    estimate_tokens,
     create_rolling_summary_with_metadata,
+    DEFAULT_MAX_INPUT_TOKENS,
+    DEFAULT_POSTS_TOKEN_BUDGET,
     LLMMetrics,
     RollingSummaryResult,
     aggregate_metrics,
@@ -54,6 +64,15 @@ from workflows.prompts.report_prompts import (
 
 logger = logging.getLogger(__name__)
 
+# Answer scoring is map-reduce: student posts are scored in token-budgeted
+# batches concurrently, then merged and summarized in code.
+SCORE_CHUNK_MAX_POSTS = 15
+SCORE_MAX_WORKERS = 4
+
+# Recent posts analyzed in full, further bounded by DEFAULT_POSTS_TOKEN_BUDGET;
+# older posts go into the rolling summary
+REPORT_MAX_RECENT_POSTS = 60
+
 
 # ============ State Definition ============
 
@@ -110,6 +129,12 @@ class ReportState(TypedDict):
     llm_metrics: List[LLMMetrics]
     start_time: float
 
+    # Incremental regeneration
+    node_cache: Dict[str, Dict[str, Any]]  # Node outputs stored on the previous report
+    node_outputs: Dict[str, Dict[str, Any]]  # Node outputs to store on this report
+    llm_nodes: List[str]  # Nodes whose output came from a successful LLM call this run
+    nodes_reused: List[str]
+
 
 # ============ Workflow Nodes ============
 
@@ -135,7 +160,7 @@ def cluster_posts(state: ReportState) -> ReportState:
         session_topics = state["session_plan"].get("topics", [])
 
     # Include older posts summary if available
-    posts_text = format_posts_for_prompt(state["posts"])
+    posts_text = format_posts_for_prompt(state["posts"], max_tokens=DEFAULT_POSTS_TOKEN_BUDGET, model_name=model_name)
     if state.get("older_posts_summary"):
         posts_text = state["older_posts_summary"] + "\n\n" + posts_text
 
@@ -153,6 +178,7 @@ def cluster_posts(state: ReportState) -> ReportState:
             clusters = parse_json_response(response.content)
             if clusters:
                 state["clusters"] = clusters
+                state["llm_nodes"].append("cluster_posts")
                 logger.info(f"Cluster: Found {len(clusters.get('clusters', []))} themes")
                 return state
 
@@ -191,7 +217,9 @@ def align_to_objectives(state: ReportState) -> ReportState:
         prompt = ALIGN_OBJECTIVES_PROMPT.format(
             objectives="\n".join(f"- {obj}" for obj in state["objectives"]),
             clusters_json=json.dumps(state["clusters"], indent=2),
-            posts_formatted=format_posts_for_prompt(state["posts"]),
+            posts_formatted=format_posts_for_prompt(
+                state["posts"], max_tokens=DEFAULT_POSTS_TOKEN_BUDGET, model_name=model_name
+            ),
         )
 
         response = invoke_llm_with_metrics(llm, prompt, model_name)
@@ -201,6 +229,7 @@ def align_to_objectives(state: ReportState) -> ReportState:
             alignment = parse_json_response(response.content)
             if alignment:
                 state["objectives_alignment"] = alignment
+                state["llm_nodes"].append("align_to_objectives")
                 logger.info(f"AlignToObjectives: Found {len(alignment.get('strong_contributions', []))} strong contributions")
                 return state
 
@@ -243,7 +272,9 @@ def identify_misconceptions(state: ReportState) -> ReportState:
             session_topics=", ".join(session_topics) if session_topics else "General topics",
             syllabus_text=state["syllabus_text"] or "No syllabus provided.",
             resources_text=state["resources_text"] or "No additional resources.",
-            posts_formatted=format_posts_for_prompt(state["posts"]),
+            posts_formatted=format_posts_for_prompt(
+                state["posts"], max_tokens=DEFAULT_POSTS_TOKEN_BUDGET, model_name=model_name
+            ),
         )
 
         response = invoke_llm_with_metrics(llm, prompt, model_name)
@@ -253,6 +284,7 @@ def identify_misconceptions(state: ReportState) -> ReportState:
             misconceptions = parse_json_response(response.content)
             if misconceptions:
                 state["misconceptions"] = misconceptions
+                state["llm_nodes"].append("identify_misconceptions")
                 logger.info(f"Misconceptions: Found {len(misconceptions.get('misconceptions', []))} issues")
                 return state
 
@@ -303,6 +335,7 @@ def generate_best_practice(state: ReportState) -> ReportState:
             best_practice = parse_json_response(response.content)
             if best_practice:
                 state["best_practice"] = best_practice
+                state["llm_nodes"].append("generate_best_practice")
                 logger.info("BestPracticeAnswer: Generated successfully")
                 return state
 
@@ -355,6 +388,7 @@ def generate_student_summary(state: ReportState) -> ReportState:
             summary = parse_json_response(response.content)
             if summary:
                 state["student_summary"] = summary
+                state["llm_nodes"].append("generate_student_summary")
                 logger.info("StudentSummary: Generated successfully")
                 return state
 
@@ -395,8 +429,128 @@ def generate_student_summary(state: ReportState) -> ReportState:
     return state
 
 
+def _format_score_post(p: Dict[str, Any]) -> str:
+    return f"[Post #{p['post_id']} by User {p.get('user_id', 'Unknown')} ({p.get('user_name', 'Unknown')})]\n{p['content']}"
+
+
+def _heuristic_score(p: Dict[str, Any]) -> Dict[str, Any]:
+    """Basic score from post length and instructor labels, used when the LLM is unavailable."""
+    score = 50  # Base score
+    content_len = len(p.get("content", ""))
+    if content_len > 200:
+        score += 15  # Longer responses get bonus
+    if content_len > 500:
+        score += 10  # Even longer get more
+    if "high-quality" in (p.get("labels") or []):
+        score += 25  # Instructor marked as high quality
+    if "needs-clarification" in (p.get("labels") or []):
+        score -= 20  # Needs work
+
+    return {
+        "user_id": p.get("user_id"),
+        "user_name": p.get("user_name"),
+        "post_id": p["post_id"],
+        "score": max(0, min(100, score)),  # Clamp to 0-100
+        "key_points_covered": [],
+        "missing_points": [],
+        "feedback": "Automated scoring based on instructor labels and post length"
+    }
+
+
+def _score_chunk(llm, model_name: str, chunk: List[Dict[str, Any]], best_practice_text: str,
+                 key_concepts_text: str) -> tuple:
+    """Score one batch of posts. Returns (scores or None on failure, LLMMetrics)."""
+    prompt = SCORE_ANSWERS_PROMPT.format(
+        best_practice_answer=best_practice_text,
+        key_concepts=key_concepts_text,
+        student_posts="\n\n".join(_format_score_post(p) for p in chunk),
+    )
+    response = invoke_llm_with_metrics(llm, prompt, model_name)
+    if not response.success:
+        return None, response.metrics
+
+    parsed = parse_json_response(response.content)
+    if not parsed or not isinstance(parsed.get("student_scores"), list):
+        return None, response.metrics
+
+    # Keep one score per post of this chunk; identity fields come from our data, not the model
+    posts_by_id = {p["post_id"]: p for p in chunk}
+    scores = {}
+    for entry in parsed["student_scores"]:
+        if not isinstance(entry, dict):
+            continue
+        post = posts_by_id.get(entry.get("post_id"))
+        try:
+            score = max(0, min(100, int(entry.get("score"))))
+        except (TypeError, ValueError):
+            continue
+        if post is None or post["post_id"] in scores:
+            continue
+        scores[post["post_id"]] = {
+            **entry,
+            "user_id": post.get("user_id"),
+            "user_name": post.get("user_name"),
+            "post_id": post["post_id"],
+            "score": score,
+        }
+    if not scores:
+        return None, response.metrics
+    # Posts the model skipped get the heuristic score
+    return [scores.get(p["post_id"]) or _heuristic_score(p) for p in chunk], response.metrics
+
+
+def summarize_scores(student_scores: List[Dict[str, Any]], note: Optional[str] = None) -> Dict[str, Any]:
+    """Build the answer_scores section, computing class statistics from the per-post scores."""
+    if not student_scores:
+        return {
+            "student_scores": [],
+            "class_statistics": None,
+            "note": note or "No scores generated"
+        }
+
+    scores_only = [s["score"] for s in student_scores]
+    avg_score = sum(scores_only) / len(scores_only)
+    highest = max(student_scores, key=lambda x: x["score"])
+    lowest = min(student_scores, key=lambda x: x["score"])
+
+    def _pick(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "user_id": entry.get("user_id"),
+            "user_name": entry.get("user_name"),
+            "post_id": entry.get("post_id"),
+            "score": entry.get("score")
+        }
+
+    answer_scores = {
+        "student_scores": student_scores,
+        "class_statistics": {
+            "average_score": round(avg_score, 1),
+            "highest_score": highest["score"],
+            "lowest_score": lowest["score"],
+            "score_distribution": {
+                "excellent": sum(1 for s in scores_only if s >= 90),
+                "good": sum(1 for s in scores_only if 75 <= s < 90),
+                "satisfactory": sum(1 for s in scores_only if 60 <= s < 75),
+                "needs_improvement": sum(1 for s in scores_only if 40 <= s < 60),
+                "insufficient": sum(1 for s in scores_only if s < 40),
+            }
+        },
+        "closest_to_correct": _pick(highest),
+        "furthest_from_correct": _pick(lowest),
+    }
+    if note:
+        answer_scores["note"] = note
+    return answer_scores
+
+
 def score_student_answers(state: ReportState) -> ReportState:
-    """Node 6: Score student answers against the best practice answer."""
+    """
+    Node 6: Score student answers against the best practice answer.
+
+    Student posts are split into token-budgeted batches that are scored
+    concurrently; the per-post scores are merged and class statistics are
+    computed in code. Batches the LLM fails on are scored heuristically.
+    """
     logger.info("ScoreAnswers: Evaluating student responses")
 
     # Only score student posts
@@ -421,99 +575,55 @@ def score_student_answers(state: ReportState) -> ReportState:
 
     llm, model_name = get_llm_with_tracking()
 
-    if llm:
-        # Format student posts with user info
-        posts_formatted = "\n\n".join(
-            f"[Post #{p['post_id']} by User {p.get('user_id', 'Unknown')} ({p.get('user_name', 'Unknown')})]\n{p['content']}"
-            for p in student_posts
-        )
-
-        key_concepts = best_practice.get("key_concepts", [])
-
-        prompt = SCORE_ANSWERS_PROMPT.format(
-            best_practice_answer=best_practice.get("detailed_explanation", best_practice.get("summary", "")),
-            key_concepts="\n".join(f"- {c}" for c in key_concepts) if key_concepts else "See best practice answer",
-            student_posts=posts_formatted
+    if not llm:
+        state["answer_scores"] = summarize_scores(
+            [_heuristic_score(p) for p in student_posts],
+            note="Fallback scoring used - LLM unavailable",
         )
+        return state
 
-        response = invoke_llm_with_metrics(llm, prompt, model_name)
-        state["llm_metrics"].append(response.metrics)
-
-        if response.success:
-            scores = parse_json_response(response.content)
-            if scores:
-                state["answer_scores"] = scores
-                logger.info(f"ScoreAnswers: Scored {len(scores.get('student_scores', []))} posts")
-                return state
-
-    # Fallback - basic scoring based on post length and labels
-    fallback_scores = []
-    for p in student_posts:
-        # Simple heuristic scoring
-        score = 50  # Base score
-        content_len = len(p.get("content", ""))
-        if content_len > 200:
-            score += 15  # Longer responses get bonus
-        if content_len > 500:
-            score += 10  # Even longer get more
-        if "high-quality" in (p.get("labels") or []):
-            score += 25  # Instructor marked as high quality
-        if "needs-clarification" in (p.get("labels") or []):
-            score -= 20  # Needs work
-
-        score = max(0, min(100, score))  # Clamp to 0-100
-
-        fallback_scores.append({
-            "user_id": p.get("user_id"),
-            "user_name": p.get("user_name"),
-            "post_id": p["post_id"],
-            "score": score,
-            "key_points_covered": [],
-            "missing_points": [],
-            "feedback": "Automated scoring based on instructor labels and post length"
-        })
-
-    if fallback_scores:
-        scores_only = [s["score"] for s in fallback_scores]
-        avg_score = sum(scores_only) / len(scores_only)
-        highest = max(fallback_scores, key=lambda x: x["score"])
-        lowest = min(fallback_scores, key=lambda x: x["score"])
-
-        state["answer_scores"] = {
-            "student_scores": fallback_scores,
-            "class_statistics": {
-                "average_score": round(avg_score, 1),
-                "highest_score": highest["score"],
-                "lowest_score": lowest["score"],
-                "score_distribution": {
-                    "excellent": sum(1 for s in scores_only if s >= 90),
-                    "good": sum(1 for s in scores_only if 75 <= s < 90),
-                    "satisfactory": sum(1 for s in scores_only if 60 <= s < 75),
-                    "needs_improvement": sum(1 for s in scores_only if 40 <= s < 60),
-                    "insufficient": sum(1 for s in scores_only if s < 40),
-                }
-            },
-            "closest_to_correct": {
-                "user_id": highest.get("user_id"),
-                "user_name": highest.get("user_name"),
-                "post_id": highest.get("post_id"),
-                "score": highest.get("score")
-            },
-            "furthest_from_correct": {
-                "user_id": lowest.get("user_id"),
-                "user_name": lowest.get("user_name"),
-                "post_id": lowest.get("post_id"),
-                "score": lowest.get("score")
-            },
-            "note": "Fallback scoring used - LLM unavailable"
-        }
+    key_concepts = best_practice.get("key_concepts", [])
+    best_practice_text = best_practice.get("detailed_explanation", best_practice.get("summary", ""))
+    key_concepts_text = "\n".join(f"- {c}" for c in key_concepts) if key_concepts else "See best practice answer"
+
+    # Budget each batch to what is left of the input limit after the fixed prompt
+    base_tokens = estimate_tokens(SCORE_ANSWERS_PROMPT.format(
+        best_practice_answer=best_practice_text, key_concepts=key_concepts_text, student_posts="",
+    ), model_name)
+    chunks = chunk_posts_for_analysis(
+        student_posts,
+        chunk_size=SCORE_CHUNK_MAX_POSTS,
+        max_tokens=max(DEFAULT_MAX_INPUT_TOKENS - base_tokens, 500),
+        format_post=_format_score_post,
+        model_name=model_name,
+    )
+    logger.info(f"ScoreAnswers: Scoring {len(student_posts)} posts in {len(chunks)} batch(es)")
+
+    with ThreadPoolExecutor(max_workers=min(SCORE_MAX_WORKERS, len(chunks))) as executor:
+        results = list(executor.map(
+            lambda chunk: _score_chunk(llm, model_name, chunk, best_practice_text, key_concepts_text),
+            chunks,
+        ))
+
+    merged: List[Dict[str, Any]] = []
+    failed_chunks = 0
+    for chunk, (scores, metrics) in zip(chunks, results):
+        state["llm_metrics"].append(metrics)
+        if scores is None:
+            failed_chunks += 1
+            scores = [_heuristic_score(p) for p in chunk]
+        merged.extend(scores)
+
+    note = None
+    if failed_chunks == len(chunks):
+        note = "Fallback scoring used - LLM unavailable"
+    elif failed_chunks:
+        note = f"Fallback scoring used for {failed_chunks} of {len(chunks)} batches"
     else:
-        state["answer_scores"] = {
-            "student_scores": [],
-            "class_statistics": None,
-            "note": "No scores generated"
-        }
+        state["llm_nodes"].append("score_student_answers")
 
+    state["answer_scores"] = summarize_scores(merged, note=note)
+    logger.info(f"ScoreAnswers: Scored {len(merged)} posts ({failed_chunks} batch(es) fell back)")
     return state
 
 
@@ -590,6 +700,7 @@ def compile_report(state: ReportState) -> Dict[str, Any]:
             "llm_calls": len(state["llm_metrics"]),
             "used_fallback": aggregated_metrics.used_fallback,
             "retry_count": aggregated_metrics.retry_count,
+            "nodes_reused": state.get("nodes_reused", []),
         },
 
         "errors": state["errors"] if state["errors"] else None,
@@ -830,19 +941,118 @@ def generate_markdown_report(report_json: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# ============ Node Memoization ============
+
+# Bump to invalidate every stored node output (e.g. after changing a prompt)
+NODE_CACHE_VERSION = "1"
+
+
+def _fingerprint(*parts: Any) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _session_topics(state: ReportState) -> List[str]:
+    return state["session_plan"].get("topics", []) if state["session_plan"] else []
+
+
+# Everything each node reads from the state (its own output field excluded)
+NODE_INPUTS = {
+    "cluster_posts": lambda s: (s["session_title"], _session_topics(s), s["posts"], s.get("older_posts_summary")),
+    "align_to_objectives": lambda s: (s["objectives"], s["clusters"], s["posts"]),
+    "identify_misconceptions": lambda s: (
+        _session_topics(s), s["syllabus_text"], s["resources_text"], s["posts"],
+    ),
+    "generate_best_practice": lambda s: (
+        s["session_title"], s["session_plan"], s["case_prompt"], s["syllabus_text"], s["resources_text"], s["objectives"],
+    ),
+    "generate_student_summary": lambda s: (
+        s["session_title"], s["case_prompt"], s["objectives"], s["objectives_alignment"], s["misconceptions"],
+    ),
+    "score_student_answers": lambda s: (
+        [p for p in s["posts"] if p["author_role"] == "student"], s["best_practice"],
+    ),
+}
+
+NODE_OUTPUT_FIELDS = {
+    "cluster_posts": "clusters",
+    "align_to_objectives": "objectives_alignment",
+    "identify_misconceptions": "misconceptions",
+    "generate_best_practice": "best_practice",
+    "generate_student_summary": "student_summary",
+    "score_student_answers": "answer_scores",
+}
+
+
+def node_fingerprint(name: str, state: ReportState) -> str:
+    return _fingerprint(NODE_CACHE_VERSION, state["prompt_version"], name, NODE_INPUTS[name](state))
+
+
+def memoized_node(name: str, node):
+    """
+    Wrap a workflow node so it reuses the previous report's output when its
+    inputs are unchanged. Only outputs produced by a successful LLM call are
+    stored; fallback outputs are recomputed on the next run.
+    """
+    output_field = NODE_OUTPUT_FIELDS[name]
+
+    def run(state: ReportState) -> ReportState:
+        fingerprint = node_fingerprint(name, state)
+        previous = (state.get("node_cache") or {}).get(name)
+        if previous and previous.get("fingerprint") == fingerprint:
+            logger.info(f"{name}: inputs unchanged, reusing previous output")
+            state[output_field] = previous["output"]
+            if previous.get("model_name"):
+                state["model_name"] = previous["model_name"]
+            state["node_outputs"][name] = previous
+            state["nodes_reused"].append(name)
+            return state
+
+        state = node(state)
+        if name in state["llm_nodes"]:
+            state["node_outputs"][name] = {
+                "fingerprint": fingerprint,
+                "output": state[output_field],
+                "model_name": state["model_name"],
+            }
+        return state
+
+    run.__name__ = name
+    return run
+
+
+def report_input_fingerprint(state: ReportState) -> str:
+    """Fingerprint of every input that shapes the report, LLM nodes and compiled sections alike."""
+    return _fingerprint(
+        NODE_CACHE_VERSION,
+        state["prompt_version"],
+        state["session_title"],
+        state["session_plan"],
+        state["case_prompt"],
+        state["syllabus_text"],
+        state["objectives"],
+        state["resources_text"],
+        state["posts"],
+        state.get("older_posts_summary"),
+        state.get("rolling_summary_metadata"),
+        state.get("poll_results"),
+        state.get("participation_metrics"),
+    )
+
+
 # ============ Build Graph ============
 
 def build_report_graph() -> StateGraph:
     """Build the LangGraph workflow for report generation."""
     workflow = StateGraph(ReportState)
 
-    # Add nodes
-    workflow.add_node("cluster_posts", cluster_posts)
-    workflow.add_node("align_to_objectives", align_to_objectives)
-    workflow.add_node("identify_misconceptions", identify_misconceptions)
-    workflow.add_node("generate_best_practice", generate_best_practice)
-    workflow.add_node("generate_student_summary", generate_student_summary)
-    workflow.add_node("score_student_answers", score_student_answers)
+    # Add nodes (memoized against the previous report's node outputs)
+    workflow.add_node("cluster_posts", memoized_node("cluster_posts", cluster_posts))
+    workflow.add_node("align_to_objectives", memoized_node("align_to_objectives", align_to_objectives))
+    workflow.add_node("identify_misconceptions", memoized_node("identify_misconceptions", identify_misconceptions))
+    workflow.add_node("generate_best_practice", memoized_node("generate_best_practice", generate_best_practice))
+    workflow.add_node("generate_student_summary", memoized_node("generate_student_summary", generate_student_summary))
+    workflow.add_node("score_student_answers", memoized_node("score_student_answers", score_student_answers))
 
     # Define edges (linear flow)
     workflow.set_entry_point("cluster_posts")
@@ -1000,6 +1210,8 @@ def run_report_workflow(session_id: int) -> Dict[str, Any]:
     - Poll results as classroom evidence (Milestone 5)
     - Token tracking and observability (Milestone 6)
     - Rolling summary for token control (Milestone 6)
+    - Incremental regeneration: nodes with unchanged inputs reuse the previous
+      report's output, and unchanged inputs return the existing version
 
     Args:
         session_id: ID of the session to generate report for
@@ -1051,7 +1263,9 @@ def run_report_workflow(session_id: int) -> Dict[str, Any]:
         logger.info(f"Participation rate: {participation_metrics.get('participation_rate', 0)}%")
 
         # Apply rolling summary for token control (Milestone 6)
-        rolling_result = create_rolling_summary_with_metadata(posts_data, max_posts=30)
+        rolling_result = create_rolling_summary_with_metadata(
+            posts_data, max_posts=REPORT_MAX_RECENT_POSTS, max_tokens=DEFAULT_POSTS_TOKEN_BUDGET
+        )
         recent_posts = rolling_result.recent_posts
         older_summary = rolling_result.older_summary_text
 
@@ -1110,8 +1324,51 @@ def run_report_workflow(session_id: int) -> Dict[str, Any]:
             "errors": [],
             "llm_metrics": [],
             "start_time": start_time,
+            "node_cache": {},
+            "node_outputs": {},
+            "llm_nodes": [],
+            "nodes_reused": [],
         }
 
+        # Incremental regeneration: compare against the latest report with stored node outputs
+        input_fingerprint = report_input_fingerprint(initial_state)
+        previous = (
+            db.query(Report)
+            .filter(Report.session_id == session_id, Report.node_cache_json.isnot(None))
+            .order_by(Report.created_at.desc(), Report.id.desc())
+            .first()
+        )
+        latest = (
+            db.query(Report.id)
+            .filter(Report.session_id == session_id)
+            .order_by(Report.created_at.desc(), Report.id.desc())
+            .first()
+        )
+        # Only short-circuit when that report is still the newest; a later error_* report
+        # would otherwise stay the one users see
+        if (
+            previous
+            and latest.id == previous.id
+            and previous.input_fingerprint == input_fingerprint
+            and not previous.used_fallback
+        ):
+            logger.info(f"Report inputs unchanged for session {session_id}; returning version {previous.version}")
+            return {
+                "session_id": session_id,
+                "version": previous.version,
+                "report_json": previous.report_json,
+                "report_md": previous.report_md,
+                "reused": True,
+                "observability": {
+                    "execution_time_seconds": round(time.time() - start_time, 2),
+                    "total_tokens": 0,
+                    "estimated_cost_usd": 0.0,
+                    "used_fallback": False,
+                },
+            }
+        if previous:
+            initial_state["node_cache"] = previous.node_cache_json
+
         # Run LangGraph workflow
         graph = build_report_graph()
         final_state = graph.invoke(initial_state)
@@ -1144,11 +1401,16 @@ def run_report_workflow(session_id: int) -> Dict[str, Any]:
             used_fallback=used_fallback,
             error_message=aggregated_metrics.error_message,
             retry_count=aggregated_metrics.retry_count,  # Track LLM retries
+            input_fingerprint=input_fingerprint,
+            node_cache_json=final_state["node_outputs"],
         )
         db.add(db_report)
         db.commit()
 
-        logger.info(f"Report workflow complete for session {session_id}, version {version}")
+        logger.info(
+            f"Report workflow complete for session {session_id}, version {version} "
+            f"(reused {len(final_state['nodes_reused'])}/{len(NODE_OUTPUT_FIELDS)} nodes)"
+        )
 
         return {
             "session_id": session_id,
@@ -1160,6 +1422,7 @@ def run_report_workflow(session_id: int) -> Dict[str, Any]:
                 "total_tokens": aggregated_metrics.total_tokens,
                 "estimated_cost_usd": aggregated_metrics.estimated_cost_usd,
                 "used_fallback": used_fallback == 1,
+                "nodes_reused": final_state["nodes_reused"],
             },
         }
 
@@ -0,0 +1,239 @@
+"""
+Tool retrieval for the voice planner prompt.
+
+Rendering every TOOL_REGISTRY entry into VOICE_PLAN_SYSTEM_PROMPT costs
+thousands of tokens per utterance, most of them describing tools that have
+nothing to do with what was said. ToolCatalog renders each tool's line once,
+indexes the lines with BM25 (tool name, description, category and parameter
+names) and returns only the top-k tools for a transcript. Tools in the
+current page's categories are candidates even when no word matched, and
+rank above other tools with the same score. Read-only context tools
+(resolve_*, get_current_context) are always included so the planner can
+look up IDs.
+
+When the best lexical match is weak the full catalog is returned instead,
+so an unusual phrasing never hides the tool the instructor asked for.
+Single-word BM25 scores of right and wrong tools overlap ("class" in "how's
+the class doing" matches go_live), so a match only counts as strong when the
+best tool has one of the query's words in its name, or matches two of them.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Added to the score of tools whose category belongs to the current page
+PAGE_CATEGORY_BOOST = 0.75
+
+ALWAYS_INCLUDED_CATEGORY = "context"
+
+# voice_page_registry routes -> tool categories used on that page
+PAGE_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "/courses": ("courses", "enrollment", "content_generation"),
+    "/sessions": ("sessions", "content_generation"),
+    "/console": ("sessions", "polls", "copilot", "forum"),
+    "/forum": ("forum",),
+    "/reports": ("reports",),
+    "/integrations": ("courses",),
+    "/dashboard": ("courses", "sessions"),
+}
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do for from get give i in is it me my of on or please "
+    "show some that the this to up us what with you your".split()
+)
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens = []
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        if word in _STOPWORDS or len(word) < 2:  # Also drops contraction ends ("how's" -> "s")
+            continue
+        # Cheap plural folding so "polls" matches "poll" and "students" matches "student"
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def render_tool_line(name: str, entry: Dict[str, Any]) -> str:
+    """One catalog line: signature, mode and description."""
+    params = entry.get("parameters", {})
+    properties = params.get("properties", {})
+    required = set(params.get("required", []))
+    fields = []
+    for field_name, field_info in properties.items():
+        type_name = field_info.get("type", "any")
+        marker = "required" if field_name in required else "optional"
+        fields.append(f"{field_name}: {type_name} ({marker})")
+    fields_str = ", ".join(fields)
+    line = f"- {name}({fields_str}) [mode={entry.get('mode', 'read')}]"
+    description = entry.get("description")
+    return f"{line}: {description}" if description else line
+
+
+def _page_categories(current_page: Optional[str]) -> Tuple[str, ...]:
+    if not current_page:
+        return ()
+    path = "/" + current_page.strip().split("?")[0].strip("/").split("/")[0]
+    return PAGE_CATEGORIES.get(path, ())
+
+
+@dataclass
+class ToolSelection:
+    text: str
+    tool_names: List[str]
+    fallback: bool  # True when the full catalog was used
+    top_score: float = 0.0
+
+
+@dataclass
+class ToolCatalog:
+    """Cached tool lines plus a BM25 index over them."""
+    names: List[str]
+    lines: Dict[str, str]
+    categories: Dict[str, str]
+    always_included: List[str]
+    full_text: str
+    _term_freqs: Dict[str, Counter] = field(default_factory=dict)
+    _name_terms: Dict[str, frozenset] = field(default_factory=dict)
+    _doc_lengths: Dict[str, int] = field(default_factory=dict)
+    _idf: Dict[str, float] = field(default_factory=dict)
+    _avg_length: float = 1.0
+
+    @classmethod
+    def build(cls, registry: Dict[str, Dict[str, Any]]) -> "ToolCatalog":
+        names = list(registry)
+        lines = {name: render_tool_line(name, entry) for name, entry in registry.items()}
+        categories = {name: entry.get("category", "general") for name, entry in registry.items()}
+        always_included = [
+            name for name, entry in registry.items()
+            if entry.get("category") == ALWAYS_INCLUDED_CATEGORY and entry.get("mode", "read") == "read"
+        ]
+        catalog = cls(
+            names=names,
+            lines=lines,
+            categories=categories,
+            always_included=always_included,
+            full_text="\n".join(lines[name] for name in names),
+        )
+        catalog._index(registry)
+        return catalog
+
+    def _index(self, registry: Dict[str, Dict[str, Any]]) -> None:
+        doc_freq: Counter = Counter()
+        for name, entry in registry.items():
+            parts = [
+                name.replace("_", " "),
+                name.replace("_", " "),  # Name terms count double
+                entry.get("description", ""),
+                entry.get("category", "").replace("_", " "),
+                " ".join(entry.get("parameters", {}).get("properties", {})).replace("_", " "),
+            ]
+            terms = Counter(_tokenize(" ".join(parts)))
+            self._term_freqs[name] = terms
+            self._name_terms[name] = frozenset(_tokenize(name.replace("_", " ")))
+            self._doc_lengths[name] = sum(terms.values())
+            doc_freq.update(terms.keys())
+        total = len(registry) or 1
+        self._avg_length = (sum(self._doc_lengths.values()) / total) or 1.0
+        self._idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def score(self, query: str) -> Dict[str, float]:
+        """BM25 score of every tool for the query (tools with no matching term are omitted)."""
+        terms = set(_tokenize(query))
+        scores: Dict[str, float] = {}
+        for name, freqs in self._term_freqs.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[name] / self._avg_length)
+            total = 0.0
+            for term in terms:
+                tf = freqs.get(term)
+                if tf:
+                    total += self._idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+            if total > 0:
+                scores[name] = total
+        return scores
+
+    def _is_strong_match(self, terms: set, name: str) -> bool:
+        matched = terms & self._term_freqs[name].keys()
+        return bool(matched & self._name_terms[name]) or len(matched) >= 2
+
+    def select(
+        self,
+        transcript: str,
+        current_page: Optional[str] = None,
+        top_k: int = 12,
+        min_score: float = 1.0,
+    ) -> ToolSelection:
+        """Top-k tools for the utterance plus the current page's tools, or the full catalog when the match is weak."""
+        terms = set(_tokenize(transcript or ""))
+        scores = self.score(transcript or "")
+        page_categories = _page_categories(current_page)
+        # Page tools are candidates even with no matching term
+        boosted = {
+            name: scores.get(name, 0.0) + (PAGE_CATEGORY_BOOST if self.categories[name] in page_categories else 0.0)
+            for name in self.names
+            if name in scores or self.categories[name] in page_categories
+        }
+        ranked = sorted(boosted, key=lambda name: (-boosted[name], self.names.index(name)))
+
+        top_score = max(scores.values(), default=0.0)
+        best = next((name for name in ranked if name in scores), None)
+        if top_score < min_score or best is None or not self._is_strong_match(terms, best):
+            return ToolSelection(self.full_text, list(self.names), fallback=True, top_score=top_score)
+
+        page_ranked = [name for name in ranked if self.categories[name] in page_categories]
+        selected = set(ranked[:top_k]) | set(page_ranked[:top_k]) | set(self.always_included)
+        # Keep registry order so the prompt is stable for the same selection
+        tool_names = [name for name in self.names if name in selected]
+        text = "\n".join(self.lines[name] for name in tool_names)
+        return ToolSelection(text, tool_names, fallback=False, top_score=top_score)
+
+_catalog: Optional[ToolCatalog] = None
+_catalog_signature: Optional[Tuple[str, ...]] = None
+
+
+def get_tool_catalog(registry: Optional[Dict[str, Dict[str, Any]]] = None) -> ToolCatalog:
+    """Catalog for the MCP tool registry, rebuilt only when the set of tools changes."""
+    global _catalog, _catalog_signature
+    if registry is None:
+        from mcp_server.server import TOOL_REGISTRY as registry
+
+    signature = tuple(registry)
+    if _catalog is None or signature != _catalog_signature:
+        _catalog = ToolCatalog.build(registry)
+        _catalog_signature = signature
+        logger.info(f"ToolCatalog: indexed {len(signature)} tools")
+    return _catalog
+
+
+def select_tools_for_prompt(
+    transcript: str,
+    current_page: Optional[str] = None,
+    registry: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> ToolSelection:
+    """Tool descriptions for the planner prompt, filtered according to settings."""
+    catalog = get_tool_catalog(registry)
+    settings = get_settings()
+    if not settings.voice_tool_retrieval_enabled:
+        return ToolSelection(catalog.full_text, list(catalog.names), fallback=True)
+    return catalog.select(
+        transcript,
+        current_page=current_page,
+        top_k=settings.voice_tool_top_k,
+        min_score=settings.voice_tool_min_score,
+    )
@@ -13,7 +13,6 @@ from typing import Any, Dict, List, Optional, TypedDict
 
 from langgraph.graph import StateGraph, END
 
-from mcp_server.server import TOOL_REGISTRY
 from workflows.llm_utils import (
     get_llm_with_tracking,
     invoke_llm_with_metrics,
@@ -26,6 +25,7 @@ from workflows.prompts.voice_prompts import (
     VOICE_PLAN_USER_PROMPT,
     VOICE_SUMMARY_PROMPT,
 )
+from workflows.tool_retrieval import select_tools_for_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -59,9 +59,13 @@ def build_plan(state: VoiceOrchestratorState) -> VoiceOrchestratorState:
         }
         return state
 
-    tool_descriptions = _build_tool_descriptions()
+    tools = select_tools_for_prompt(state["transcript"], state.get("current_page"))
+    logger.info(
+        f"VoiceOrchestrator: {len(tools.tool_names)} tools in prompt "
+        f"({'full catalog' if tools.fallback else 'retrieved'}, top score {tools.top_score:.2f})"
+    )
     system = VOICE_PLAN_SYSTEM_PROMPT.format(
-        tool_descriptions=tool_descriptions,
+        tool_descriptions=tools.text,
         mcp_voice_phases=MCP_VOICE_PHASES,
     )
     user = VOICE_PLAN_USER_PROMPT.format(
@@ -95,22 +99,6 @@ def build_plan(state: VoiceOrchestratorState) -> VoiceOrchestratorState:
     return state
 
 
-def _build_tool_descriptions() -> str:
-    lines = []
-    for name, entry in TOOL_REGISTRY.items():
-        params = entry.get("parameters", {})
-        properties = params.get("properties", {})
-        required = set(params.get("required", []))
-        fields = []
-        for field_name, field_info in properties.items():
-            type_name = field_info.get("type", "any")
-            marker = "required" if field_name in required else "optional"
-            fields.append(f"{field_name}: {type_name} ({marker})")
-        fields_str = ", ".join(fields)
-        lines.append(f"- {name}({fields_str}) [mode={entry.get('mode', 'read')}]")
-    return "\n".join(lines)
-
-
 def build_voice_orchestrator_graph():
     """Build the LangGraph workflow for voice orchestration."""
     workflow = StateGraph(VoiceOrchestratorState)